@@ -15,10 +15,215 @@ WINDOW_MIN_HEIGHT = 600
 # Datei-Einstellungen
 LOG_FILE = "log.txt"
 CONFIG_FILE = "last_used_repo.json"
+PROFILE_STORE_FILE = "repositories.db"
+
+# Repository-Profile
+PROFILE_STORE = {
+    "batch_size": 500,  # Profile pro Abfrage beim Durchlaufen aller Profile
+    "default_strategy": "timestamped",  # "timestamped" oder "overwrite"
+    "default_options": {
+        "create_zip": False,
+        "incremental_zip": False,
+        "archive_format": "zip",
+        "git_mode": "include",
+        "reproducible": False,
+        "submodules": True,
+    },
+}
+
+# Bulk-Import von Repository-Listen
+IMPORT = {
+    "batch_size": 256,  # Einträge pro Validierungs-/Schreibblock
+    "validate_workers": 16,  # Parallele "git ls-remote"-Aufrufe
+    "json_chunk_size": 64 * 1024,
+    "case_insensitive_hosts": ["github.com", "gitlab.com", "bitbucket.org"],
+}
+
+# Submodule (rekursiv, parallel)
+SUBMODULES = {
+    "enabled": True,
+    "jobs": 8,  # Parallele Submodul-Klone, über alle Ebenen
+    "cache_dir": "submodule_cache",  # Mirrors geteilter Submodule, "" = kein Cache
+}
+
+# Wiederherstellung von Backups
+RESTORE = {
+    "workers": 8,  # Parallele Extraktions-Threads
+    "verify": True,  # Hashes aus dem Manifest beim Extrahieren prüfen
+    "max_inflight_bytes": 64 * 1024 * 1024,  # TAR: gelesene, noch nicht geschriebene Daten
+}
+
+# Vergleich zweier Backups
+DIFF = {
+    "hash_workers": 8,  # Threads zum Hashen gleich großer Dateien ohne Prüfsumme
+}
+
+# Replikation fertiger Backups auf weitere Ziele
+REPLICATION = {
+    "targets": [],  # Zielverzeichnisse, leer = keine Replikation
+    "workers": 4,  # Parallele Kopien (über alle Ziele)
+    "verify": True,  # Prüfsumme jeder Kopie am Ziel vergleichen
+    "drop_cache": True,  # Linux: Kopie vor der Prüfung aus dem Page-Cache werfen
+}
+
+# Upload fertiger Archive in S3-kompatiblen Object Storage (AWS S3, MinIO, Ceph, ...)
+OBJECT_STORAGE = {
+    "enabled": False,  # Jedes Archiv samt Manifest hochladen
+    "endpoint": "",  # z.B. "https://s3.eu-central-1.amazonaws.com" oder "http://localhost:9000"
+    "bucket": "",
+    "prefix": "",  # Schlüssel-Präfix, z.B. "backups/"
+    "region": "us-east-1",  # Für die Signatur (MinIO: beliebig)
+    "access_key": "",  # Leer = Umgebungsvariable AWS_ACCESS_KEY_ID
+    "secret_key": "",  # Leer = Umgebungsvariable AWS_SECRET_ACCESS_KEY
+    "part_size": 16 * 1024 * 1024,  # Bytes pro Teil, mindestens 5 MiB
+    "workers": 8,  # Gleichzeitig hochgeladene Teile; Speicher ca. (workers + 1) x part_size
+    "retries": 3,  # Wiederholungen pro Anfrage bei Verbindungsfehlern und 5xx
+    "timeout": 60,  # Sekunden pro Anfrage
+    "poll_seconds": 0.2,  # Wartezeit auf neue Daten eines Archivs, das noch geschrieben wird
+    "state_suffix": ".upload.json",  # Stand eines Multipart-Uploads neben dem Archiv (Fortsetzung)
+}
+
+# Wartung gespeicherter Clones (Repack, Commit-Graph, Multi-Pack-Index, Prune)
+MAINTENANCE = {
+    "workers": 2,  # Repositories gleichzeitig, jeweils mit niedriger Priorität
+    "state_file": "maintenance.json",  # Refs-Prüfsumme und Ergebnis der letzten Wartung pro Repository
+    "prune_expire": "2.weeks.ago",  # Unerreichbare Objekte erst ab diesem Alter löschen
+}
+
+# Integritätsprüfung gespeicherter Clones (git fsck), rotierend mit Zeitbudget
+INTEGRITY = {
+    "workers": 2,  # Repositories gleichzeitig, jeweils mit niedriger Priorität
+    "state_file": "integrity.json",  # Zeitpunkt, Dauer und Ergebnis der letzten Prüfung pro Backup
+    "full": True,  # Inhalt und Hash jedes Objekts prüfen; False = nur Erreichbarkeit (--connectivity-only)
+    "budget_minutes": 60,  # Pro Lauf nur so lange prüfen (älteste Prüfung zuerst), 0 = alle Backups
+    "max_age_days": 7,  # Backups, die länger nicht geprüft wurden, werden als überfällig gemeldet
+}
+
+# Profiling einzelner Backup-Jobs (CPU, Speicher, Git-Prozesse)
+PROFILING = {
+    "enabled": False,  # Per --profile-jobs einschalten
+    "directory": "profiles",  # Ein Unterordner pro Job
+    "top_functions": 40,  # Einträge in <stufe>.txt
+    "tracemalloc_frames": 10,  # Stack-Tiefe der Allokations-Snapshots
+}
+
+# Speicherplatz-Prüfung vor Clone und Archivierung
+DISK_SPACE = {
+    "enabled": True,
+    "min_free_bytes": 512 * 1024 * 1024,  # Bleibt immer frei
+    "margin_ratio": 0.1,  # Sicherheitszuschlag auf die Schätzung
+    "pack_factor": 2.5,  # Clone (Objekte + Arbeitskopie) im Verhältnis zur Pack-Größe
+    "archive_ratio": 1.0,  # Archivgröße im Verhältnis zum Clone, wenn kein altes Archiv existiert
+    "github_api": True,  # Repository-Größe über die GitHub-API abfragen
+    "api_timeout": 5,
+    "defer_timeout": 3600,  # Max. Wartezeit in Sekunden, wenn andere Jobs Platz belegen
+    "defer_poll_interval": 10,
+}
+
+# Drosselung und Priorität von Backups (Raten in Bytes/s, 0 = unbegrenzt)
+THROTTLE = {
+    "network_bytes_per_s": 0,  # Alle Git-Transfers (HTTPS) zusammen
+    "network_host_bytes_per_s": {},  # Pro Host, z.B. {"github.com": 5 * 1024 * 1024}
+    "network_host_default_bytes_per_s": 0,  # Hosts ohne eigenen Eintrag
+    "archive_bytes_per_s": 0,  # Lesen + Schreiben aller Archiv-Operationen
+    "burst_seconds": 1.0,  # Angesparte Menge in Sekunden der Rate
+    "chunk_size": 64 * 1024,
+    "connect_timeout": 30,
+    "low_priority": True,  # Git-Prozesse und Worker-Threads mit niedriger Priorität
+    "nice": 10,
+    "ionice_class": 2,  # best-effort
+    "ionice_level": 7,  # niedrigste Stufe innerhalb der Klasse
+}
+
+# Log-Viewer Einstellungen
+LOG_VIEWER = {
+    "width": 900,
+    "height": 550,
+    "poll_interval_ms": 500,
+    "index_batch_bytes": 8 * 1024 * 1024,
+    "filter_batch_lines": 50000,
+}
+
+# Log-Levels (in Anzeige-Reihenfolge)
+LOG_LEVELS = ["INFO", "SUCCESS", "WARNING", "ERROR", "DEBUG"]
+
+# Job-Einstellungen
+JOBS = {
+    "max_concurrent": 4,
+    "refresh_hz": 10,  # UI-Aktualisierungen pro Sekunde
+    "width": 900,
+    "height": 450,
+}
+
+# Gestufte Pipeline für Batch-Läufe (--headless)
+PIPELINE = {
+    "clone_workers": 4,  # Netzwerklastig
+    "archive_workers": 2,  # CPU-lastig, höchstens Anzahl Kerne
+    "post_workers": 1,
+    "queue_size": 4,  # Fertige Clones, die auf ihre Archivierung warten dürfen
+}
+
+# Laufzeit-Historie für Restdauer-Schätzungen
+HISTORY = {
+    "file": "history.db",  # SQLite, ein Eintrag pro erfolgreichem Backup
+    "keep_runs": 50,  # Gespeicherte Läufe pro Repository
+    "sample_runs": 10,  # Letzte Läufe eines Repositories für den Median
+    "global_runs": 200,  # Letzte Läufe aller Repositories für unbekannte Repositories
+}
+
+# Spalten der Job-Tabelle
+JOB_COLUMNS = ["Repository", "Status", "Phase", "Progress", "Rate", "ETA"]
 
 # Git-Einstellungen
 GIT_CLONE_TIMEOUT = 10
 
+# Archiv-Einstellungen
+ARCHIVE = {
+    "manifest_suffix": ".manifest.json",
+    "hash_algorithm": "sha256",
+    "chunk_size": 1024 * 1024,
+    "incremental_mode": "merged",  # "merged" oder "delta"
+    "zstd_level": 3,  # 1-22
+    "zstd_threads": 0,  # 0 = alle CPU-Kerne
+    "git_mode": "include",  # Schlüssel aus GIT_ARCHIVE_MODES
+    "bundle_member": "repository.bundle",
+    "volume_size": 1024 * 1024 * 1024,  # Format "volumes": unkomprimierte Bytes pro Volume
+    "volume_workers": 0,  # Parallel geschriebene Volumes, 0 = Anzahl CPU-Kerne
+    "reproducible": False,  # Fester Zeitstempel (SOURCE_DATE_EPOCH / Commit-Zeit), Rechte 644/755
+    "reuse_unchanged": True,  # Archiv bei gleichem Tree/Refs per Hardlink übernehmen statt neu bauen
+    "source_index": "archives.json",  # Pro Speicherort: Commit, Tree und Optionen jedes Archivs
+    "exclude": [],  # fnmatch-Muster, die nie archiviert werden, z.B. ["node_modules", "*.pyc", "docs/build"]
+}
+
+# Verzeichnis-Durchlauf (Archive, Manifeste, Größen, Vergleiche)
+WALKER = {
+    "workers": 8,  # Threads, die Verzeichnisse parallel lesen
+    "lookahead": 1024,  # Vorausgelesene Verzeichnisse (begrenzt den Speicher)
+}
+
+# Verschlüsselte Archive (Format "tar.enc", benötigt das Paket cryptography)
+ENCRYPTION = {
+    "key_file": "backup.key",  # 32 Bytes (roh, Hex oder Base64), erzeugen mit --generate-key
+    "chunk_size": 4 * 1024 * 1024,  # Klartext pro Block; jeder Block ist einzeln entschlüsselbar
+    "workers": 0,  # Threads für Komprimieren + Verschlüsseln, 0 = Anzahl CPU-Kerne
+}
+
+# Verfügbare Archiv-Formate (Schlüssel -> Anzeigename)
+ARCHIVE_FORMATS = {
+    "zip": "ZIP (Deflate)",
+    "tar.zst": "TAR + Zstandard",
+    "volumes": "ZIP volumes (parallel)",
+    "tar.enc": "TAR, compressed + encrypted",
+}
+
+# Behandlung des .git-Verzeichnisses beim Archivieren (Schlüssel -> Anzeigename)
+GIT_ARCHIVE_MODES = {
+    "include": "Include .git as-is",
+    "exclude": "Exclude .git",
+    "repack": "Repack .git into a single pack",
+    "bundle": "Store .git as a single bundle",
+}
+
 # Farben (Dark Theme)
 COLORS = {
     "primary": "#4CAF50",
@@ -31,6 +236,7 @@ COLORS = {
     "text_secondary": "#b0b0b0",
     "text_disabled": "#666666",
     "error": "#f44336",
+    "warning": "#FFC107",
     "success": "#4CAF50",
     "button_bg": "#3d3d3d",
     "button_hover": "#4d4d4d",
@@ -45,8 +251,17 @@ MESSAGES = {
     "clone_in_progress": "Cloning...",
     "clone_complete": "Clone Repository",
     "log_not_found": "Log file not found",
+    "log_all_levels": "All levels",
     "error_prefix": "Error: ",
+    "job_queued": "Backup queued: ",
+    "jobs_summary": "{running} running, {queued} queued, {finished} finished, {failed} failed",
+    "jobs_eta": "{running} running, {queued} queued - all done in ~{eta}",
     "unexpected_error": "Unexpected error: ",
+    "select_location_first": "Please choose a save location first",
+    "import_running": "An import is already running",
+    "import_progress": "Importing... {count} entries read",
+    "restore_running": "A restore is already running",
+    "restore_progress": "Restoring... {percent}%",
 }
 
 # Platzhalter-Texte
@@ -54,6 +269,7 @@ PLACEHOLDERS = {
     "github_url": "https://github.com/username/repository",
     "folder_name": "my-project",
     "save_location": "/path/to/save",
+    "log_repo_filter": "Filter by URL or folder",
 }
 
 # Labels
@@ -64,10 +280,30 @@ LABELS = {
     "save_location": "Save Location",
     "backup_option": "Create timestamped backup folder",
     "zip_option": "Create ZIP archive after cloning",
+    "incremental_option": "Incremental archive (only changed files)",
+    "reproducible_option": "Reproducible archive (commit time, fixed permissions)",
+    "archive_format": "Archive format",
+    "git_mode": ".git directory",
     "clone_button": "Clone Repository",
     "clear_button": "Clear All",
     "log_button": "View Log",
+    "jobs_button": "Jobs",
+    "import_button": "Import",
+    "import_file": "From list file (TXT, CSV, JSON)...",
+    "import_directory": "From folder of bare repositories...",
+    "import_file_filter": "Repository lists (*.txt *.csv *.json *.jsonl *.ndjson);;All files (*)",
+    "restore_button": "Restore",
+    "restore_archive": "From archive or bundle...",
+    "restore_folder": "From backup folder...",
+    "restore_file_filter": "Backups (*.zip *.tar.zst *.tar.enc *.tar.gz *.tgz *.tar *.bundle);;All files (*)",
+    "restore_destination": "Restore to (empty folder)",
+    "restore_path": "Path inside the backup (empty = everything):",
+    "jobs_title": "Backup Jobs",
     "browse_button": "Browse",
+    "log_viewer_title": "Log",
+    "log_level_filter": "Level",
+    "log_repo_filter": "Repository",
+    "log_follow": "Follow",
 }
 
 # Layout-Einstellungen
@@ -105,6 +341,13 @@ STATUS_LABEL = {
     "font_weight": "bold",
 }
 
+# ComboBox-Einstellungen
+COMBOBOX = {
+    "padding": "6px 12px",
+    "border_radius": "8px",
+    "font_size": "14px",
+}
+
 # Checkbox-Einstellungen
 CHECKBOX = {
     "indicator_size": "20px",
@@ -3,24 +3,49 @@
 """
 GitBackupTool Pro - Haupteinstiegspunkt
 Ein einfaches GUI-Tool zum Klonen von GitHub-Repositories, Erstellen von Backups und Generieren von ZIP-Archiven.
+
+Mit ``--profile-startup`` werden die Dauer der Imports, der Palette, des
+Fensteraufbaus, des ersten Frames und der verzögerten Initialisierung ausgegeben.
+``--profile-jobs`` schreibt pro Backup-Job ein CPU-, Speicher- und Git-Profil.
+Mit ``--headless`` läuft eine Batch ohne Fenster durch die gestufte BackupPipeline,
+mit ``--restore`` wird ein Backup ohne Fenster wiederhergestellt und
+``--compare`` vergleicht zwei Backups; ``--maintain`` wartet gespeicherte Clones,
+``--check-integrity`` prüft sie rotierend mit git fsck.
+``--upload`` lädt jedes Archiv in S3-kompatiblen Object Storage hoch,
+``--upload-files`` lädt vorhandene Backups hoch bzw. setzt abgebrochene Uploads fort.
 """
 
+import os
 import sys
-from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QPalette, QColor
-from PySide6.QtCore import Qt
+import json
+import time
+import argparse
+from typing import TYPE_CHECKING
+
+# Startzeitpunkt vor den schweren Imports (PySide6, UI)
+STARTUP_TIME = time.perf_counter()
 
-from config import COLORS
-from src.ui import GitBackupToolPro
+from config import COLORS, ARCHIVE, ARCHIVE_FORMATS, GIT_ARCHIVE_MODES, PIPELINE, PROFILING, ENCRYPTION, OBJECT_STORAGE, INTEGRITY
+from src.core.logger import Logger
 
+# PySide6, die UI und die Funktions-Module werden erst im jeweiligen Modus
+# importiert: die Kommandozeilen-Modi laden kein Qt, die GUI nichts davon vor dem ersten Frame.
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QApplication
+    from src.core.backup_job import BackupJob
+    from src.core.job_history import BatchEstimator
 
-def setup_dark_palette(app: QApplication) -> None:
+
+def setup_dark_palette(app: "QApplication") -> None:
     """
     Setzt ein globales Dark-Theme-Palette für die Anwendung.
     
     Args:
         app (QApplication): Die QApplication-Instanz
     """
+    from PySide6.QtGui import QPalette, QColor
+    from PySide6.QtCore import Qt
+    
     palette = QPalette()
     
     palette.setColor(QPalette.Window, QColor(COLORS['dark']))
@@ -39,24 +64,491 @@ def setup_dark_palette(app: QApplication) -> None:
     app.setPalette(palette)
 
 
+def parse_args(argv: list) -> argparse.Namespace:
+    """
+    Liest die Kommandozeilen-Argumente.
+    
+    Args:
+        argv (list): Argumente ohne Programmnamen
+    
+    Returns:
+        argparse.Namespace: Die geparsten Argumente
+    """
+    parser = argparse.ArgumentParser(description="GitBackupTool Pro")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Print the duration of each startup phase up to the first frame"
+    )
+    parser.add_argument(
+        "--profile-jobs",
+        nargs="?",
+        const=PROFILING['directory'],
+        metavar="DIR",
+        help="Write a CPU, memory and git resource profile per backup job (GUI and headless)"
+    )
+    
+    headless = parser.add_argument_group("headless batch mode")
+    headless.add_argument("--headless", action="store_true", help="Run a batch without the GUI and exit")
+    headless.add_argument("--batch", metavar="FILE", help="Repository list (.txt, .csv, .json, .jsonl)")
+    headless.add_argument("--profiles", action="store_true", help="Back up all saved repository profiles")
+    headless.add_argument("--target", metavar="DIR", help="Target folder for entries without their own")
+    headless.add_argument("--timestamp", action="store_true", help="Add a timestamp to each backup folder")
+    headless.add_argument("--zip", action="store_true", help="Create an archive after each clone")
+    headless.add_argument("--format", choices=list(ARCHIVE_FORMATS), default="zip")
+    headless.add_argument("--volume-size", type=int, metavar="MB", help="Volume size for --format volumes")
+    headless.add_argument("--exclude", metavar="PATTERN", action="append", help="Leave matching files and folders out of archives (repeatable)")
+    headless.add_argument("--no-submodules", action="store_true", help="Do not clone submodules")
+    headless.add_argument("--git-mode", choices=list(GIT_ARCHIVE_MODES), default=ARCHIVE['git_mode'])
+    headless.add_argument("--reproducible", action="store_true", default=ARCHIVE['reproducible'], help="Byte-identical archives for identical content (commit time, fixed permissions)")
+    headless.add_argument("--clone-workers", type=int, default=PIPELINE['clone_workers'])
+    headless.add_argument("--archive-workers", type=int, default=PIPELINE['archive_workers'])
+    headless.add_argument("--post-workers", type=int, default=PIPELINE['post_workers'])
+    headless.add_argument("--maintenance", action="store_true", help="Run repository maintenance on each new clone")
+    headless.add_argument("--integrity", action="store_true", help="Check each new clone with git fsck")
+    headless.add_argument("--replicate", metavar="DIR", action="append", help="Also copy each finished backup here (repeatable)")
+    headless.add_argument("--predict", action="store_true", help="Print the predicted duration per repository and for the batch, then exit")
+    headless.add_argument("--skip-preflight", action="store_true", help="Do not check disk space for the whole batch first")
+    
+    encryption = parser.add_argument_group("encryption")
+    encryption.add_argument("--key-file", metavar="FILE", help="Key for --format tar.enc and for restoring .tar.enc backups")
+    encryption.add_argument("--generate-key", metavar="FILE", help="Create a new random key file and exit")
+    
+    restore = parser.add_argument_group("restore")
+    restore.add_argument("--restore", metavar="BACKUP", help="Backup folder, archive or bundle to restore (with --snapshot: <save location>/<folder name>)")
+    restore.add_argument("--destination", metavar="DIR", help="Empty folder to restore into")
+    restore.add_argument("--path", help="Restore only this file or folder from the backup")
+    restore.add_argument("--snapshot", metavar="ID", help="Pick a backup by part of its name (e.g. 20260325_143022) or 'latest'")
+    restore.add_argument("--no-verify", action="store_true", help="Skip manifest hash checks (CRC and size are still checked)")
+    
+    maintenance = parser.add_argument_group("maintenance")
+    maintenance.add_argument("--maintain", metavar="DIR", help="Repack, write commit-graph/multi-pack-index and prune stored clones in DIR")
+    maintenance.add_argument("--force", action="store_true", help="Also maintain clones whose refs did not change")
+    
+    integrity = parser.add_argument_group("integrity")
+    integrity.add_argument("--check-integrity", metavar="DIR", help="Run git fsck on stored clones in DIR, least recently checked first")
+    integrity.add_argument("--budget", type=float, metavar="MINUTES", default=INTEGRITY['budget_minutes'], help="Start no further checks after this time, 0 = check all")
+    integrity.add_argument("--quick", action="store_true", help="Only check object connectivity, do not read every object")
+    
+    compare = parser.add_argument_group("compare")
+    compare.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="Show what changed between two backups")
+    compare.add_argument("--json", action="store_true", help="Print the comparison as JSON")
+    compare.add_argument("--include-git", action="store_true", help="Count .git contents when comparing files")
+    
+    storage = parser.add_argument_group("object storage (S3-compatible)")
+    storage.add_argument("--upload", action="store_true", help="Upload each finished archive and its manifest (GUI and headless)")
+    storage.add_argument("--upload-files", nargs="+", metavar="PATH", help="Upload existing archives or volume folders (resumes interrupted uploads) and exit")
+    storage.add_argument("--s3-endpoint", metavar="URL", help="e.g. https://s3.eu-central-1.amazonaws.com or http://localhost:9000")
+    storage.add_argument("--s3-bucket", metavar="NAME")
+    storage.add_argument("--s3-prefix", metavar="PREFIX", help="Key prefix, e.g. backups/")
+    storage.add_argument("--s3-region", metavar="REGION")
+    
+    # Unbekannte Argumente bleiben für Qt (z.B. -platform)
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+
+def build_jobs(args: argparse.Namespace, logger: Logger):
+    """
+    Erzeugt die BackupJobs einer Headless-Batch (als Generator).
+    
+    Args:
+        args (argparse.Namespace): Die geparsten Argumente
+        logger (Logger): Logger-Instanz für die Jobs
+    
+    Yields:
+        BackupJob: Ein Job pro Repository
+    """
+    from src.core.backup_job import BackupJob
+    from src.core.profile_store import ProfileStore
+    from src.core.repo_importer import RepositoryImporter, normalize_url, folder_name_from_url
+    
+    if args.profiles:
+        store = ProfileStore(logger=logger)
+        try:
+            for profile in store.iter_profiles():
+                job = profile.to_job(logger)
+                if args.replicate:
+                    job.replicate_targets = args.replicate
+                if args.reproducible:
+                    job.reproducible = True
+                yield job
+        finally:
+            store.close()
+        return
+    
+    for url, folder_name, target_path in RepositoryImporter(None, logger).iter_file(args.batch):
+        url, _ = normalize_url(url)
+        yield BackupJob(
+            url,
+            folder_name or folder_name_from_url(url),
+            target_path or args.target,
+            add_backup=args.timestamp,
+            create_zip=args.zip,
+            archive_format=args.format,
+            git_mode=args.git_mode,
+            reproducible=args.reproducible,
+            submodules=not args.no_submodules,
+            replicate_targets=args.replicate,
+            logger=logger
+        )
+
+
+def run_headless(args: argparse.Namespace) -> int:
+    """
+    Führt eine Batch ohne GUI aus und gibt pro Repository eine Zeile aus.
+    
+    Args:
+        args (argparse.Namespace): Die geparsten Argumente
+    
+    Returns:
+        int: Exit-Code (0 = alle erfolgreich, 1 = mindestens ein Fehler, 2 = Aufruf-/Platzfehler)
+    """
+    if not args.profiles and not (args.batch and args.target):
+        print("--headless needs --profiles or --batch FILE --target DIR", file=sys.stderr)
+        return 2
+    from src.core.disk_space import DiskSpaceChecker
+    from src.core.job_history import JobHistory, BatchEstimator
+    from src.core.pipeline import BackupPipeline
+    
+    logger = Logger()
+    jobs = build_jobs(args, logger)
+    if args.predict:
+        return run_predict(jobs, args)
+    if not args.skip_preflight:
+        # Die ganze Batch vorab prüfen, statt nach Stunden an I/O abzubrechen
+        jobs = list(jobs)
+        success, msg = DiskSpaceChecker(logger).check_batch([(job.target_path, job.estimate_size()) for job in jobs])
+        print(msg, file=sys.stderr)
+        if not success:
+            return 2
+    
+    history = JobHistory(logger=logger)
+    estimator = BatchEstimator(history, pipeline_workers(args))
+    if isinstance(jobs, list):
+        for job in jobs:
+            estimator.add(job)
+        print_batch_eta(estimator)
+    else:
+        jobs = estimate_lazily(jobs, estimator)
+    
+    def on_result(job: "BackupJob", success: bool, message: str) -> None:
+        print(f"{'OK' if success else 'FAILED'}\t{job.github_url}\t{message.strip()}", flush=True)
+        if success:
+            history.record(job)
+        estimator.finish(job)
+        print_batch_eta(estimator)
+    
+    pipeline = BackupPipeline(
+        clone_workers=max(1, args.clone_workers),
+        archive_workers=max(1, args.archive_workers),
+        post_workers=max(1, args.post_workers),
+        post_processors=post_processors(args, logger),
+        logger=logger
+    )
+    # Ein Fortschritts-Empfänger lässt die Jobs den Git-Fortschritt auswerten (für die Restdauer)
+    counts = pipeline.run(jobs, on_result=on_result, progress=lambda job, phase, percent, rate: None)
+    history.close()
+    stages = ", ".join(f"{stage} {seconds:.1f}s" for stage, seconds in pipeline.busy_seconds.items())
+    print(f"{counts['finished']} finished, {counts['failed']} failed (busy: {stages})", file=sys.stderr)
+    return 1 if counts['failed'] else 0
+
+
+def post_processors(args: argparse.Namespace, logger: Logger) -> list:
+    """
+    Schritte der Nachbearbeitungs-Stufe: erst die Wartung, dann die Prüfung des Ergebnisses.
+    
+    Args:
+        args (argparse.Namespace): Die geparsten Argumente
+        logger (Logger): Logger-Instanz
+    
+    Returns:
+        list: Callables für BackupPipeline(post_processors=...)
+    """
+    steps = []
+    if args.maintenance:
+        from src.core.maintenance import MaintenanceManager
+        steps.append(MaintenanceManager(logger).post_process)
+    if args.integrity:
+        from src.core.integrity import IntegrityChecker
+        steps.append(IntegrityChecker(logger, full=not args.quick).post_process)
+    return steps
+
+
+def pipeline_workers(args: argparse.Namespace) -> dict:
+    """
+    Threads pro gemessener Stufe, wie sie die BackupPipeline verwendet.
+    
+    Args:
+        args (argparse.Namespace): Die geparsten Argumente
+    
+    Returns:
+        dict: Stufe -> Anzahl Threads (die Replikation läuft in der Nachbearbeitung)
+    """
+    return {
+        "clone": max(1, args.clone_workers),
+        "archive": max(1, args.archive_workers),
+        "replicate": max(1, args.post_workers),
+    }
+
+
+def estimate_lazily(jobs, estimator: "BatchEstimator"):
+    """
+    Nimmt Jobs erst in die Schätzung auf, wenn die Pipeline sie liest (ohne Preflight).
+    
+    Args:
+        jobs (Iterable[BackupJob]): Die Jobs
+        estimator (BatchEstimator): Die Schätzung der Batch
+    
+    Yields:
+        BackupJob: Die unveränderten Jobs
+    """
+    for job in jobs:
+        estimator.add(job)
+        yield job
+
+
+def print_batch_eta(estimator: "BatchEstimator") -> None:
+    """
+    Gibt Fortschritt und Restdauer der Batch auf stderr aus.
+    
+    Args:
+        estimator (BatchEstimator): Die Schätzung der Batch
+    """
+    from src.core.job_history import format_duration
+    
+    remaining = estimator.remaining()
+    eta = f"~{format_duration(remaining)}" if remaining is not None else "unknown (no history yet)"
+    unknown = f", {estimator.unknown} without history" if estimator.unknown else ""
+    print(f"[{estimator.finished}/{estimator.jobs}] remaining {eta}{unknown}", file=sys.stderr, flush=True)
+
+
+def run_predict(jobs, args: argparse.Namespace) -> int:
+    """
+    Gibt die vorhergesagte Dauer jedes Jobs und der ganzen Batch aus, ohne etwas zu sichern.
+    
+    Args:
+        jobs (Iterable[BackupJob]): Die Jobs
+        args (argparse.Namespace): Die geparsten Argumente
+    
+    Returns:
+        int: Exit-Code (0 = alle schätzbar, 1 = mindestens ein Repository ohne jede Vorhersage)
+    """
+    from src.core.disk_space import format_size
+    from src.core.job_history import JobHistory, BatchEstimator, format_duration
+    
+    history = JobHistory()
+    estimator = BatchEstimator(history, pipeline_workers(args))
+    missing = 0
+    for job in jobs:
+        prediction = estimator.add(job)
+        if prediction is None:
+            missing += 1
+            print(f"{job.github_url}\tunknown", flush=True)
+            continue
+        source = "history" if prediction["known"] else "average"
+        throughput = ""
+        if prediction["pack_bytes"] and prediction["clone"]:
+            throughput = f"\t{format_size(prediction['pack_bytes'])} at {format_size(prediction['pack_bytes'] / prediction['clone'])}/s"
+        print(f"{job.github_url}\t{format_duration(prediction['total'])}\t{source}{throughput}", flush=True)
+    history.close()
+    print_batch_eta(estimator)
+    return 1 if missing else 0
+
+
+def run_restore(args: argparse.Namespace) -> int:
+    """
+    Stellt ein Backup ohne GUI wieder her.
+    
+    Args:
+        args (argparse.Namespace): Die geparsten Argumente
+    
+    Returns:
+        int: Exit-Code (0 = erfolgreich, 1 = Fehler, 2 = Aufruffehler)
+    """
+    if not args.destination:
+        print("--restore needs --destination DIR", file=sys.stderr)
+        return 2
+    from src.core.restore import RestoreManager
+    
+    restore_manager = RestoreManager(Logger())
+    source = args.restore
+    if args.snapshot:
+        source = restore_manager.find_snapshot(os.path.dirname(source) or ".", os.path.basename(source), args.snapshot)
+        if source is None:
+            print(f"No backup matches {args.snapshot} for {args.restore}", file=sys.stderr)
+            return 2
+    
+    success, message = restore_manager.restore(source, args.destination, path=args.path, verify=not args.no_verify)
+    print(message, file=sys.stdout if success else sys.stderr)
+    return 0 if success else 1
+
+
+def run_maintenance(args: argparse.Namespace) -> int:
+    """
+    Wartet die gespeicherten Clones eines Verzeichnisses.
+    
+    Args:
+        args (argparse.Namespace): Die geparsten Argumente
+    
+    Returns:
+        int: Exit-Code (0 = erfolgreich, 1 = Fehler)
+    """
+    from src.core.maintenance import MaintenanceManager
+    
+    manager = MaintenanceManager(Logger())
+    repositories = manager.find_repositories(args.maintain)
+    success, message = manager.maintain(
+        repositories,
+        force=args.force,
+        progress=lambda done, total: print(f"{done}/{total}", file=sys.stderr, flush=True)
+    )
+    print(message, file=sys.stdout if success else sys.stderr)
+    return 0 if success else 1
+
+
+def run_integrity(args: argparse.Namespace) -> int:
+    """
+    Prüft die gespeicherten Clones eines Verzeichnisses innerhalb des Zeitbudgets.
+    
+    Args:
+        args (argparse.Namespace): Die geparsten Argumente
+    
+    Returns:
+        int: Exit-Code (0 = alle geprüften intakt, 1 = Beschädigung gefunden)
+    """
+    from src.core.integrity import IntegrityChecker
+    
+    checker = IntegrityChecker(Logger(), full=not args.quick)
+    repositories = checker.find_repositories(args.check_integrity)
+    success, message = checker.check(
+        repositories,
+        budget_minutes=args.budget,
+        progress=lambda done, total: print(f"{done}/{total}", file=sys.stderr, flush=True)
+    )
+    print(message, file=sys.stdout if success else sys.stderr)
+    return 0 if success else 1
+
+
+def run_compare(args: argparse.Namespace) -> int:
+    """
+    Vergleicht zwei Backups und gibt die Änderungen aus.
+    
+    Args:
+        args (argparse.Namespace): Die geparsten Argumente
+    
+    Returns:
+        int: Exit-Code (0 = verglichen, 1 = Fehler)
+    """
+    from src.core.backup_diff import BackupComparer
+    
+    diff, message = BackupComparer(Logger()).compare(*args.compare, include_git=args.include_git)
+    if diff is None:
+        print(message, file=sys.stderr)
+        return 1
+    
+    if args.json:
+        print(json.dumps(diff.to_dict(), indent=1))
+        return 0
+    for prefix, paths in (("+", diff.added), ("-", diff.removed), ("M", diff.modified)):
+        for path in sorted(paths):
+            print(f"{prefix} {path}")
+    print(message)
+    return 0
+
+
+def run_upload(args: argparse.Namespace) -> int:
+    """
+    Lädt vorhandene Archive in den Object Storage hoch.
+    
+    Args:
+        args (argparse.Namespace): Die geparsten Argumente
+    
+    Returns:
+        int: Exit-Code (0 = erfolgreich, 1 = Fehler, 2 = Aufruffehler)
+    """
+    missing = [path for path in args.upload_files if not os.path.exists(path)]
+    if missing:
+        print(f"Not found: {', '.join(missing)}", file=sys.stderr)
+        return 2
+    from src.core.object_storage import S3Uploader
+    
+    try:
+        uploader = S3Uploader(logger=Logger())
+    except ValueError as e:
+        print(f"{str(e)} (see --s3-endpoint, --s3-bucket)", file=sys.stderr)
+        return 2
+    
+    success, message = uploader.upload(args.upload_files)
+    print(message, file=sys.stdout if success else sys.stderr)
+    return 0 if success else 1
+
+
 def main() -> None:
     """Haupteinstiegspunkt der Anwendung."""
+    args = parse_args(sys.argv[1:])
+    if args.generate_key:
+        from src.core.encryption import generate_key
+        success, message = generate_key(args.generate_key)
+        print(message, file=sys.stdout if success else sys.stderr)
+        sys.exit(0 if success else 1)
+    if args.key_file:
+        ENCRYPTION['key_file'] = args.key_file
+    if args.volume_size:
+        ARCHIVE['volume_size'] = args.volume_size * 1024 * 1024
+    if args.exclude:
+        ARCHIVE['exclude'] = ARCHIVE['exclude'] + args.exclude
+    if args.profile_jobs:
+        # Gilt für alle danach erstellten BackupJobs (GUI, JobQueue, Pipeline)
+        PROFILING['enabled'] = True
+        PROFILING['directory'] = args.profile_jobs
+    for name in ("endpoint", "bucket", "prefix", "region"):
+        if getattr(args, f"s3_{name}") is not None:
+            OBJECT_STORAGE[name] = getattr(args, f"s3_{name}")
+    if args.upload:
+        OBJECT_STORAGE['enabled'] = True
+    if args.upload_files:
+        sys.exit(run_upload(args))
+    if args.headless:
+        sys.exit(run_headless(args))
+    if args.restore:
+        sys.exit(run_restore(args))
+    if args.compare:
+        sys.exit(run_compare(args))
+    if args.maintain:
+        sys.exit(run_maintenance(args))
+    if args.check_integrity:
+        sys.exit(run_integrity(args))
+    
+    from PySide6.QtWidgets import QApplication
+    from src.core.startup_profiler import StartupProfiler
+    from src.ui.main_window import GitBackupToolPro
+    
+    profiler = StartupProfiler(enabled=args.profile_startup, start_time=STARTUP_TIME)
+    profiler.mark("imports")
+    
     # QApplication erstellen
     app = QApplication(sys.argv)
     
     # Fusion-Style setzen (Cross-Platform)
     app.setStyle("Fusion")
+    profiler.mark("qapplication")
     
     # Dark-Palette anwenden
     setup_dark_palette(app)
+    profiler.mark("palette")
     
     # Hauptfenster erstellen und anzeigen
-    window = GitBackupToolPro()
+    window = GitBackupToolPro(profiler=profiler)
     window.show()
+    profiler.mark("show")
+    
+    if args.profile_startup:
+        window.startup_finished.connect(lambda: print(profiler.report(), file=sys.stderr))
     
     # Event-Loop starten
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
-    main()
+    main()
\ No newline at end of file
@@ -3,11 +3,75 @@
 """
 Core-Modul für GitBackupTool Pro.
 Enthält alle Business-Logik Komponenten.
+
+Die Klassen werden erst beim ersten Zugriff aus ihrem Modul geladen, damit
+``import src.core`` nicht jede Funktion (Object Storage, Verschlüsselung,
+Restore, ...) vor dem ersten Frame bzw. vor der Argument-Auswertung lädt.
 """
 
-from .logger import Logger
-from .git_manager import GitManager
-from .file_manager import FileManager
-from .worker import CloneWorker
+import importlib
+
+# Exportierter Name -> Modul
+_EXPORTS = {
+    'Logger': 'logger',
+    'GitManager': 'git_manager',
+    'FileManager': 'file_manager',
+    'ArchiveManager': 'archive_manager',
+    'LogIndex': 'log_index',
+    'BackupJob': 'backup_job',
+    'BackupComparer': 'backup_diff',
+    'BackupDiff': 'backup_diff',
+    'EncryptingWriter': 'encryption',
+    'DecryptingReader': 'encryption',
+    'EncryptionError': 'encryption',
+    'IntegrityChecker': 'integrity',
+    'JobHistory': 'job_history',
+    'BatchEstimator': 'job_history',
+    'JobProfiler': 'job_profiler',
+    'JobQueue': 'job_queue',
+    'JobState': 'job_queue',
+    'MaintenanceManager': 'maintenance',
+    'S3Client': 'object_storage',
+    'S3Uploader': 'object_storage',
+    'StorageError': 'object_storage',
+    'StreamingUpload': 'object_storage',
+    'BackupPipeline': 'pipeline',
+    'ProfileStore': 'profile_store',
+    'RepositoryProfile': 'profile_store',
+    'Replicator': 'replication',
+    'RepositoryImporter': 'repo_importer',
+    'RestoreManager': 'restore',
+    'StartupProfiler': 'startup_profiler',
+    'SubmoduleManager': 'submodules',
+    'TreeWalker': 'tree_walker',
+    'WalkEntry': 'tree_walker',
+    'ImportWorker': 'worker',
+    'RestoreWorker': 'worker',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """
+    Lädt eine exportierte Klasse beim ersten Zugriff (PEP 562).
+    
+    Args:
+        name (str): Name der Klasse
+    
+    Returns:
+        Die Klasse aus ihrem Modul
+    
+    Raises:
+        AttributeError: Wenn der Name nicht exportiert wird
+    """
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ['Logger', 'GitManager', 'FileManager', 'CloneWorker']
+def __dir__():
+    """Exportierte Namen für dir() und Autovervollständigung."""
+    return sorted(list(globals()) + __all__)
\ No newline at end of file
@@ -0,0 +1,1219 @@
+# core/archive_manager.py
+
+"""
+Archiv-Manager für inkrementelle Archive, TAR/Zstandard-Archive und Manifeste.
+Vergleicht den aktuellen Stand mit dem Manifest des letzten Archivs und
+komprimiert nur neue oder geänderte Dateien.
+"""
+
+import os
+import json
+import time
+import glob
+import shutil
+import stat
+import struct
+import hashlib
+import tarfile
+import zipfile
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from config import ARCHIVE
+from .logger import Logger
+from .git_manager import GitManager
+from .throttle import archive_open, zip_write, tar_add, lower_thread_priority
+from .reproducible import ZIP_UNIX_SYSTEM, ZIP_EPOCH, normalized_mode, source_date_epoch, zip_info
+from .encryption import EncryptingWriter, load_key
+from .tree_walker import TreeWalker
+
+try:
+    import zstandard
+except ImportError:  # Optional: Fallback auf das zstd-Kommandozeilentool
+    zstandard = None
+
+
+MANIFEST_VERSION = 1
+
+# Mehrteilige Archive: <quelle>.volumes/part0001.zip ... und index.json
+VOLUME_SUFFIX = ".volumes"
+VOLUME_PREFIX = "part"
+VOLUME_INDEX = "index.json"
+
+# Dateiendung des Archivs pro Format (siehe ARCHIVE_FORMATS)
+ARCHIVE_SUFFIXES = {
+    "zip": ".zip",
+    "tar.zst": ".tar.zst",
+    "tar.enc": ".tar.enc",
+    "volumes": VOLUME_SUFFIX,
+}
+
+
+class ArchiveManager:
+    """
+    Manager für Archiv-Operationen mit Manifest-Unterstützung.
+    
+    Jedes Archiv erhält ein Manifest (``<archiv>.manifest.json``) mit Pfad,
+    Größe und Hash aller Dateien. Über das Manifest des vorherigen Archivs
+    lassen sich unveränderte Dateien erkennen, ohne sie neu zu komprimieren.
+    
+    Pro Speicherort hält ein Index (ARCHIVE['source_index']) fest, aus welchem
+    Commit, Tree und mit welchen Optionen jedes Archiv gebaut wurde. Ergibt ein
+    neuer Clone denselben Stand, wird das vorhandene Archiv per Hardlink
+    übernommen statt neu komprimiert.
+    
+    Attributes:
+        logger (Logger): Logger-Instanz für Logging
+        git_manager (GitManager): Für Repack/Bundle des .git-Verzeichnisses
+        chunk_size (int): Blockgröße für Hashing und Kopieroperationen
+    """
+    
+    # Mehrere Instanzen (parallele Jobs) teilen sich den Index eines Speicherorts
+    _index_lock = threading.Lock()
+    
+    def __init__(self, logger: Logger = None, chunk_size: int = ARCHIVE['chunk_size']) -> None:
+        """
+        Initialisiert den ArchiveManager.
+        
+        Args:
+            logger (Logger): Logger-Instanz. Wenn None, wird eine neue erstellt
+            chunk_size (int): Blockgröße in Bytes. Default aus config.py
+        """
+        self.logger = logger or Logger()
+        self.git_manager = GitManager(self.logger)
+        self.chunk_size = chunk_size
+    
+    # ------------------------------------------------------------------
+    # Manifeste
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def get_manifest_path(archive_path: str) -> str:
+        """
+        Gibt den Pfad des Manifests zu einem Archiv zurück.
+        
+        Args:
+            archive_path (str): Pfad des Archivs
+        
+        Returns:
+            str: Pfad der Manifest-Datei
+        """
+        return f"{archive_path}{ARCHIVE['manifest_suffix']}"
+    
+    def hash_file(self, file_path: str) -> str:
+        """
+        Berechnet den Hash einer Datei blockweise.
+        
+        Args:
+            file_path (str): Pfad der Datei
+        
+        Returns:
+            str: Hex-Digest der Datei
+        """
+        digest = hashlib.new(ARCHIVE['hash_algorithm'])
+        with archive_open(file_path) as f:
+            for block in iter(lambda: f.read(self.chunk_size), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def build_manifest(
+        self,
+        source_folder: str,
+        exclude_git: bool = False,
+        extra_files: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Dict]:
+        """
+        Erstellt die Dateiliste eines Ordners mit Größe und Hash.
+        
+        Args:
+            source_folder (str): Der Quellordner
+            exclude_git (bool): Wenn True, werden .git-Verzeichnisse übersprungen
+            extra_files (Optional[Dict[str, str]]): Zusätzliche Members (Archivname -> Dateipfad)
+        
+        Returns:
+            Dict[str, Dict]: Archivname (mit ``/``) -> {"size", "hash"}
+        """
+        files = {}
+        # Sortiert: die Reihenfolge bestimmt auch die Reihenfolge im Archiv
+        for entry in TreeWalker.for_archive(exclude_git).files(source_folder):
+            files[entry.relpath] = self._manifest_entry(entry.path, entry.stat.st_size if entry.stat else None)
+        for arcname, file_path in sorted((extra_files or {}).items()):
+            files[arcname] = self._manifest_entry(file_path)
+        return files
+    
+    def _manifest_entry(self, file_path: str, size: Optional[int] = None) -> Dict:
+        """
+        Erstellt den Manifest-Eintrag einer Datei.
+        
+        Args:
+            file_path (str): Pfad der Datei
+            size (Optional[int]): Bereits bekannte Größe (z.B. aus TreeWalker), sonst per stat
+        
+        Returns:
+            Dict: {"size", "hash"}
+        """
+        return {
+            "size": os.path.getsize(file_path) if size is None else size,
+            "hash": self.hash_file(file_path),
+        }
+    
+    def load_manifest(self, archive_path: str) -> Dict:
+        """
+        Lädt das Manifest eines Archivs (bei Volumes: index.json).
+        
+        Args:
+            archive_path (str): Pfad des Archivs oder Volume-Ordners
+        
+        Returns:
+            Dict: Das Manifest oder leeres Dict wenn nicht vorhanden/ungültig
+        """
+        if self.is_volume_archive(archive_path):
+            manifest_path = os.path.join(archive_path, VOLUME_INDEX)
+        else:
+            manifest_path = self.get_manifest_path(archive_path)
+        try:
+            if not os.path.exists(manifest_path):
+                return {}
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get("version") != MANIFEST_VERSION:
+                self.logger.warning(f"Unsupported manifest version: {manifest_path}")
+                return {}
+            return manifest
+        except json.JSONDecodeError:
+            self.logger.warning(f"Invalid JSON in manifest: {manifest_path}")
+            return {}
+        except Exception as e:
+            self.logger.error(f"Error loading manifest: {str(e)}")
+            return {}
+    
+    def save_manifest(self, archive_path: str, manifest: Dict) -> None:
+        """
+        Speichert das Manifest eines Archivs atomar.
+        
+        Args:
+            archive_path (str): Pfad des Archivs
+            manifest (Dict): Das zu speichernde Manifest
+        """
+        manifest_path = self.get_manifest_path(archive_path)
+        temp_path = f"{manifest_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=1, ensure_ascii=False)
+        os.replace(temp_path, manifest_path)
+    
+    @staticmethod
+    def diff_manifests(old_files: Dict[str, Dict], new_files: Dict[str, Dict]) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Vergleicht zwei Dateilisten nach Pfad, Größe und Hash.
+        
+        Args:
+            old_files (Dict[str, Dict]): Dateiliste des alten Manifests
+            new_files (Dict[str, Dict]): Dateiliste des neuen Manifests
+        
+        Returns:
+            Tuple[List[str], List[str], List[str]]: (unverändert, neu/geändert, gelöscht)
+        """
+        unchanged, changed = [], []
+        for path, entry in new_files.items():
+            old = old_files.get(path)
+            if old and old.get("size") == entry["size"] and old.get("hash") == entry["hash"]:
+                unchanged.append(path)
+            else:
+                changed.append(path)
+        deleted = [path for path in old_files if path not in new_files]
+        return unchanged, changed, deleted
+    
+    def find_previous_archive(self, directory: str, folder_name: str, exclude: Optional[str] = None) -> Optional[str]:
+        """
+        Sucht das neueste Archiv mit Manifest für einen Ordnernamen.
+        
+        Berücksichtigt ``<name>.zip`` sowie Zeitstempel-Backups
+        ``<name>_backup_YYYYMMDD_HHMMSS.zip``.
+        
+        Args:
+            directory (str): Verzeichnis, in dem die Archive liegen
+            folder_name (str): Basis-Ordnername des Repositories
+            exclude (Optional[str]): Archivpfad, der ignoriert werden soll
+        
+        Returns:
+            Optional[str]: Pfad des vorherigen Archivs oder None
+        """
+        candidates = [os.path.join(directory, f"{folder_name}.zip")]
+        candidates += glob.glob(os.path.join(glob.escape(directory), f"{glob.escape(folder_name)}_backup_*.zip"))
+        
+        found = []
+        for candidate in candidates:
+            if exclude and os.path.abspath(candidate) == os.path.abspath(exclude):
+                continue
+            manifest = self.load_manifest(candidate)
+            if manifest and os.path.exists(candidate):
+                found.append((manifest.get("created", ""), candidate))
+        
+        if not found:
+            return None
+        previous = max(found)[1]
+        self.logger.debug(f"Previous archive found: {previous}")
+        return previous
+    
+    # ------------------------------------------------------------------
+    # Wiederverwendung unveränderter Archive
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def archive_path(source_folder: str, archive_format: str) -> str:
+        """
+        Standard-Pfad des Archivs eines Ordners (wie in den create_*-Methoden).
+        
+        Args:
+            source_folder (str): Der zu archivierende Ordner
+            archive_format (str): Schlüssel aus ARCHIVE_FORMATS
+        
+        Returns:
+            str: Pfad der Archivdatei bzw. des Volume-Ordners
+        """
+        return f"{source_folder}{ARCHIVE_SUFFIXES.get(archive_format, '.zip')}"
+    
+    @staticmethod
+    def partial_path(archive_path: str) -> str:
+        """
+        Temporäre Datei, in die tar.zst- und tar.enc-Archive geschrieben werden,
+        bevor sie unter archive_path erscheinen.
+        
+        Args:
+            archive_path (str): Pfad des fertigen Archivs
+        
+        Returns:
+            str: Pfad der temporären Datei
+        """
+        return f"{archive_path}.tmp"
+    
+    def archive_source(self, source_folder: str, git_mode: str, options: Dict) -> Optional[Dict]:
+        """
+        Beschreibt den Stand, aus dem ein Archiv gebaut wird.
+        
+        Der Tree bestimmt die Dateien im Arbeitsverzeichnis (inklusive der
+        Submodul-Commits). Wird .git mitarchiviert, gehört auch die Prüfsumme
+        aller Refs dazu, da weitere Branches und Tags im Archiv landen.
+        
+        Args:
+            source_folder (str): Der geklonte Ordner
+            git_mode (str): Behandlung des .git-Verzeichnisses (siehe GIT_ARCHIVE_MODES)
+            options (Dict): Archiv-Optionen, die das Ergebnis beeinflussen (Format, Modi, ...)
+        
+        Returns:
+            Optional[Dict]: {"commit", "tree", "refs", "options"} oder None (kein lesbares Repository)
+        """
+        ids = self.git_manager.head_ids(source_folder)
+        if ids is None:
+            return None
+        refs = None
+        if git_mode != "exclude":
+            refs = self.git_manager.refs_fingerprint(source_folder)
+            if refs is None:
+                return None
+        return {"commit": ids[0], "tree": ids[1], "refs": refs, "options": dict(options, git_mode=git_mode)}
+    
+    def find_reusable_archive(self, directory: str, source: Dict) -> Optional[str]:
+        """
+        Sucht im Index eines Speicherorts das neueste Archiv mit gleichem Stand.
+        
+        Args:
+            directory (str): Verzeichnis, in dem die Archive liegen
+            source (Dict): Rückgabe von archive_source
+        
+        Returns:
+            Optional[str]: Pfad des Archivs oder None
+        """
+        with self._index_lock:
+            index = self._load_index(directory)
+        matches = [
+            (entry.get("created", ""), os.path.join(directory, name))
+            for name, entry in index.items()
+            if self._same_source(entry, source) and os.path.exists(os.path.join(directory, name))
+        ]
+        if not matches:
+            return None
+        previous = max(matches)[1]
+        self.logger.debug(f"Unchanged archive found: {previous}")
+        return previous
+    
+    def reuse_archive(self, previous: str, output_path: str) -> Tuple[bool, str]:
+        """
+        Übernimmt ein vorhandenes Archiv (samt Manifest) per Hardlink.
+        Wo keine Hardlinks möglich sind, wird kopiert - auch das spart das Komprimieren.
+        
+        Args:
+            previous (str): Vorhandenes Archiv mit gleichem Stand
+            output_path (str): Pfad des neuen Archivs
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Pfad des Archivs oder Fehlermeldung)
+        """
+        if os.path.abspath(previous) == os.path.abspath(output_path):
+            self.logger.info(f"Archive unchanged: {output_path}")
+            return True, output_path
+        
+        temp_path = f"{output_path}.tmp"
+        try:
+            if os.path.isdir(previous):
+                if os.path.exists(temp_path):
+                    shutil.rmtree(temp_path)
+                os.makedirs(temp_path)
+                for name in os.listdir(previous):
+                    self._link_or_copy(os.path.join(previous, name), os.path.join(temp_path, name))
+                if os.path.exists(output_path):
+                    shutil.rmtree(output_path)
+            else:
+                self._link_or_copy(previous, temp_path)
+                # Manifest mitnehmen, damit inkrementelle Archive darauf aufbauen können
+                manifest_path = self.get_manifest_path(output_path)
+                if os.path.exists(self.get_manifest_path(previous)):
+                    self._link_or_copy(self.get_manifest_path(previous), f"{manifest_path}.tmp")
+                    os.replace(f"{manifest_path}.tmp", manifest_path)
+                elif os.path.exists(manifest_path):
+                    os.remove(manifest_path)
+            os.replace(temp_path, output_path)
+            
+            msg = f"Archive reused: {output_path} (unchanged since {os.path.basename(previous)})"
+            self.logger.success(msg)
+            return True, output_path
+        except OSError as e:
+            msg = f"Error reusing archive {previous}: {str(e)}"
+            self.logger.error(msg)
+            return False, msg
+        finally:
+            if os.path.isdir(temp_path):
+                shutil.rmtree(temp_path, ignore_errors=True)
+            else:
+                self._remove_partial(temp_path)
+    
+    def record_archive(self, archive_path: str, source: Dict) -> None:
+        """
+        Trägt ein fertiges Archiv mit seinem Stand in den Index seines Speicherorts ein.
+        Einträge gelöschter Archive werden dabei entfernt.
+        
+        Args:
+            archive_path (str): Pfad des Archivs
+            source (Dict): Rückgabe von archive_source
+        """
+        directory = os.path.dirname(os.path.abspath(archive_path))
+        try:
+            with self._index_lock:
+                # Neu laden, damit parallele Jobs sich nicht überschreiben
+                index = {
+                    name: entry for name, entry in self._load_index(directory).items()
+                    if os.path.exists(os.path.join(directory, name))
+                }
+                index[os.path.basename(archive_path)] = dict(source, created=datetime.now().isoformat())
+                self._save_index(directory, index)
+        except OSError as e:
+            self.logger.warning(f"Could not update archive index in {directory}: {str(e)}")
+    
+    @staticmethod
+    def unshare_archive(archive_path: str) -> None:
+        """
+        Löst einen Hardlink auf ein vorhandenes Archiv, bevor es neu geschrieben wird.
+        Sonst würde das Überschreiben auch das wiederverwendete Original ändern.
+        
+        Args:
+            archive_path (str): Pfad des zu schreibenden Archivs
+        """
+        if os.path.isfile(archive_path) and os.stat(archive_path).st_nlink > 1:
+            os.remove(archive_path)
+    
+    @staticmethod
+    def _same_source(entry: Dict, source: Dict) -> bool:
+        """
+        Ob ein Index-Eintrag denselben Stand beschreibt.
+        
+        Args:
+            entry (Dict): Eintrag aus dem Index
+            source (Dict): Rückgabe von archive_source
+        
+        Returns:
+            bool: True bei gleichem Tree, gleichen Refs und gleichen Optionen
+        """
+        return all(entry.get(key) == source[key] for key in ("tree", "refs", "options"))
+    
+    @staticmethod
+    def _link_or_copy(source: str, target: str) -> None:
+        """
+        Legt einen Hardlink an, sonst (z.B. FAT, SMB) eine Kopie.
+        
+        Args:
+            source (str): Vorhandene Datei
+            target (str): Neuer Pfad (darf nicht existieren, außer als Rest eines Abbruchs)
+        """
+        if os.path.lexists(target):
+            os.remove(target)
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+    
+    @staticmethod
+    def _load_index(directory: str) -> Dict[str, Dict]:
+        """
+        Lädt den Archiv-Index eines Speicherorts.
+        
+        Args:
+            directory (str): Verzeichnis der Archive
+        
+        Returns:
+            Dict[str, Dict]: Archivname -> Stand, leer wenn nicht vorhanden/ungültig
+        """
+        try:
+            with open(os.path.join(directory, ARCHIVE['source_index']), 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    @staticmethod
+    def _save_index(directory: str, index: Dict[str, Dict]) -> None:
+        """
+        Speichert den Archiv-Index eines Speicherorts atomar.
+        
+        Args:
+            directory (str): Verzeichnis der Archive
+            index (Dict[str, Dict]): Archivname -> Stand
+        """
+        index_path = os.path.join(directory, ARCHIVE['source_index'])
+        temp_path = f"{index_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=1, sort_keys=True)
+        os.replace(temp_path, index_path)
+    
+    # ------------------------------------------------------------------
+    # .git-Verzeichnis
+    # ------------------------------------------------------------------
+    
+    def prepare_git_directory(self, source_folder: str, git_mode: str = ARCHIVE['git_mode']) -> Tuple[bool, Dict[str, str]]:
+        """
+        Bereitet das .git-Verzeichnis eines Klons für die Archivierung vor.
+        
+        Modi:
+            - ``include``: .git wird unverändert archiviert
+            - ``exclude``: .git wird nicht archiviert
+            - ``repack``: Alle Objekte werden vorher in ein einzelnes Pack gepackt
+            - ``bundle``: .git wird durch ein einzelnes Git-Bundle als Member ersetzt
+        
+        Ausgecheckte Submodule werden ebenfalls umgepackt bzw. als eigenes Bundle
+        (``<Submodul-Pfad>/repository.bundle``) abgelegt.
+        
+        Schlägt Repack oder Bundle fehl, wird .git unverändert archiviert.
+        
+        Args:
+            source_folder (str): Der geklonte Ordner
+            git_mode (str): Schlüssel aus GIT_ARCHIVE_MODES. Default aus config.py
+        
+        Returns:
+            Tuple[bool, Dict[str, str]]: (exclude_git, extra_files) für die Archiv-Methoden
+        """
+        if git_mode == "exclude":
+            return True, {}
+        
+        if not os.path.isdir(os.path.join(source_folder, '.git')) or git_mode == "include":
+            return False, {}
+        
+        # Submodule liegen unter .git/modules und werden genauso behandelt
+        submodules = self.git_manager.submodule_paths(source_folder)
+        
+        if git_mode == "repack":
+            for path in [""] + submodules:
+                self.git_manager.repack(os.path.join(source_folder, path))
+            return False, {}
+        
+        if git_mode == "bundle":
+            extra_files = {}
+            for path in [""] + submodules:
+                # Ein Bundle pro (Sub-)Repository, im Archiv neben dessen Dateien
+                member = '/'.join(filter(None, [path.replace(os.sep, '/'), ARCHIVE['bundle_member']]))
+                bundle_path = f"{source_folder}.{len(extra_files)}.bundle"
+                success, _ = self.git_manager.create_bundle(os.path.join(source_folder, path), bundle_path)
+                if not success:
+                    self.cleanup_git_directory(extra_files)
+                    self.logger.warning("Bundle creation failed, archiving .git as-is")
+                    return False, {}
+                extra_files[member] = bundle_path
+            return True, extra_files
+        
+        self.logger.warning(f"Unknown .git archive mode: {git_mode}, archiving .git as-is")
+        return False, {}
+    
+    def cleanup_git_directory(self, extra_files: Dict[str, str]) -> None:
+        """
+        Entfernt temporäre Dateien aus prepare_git_directory (z.B. das Bundle).
+        
+        Args:
+            extra_files (Dict[str, str]): Rückgabe von prepare_git_directory
+        """
+        for file_path in extra_files.values():
+            self._remove_partial(file_path)
+    
+    def source_date_epoch(self, source_folder: str) -> int:
+        """
+        Fester Zeitstempel für reproduzierbare Archive eines Klons.
+        
+        Args:
+            source_folder (str): Der geklonte Ordner
+        
+        Returns:
+            int: SOURCE_DATE_EPOCH, sonst Commit-Zeit von HEAD, sonst 1980-01-01
+        """
+        return source_date_epoch(self.git_manager.head_commit_time(source_folder))
+    
+    # ------------------------------------------------------------------
+    # Inkrementelle ZIP-Archive
+    # ------------------------------------------------------------------
+    
+    def create_incremental_zip_archive(
+        self,
+        source_folder: str,
+        output_zip: Optional[str] = None,
+        previous_zip: Optional[str] = None,
+        mode: str = ARCHIVE['incremental_mode'],
+        exclude_git: bool = False,
+        extra_files: Optional[Dict[str, str]] = None,
+        mtime: Optional[int] = None
+    ) -> Tuple[bool, str]:
+        """
+        Erstellt ein ZIP-Archiv, das nur neue oder geänderte Dateien komprimiert.
+        
+        Modi:
+            - ``merged``: Vollständiges Archiv. Unveränderte Einträge werden
+              byteweise (bereits komprimiert) aus den vorherigen Archiven übernommen.
+            - ``delta``: Archiv enthält nur neue/geänderte Dateien. Das Manifest
+              verweist für unveränderte Dateien auf das Archiv, das sie enthält.
+        
+        Ohne vorheriges Archiv wird ein vollständiges Archiv erstellt.
+        
+        Args:
+            source_folder (str): Der Quellordner
+            output_zip (Optional[str]): Der Pfad der ZIP-Datei.
+                                       Wenn None, wird [source_folder].zip verwendet
+            previous_zip (Optional[str]): Das vorherige Archiv mit Manifest
+            mode (str): "merged" oder "delta". Default aus config.py
+            exclude_git (bool): Wenn True, werden .git-Verzeichnisse übersprungen
+            extra_files (Optional[Dict[str, str]]): Zusätzliche Members (Archivname -> Dateipfad)
+            mtime (Optional[int]): Fester Zeitstempel für ein reproduzierbares Archiv, auch für
+                                  übernommene Members (siehe source_date_epoch)
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Pfad oder Fehlermeldung)
+        """
+        if not output_zip:
+            output_zip = f"{source_folder}.zip"
+        if mode not in ("merged", "delta"):
+            msg = f"Unknown incremental archive mode: {mode}"
+            self.logger.error(msg)
+            return False, msg
+        
+        temp_zip = f"{output_zip}.tmp"
+        try:
+            if not os.path.isdir(source_folder):
+                msg = f"Source folder does not exist: {source_folder}"
+                self.logger.error(msg)
+                return False, msg
+            
+            previous_manifest = self.load_manifest(previous_zip) if previous_zip else {}
+            previous_files = previous_manifest.get("files", {})
+            
+            # Ein Delta darf sein eigenes Basis-Archiv nicht überschreiben
+            if mode == "delta" and previous_zip and os.path.abspath(previous_zip) == os.path.abspath(output_zip):
+                self.logger.info("Delta archive would replace its base, writing merged archive instead")
+                mode = "merged"
+            if not previous_files:
+                mode = "full"
+            
+            self.logger.info(f"Creating {mode} ZIP archive: {output_zip}")
+            
+            extra_files = extra_files or {}
+            new_files = self.build_manifest(source_folder, exclude_git, extra_files)
+            unchanged, _, deleted = self.diff_manifests(previous_files, new_files)
+            archive_name = os.path.basename(output_zip)
+            archive_dir = os.path.dirname(os.path.abspath(output_zip))
+            previous_dir = os.path.dirname(os.path.abspath(previous_zip)) if previous_zip else archive_dir
+            
+            # Herkunft unveränderter Einträge: Archiv, das das Member tatsächlich enthält
+            sources = {}
+            for path in unchanged:
+                origin = previous_files[path].get("archive") or os.path.basename(previous_zip)
+                origin_path = os.path.join(previous_dir, origin)
+                if os.path.exists(origin_path):
+                    sources[path] = origin_path
+            
+            reused = compressed = 0
+            open_sources: Dict[str, zipfile.ZipFile] = {}
+            try:
+                with archive_open(temp_zip, 'wb') as output, zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                    for arcname in new_files:
+                        if arcname in sources and mode == "delta":
+                            new_files[arcname]["archive"] = os.path.relpath(sources[arcname], archive_dir)
+                            continue
+                        if arcname in sources and self._copy_member(sources[arcname], arcname, zipf, open_sources, mtime):
+                            reused += 1
+                        else:
+                            file_path = extra_files.get(arcname) or os.path.join(source_folder, *arcname.split('/'))
+                            zip_write(zipf, file_path, arcname, mtime)
+                            compressed += 1
+                        new_files[arcname]["archive"] = archive_name
+            finally:
+                for source_zip in open_sources.values():
+                    source_zip.close()
+            
+            os.replace(temp_zip, output_zip)
+            self.save_manifest(output_zip, {
+                "version": MANIFEST_VERSION,
+                "created": datetime.now().isoformat(),
+                "mode": mode,
+                "base_archive": os.path.basename(previous_zip) if previous_zip and mode != "full" else None,
+                "deleted": deleted,
+                "files": new_files,
+            })
+            
+            zip_size = os.path.getsize(output_zip)
+            msg = (
+                f"ZIP archive created: {output_zip} ({zip_size / (1024*1024):.2f} MB, "
+                f"{compressed} compressed, {reused} reused, {len(deleted)} deleted)"
+            )
+            self.logger.success(msg)
+            return True, output_zip
+        
+        except PermissionError:
+            msg = f"Permission denied creating ZIP: {output_zip}"
+            self.logger.error(msg)
+            return False, msg
+        except Exception as e:
+            msg = f"Error creating incremental ZIP archive: {str(e)}"
+            self.logger.error(msg)
+            return False, msg
+        finally:
+            if os.path.exists(temp_zip):
+                os.remove(temp_zip)
+    
+    def _copy_member(
+        self,
+        source_path: str,
+        arcname: str,
+        target_zip: zipfile.ZipFile,
+        open_sources: Dict[str, zipfile.ZipFile],
+        mtime: Optional[int] = None
+    ) -> bool:
+        """
+        Übernimmt ein komprimiertes Member byteweise in ein anderes Archiv.
+        
+        Args:
+            source_path (str): Pfad des Quellarchivs
+            arcname (str): Name des Members
+            target_zip (zipfile.ZipFile): Das Zielarchiv (im Schreibmodus)
+            open_sources (Dict[str, zipfile.ZipFile]): Cache geöffneter Quellarchive
+            mtime (Optional[int]): Zeitstempel und Rechte wie bei neu komprimierten Members normalisieren
+        
+        Returns:
+            bool: True wenn übernommen, False wenn das Member nicht verfügbar ist
+        """
+        try:
+            source_zip = open_sources.get(source_path)
+            if source_zip is None:
+                source_zip = zipfile.ZipFile(source_path, 'r')
+                open_sources[source_path] = source_zip
+            info = source_zip.getinfo(arcname)
+        except (OSError, KeyError, zipfile.BadZipFile):
+            self.logger.debug(f"Member not reusable, recompressing: {arcname}")
+            return False
+        
+        # Beginn der komprimierten Daten hinter dem Local File Header bestimmen
+        source_fp = source_zip.fp
+        source_fp.seek(info.header_offset)
+        header = source_fp.read(zipfile.sizeFileHeader)
+        name_length, extra_length = struct.unpack('<HH', header[26:30])
+        source_fp.seek(info.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+        
+        new_info = zipfile.ZipInfo(info.filename, info.date_time)
+        new_info.compress_type = info.compress_type
+        new_info.create_system = info.create_system
+        new_info.external_attr = info.external_attr
+        new_info.flag_bits = info.flag_bits & ~0x08  # Kein Data Descriptor nötig
+        if mtime is not None:
+            new_info.date_time = time.gmtime(max(mtime, ZIP_EPOCH))[:6]
+            new_info.create_system = ZIP_UNIX_SYSTEM
+            new_info.external_attr = (stat.S_IFREG | normalized_mode(info.external_attr >> 16)) << 16
+        new_info.CRC = info.CRC
+        new_info.compress_size = info.compress_size
+        new_info.file_size = info.file_size
+        
+        zip64 = max(info.file_size, info.compress_size) > zipfile.ZIP64_LIMIT
+        target_fp = target_zip.fp
+        target_fp.seek(target_zip.start_dir)
+        new_info.header_offset = target_fp.tell()
+        target_fp.write(new_info.FileHeader(zip64))
+        
+        remaining = info.compress_size
+        while remaining > 0:
+            block = source_fp.read(min(self.chunk_size, remaining))
+            if not block:
+                raise IOError(f"Unexpected end of archive: {source_path}")
+            target_fp.write(block)
+            remaining -= len(block)
+        
+        target_zip.filelist.append(new_info)
+        target_zip.NameToInfo[new_info.filename] = new_info
+        target_zip.start_dir = target_fp.tell()
+        target_zip._didModify = True
+        return True
+    
+    # ------------------------------------------------------------------
+    # TAR + Zstandard
+    # ------------------------------------------------------------------
+    
+    def create_tar_zstd_archive(
+        self,
+        source_folder: str,
+        output_path: Optional[str] = None,
+        level: int = ARCHIVE['zstd_level'],
+        threads: int = ARCHIVE['zstd_threads'],
+        exclude_git: bool = False,
+        extra_files: Optional[Dict[str, str]] = None,
+        mtime: Optional[int] = None
+    ) -> Tuple[bool, str]:
+        """
+        Erstellt ein mit Zstandard komprimiertes TAR-Archiv aus einem Ordner.
+        
+        Das TAR wird direkt aus dem Verzeichnisdurchlauf in den Kompressor
+        gestreamt, ohne temporäre Dateien. Geschrieben wird nach partial_path,
+        erst das fertige Archiv wird umbenannt. Verwendet das Paket ``zstandard``
+        oder, falls nicht installiert, das ``zstd``-Kommandozeilentool.
+        
+        Args:
+            source_folder (str): Der Quellordner
+            output_path (Optional[str]): Der Pfad des Archivs.
+                                        Wenn None, wird [source_folder].tar.zst verwendet
+            level (int): Kompressionsstufe 1-22. Default aus config.py
+            threads (int): Anzahl Kompressions-Threads, 0 = alle CPU-Kerne
+            exclude_git (bool): Wenn True, werden .git-Verzeichnisse übersprungen
+            extra_files (Optional[Dict[str, str]]): Zusätzliche Members (Archivname -> Dateipfad)
+            mtime (Optional[int]): Fester Zeitstempel für ein reproduzierbares Archiv (siehe source_date_epoch)
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Pfad oder Fehlermeldung)
+        """
+        if not output_path:
+            output_path = f"{source_folder}.tar.zst"
+        temp_path = self.partial_path(output_path)
+        
+        try:
+            if not os.path.isdir(source_folder):
+                msg = f"Source folder does not exist: {source_folder}"
+                self.logger.error(msg)
+                return False, msg
+            
+            if not 1 <= level <= 22:
+                msg = f"Invalid zstd compression level: {level}"
+                self.logger.error(msg)
+                return False, msg
+            
+            self.logger.info(f"Creating TAR+Zstandard archive: {output_path} (level {level}, threads {threads or 'auto'})")
+            
+            if zstandard is not None:
+                compressor = zstandard.ZstdCompressor(level=level, threads=threads or -1)
+                with archive_open(temp_path, 'wb') as f, compressor.stream_writer(f) as writer:
+                    self._write_tar_stream(source_folder, writer, exclude_git, extra_files, mtime)
+            elif shutil.which("zstd"):
+                self._write_tar_zstd_cli(source_folder, temp_path, level, threads, exclude_git, extra_files, mtime)
+            else:
+                msg = "Zstandard not available. Install the 'zstandard' package or the zstd tool."
+                self.logger.error(msg)
+                return False, msg
+            os.replace(temp_path, output_path)
+            
+            archive_size = os.path.getsize(output_path)
+            msg = f"TAR+Zstandard archive created: {output_path} ({archive_size / (1024*1024):.2f} MB)"
+            self.logger.success(msg)
+            return True, output_path
+        
+        except PermissionError:
+            msg = f"Permission denied creating archive: {output_path}"
+            self.logger.error(msg)
+            return False, msg
+        except Exception as e:
+            msg = f"Error creating TAR+Zstandard archive: {str(e)}"
+            self.logger.error(msg)
+            return False, msg
+        finally:
+            self._remove_partial(temp_path)
+    
+    def create_encrypted_archive(
+        self,
+        source_folder: str,
+        output_path: Optional[str] = None,
+        key_file: Optional[str] = None,
+        exclude_git: bool = False,
+        extra_files: Optional[Dict[str, str]] = None,
+        mtime: Optional[int] = None
+    ) -> Tuple[bool, str]:
+        """
+        Erstellt ein komprimiertes und verschlüsseltes TAR in einem Durchlauf.
+        
+        Der TAR-Strom geht direkt in einen EncryptingWriter (Blöcke parallel mit
+        zstd bzw. zlib komprimiert und mit AES-256-GCM verschlüsselt); Klartext
+        landet nie auf der Festplatte. Es wird kein Manifest geschrieben, da es
+        Dateinamen und Hashes im Klartext enthielte.
+        
+        Args:
+            source_folder (str): Der Quellordner
+            output_path (Optional[str]): Der Pfad des Archivs.
+                                        Wenn None, wird [source_folder].tar.enc verwendet
+            key_file (Optional[str]): Schlüsseldatei. Wenn None, ENCRYPTION['key_file']
+            exclude_git (bool): Wenn True, werden .git-Verzeichnisse übersprungen
+            extra_files (Optional[Dict[str, str]]): Zusätzliche Members (Archivname -> Dateipfad)
+            mtime (Optional[int]): Fester Zeitstempel im TAR. Das verschlüsselte Archiv selbst
+                                  unterscheidet sich trotzdem bei jedem Lauf (zufälliger Salt)
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Pfad oder Fehlermeldung)
+        """
+        if not output_path:
+            output_path = f"{source_folder}.tar.enc"
+        temp_path = self.partial_path(output_path)
+        
+        try:
+            if not os.path.isdir(source_folder):
+                msg = f"Source folder does not exist: {source_folder}"
+                self.logger.error(msg)
+                return False, msg
+            
+            key = load_key(key_file)
+            self.logger.info(f"Creating encrypted archive: {output_path}")
+            with archive_open(temp_path, 'wb') as f, EncryptingWriter(f, key) as writer:
+                self._write_tar_stream(source_folder, writer, exclude_git, extra_files, mtime)
+            os.replace(temp_path, output_path)
+            
+            archive_size = os.path.getsize(output_path)
+            msg = f"Encrypted archive created: {output_path} ({archive_size / (1024*1024):.2f} MB)"
+            self.logger.success(msg)
+            return True, output_path
+        
+        except PermissionError:
+            msg = f"Permission denied creating archive: {output_path}"
+            self.logger.error(msg)
+            return False, msg
+        except Exception as e:
+            msg = f"Error creating encrypted archive: {str(e)}"
+            self.logger.error(msg)
+            return False, msg
+        finally:
+            self._remove_partial(temp_path)
+    
+    def _write_tar_stream(
+        self,
+        source_folder: str,
+        fileobj,
+        exclude_git: bool = False,
+        extra_files: Optional[Dict[str, str]] = None,
+        mtime: Optional[int] = None
+    ) -> None:
+        """
+        Schreibt einen Ordner als TAR-Stream (ohne Seek) in ein File-Objekt, Members sortiert.
+        
+        Args:
+            source_folder (str): Der Quellordner
+            fileobj: Beschreibbares File-Objekt (z.B. Kompressor-Stream)
+            exclude_git (bool): Wenn True, werden .git-Verzeichnisse übersprungen
+            extra_files (Optional[Dict[str, str]]): Zusätzliche Members (Archivname -> Dateipfad)
+            mtime (Optional[int]): Fester Zeitstempel, normalisierte Rechte, ohne Besitzer
+        """
+        with tarfile.open(fileobj=fileobj, mode='w|', bufsize=self.chunk_size) as tar:
+            for entry in TreeWalker.for_archive(exclude_git).walk(source_folder):
+                tar_add(tar, entry.path, entry.relpath, mtime)
+            for arcname, path in sorted((extra_files or {}).items()):
+                tar_add(tar, path, arcname, mtime)
+    
+    def _write_tar_zstd_cli(
+        self,
+        source_folder: str,
+        output_path: str,
+        level: int,
+        threads: int,
+        exclude_git: bool = False,
+        extra_files: Optional[Dict[str, str]] = None,
+        mtime: Optional[int] = None
+    ) -> None:
+        """
+        Streamt das TAR über eine Pipe in das zstd-Kommandozeilentool.
+        
+        Args:
+            source_folder (str): Der Quellordner
+            output_path (str): Der Pfad des Archivs
+            level (int): Kompressionsstufe 1-22
+            threads (int): Anzahl Kompressions-Threads, 0 = alle CPU-Kerne
+            exclude_git (bool): Wenn True, werden .git-Verzeichnisse übersprungen
+            extra_files (Optional[Dict[str, str]]): Zusätzliche Members (Archivname -> Dateipfad)
+            mtime (Optional[int]): Fester Zeitstempel (siehe _write_tar_stream)
+        """
+        command = ["zstd", f"-{level}", f"-T{threads}", "-q", "-f", "-o", output_path]
+        if level > 19:
+            command.insert(1, "--ultra")
+        
+        process = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            self._write_tar_stream(source_folder, process.stdin, exclude_git, extra_files, mtime)
+        finally:
+            process.stdin.close()
+            stderr = process.stderr.read()
+            process.wait()
+        
+        if process.returncode != 0:
+            raise RuntimeError(f"zstd failed: {stderr.decode(errors='replace').strip()}")
+    
+    # ------------------------------------------------------------------
+    # Mehrteilige Archive (Volumes)
+    # ------------------------------------------------------------------
+    
+    def create_volume_archive(
+        self,
+        source_folder: str,
+        output_dir: Optional[str] = None,
+        volume_size: Optional[int] = None,
+        workers: Optional[int] = None,
+        exclude_git: bool = False,
+        extra_files: Optional[Dict[str, str]] = None,
+        mtime: Optional[int] = None
+    ) -> Tuple[bool, str]:
+        """
+        Erstellt ein in Volumes aufgeteiltes Archiv. Jedes Volume ist ein eigenständiges
+        ZIP (ohne die anderen lesbar); die Volumes werden parallel geschrieben.
+        
+        Die Dateien werden in sortierter Reihenfolge auf Volumes mit höchstens
+        ``volume_size`` unkomprimierten Bytes verteilt; größere Dateien bekommen ein
+        eigenes Volume, da Members nicht geteilt werden. ``index.json`` enthält pro Volume
+        Größe und Hash und pro Datei Größe, Hash und das Volume (Feld ``archive`` wie im Manifest).
+        
+        Args:
+            source_folder (str): Der Quellordner
+            output_dir (Optional[str]): Zielordner der Volumes.
+                                       Wenn None, wird [source_folder].volumes verwendet
+            volume_size (Optional[int]): Maximale Bytes pro Volume. Wenn None, aus config.py
+            workers (Optional[int]): Parallel geschriebene Volumes. Wenn None, aus config.py
+            exclude_git (bool): Wenn True, werden .git-Verzeichnisse übersprungen
+            extra_files (Optional[Dict[str, str]]): Zusätzliche Members (Archivname -> Dateipfad)
+            mtime (Optional[int]): Fester Zeitstempel für reproduzierbare Volumes (siehe source_date_epoch)
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Pfad des Ordners oder Fehlermeldung)
+        """
+        if not output_dir:
+            output_dir = f"{source_folder}{VOLUME_SUFFIX}"
+        volume_size = volume_size or ARCHIVE['volume_size']
+        workers = workers or ARCHIVE['volume_workers'] or os.cpu_count() or 1
+        temp_dir = f"{output_dir}.tmp"
+        
+        try:
+            if not os.path.isdir(source_folder):
+                msg = f"Source folder does not exist: {source_folder}"
+                self.logger.error(msg)
+                return False, msg
+            
+            volumes = self._plan_volumes(source_folder, volume_size, exclude_git, extra_files)
+            self.logger.info(
+                f"Creating {len(volumes)} ZIP volumes: {output_dir} "
+                f"(max {volume_size / (1024*1024):.0f} MB each, {workers} in parallel)"
+            )
+            if os.path.exists(temp_dir):
+                shutil.rmtree(temp_dir)
+            os.makedirs(temp_dir)
+            
+            names = [f"{VOLUME_PREFIX}{number:04d}.zip" for number in range(1, len(volumes) + 1)]
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="volume") as executor:
+                results = list(executor.map(
+                    lambda name, members: self._write_volume(os.path.join(temp_dir, name), members, mtime),
+                    names,
+                    volumes
+                ))
+            
+            files: Dict[str, Dict] = {}
+            index_volumes = []
+            for name, (volume_hash, volume_files) in zip(names, results):
+                for entry in volume_files.values():
+                    entry["archive"] = name
+                files.update(volume_files)
+                index_volumes.append({
+                    "name": name,
+                    "size": os.path.getsize(os.path.join(temp_dir, name)),
+                    "hash": volume_hash,
+                    "files": len(volume_files),
+                })
+            # Reproduzierbar: der Index trägt den festen Zeitstempel statt der Uhrzeit des Laufs
+            created = datetime.utcfromtimestamp(mtime) if mtime is not None else datetime.now()
+            with open(os.path.join(temp_dir, VOLUME_INDEX), 'w', encoding='utf-8') as f:
+                json.dump({
+                    "version": MANIFEST_VERSION,
+                    "created": created.isoformat(),
+                    "volume_size": volume_size,
+                    "volumes": index_volumes,
+                    "files": files,
+                }, f, indent=1)
+            
+            if os.path.exists(output_dir):
+                shutil.rmtree(output_dir)
+            os.replace(temp_dir, output_dir)
+            
+            total = sum(volume["size"] for volume in index_volumes)
+            msg = f"ZIP volumes created: {output_dir} ({len(index_volumes)} volumes, {total / (1024*1024):.2f} MB)"
+            self.logger.success(msg)
+            return True, output_dir
+        
+        except PermissionError:
+            msg = f"Permission denied creating volumes: {output_dir}"
+            self.logger.error(msg)
+            return False, msg
+        except Exception as e:
+            msg = f"Error creating ZIP volumes: {str(e)}"
+            self.logger.error(msg)
+            return False, msg
+        finally:
+            if os.path.exists(temp_dir):
+                shutil.rmtree(temp_dir, ignore_errors=True)
+    
+    @staticmethod
+    def is_volume_archive(path: str) -> bool:
+        """
+        Ob ein Pfad ein mehrteiliges Archiv aus create_volume_archive ist.
+        
+        Args:
+            path (str): Zu prüfender Pfad
+        
+        Returns:
+            bool: True wenn Index und erstes Volume vorhanden sind
+        """
+        return (
+            os.path.isfile(os.path.join(path, VOLUME_INDEX))
+            and os.path.isfile(os.path.join(path, f"{VOLUME_PREFIX}0001.zip"))
+        )
+    
+    def verify_volumes(self, volume_dir: str, workers: Optional[int] = None) -> Tuple[bool, str]:
+        """
+        Prüft Größe und Hash aller Volumes gegen index.json, parallel.
+        
+        Args:
+            volume_dir (str): Ordner der Volumes
+            workers (Optional[int]): Parallel geprüfte Volumes. Wenn None, aus config.py
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        workers = workers or ARCHIVE['volume_workers'] or os.cpu_count() or 1
+        try:
+            with open(os.path.join(volume_dir, VOLUME_INDEX), 'r', encoding='utf-8') as f:
+                volumes = json.load(f)["volumes"]
+        except (OSError, ValueError, KeyError) as e:
+            msg = f"Invalid volume index in {volume_dir}: {str(e)}"
+            self.logger.error(msg)
+            return False, msg
+        
+        def check(volume: Dict) -> Optional[str]:
+            path = os.path.join(volume_dir, volume["name"])
+            if not os.path.isfile(path) or os.path.getsize(path) != volume["size"]:
+                return f"{volume['name']}: missing or wrong size"
+            if self.hash_file(path) != volume["hash"]:
+                return f"{volume['name']}: hash mismatch"
+            return None
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="volume") as executor:
+            errors = [error for error in executor.map(check, volumes) if error]
+        if errors:
+            msg = f"{len(errors)} of {len(volumes)} volumes damaged: " + "; ".join(errors)
+            self.logger.error(msg)
+            return False, msg
+        msg = f"All {len(volumes)} volumes verified: {volume_dir}"
+        self.logger.success(msg)
+        return True, msg
+    
+    def _plan_volumes(
+        self,
+        source_folder: str,
+        volume_size: int,
+        exclude_git: bool = False,
+        extra_files: Optional[Dict[str, str]] = None
+    ) -> List[List[Tuple[str, str, int]]]:
+        """
+        Verteilt die Dateien eines Ordners auf Volumes.
+        
+        Args:
+            source_folder (str): Der Quellordner
+            volume_size (int): Maximale unkomprimierte Bytes pro Volume
+            exclude_git (bool): Wenn True, werden .git-Verzeichnisse übersprungen
+            extra_files (Optional[Dict[str, str]]): Zusätzliche Members (Archivname -> Dateipfad)
+        
+        Returns:
+            List[List[Tuple[str, str, int]]]: Pro Volume (Archivname, Dateipfad, Größe)
+        """
+        members = [
+            (entry.relpath, entry.path, entry.stat.st_size if entry.stat else os.path.getsize(entry.path))
+            for entry in TreeWalker.for_archive(exclude_git).files(source_folder)
+        ]
+        members += [
+            (arcname, file_path, os.path.getsize(file_path))
+            for arcname, file_path in sorted((extra_files or {}).items())
+        ]
+        
+        volumes: List[List[Tuple[str, str, int]]] = [[]]
+        used = 0
+        for arcname, file_path, size in members:
+            if volumes[-1] and used + size > volume_size:
+                volumes.append([])
+                used = 0
+            volumes[-1].append((arcname, file_path, size))
+            used += size
+        return volumes
+    
+    def _write_volume(
+        self,
+        volume_path: str,
+        members: List[Tuple[str, str, int]],
+        mtime: Optional[int] = None
+    ) -> Tuple[str, Dict[str, Dict]]:
+        """
+        Schreibt ein Volume und hasht dabei jede Datei (kein zweites Lesen für das Manifest).
+        
+        Args:
+            volume_path (str): Pfad des Volumes
+            members (List[Tuple[str, str, int]]): (Archivname, Dateipfad, Größe)
+            mtime (Optional[int]): Fester Zeitstempel mit normalisierten Rechten oder None
+        
+        Returns:
+            Tuple[str, Dict[str, Dict]]: (Hash des Volumes, Archivname -> {"size", "hash"})
+        """
+        lower_thread_priority()
+        files = {}
+        with archive_open(volume_path, 'wb') as output, zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            for arcname, file_path, _ in members:
+                if mtime is not None:
+                    info = zip_info(file_path, arcname, mtime, zipfile.ZIP_DEFLATED)
+                else:
+                    info = zipfile.ZipInfo.from_file(file_path, arcname)
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                digest = hashlib.new(ARCHIVE['hash_algorithm'])
+                size = 0
+                with archive_open(file_path) as source, zipf.open(info, 'w') as target:
+                    for block in iter(lambda: source.read(self.chunk_size), b''):
+                        digest.update(block)
+                        target.write(block)
+                        size += len(block)
+                files[arcname] = {"size": size, "hash": digest.hexdigest()}
+        return self.hash_file(volume_path), files
+    
+    def _remove_partial(self, path: str) -> None:
+        """
+        Entfernt eine unvollständig geschriebene Ausgabedatei.
+        
+        Args:
+            path (str): Pfad der Datei
+        """
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except OSError as e:
+            self.logger.warning(f"Could not remove partial file {path}: {str(e)}")
\ No newline at end of file
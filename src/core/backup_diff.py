@@ -0,0 +1,420 @@
+# core/backup_diff.py
+
+"""
+Vergleich zweier Backups desselben Repositories.
+Mit .git werden Commit- und Tree-IDs verglichen, sonst die gespeicherten
+Manifeste oder Dateigröße/Änderungszeit, und nur im Zweifel Hashes.
+"""
+
+import os
+import zlib
+import hashlib
+import tarfile
+import zipfile
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, Optional, Tuple
+from config import ARCHIVE, DIFF
+from .logger import Logger
+from .git_manager import GitManager
+from .archive_manager import ArchiveManager
+from .encryption import DecryptingReader, load_key
+from .disk_space import format_size
+from .tree_walker import TreeWalker
+
+try:
+    import zstandard
+except ImportError:  # Optional: TAR+Zstandard ohne Manifest wird dann nicht unterstützt
+    zstandard = None
+
+
+# Git meldet neue/gelöschte Seiten mit dieser ID
+NULL_OBJECT_ID = "0" * 40
+
+
+class BackupDiff:
+    """
+    Ergebnis eines Vergleichs zweier Backups.
+    
+    Attributes:
+        method (str): "git", "manifest" oder "stat"
+        added (Dict[str, int]): Neue Pfade -> Größe
+        removed (Dict[str, int]): Gelöschte Pfade -> Größe
+        modified (Dict[str, Tuple[int, int]]): Geänderte Pfade -> (alte Größe, neue Größe)
+        old_commit (Optional[str]): Commit-ID des alten Backups (nur "git")
+        new_commit (Optional[str]): Commit-ID des neuen Backups (nur "git")
+    """
+    
+    def __init__(self, method: str) -> None:
+        """
+        Initialisiert den BackupDiff.
+        
+        Args:
+            method (str): Verwendetes Verfahren
+        """
+        self.method = method
+        self.added: Dict[str, int] = {}
+        self.removed: Dict[str, int] = {}
+        self.modified: Dict[str, Tuple[int, int]] = {}
+        self.old_commit: Optional[str] = None
+        self.new_commit: Optional[str] = None
+    
+    @property
+    def byte_delta(self) -> int:
+        """Größenänderung insgesamt (neu minus alt) in Bytes."""
+        return (
+            sum(self.added.values())
+            - sum(self.removed.values())
+            + sum(new - old for old, new in self.modified.values())
+        )
+    
+    @property
+    def changed_bytes(self) -> int:
+        """Bytes, die für ein inkrementelles Backup übertragen werden müssten."""
+        return sum(self.added.values()) + sum(new for _, new in self.modified.values())
+    
+    def summary(self) -> str:
+        """
+        Einzeilige Zusammenfassung.
+        
+        Returns:
+            str: z.B. "3 added, 1 removed, 5 modified, +1.2 MiB (git)"
+        """
+        delta = self.byte_delta
+        sign = "+" if delta >= 0 else "-"
+        return (
+            f"{len(self.added)} added, {len(self.removed)} removed, {len(self.modified)} modified, "
+            f"{sign}{format_size(abs(delta))}, {format_size(self.changed_bytes)} to transfer ({self.method})"
+        )
+    
+    def to_dict(self) -> Dict:
+        """
+        Ergebnis als JSON-taugliches Dict.
+        
+        Returns:
+            Dict: Alle Attribute plus byte_delta und changed_bytes
+        """
+        return {
+            "method": self.method,
+            "old_commit": self.old_commit,
+            "new_commit": self.new_commit,
+            "added": self.added,
+            "removed": self.removed,
+            "modified": {path: {"old": old, "new": new} for path, (old, new) in self.modified.items()},
+            "byte_delta": self.byte_delta,
+            "changed_bytes": self.changed_bytes,
+        }
+
+
+class BackupComparer:
+    """
+    Vergleicht zwei Backups (Ordner oder Archive) mit dem günstigsten Verfahren.
+    
+    1. Zwei Ordner mit .git: gleiche Tree-ID bedeutet keine Änderung; sonst
+       ``git diff-tree`` zwischen beiden Repositories (das alte wird nur als
+       Alternate eingebunden) und Blob-Größen per ``cat-file --batch-check``.
+    2. Sonst Dateilisten: Manifest des Archivs, ZIP-Verzeichnis (Größe + CRC)
+       oder Verzeichnis-Scan (Größe + Änderungszeit). Gleich große Dateien
+       ohne vergleichbare Prüfsumme werden parallel gehasht.
+    
+    Attributes:
+        logger (Logger): Logger-Instanz für Logging
+        git_manager (GitManager): Für den Tree-Vergleich
+        archive_manager (ArchiveManager): Für Manifeste und Hashes
+        workers (int): Threads zum Hashen
+    """
+    
+    def __init__(self, logger: Logger = None, workers: int = DIFF['hash_workers']) -> None:
+        """
+        Initialisiert den BackupComparer.
+        
+        Args:
+            logger (Logger): Logger-Instanz. Wenn None, wird eine neue erstellt
+            workers (int): Threads zum Hashen. Default aus config.py
+        """
+        self.logger = logger or Logger()
+        self.git_manager = GitManager(self.logger)
+        self.archive_manager = ArchiveManager(self.logger)
+        self.workers = max(1, workers)
+    
+    def compare(self, old: str, new: str, include_git: bool = False) -> Tuple[Optional[BackupDiff], str]:
+        """
+        Vergleicht zwei Backups.
+        
+        Args:
+            old (str): Älteres Backup (Ordner, ZIP oder TAR)
+            new (str): Neueres Backup
+            include_git (bool): .git-Inhalte bei Datei-Vergleichen mitzählen
+        
+        Returns:
+            Tuple[Optional[BackupDiff], str]: (Ergebnis oder None, Zusammenfassung oder Fehlermeldung)
+        """
+        for path in (old, new):
+            if not os.path.exists(path):
+                msg = f"Backup not found: {path}"
+                self.logger.error(msg)
+                return None, msg
+        try:
+            diff = None
+            if os.path.isdir(old) and os.path.isdir(new):
+                diff = self._compare_git(old, new)
+            if diff is None:
+                diff = self._compare_files(old, new, include_git)
+        except Exception as e:
+            msg = f"Compare failed: {str(e)}"
+            self.logger.error(msg)
+            return None, msg
+        
+        msg = diff.summary()
+        self.logger.info(f"Compared {old} -> {new}: {msg}")
+        return diff, msg
+    
+    def _compare_git(self, old: str, new: str) -> Optional[BackupDiff]:
+        """
+        Vergleich über Commit- und Tree-IDs.
+        
+        Args:
+            old (str): Alter Backup-Ordner
+            new (str): Neuer Backup-Ordner
+        
+        Returns:
+            Optional[BackupDiff]: Ergebnis oder None, wenn kein Git-Vergleich möglich ist
+        """
+        # Ohne eigenes .git würde Git ein übergeordnetes Repository finden
+        old_objects = os.path.join(old, '.git', 'objects')
+        if not os.path.isdir(old_objects) or not os.path.isdir(os.path.join(new, '.git')):
+            return None
+        old_ids = self.git_manager.head_ids(old)
+        new_ids = self.git_manager.head_ids(new)
+        if not old_ids or not new_ids:
+            return None
+        
+        diff = BackupDiff("git")
+        diff.old_commit, diff.new_commit = old_ids[0], new_ids[0]
+        if old_ids[1] == new_ids[1]:
+            return diff
+        
+        try:
+            changes = self.git_manager.diff_trees(new, old_ids[1], new_ids[1], old_objects=old_objects)
+        except subprocess.CalledProcessError as e:
+            self.logger.warning(f"Tree diff failed, comparing files instead: {str(e)}")
+            return None
+        blob_ids = {blob for _, old_id, new_id, _ in changes for blob in (old_id, new_id) if blob != NULL_OBJECT_ID}
+        sizes = self.git_manager.object_sizes(new, sorted(blob_ids), extra_objects=old_objects)
+        
+        for status, old_id, new_id, path in changes:
+            if status == "A":
+                diff.added[path] = sizes.get(new_id, 0)
+            elif status == "D":
+                diff.removed[path] = sizes.get(old_id, 0)
+            else:
+                diff.modified[path] = (sizes.get(old_id, 0), sizes.get(new_id, 0))
+        return diff
+    
+    def _compare_files(self, old: str, new: str, include_git: bool) -> BackupDiff:
+        """
+        Vergleich über Dateilisten (Manifest, ZIP-Verzeichnis oder Scan).
+        
+        Args:
+            old (str): Altes Backup
+            new (str): Neues Backup
+            include_git (bool): .git-Inhalte mitzählen
+        
+        Returns:
+            BackupDiff: Das Ergebnis
+        """
+        old_files, old_method = self._file_list(old, include_git)
+        new_files, new_method = self._file_list(new, include_git)
+        diff = BackupDiff("manifest" if old_method == new_method == "manifest" else "stat")
+        
+        undecided = []
+        for path, entry in new_files.items():
+            previous = old_files.get(path)
+            if previous is None:
+                diff.added[path] = entry["size"]
+            elif previous["size"] != entry["size"]:
+                diff.modified[path] = (previous["size"], entry["size"])
+            else:
+                same = self._same_content(previous, entry)
+                if same is None:
+                    undecided.append((path, previous, entry))
+                elif not same:
+                    diff.modified[path] = (previous["size"], entry["size"])
+        for path, entry in old_files.items():
+            if path not in new_files:
+                diff.removed[path] = entry["size"]
+        
+        # Gleich groß, aber ohne vergleichbare Prüfsumme: Hashes parallel berechnen
+        if undecided:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="diff") as executor:
+                results = executor.map(lambda item: self._hash_compare(item[1], item[2]), undecided)
+                for (path, previous, entry), same in zip(undecided, results):
+                    if not same:
+                        diff.modified[path] = (previous["size"], entry["size"])
+        return diff
+    
+    def _file_list(self, backup: str, include_git: bool) -> Tuple[Dict[str, Dict], str]:
+        """
+        Dateiliste eines Backups mit den billigsten verfügbaren Merkmalen.
+        
+        Args:
+            backup (str): Ordner oder Archiv
+            include_git (bool): .git-Inhalte aufnehmen
+        
+        Returns:
+            Tuple[Dict[str, Dict], str]: (Pfad -> {"size", ["hash"|"crc"|"mtime", "file"|"zip"]}, Quelle)
+        """
+        if os.path.isdir(backup) and not self.archive_manager.is_volume_archive(backup):
+            return self._scan_folder(backup, include_git), "stat"
+        
+        manifest_files = self.archive_manager.load_manifest(backup).get("files")
+        if manifest_files:
+            return {
+                path: {"size": entry["size"], "hash": entry["hash"]}
+                for path, entry in manifest_files.items()
+                if include_git or not self._is_git_path(path)
+            }, "manifest"
+        
+        if backup.endswith(".zip"):
+            with zipfile.ZipFile(backup) as zipf:
+                return {
+                    info.filename: {"size": info.file_size, "crc": info.CRC, "zip": (backup, info.filename)}
+                    for info in zipf.infolist()
+                    if not info.is_dir() and (include_git or not self._is_git_path(info.filename))
+                }, "archive"
+        
+        if backup.endswith((".tar", ".tar.gz", ".tgz", ".tar.zst", ".tar.enc")):
+            return dict(self._hash_tar(backup, include_git)), "archive"
+        raise ValueError(f"Unsupported backup format: {backup}")
+    
+    def _scan_folder(self, folder: str, include_git: bool) -> Dict[str, Dict]:
+        """
+        Scannt einen Ordner nur über Metadaten (TreeWalker, kein Lesen).
+        
+        Args:
+            folder (str): Der Backup-Ordner
+            include_git (bool): .git-Verzeichnisse und -Dateien aufnehmen
+        
+        Returns:
+            Dict[str, Dict]: Pfad -> {"size", "mtime", "file"}
+        """
+        walker = TreeWalker(exclude=[] if include_git else [".git"])
+        return {
+            entry.relpath: {"size": entry.stat.st_size, "mtime": entry.stat.st_mtime_ns, "file": entry.path}
+            for entry in walker.files(folder)
+            if not entry.is_symlink and entry.stat is not None
+        }
+    
+    def _hash_tar(self, archive: str, include_git: bool) -> Iterator[Tuple[str, Dict]]:
+        """
+        Liest ein TAR ohne Manifest einmal vollständig und hasht jedes Member.
+        
+        Args:
+            archive (str): Pfad des TAR
+            include_git (bool): .git-Inhalte aufnehmen
+        
+        Yields:
+            Tuple[str, Dict]: (Pfad, {"size", "hash", "crc"})
+        """
+        with open(archive, 'rb') as raw:
+            stream = raw
+            if archive.endswith(".enc"):
+                stream = DecryptingReader(raw, load_key())
+            elif archive.endswith(".zst"):
+                if zstandard is None:
+                    raise RuntimeError("TAR+Zstandard without manifest needs the 'zstandard' package")
+                stream = zstandard.ZstdDecompressor().stream_reader(raw)
+            mode = "r|gz" if archive.endswith((".gz", ".tgz")) else "r|"
+            try:
+                with tarfile.open(fileobj=stream, mode=mode) as tar:
+                    for member in tar:
+                        if not member.isreg() or (not include_git and self._is_git_path(member.name)):
+                            continue
+                        digest = hashlib.new(ARCHIVE['hash_algorithm'])
+                        crc = 0
+                        source = tar.extractfile(member)
+                        for block in iter(lambda: source.read(ARCHIVE['chunk_size']), b''):
+                            digest.update(block)
+                            crc = zlib.crc32(block, crc)
+                        yield member.name, {"size": member.size, "hash": digest.hexdigest(), "crc": crc}
+            finally:
+                # Beendet auch die Threads eines DecryptingReader
+                stream.close()
+    
+    @staticmethod
+    def _same_content(old: Dict, new: Dict) -> Optional[bool]:
+        """
+        Vergleicht zwei gleich große Einträge ohne Dateien zu lesen.
+        
+        Args:
+            old (Dict): Eintrag des alten Backups
+            new (Dict): Eintrag des neuen Backups
+        
+        Returns:
+            Optional[bool]: True/False oder None, wenn gehasht werden muss
+        """
+        for key in ("hash", "crc", "mtime"):
+            if key in old and key in new:
+                # Gleiche Änderungszeit gilt als unverändert, abweichende beweist nichts
+                if key == "mtime" and old[key] != new[key]:
+                    continue
+                return old[key] == new[key]
+        return None
+    
+    def _hash_compare(self, old: Dict, new: Dict) -> bool:
+        """
+        Vergleicht zwei Einträge, indem fehlende Prüfsummen aus den Dateien berechnet werden.
+        
+        Args:
+            old (Dict): Eintrag des alten Backups
+            new (Dict): Eintrag des neuen Backups
+        
+        Returns:
+            bool: True wenn der Inhalt gleich ist
+        """
+        # CRC ist billiger, aber nur nutzbar, wenn beide Seiten sie liefern können
+        key = "crc" if all("crc" in entry or "file" in entry for entry in (old, new)) else "hash"
+        return self._checksum(old, key) == self._checksum(new, key)
+    
+    def _checksum(self, entry: Dict, key: str):
+        """
+        Prüfsumme eines Eintrags, bei Bedarf aus der Datei oder dem ZIP-Member berechnet.
+        
+        Args:
+            entry (Dict): Eintrag mit key, "file" oder "zip"
+            key (str): "hash" oder "crc"
+        
+        Returns:
+            Die Prüfsumme (Hex-String bzw. CRC32) oder None
+        """
+        if key in entry:
+            return entry[key]
+        if "zip" in entry:
+            archive, member = entry["zip"]
+            digest = hashlib.new(ARCHIVE['hash_algorithm'])
+            with zipfile.ZipFile(archive) as zipf, zipf.open(member) as source:
+                for block in iter(lambda: source.read(ARCHIVE['chunk_size']), b''):
+                    digest.update(block)
+            return digest.hexdigest()
+        if "file" not in entry:
+            return None
+        if key == "hash":
+            return self.archive_manager.hash_file(entry["file"])
+        crc = 0
+        with open(entry["file"], 'rb') as f:
+            for block in iter(lambda: f.read(ARCHIVE['chunk_size']), b''):
+                crc = zlib.crc32(block, crc)
+        return crc
+    
+    @staticmethod
+    def _is_git_path(path: str) -> bool:
+        """
+        Ob ein Archivpfad in einem .git-Verzeichnis liegt oder eine .git-Datei ist.
+        
+        Args:
+            path (str): Pfad mit ``/``
+        
+        Returns:
+            bool: True für .git-Inhalte
+        """
+        return '.git' in path.split('/')
\ No newline at end of file
@@ -0,0 +1,538 @@
+# core/backup_job.py
+
+"""
+Backup-Job: Klonen und Archivieren eines Repositories ohne Qt-Abhängigkeit.
+Wird von der JobQueue (GUI) und der BackupPipeline (Headless-Betrieb) gemeinsam verwendet.
+"""
+
+import os
+import time
+import zipfile
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from config import ARCHIVE, DISK_SPACE, SUBMODULES, REPLICATION, PROFILING, OBJECT_STORAGE
+from .logger import Logger
+from .git_manager import GitManager
+from .file_manager import FileManager
+from .archive_manager import ArchiveManager
+from .disk_space import DiskSpaceChecker
+from .submodules import SubmoduleManager
+from .replication import Replicator
+from .object_storage import S3Uploader, StreamingUpload
+from .job_profiler import JobProfiler
+from .throttle import lower_thread_priority
+
+
+# Fortschrittsbereiche (Prozent) der einzelnen Phasen
+PHASE_PROGRESS = {
+    "prepare": 0,
+    "directory": 2,
+    "clone": 5,
+    "clone_end": 70,
+    "submodules": 70,
+    "submodules_end": 78,
+    "archive": 80,
+    "replicate": 90,
+    "done": 100,
+}
+
+# Anteil der Git-Phasen am Clone-Bereich (Start, Ende innerhalb von clone..clone_end)
+GIT_PHASE_WEIGHTS = {
+    "Receiving objects": (0.0, 0.85),
+    "Resolving deltas": (0.85, 0.95),
+    "Updating files": (0.95, 1.0),
+}
+
+# Formate, deren Ausgabe nur angehängt wird: Upload läuft schon während des Schreibens
+STREAMING_FORMATS = ("tar.zst", "tar.enc")
+
+ProgressCallback = Callable[[str, float, str], None]
+
+
+class BackupJob:
+    """
+    Eine einzelne Backup-Operation für ein Repository.
+    
+    Attributes:
+        github_url (str): Die URL des Repositories
+        folder_name (str): Der Name des lokalen Ordners
+        target_path (str): Der Pfad wo das Repository gespeichert wird
+        add_backup (bool): Ob ein Zeitstempel-Backup erstellt wird
+        create_zip (bool): Ob nach dem Clone ein Archiv erstellt wird
+        incremental_zip (bool): Ob das ZIP inkrementell zum letzten Archiv erstellt wird
+        archive_format (str): Archiv-Format ("zip", "tar.zst", "tar.enc" oder "volumes")
+        git_mode (str): Behandlung des .git-Verzeichnisses im Archiv
+        reproducible (bool): Ob das Archiv byte-identisch reproduzierbar erstellt wird
+        submodules (bool): Ob Submodule rekursiv mitgeklont werden
+        replicate_targets (List[str]): Weitere Ziele, auf die das fertige Backup kopiert wird
+        upload (bool): Ob das Archiv in den Object Storage (OBJECT_STORAGE) hochgeladen wird
+        target_directory (Optional[str]): Der erzeugte Backup-Ordner (nach run())
+        archive_path (Optional[str]): Das erstellte Archiv (nach archive_stage())
+        profiler (Optional[JobProfiler]): Profiler des Jobs, wenn Profiling aktiv ist
+        timings (Dict[str, float]): Dauer jeder abgeschlossenen Stufe in Sekunden
+        stage (Optional[str]): Gerade laufende Stufe ("clone", "archive", "replicate") oder None
+        stage_started (float): Startzeit der laufenden Stufe (time.monotonic)
+        percent (float): Zuletzt gemeldeter Gesamtfortschritt 0-100
+    """
+    
+    def __init__(
+        self,
+        github_url: str,
+        folder_name: str,
+        target_path: str,
+        add_backup: bool = False,
+        create_zip: bool = False,
+        incremental_zip: bool = False,
+        archive_format: str = "zip",
+        git_mode: str = "include",
+        reproducible: bool = ARCHIVE['reproducible'],
+        submodules: bool = SUBMODULES['enabled'],
+        replicate_targets: Optional[List[str]] = None,
+        upload: Optional[bool] = None,
+        profile: Optional[bool] = None,
+        logger: Optional[Logger] = None
+    ) -> None:
+        """
+        Initialisiert den BackupJob.
+        
+        Args:
+            github_url (str): Die GitHub-URL des zu klonenden Repositories
+            folder_name (str): Der Name des lokalen Ordners
+            target_path (str): Der Pfad wo das Repository gespeichert wird
+            add_backup (bool): Ob ein Zeitstempel-Backup erstellt wird
+            create_zip (bool): Ob nach dem Clone ein Archiv erstellt wird
+            incremental_zip (bool): Ob das ZIP inkrementell zum letzten Archiv erstellt wird
+            archive_format (str): Archiv-Format ("zip", "tar.zst", "tar.enc" oder "volumes")
+            git_mode (str): Behandlung des .git-Verzeichnisses im Archiv (siehe GIT_ARCHIVE_MODES)
+            reproducible (bool): Fester Zeitstempel (Commit-Zeit) und normalisierte Rechte im Archiv
+            submodules (bool): Ob Submodule rekursiv und parallel mitgeklont werden
+            replicate_targets (Optional[List[str]]): Replikationsziele. Wenn None, aus config.py
+            upload (Optional[bool]): Archiv in den Object Storage hochladen. Wenn None, aus config.py
+            profile (Optional[bool]): CPU-, Speicher- und Git-Profil schreiben. Wenn None, aus config.py
+            logger (Optional[Logger]): Logger-Instanz. Wenn None, wird eine neue erstellt
+        """
+        self.github_url = github_url
+        self.folder_name = folder_name
+        self.target_path = target_path
+        self.add_backup = add_backup
+        self.create_zip = create_zip
+        self.incremental_zip = incremental_zip
+        self.archive_format = archive_format
+        self.git_mode = git_mode
+        self.reproducible = reproducible
+        self.submodules = submodules
+        self.replicate_targets = list(REPLICATION['targets'] if replicate_targets is None else replicate_targets)
+        self.upload = OBJECT_STORAGE['enabled'] if upload is None else upload
+        self.target_directory: Optional[str] = None
+        self.archive_path: Optional[str] = None
+        self.timings: Dict[str, float] = {}
+        self.stage: Optional[str] = None
+        self.stage_started = 0.0
+        self.percent = 0.0
+        
+        # Manager-Instanzen
+        self.logger = logger or Logger()
+        enabled = PROFILING['enabled'] if profile is None else profile
+        self.profiler = JobProfiler(folder_name, logger=self.logger) if enabled else None
+        self.git_manager = GitManager(self.logger, profiler=self.profiler)
+        self.file_manager = FileManager(self.logger)
+        self.archive_manager = ArchiveManager(self.logger)
+        self.archive_manager.git_manager.profiler = self.profiler
+        self.space_checker = DiskSpaceChecker(self.logger)
+        
+        self._progress: Optional[ProgressCallback] = None
+        self._reserved_bytes = 0
+        self._streamed = False
+    
+    def run(self, progress: Optional[ProgressCallback] = None) -> Tuple[bool, str]:
+        """
+        Führt das Backup aus (blockierend): clone_stage, archive_stage, replicate_stage, finish.
+        
+        Args:
+            progress (Optional[ProgressCallback]): Wird mit (Phase, Prozent 0-100, Rate)
+                aufgerufen. Wird im ausführenden Thread aufgerufen.
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        self.set_progress(progress)
+        try:
+            success, message = self.clone_stage()
+            if success:
+                self.archive_stage()
+                self.replicate_stage()
+            return self.finish(success, message)
+        finally:
+            self.set_progress(None)
+    
+    def set_progress(self, progress: Optional[ProgressCallback]) -> None:
+        """
+        Setzt den Fortschritts-Callback für die folgenden Stufen.
+        
+        Args:
+            progress (Optional[ProgressCallback]): Empfänger für (Phase, Prozent, Rate) oder None
+        """
+        self._progress = progress
+    
+    def clone_stage(self) -> Tuple[bool, str]:
+        """
+        Stufe 1 (netzwerklastig): Speicherplatz reservieren, Ordner erstellen, klonen.
+        Die Reservierung bleibt bis finish() bestehen.
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        with self._stage("clone"):
+            return self._clone()
+    
+    def _clone(self) -> Tuple[bool, str]:
+        """
+        Führt die Clone-Stufe aus (siehe clone_stage).
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        # Backups laufen im Hintergrund und sollen andere Dienste nicht verdrängen
+        lower_thread_priority()
+        try:
+            # Schritt 1: Backup-Ordnernamen generieren
+            self._report("Preparing backup folder...", PHASE_PROGRESS['prepare'])
+            backup_folder_name = self.file_manager.create_backup_folder_name(
+                self.folder_name,
+                add_timestamp=self.add_backup
+            )
+            self.target_directory = os.path.join(self.target_path, backup_folder_name)
+            
+            # Schritt 2: Speicherplatz prüfen und reservieren (wartet ggf. auf andere Jobs)
+            if DISK_SPACE['enabled']:
+                self._report("Checking disk space...", PHASE_PROGRESS['prepare'])
+                needed = self.estimate_size()
+                success, msg = self.space_checker.reserve(self.target_path, needed)
+                if not success:
+                    return False, msg
+                self._reserved_bytes = needed
+            
+            # Schritt 3: Verzeichnis erstellen
+            self._report("Creating directory...", PHASE_PROGRESS['directory'])
+            success, msg = self.file_manager.ensure_directory_exists(self.target_directory)
+            if not success:
+                return False, msg
+            
+            # Schritt 4: Repository klonen
+            self._report("Cloning repository...", PHASE_PROGRESS['clone'])
+            success, msg = self.git_manager.clone(
+                self.github_url,
+                self.target_directory,
+                progress_callback=self._on_git_progress if self._progress else None
+            )
+            if not success or not self.submodules:
+                return success, msg
+            
+            # Schritt 5: Submodule parallel und rekursiv klonen
+            self._report("Cloning submodules...", PHASE_PROGRESS['submodules'])
+            return SubmoduleManager(self.logger, profiler=self.profiler).clone_submodules(
+                self.target_directory,
+                progress=self._on_submodule_progress
+            )
+        
+        except Exception as e:
+            error_msg = f"Unexpected error: {str(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+    
+    def archive_stage(self) -> None:
+        """
+        Stufe 2 (CPU-lastig): Archiv erstellen, wenn gewünscht.
+        Fehler werden nur geloggt, da der Clone selbst erfolgreich war.
+        """
+        if not self.create_zip or not self.target_directory:
+            return
+        lower_thread_priority()
+        try:
+            with self._stage("archive"):
+                self._create_archive(self.target_directory)
+        except Exception as e:
+            self.logger.warning(f"Archive creation failed: {str(e)}")
+    
+    def replicate_stage(self) -> None:
+        """
+        Stufe 3 (I/O-lastig): Backup-Ordner und Archiv auf alle Replikationsziele kopieren
+        und das Archiv in den Object Storage hochladen.
+        Fehler werden nur geloggt, da das Backup selbst erfolgreich war.
+        """
+        upload = self.upload and self.archive_path is not None
+        if not (self.replicate_targets or upload) or not self.target_directory:
+            return
+        with self._stage("replicate"):
+            if self.replicate_targets:
+                self._replicate()
+            if upload:
+                self._upload()
+    
+    def finish(self, success: bool, message: str) -> Tuple[bool, str]:
+        """
+        Abschluss: gibt die Speicherplatz-Reservierung frei und meldet das Ergebnis.
+        
+        Args:
+            success (bool): Ergebnis von clone_stage()
+            message (str): Nachricht von clone_stage()
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        if self._reserved_bytes:
+            self.space_checker.release(self.target_path, self._reserved_bytes)
+            self._reserved_bytes = 0
+        if self.profiler:
+            self.profiler.save()
+        if not success:
+            return False, message
+        
+        success_msg = f"Repository successfully cloned to {self.target_directory}"
+        self.logger.success(success_msg)
+        self._report("Done", PHASE_PROGRESS['done'])
+        return True, success_msg
+    
+    def estimate_size(self) -> int:
+        """
+        Schätzt den Platzbedarf dieses Jobs (siehe DiskSpaceChecker.estimate).
+        
+        Returns:
+            int: Geschätzter Bedarf in Bytes
+        """
+        return self.space_checker.estimate(
+            self.github_url,
+            self.folder_name,
+            self.target_path,
+            create_archive=self.create_zip,
+            git_mode=self.git_mode
+        )
+    
+    def _replicate(self) -> None:
+        """Kopiert Backup-Ordner, Archiv und Manifest auf die Replikationsziele."""
+        self._report("Replicating backup...", PHASE_PROGRESS['replicate'])
+        paths = [self.target_directory]
+        if self.archive_path:
+            paths += [self.archive_path, self.archive_manager.get_manifest_path(self.archive_path)]
+        try:
+            success, msg = Replicator(self.replicate_targets, self.logger).replicate(paths)
+        except Exception as e:
+            success, msg = False, str(e)
+        if not success:
+            self.logger.warning(f"Replication failed: {msg}")
+    
+    def _upload(self) -> None:
+        """
+        Lädt Archiv und Manifest in den Object Storage hoch. Wurde das Archiv schon
+        beim Schreiben hochgeladen, fehlt nur noch das Manifest. Ein abgebrochener
+        Upload wird fortgesetzt.
+        """
+        self._report("Uploading archive...", PHASE_PROGRESS['replicate'])
+        paths = [] if self._streamed else [self.archive_path]
+        paths.append(self.archive_manager.get_manifest_path(self.archive_path))
+        paths = [path for path in paths if os.path.exists(path)]
+        if not paths:
+            return
+        try:
+            success, msg = S3Uploader(logger=self.logger).upload(paths)
+        except Exception as e:
+            success, msg = False, str(e)
+        if not success:
+            self.logger.warning(f"Upload failed: {msg}")
+    
+    def _stream_upload(self, archive_path: str) -> Optional[StreamingUpload]:
+        """
+        Startet den Upload eines TAR-Archivs, bevor es geschrieben wird.
+        
+        Args:
+            archive_path (str): Pfad des fertigen Archivs
+        
+        Returns:
+            Optional[StreamingUpload]: Der laufende Upload oder None (Format oder Einstellungen passen nicht)
+        """
+        if not self.upload or self.archive_format not in STREAMING_FORMATS:
+            return None
+        partial_path = self.archive_manager.partial_path(archive_path)
+        try:
+            # Ein Rest eines abgebrochenen Laufs darf nicht als neues Archiv gelesen werden
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            return S3Uploader(logger=self.logger).stream(partial_path, archive_path)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Cannot stream upload: {str(e)}")
+            return None
+    
+    def _create_archive(self, target_directory: str) -> None:
+        """
+        Erstellt das Archiv im gewählten Format.
+        Ist der Stand unverändert gegenüber einem vorhandenen Archiv, wird dieses übernommen.
+        Fehler werden nur geloggt, da der Clone selbst erfolgreich war.
+        
+        Args:
+            target_directory (str): Der geklonte Ordner
+        """
+        archive_path = self.archive_manager.archive_path(target_directory, self.archive_format)
+        source = self._archive_source(target_directory)
+        previous = self.archive_manager.find_reusable_archive(os.path.dirname(archive_path), source) if source else None
+        if previous:
+            self._report("Reusing unchanged archive...", PHASE_PROGRESS['archive'])
+            success, zip_msg = self.archive_manager.reuse_archive(previous, archive_path)
+            if success:
+                self.archive_manager.record_archive(zip_msg, source)
+                self.archive_path = zip_msg
+                return
+        self.archive_manager.unshare_archive(archive_path)
+        
+        if self.git_mode != "include":
+            self._report("Preparing .git directory...", PHASE_PROGRESS['archive'])
+        exclude_git, extra_files = self.archive_manager.prepare_git_directory(target_directory, self.git_mode)
+        mtime = self.archive_manager.source_date_epoch(target_directory) if self.reproducible else None
+        streaming = self._stream_upload(archive_path)
+        success, zip_msg = False, ""
+        
+        try:
+            if self.archive_format == "volumes":
+                self._report("Creating ZIP volumes...", PHASE_PROGRESS['archive'])
+                success, zip_msg = self.archive_manager.create_volume_archive(
+                    target_directory,
+                    exclude_git=exclude_git,
+                    extra_files=extra_files,
+                    mtime=mtime
+                )
+            elif self.archive_format == "tar.enc":
+                self._report("Creating encrypted archive...", PHASE_PROGRESS['archive'])
+                success, zip_msg = self.archive_manager.create_encrypted_archive(
+                    target_directory,
+                    exclude_git=exclude_git,
+                    extra_files=extra_files,
+                    mtime=mtime
+                )
+            elif self.archive_format == "tar.zst":
+                self._report("Creating TAR+Zstandard archive...", PHASE_PROGRESS['archive'])
+                success, zip_msg = self.archive_manager.create_tar_zstd_archive(
+                    target_directory,
+                    exclude_git=exclude_git,
+                    extra_files=extra_files,
+                    mtime=mtime
+                )
+            elif self.incremental_zip:
+                self._report("Creating ZIP archive...", PHASE_PROGRESS['archive'])
+                previous_zip = self.archive_manager.find_previous_archive(self.target_path, self.folder_name)
+                success, zip_msg = self.archive_manager.create_incremental_zip_archive(
+                    target_directory,
+                    previous_zip=previous_zip,
+                    exclude_git=exclude_git,
+                    extra_files=extra_files,
+                    mtime=mtime
+                )
+            else:
+                self._report("Creating ZIP archive...", PHASE_PROGRESS['archive'])
+                success, zip_msg = self.file_manager.create_zip_archive(
+                    target_directory,
+                    exclude_git=exclude_git,
+                    extra_files=extra_files,
+                    mtime=mtime
+                )
+        finally:
+            self.archive_manager.cleanup_git_directory(extra_files)
+            if streaming is not None:
+                # Fehlgeschlagener Upload: replicate_stage lädt erneut hoch (mit Fortsetzung)
+                self._streamed = streaming.finish(success)[0]
+        
+        if not success:
+            self.logger.warning(f"Archive creation failed: {zip_msg}")
+            return
+        self.archive_path = zip_msg
+        if source is not None:
+            self.archive_manager.record_archive(zip_msg, source)
+    
+    def _archive_source(self, target_directory: str) -> Optional[Dict]:
+        """
+        Stand des Clones samt Archiv-Optionen für die Wiederverwendung (siehe ArchiveManager.archive_source).
+        
+        Args:
+            target_directory (str): Der geklonte Ordner
+        
+        Returns:
+            Optional[Dict]: Der Stand oder None, wenn das Archiv immer neu gebaut wird
+        """
+        if not ARCHIVE['reuse_unchanged']:
+            return None
+        # Verschlüsselte Archive: keine Metadaten daneben. Delta-Archive: hängen vom Vorgänger ab
+        if self.archive_format == "tar.enc":
+            return None
+        if self.archive_format == "zip" and self.incremental_zip and ARCHIVE['incremental_mode'] == "delta":
+            return None
+        # Alle Einstellungen, die die Bytes des Archivs bestimmen
+        options = {
+            "format": self.archive_format,
+            "submodules": self.submodules,
+            "reproducible": self.reproducible,
+        }
+        if self.archive_format == "tar.zst":
+            options["zstd_level"] = ARCHIVE['zstd_level']
+            options["zstd_threads"] = ARCHIVE['zstd_threads']
+        else:
+            options["compression"] = zipfile.ZIP_DEFLATED
+        if self.archive_format == "zip" and self.incremental_zip:
+            # "merged" übernimmt Einträge komprimiert aus den Vorgängern
+            options["incremental_mode"] = ARCHIVE['incremental_mode']
+        if self.archive_format == "volumes":
+            options["volume_size"] = ARCHIVE['volume_size']
+        if ARCHIVE['exclude']:
+            options["exclude"] = list(ARCHIVE['exclude'])
+        return self.archive_manager.archive_source(target_directory, self.git_mode, options)
+    
+    @contextmanager
+    def _stage(self, stage: str) -> Iterator[None]:
+        """
+        Misst die Dauer einer Stufe (siehe timings) und profiliert sie, wenn Profiling aktiv ist.
+        
+        Args:
+            stage (str): Name der Stufe
+        """
+        self.stage, self.stage_started = stage, time.monotonic()
+        try:
+            with self.profiler.stage(stage) if self.profiler else nullcontext():
+                yield
+        finally:
+            self.timings[stage] = time.monotonic() - self.stage_started
+            self.stage = None
+    
+    def _on_git_progress(self, phase: str, percent: int, rate: str) -> None:
+        """
+        Rechnet den Git-Fortschritt in den Gesamtfortschritt des Jobs um.
+        
+        Args:
+            phase (str): Git-Phase, z.B. "Receiving objects"
+            percent (int): Fortschritt der Git-Phase in Prozent
+            rate (str): Transferrate, z.B. "2.00 MiB/s"
+        """
+        start, end = GIT_PHASE_WEIGHTS.get(phase, (0.0, 0.0))
+        fraction = start + (end - start) * percent / 100
+        span = PHASE_PROGRESS['clone_end'] - PHASE_PROGRESS['clone']
+        self._report(f"{phase} ({percent}%)", PHASE_PROGRESS['clone'] + span * fraction, rate)
+    
+    def _on_submodule_progress(self, done: int, total: int) -> None:
+        """
+        Meldet den Fortschritt der Submodule.
+        
+        Args:
+            done (int): Fertige Submodule
+            total (int): Bisher bekannte Submodule (wächst mit verschachtelten)
+        """
+        span = PHASE_PROGRESS['submodules_end'] - PHASE_PROGRESS['submodules']
+        self._report(f"Cloning submodules ({done}/{total})", PHASE_PROGRESS['submodules'] + span * done / total)
+    
+    def _report(self, phase: str, percent: float, rate: str = "") -> None:
+        """
+        Merkt sich den Fortschritt und meldet ihn an den Callback, falls vorhanden.
+        
+        Args:
+            phase (str): Beschreibung der aktuellen Phase
+            percent (float): Gesamtfortschritt 0-100
+            rate (str): Transferrate oder leer
+        """
+        self.percent = percent
+        if self._progress:
+            self._progress(phase, percent, rate)
\ No newline at end of file
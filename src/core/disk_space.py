@@ -0,0 +1,308 @@
+# core/disk_space.py
+
+"""
+Speicherplatz-Prüfung vor Clone und Archivierung.
+Schätzt den Platzbedarf eines Backups und reserviert ihn auf dem Ziel-Dateisystem,
+damit volle Platten nicht erst nach Gigabytes an Schreibarbeit auffallen.
+"""
+
+import os
+import json
+import shutil
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from config import DISK_SPACE, ARCHIVE
+from .logger import Logger
+from .tree_walker import TreeWalker
+from .archive_manager import ARCHIVE_SUFFIXES
+
+
+def format_size(size: int) -> str:
+    """
+    Formatiert eine Byte-Anzahl lesbar, z.B. "1.5 GiB".
+    
+    Args:
+        size (int): Anzahl Bytes
+    
+    Returns:
+        str: Formatierte Größe
+    """
+    value = float(size)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(value) < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} TiB"
+
+
+class DiskSpaceChecker:
+    """
+    Schätzt den Platzbedarf von Backups und prüft/reserviert freien Speicher.
+    
+    Reservierungen gelten prozessweit pro Dateisystem, damit parallel laufende
+    Jobs denselben freien Platz nicht mehrfach einplanen. Bereits geschriebene
+    Daten laufender Jobs zählen dabei doppelt (freier Platz sinkt, Reservierung
+    bleibt) - die Prüfung ist also bewusst konservativ.
+    
+    Attributes:
+        logger (Logger): Logger-Instanz für Logging
+    """
+    
+    # Prozessweite Reservierungen: Geräte-ID -> reservierte Bytes
+    _reserved: Dict[int, int] = {}
+    _condition = threading.Condition()
+    
+    def __init__(self, logger: Logger = None) -> None:
+        """
+        Initialisiert den DiskSpaceChecker.
+        
+        Args:
+            logger (Logger): Logger-Instanz. Wenn None, wird eine neue erstellt
+        """
+        self.logger = logger or Logger()
+    
+    def estimate(
+        self,
+        github_url: str,
+        folder_name: str,
+        target_path: str,
+        create_archive: bool = False,
+        git_mode: str = ARCHIVE['git_mode']
+    ) -> int:
+        """
+        Schätzt den Platzbedarf eines Backups in Bytes.
+        
+        Reihenfolge der Quellen: letztes Backup desselben Repositories im
+        Zielordner, sonst Größe der Pack-Dateien (lokales Mirror/Bare-Repository
+        oder GitHub-API), sonst 0 (nur DISK_SPACE['min_free_bytes'] wird geprüft).
+        
+        Args:
+            github_url (str): Die Repository-URL
+            folder_name (str): Name des lokalen Ordners
+            target_path (str): Speicherort der Backups
+            create_archive (bool): Ob zusätzlich ein Archiv erstellt wird
+            git_mode (str): Behandlung des .git-Verzeichnisses im Archiv
+        
+        Returns:
+            int: Geschätzter Bedarf in Bytes (inklusive Sicherheitszuschlag)
+        """
+        clone_bytes, archive_bytes = self._estimate_from_previous(folder_name, target_path)
+        if clone_bytes is None:
+            pack_bytes = self._pack_size(github_url)
+            clone_bytes = int(pack_bytes * DISK_SPACE['pack_factor']) if pack_bytes else 0
+        
+        needed = clone_bytes
+        if create_archive:
+            needed += archive_bytes if archive_bytes is not None else int(clone_bytes * DISK_SPACE['archive_ratio'])
+            # Repack/Bundle erzeugen vor dem Archivieren eine Kopie der Objekte
+            if git_mode in ("repack", "bundle"):
+                needed += int(clone_bytes * DISK_SPACE['archive_ratio'])
+        return int(needed * (1 + DISK_SPACE['margin_ratio']))
+    
+    def reserve(self, path: str, needed: int, wait: bool = True) -> Tuple[bool, str]:
+        """
+        Prüft den freien Platz und reserviert den Bedarf auf dem Dateisystem von path.
+        
+        Reicht der Platz nicht, solange andere Jobs auf demselben Dateisystem
+        reserviert haben, wird gewartet (bis DISK_SPACE['defer_timeout']),
+        da deren Abschluss Platz freigeben kann. Ohne andere Reservierungen
+        wird sofort abgelehnt.
+        
+        Args:
+            path (str): Zielpfad (muss noch nicht existieren)
+            needed (int): Benötigte Bytes
+            wait (bool): Ob bei fremden Reservierungen gewartet wird
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        existing = self._existing_parent(path)
+        device = os.stat(existing).st_dev
+        deadline = time.monotonic() + DISK_SPACE['defer_timeout']
+        deferred = False
+        
+        with self._condition:
+            while True:
+                available = self.available(existing)
+                if needed <= available:
+                    self._reserved[device] = self._reserved.get(device, 0) + needed
+                    self.logger.debug(f"Disk space reserved: {format_size(needed)} on {existing}")
+                    return True, f"Reserved {format_size(needed)}"
+                
+                remaining = deadline - time.monotonic()
+                if not wait or not self._reserved.get(device) or remaining <= 0:
+                    msg = (
+                        f"Not enough disk space on {existing}: "
+                        f"need {format_size(needed)}, available {format_size(max(available, 0))}"
+                    )
+                    self.logger.error(msg)
+                    return False, msg
+                
+                if not deferred:
+                    deferred = True
+                    self.logger.warning(f"Waiting for disk space on {existing} (need {format_size(needed)})")
+                self._condition.wait(min(remaining, DISK_SPACE['defer_poll_interval']))
+    
+    def release(self, path: str, needed: int) -> None:
+        """
+        Gibt eine Reservierung wieder frei und weckt wartende Jobs.
+        
+        Args:
+            path (str): Derselbe Pfad wie bei reserve()
+            needed (int): Dieselbe Byte-Anzahl wie bei reserve()
+        """
+        device = os.stat(self._existing_parent(path)).st_dev
+        with self._condition:
+            remaining = self._reserved.get(device, 0) - needed
+            if remaining > 0:
+                self._reserved[device] = remaining
+            else:
+                self._reserved.pop(device, None)
+            self._condition.notify_all()
+    
+    def available(self, path: str) -> int:
+        """
+        Freier Platz abzüglich Reservierungen und Mindestreserve.
+        
+        Args:
+            path (str): Pfad auf dem Dateisystem
+        
+        Returns:
+            int: Verfügbare Bytes (kann negativ sein)
+        """
+        existing = self._existing_parent(path)
+        device = os.stat(existing).st_dev
+        free = shutil.disk_usage(existing).free
+        return free - self._reserved.get(device, 0) - DISK_SPACE['min_free_bytes']
+    
+    def check_batch(self, requirements: List[Tuple[str, int]]) -> Tuple[bool, str]:
+        """
+        Prüft vorab, ob eine ganze Batch auf die Ziel-Dateisysteme passt.
+        Damit bricht ein Batch-Lauf sofort ab statt nach Stunden an I/O.
+        
+        Args:
+            requirements (List[Tuple[str, int]]): (Zielpfad, geschätzte Bytes) pro Job
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        per_device: Dict[int, List] = {}
+        for path, needed in requirements:
+            existing = self._existing_parent(path)
+            entry = per_device.setdefault(os.stat(existing).st_dev, [existing, 0])
+            entry[1] += needed
+        
+        for existing, needed in per_device.values():
+            available = self.available(existing)
+            if needed > available:
+                msg = (
+                    f"Batch does not fit on {existing}: "
+                    f"need {format_size(needed)}, available {format_size(max(available, 0))}"
+                )
+                self.logger.error(msg)
+                return False, msg
+        return True, f"Batch fits: {format_size(sum(needed for _, needed in per_device.values()))} estimated"
+    
+    def _estimate_from_previous(self, folder_name: str, target_path: str) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Größe des letzten Backups und Archivs desselben Repositories.
+        
+        Args:
+            folder_name (str): Name des lokalen Ordners
+            target_path (str): Speicherort der Backups
+        
+        Returns:
+            Tuple[Optional[int], Optional[int]]: (Ordnergröße, Archivgröße), None wenn unbekannt
+        """
+        folders, archives = [], []
+        try:
+            with os.scandir(target_path) as it:
+                for entry in it:
+                    stem = entry.name
+                    suffix = next((suffix for suffix in ARCHIVE_SUFFIXES.values() if stem.endswith(suffix)), None)
+                    if suffix:
+                        stem = stem[:-len(suffix)]
+                    if stem != folder_name and not stem.startswith(f"{folder_name}_backup_"):
+                        continue
+                    if suffix:
+                        archives.append(entry)
+                    elif entry.is_dir(follow_symlinks=False):
+                        folders.append(entry)
+        except OSError:
+            return None, None
+        
+        clone_bytes = archive_bytes = None
+        if folders:
+            latest = max(folders, key=lambda entry: entry.stat().st_mtime)
+            clone_bytes = self._directory_size(latest.path)
+        if archives:
+            latest = max(archives, key=lambda entry: entry.stat().st_mtime)
+            # Mehrteilige Archive sind Ordner mit den Teil-Archiven
+            if latest.is_dir(follow_symlinks=False):
+                archive_bytes = self._directory_size(latest.path)
+            else:
+                archive_bytes = latest.stat().st_size
+        return clone_bytes, archive_bytes
+    
+    def _pack_size(self, github_url: str) -> Optional[int]:
+        """
+        Größe der Git-Objekte eines lokalen Mirrors oder laut GitHub-API.
+        
+        Args:
+            github_url (str): Die Repository-URL oder ein lokaler Pfad
+        
+        Returns:
+            Optional[int]: Größe in Bytes oder None
+        """
+        local_path = github_url[len("file://"):] if github_url.startswith("file://") else github_url
+        for objects in (os.path.join(local_path, "objects"), os.path.join(local_path, ".git", "objects")):
+            if os.path.isdir(objects):
+                return self._directory_size(objects)
+        
+        if DISK_SPACE['github_api'] and "github.com" in github_url:
+            path = github_url.split("github.com", 1)[1].lstrip(":/")
+            parts = path[:-4].split("/") if path.endswith(".git") else path.rstrip("/").split("/")
+            if len(parts) == 2:
+                # Erst hier: urllib.request lädt http.client, ssl und email (spürbar beim Start)
+                import urllib.request
+                try:
+                    api_url = f"https://api.github.com/repos/{parts[0]}/{parts[1]}"
+                    with urllib.request.urlopen(api_url, timeout=DISK_SPACE['api_timeout']) as response:
+                        # "size" ist in KiB angegeben
+                        return json.load(response).get("size", 0) * 1024
+                except (OSError, ValueError):
+                    return None
+        return None
+    
+    @staticmethod
+    def _directory_size(path: str) -> int:
+        """
+        Summe der Dateigrößen unterhalb eines Verzeichnisses (nur Metadaten).
+        
+        Args:
+            path (str): Das Verzeichnis
+        
+        Returns:
+            int: Größe in Bytes
+        """
+        return sum(entry.size for entry in TreeWalker().files(path) if not entry.is_symlink)
+    
+    @staticmethod
+    def _existing_parent(path: str) -> str:
+        """
+        Nächstes existierendes Verzeichnis auf dem Weg zu path.
+        
+        Args:
+            path (str): Zielpfad
+        
+        Returns:
+            str: Existierender Pfad
+        """
+        path = os.path.abspath(path)
+        while not os.path.exists(path):
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+        return path
\ No newline at end of file
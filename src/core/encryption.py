@@ -0,0 +1,382 @@
+# core/encryption.py
+
+"""
+Verschlüsselte Archive ohne Klartext auf der Festplatte.
+Der TAR-Strom wird in Blöcke geteilt; jeder Block wird einzeln komprimiert und mit
+AES-256-GCM verschlüsselt. Die Blöcke sind unabhängig und werden daher auf mehreren
+Kernen gleichzeitig verarbeitet, beim Schreiben wie beim Lesen.
+
+Dateiformat::
+    
+    Kopf:   MAGIC | Version (1) | Kompression (1) | Blockgröße (4) | Salt (16)
+    Block:  Länge (4) | Flags (1) | Chiffrat inkl. GCM-Tag
+
+Der Schlüssel pro Archiv wird per HKDF aus dem Schlüssel der Schlüsseldatei und
+dem zufälligen Salt abgeleitet; die Nonce ist die Blocknummer. Kopf, Blocknummer
+und Flags sind als Associated Data authentifiziert, das Flag des letzten Blocks
+erkennt abgeschnittene Archive.
+"""
+
+import os
+import zlib
+import struct
+import binascii
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import BinaryIO, Deque, Optional, Tuple
+from config import ENCRYPTION, ARCHIVE
+
+try:
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+except ImportError:  # Optional: nur für verschlüsselte Archive nötig
+    AESGCM = None
+
+try:
+    import zstandard
+except ImportError:  # Optional: Fallback auf zlib
+    zstandard = None
+
+
+MAGIC = b"GBTENC\x00\x01"
+FORMAT_VERSION = 1
+HEADER = struct.Struct(">8sBBI16s")
+RECORD = struct.Struct(">IB")
+FLAG_LAST = 0x01
+COMPRESSION_ZLIB = 1
+COMPRESSION_ZSTD = 2
+KEY_SIZE = 32
+
+
+class EncryptionError(Exception):
+    """Schlüssel fehlt oder ist ungültig, oder ein Block lässt sich nicht entschlüsseln."""
+
+
+def require_cryptography() -> None:
+    """
+    Prüft, ob das Paket ``cryptography`` installiert ist.
+    
+    Raises:
+        EncryptionError: Wenn es fehlt
+    """
+    if AESGCM is None:
+        raise EncryptionError("Encryption needs the 'cryptography' package (pip install cryptography)")
+
+
+def generate_key(key_file: str) -> Tuple[bool, str]:
+    """
+    Erzeugt eine neue Schlüsseldatei (32 Zufallsbytes als Hex, nur für den Besitzer lesbar).
+    
+    Args:
+        key_file (str): Pfad der Schlüsseldatei (wird nicht überschrieben)
+    
+    Returns:
+        Tuple[bool, str]: (Erfolg True/False, Nachricht)
+    """
+    try:
+        descriptor = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        return False, f"Key file already exists: {key_file}"
+    except OSError as e:
+        return False, f"Cannot create key file {key_file}: {str(e)}"
+    with os.fdopen(descriptor, 'w') as f:
+        f.write(os.urandom(KEY_SIZE).hex() + "\n")
+    return True, f"Key written to {key_file}. Keep a copy: backups cannot be restored without it."
+
+
+def load_key(key_file: Optional[str] = None) -> bytes:
+    """
+    Liest einen Schlüssel: 32 Bytes roh, als Hex oder als Base64.
+    
+    Args:
+        key_file (Optional[str]): Pfad der Schlüsseldatei. Wenn None, ENCRYPTION['key_file']
+    
+    Returns:
+        bytes: Der 32-Byte-Schlüssel
+    
+    Raises:
+        EncryptionError: Wenn die Datei fehlt oder kein gültiger Schlüssel ist
+    """
+    key_file = key_file or ENCRYPTION['key_file']
+    try:
+        with open(key_file, 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        raise EncryptionError(f"Cannot read key file {key_file}: {str(e)}")
+    if len(data) == KEY_SIZE:
+        return data
+    text = data.strip()
+    for decode in (binascii.unhexlify, binascii.a2b_base64):
+        try:
+            key = decode(text)
+        except (binascii.Error, ValueError):
+            continue
+        if len(key) == KEY_SIZE:
+            return key
+    raise EncryptionError(f"Invalid key file {key_file}: expected {KEY_SIZE} bytes (raw, hex or base64)")
+
+
+def _derive_key(key: bytes, salt: bytes) -> "AESGCM":
+    """
+    Leitet den Schlüssel eines Archivs ab.
+    
+    Args:
+        key (bytes): Schlüssel aus der Schlüsseldatei
+        salt (bytes): Zufälliges Salt aus dem Archivkopf
+    
+    Returns:
+        AESGCM: Cipher-Objekt (thread-sicher)
+    """
+    hkdf = HKDF(algorithm=hashes.SHA256(), length=KEY_SIZE, salt=salt, info=b"GitBackupTool archive")
+    return AESGCM(hkdf.derive(key))
+
+
+def _associated_data(header: bytes, index: int, flags: int) -> bytes:
+    """Kopf, Blocknummer und Flags als Associated Data eines Blocks."""
+    return header + struct.pack(">QB", index, flags)
+
+
+class EncryptingWriter:
+    """
+    Datei-Objekt, das geschriebene Daten blockweise komprimiert, verschlüsselt
+    und in Reihenfolge in die Ausgabe schreibt. Es sind höchstens
+    ``2 * workers`` Blöcke gleichzeitig im Speicher.
+    
+    Attributes:
+        output (BinaryIO): Ausgabedatei
+        chunk_size (int): Klartext-Bytes pro Block
+    """
+    
+    def __init__(
+        self,
+        output: BinaryIO,
+        key: bytes,
+        chunk_size: int = ENCRYPTION['chunk_size'],
+        workers: int = ENCRYPTION['workers']
+    ) -> None:
+        """
+        Initialisiert den EncryptingWriter und schreibt den Archivkopf.
+        
+        Args:
+            output (BinaryIO): Ausgabedatei
+            key (bytes): Schlüssel aus load_key
+            chunk_size (int): Klartext-Bytes pro Block. Default aus config.py
+            workers (int): Threads, 0 = Anzahl CPU-Kerne. Default aus config.py
+        """
+        require_cryptography()
+        self.output = output
+        self.chunk_size = chunk_size
+        self._compression = COMPRESSION_ZSTD if zstandard is not None else COMPRESSION_ZLIB
+        salt = os.urandom(16)
+        self._header = HEADER.pack(MAGIC, FORMAT_VERSION, self._compression, chunk_size, salt)
+        self._cipher = _derive_key(key, salt)
+        workers = workers or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="encrypt")
+        self._window = 2 * workers
+        self._pending: Deque[Future] = deque()
+        self._buffer = bytearray()
+        self._index = 0
+        self._closed = False
+        self._local = threading.local()
+        output.write(self._header)
+    
+    def write(self, data) -> int:
+        """
+        Nimmt Klartext entgegen. Ein Block wird erst abgegeben, wenn weitere Daten
+        folgen, damit der letzte Block beim Schließen markiert werden kann.
+        
+        Args:
+            data: Bytes-artige Daten
+        
+        Returns:
+            int: Anzahl angenommener Bytes
+        """
+        self._buffer += data
+        while len(self._buffer) > self.chunk_size:
+            self._submit(bytes(self._buffer[:self.chunk_size]), 0)
+            del self._buffer[:self.chunk_size]
+        return len(data)
+    
+    def close(self) -> None:
+        """Verschlüsselt den letzten Block und wartet auf alle ausstehenden Blöcke."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._submit(bytes(self._buffer), FLAG_LAST)
+            self._buffer = bytearray()
+            while self._pending:
+                self.output.write(self._pending.popleft().result())
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+    
+    def __enter__(self) -> "EncryptingWriter":
+        return self
+    
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            # Abbruch: kein gültiges Ende schreiben
+            self._closed = True
+            self._executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _submit(self, plaintext: bytes, flags: int) -> None:
+        """
+        Gibt einen Block an den Thread-Pool und schreibt fertige Blöcke in Reihenfolge.
+        
+        Args:
+            plaintext (bytes): Klartext des Blocks
+            flags (int): FLAG_LAST für den letzten Block
+        """
+        while len(self._pending) >= self._window:
+            self.output.write(self._pending.popleft().result())
+        self._pending.append(self._executor.submit(self._seal, self._index, plaintext, flags))
+        self._index += 1
+    
+    def _seal(self, index: int, plaintext: bytes, flags: int) -> bytes:
+        """
+        Komprimiert und verschlüsselt einen Block.
+        
+        Args:
+            index (int): Blocknummer (Nonce)
+            plaintext (bytes): Klartext
+            flags (int): Flags des Blocks
+        
+        Returns:
+            bytes: Der vollständige Block-Datensatz
+        """
+        if self._compression == COMPRESSION_ZSTD:
+            # ZstdCompressor ist nicht thread-sicher: einer pro Thread
+            compressor = getattr(self._local, "compressor", None)
+            if compressor is None:
+                compressor = self._local.compressor = zstandard.ZstdCompressor(level=ARCHIVE['zstd_level'])
+            compressed = compressor.compress(plaintext)
+        else:
+            compressed = zlib.compress(plaintext, 6)
+        nonce = index.to_bytes(12, "big")
+        ciphertext = self._cipher.encrypt(nonce, compressed, _associated_data(self._header, index, flags))
+        return RECORD.pack(len(ciphertext), flags) + ciphertext
+
+
+class DecryptingReader:
+    """
+    Datei-Objekt, das ein verschlüsseltes Archiv liest und den Klartext liefert.
+    Die folgenden Blöcke werden im Voraus parallel entschlüsselt.
+    
+    Attributes:
+        source (BinaryIO): Das verschlüsselte Archiv
+    """
+    
+    def __init__(self, source: BinaryIO, key: bytes, workers: int = ENCRYPTION['workers']) -> None:
+        """
+        Initialisiert den DecryptingReader und prüft den Archivkopf.
+        
+        Args:
+            source (BinaryIO): Das verschlüsselte Archiv
+            key (bytes): Schlüssel aus load_key
+            workers (int): Threads, 0 = Anzahl CPU-Kerne. Default aus config.py
+        
+        Raises:
+            EncryptionError: Wenn der Kopf ungültig ist
+        """
+        require_cryptography()
+        self.source = source
+        self._header = source.read(HEADER.size)
+        if len(self._header) != HEADER.size:
+            raise EncryptionError("Not an encrypted archive (header too short)")
+        magic, version, self._compression, self._chunk_size, salt = HEADER.unpack(self._header)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise EncryptionError("Not an encrypted archive or unsupported version")
+        if self._compression == COMPRESSION_ZSTD and zstandard is None:
+            raise EncryptionError("This archive needs the 'zstandard' package")
+        self._cipher = _derive_key(key, salt)
+        workers = workers or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="decrypt")
+        self._window = 2 * workers
+        self._pending: Deque[Future] = deque()
+        self._index = 0
+        self._finished = False
+        self._buffer = b""
+        self._offset = 0
+        self._local = threading.local()
+    
+    def read(self, size: int = -1) -> bytes:
+        """
+        Liest Klartext.
+        
+        Args:
+            size (int): Maximale Anzahl Bytes, -1 = alles
+        
+        Returns:
+            bytes: Klartext, leer am Ende
+        
+        Raises:
+            EncryptionError: Bei falschem Schlüssel, manipulierten oder abgeschnittenen Daten
+        """
+        parts = []
+        while size < 0 or size > 0:
+            if self._offset >= len(self._buffer):
+                self._fill()
+                if not self._pending:
+                    break
+                self._buffer, self._offset = self._pending.popleft().result(), 0
+                continue
+            end = len(self._buffer) if size < 0 else min(len(self._buffer), self._offset + size)
+            parts.append(self._buffer[self._offset:end])
+            if size > 0:
+                size -= end - self._offset
+            self._offset = end
+        return b"".join(parts)
+    
+    def close(self) -> None:
+        """Beendet die Entschlüsselungs-Threads."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _fill(self) -> None:
+        """
+        Liest Block-Datensätze, bis genug Blöcke in Arbeit sind.
+        
+        Raises:
+            EncryptionError: Wenn das Archiv vor dem letzten Block endet
+        """
+        while not self._finished and len(self._pending) < self._window:
+            record = self.source.read(RECORD.size)
+            if len(record) < RECORD.size:
+                raise EncryptionError("Encrypted archive is truncated")
+            length, flags = RECORD.unpack(record)
+            ciphertext = self.source.read(length)
+            if len(ciphertext) != length:
+                raise EncryptionError("Encrypted archive is truncated")
+            self._pending.append(self._executor.submit(self._open, self._index, ciphertext, flags))
+            self._index += 1
+            self._finished = bool(flags & FLAG_LAST)
+    
+    def _open(self, index: int, ciphertext: bytes, flags: int) -> bytes:
+        """
+        Entschlüsselt und entpackt einen Block.
+        
+        Args:
+            index (int): Blocknummer
+            ciphertext (bytes): Chiffrat inkl. Tag
+            flags (int): Flags des Blocks
+        
+        Returns:
+            bytes: Klartext
+        """
+        try:
+            compressed = self._cipher.decrypt(
+                index.to_bytes(12, "big"),
+                ciphertext,
+                _associated_data(self._header, index, flags)
+            )
+        except Exception:
+            raise EncryptionError(f"Block {index} cannot be decrypted (wrong key or damaged archive)")
+        if self._compression == COMPRESSION_ZSTD:
+            decompressor = getattr(self._local, "decompressor", None)
+            if decompressor is None:
+                decompressor = self._local.decompressor = zstandard.ZstdDecompressor()
+            return decompressor.decompress(compressed, max_output_size=self._chunk_size)
+        return zlib.decompress(compressed)
\ No newline at end of file
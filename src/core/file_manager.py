@@ -13,6 +13,8 @@ from pathlib import Path
 from typing import Dict, Optional, Tuple
 from config import CONFIG_FILE
 from .logger import Logger
+from .throttle import archive_open, zip_write
+from .tree_walker import TreeWalker
 
 
 class FileManager:
@@ -82,14 +84,25 @@ class FileManager:
             self.logger.error(msg)
             return False, msg
     
-    def create_zip_archive(self, source_folder: str, output_zip: Optional[str] = None) -> Tuple[bool, str]:
+    def create_zip_archive(
+        self,
+        source_folder: str,
+        output_zip: Optional[str] = None,
+        exclude_git: bool = False,
+        extra_files: Optional[Dict[str, str]] = None,
+        mtime: Optional[int] = None
+    ) -> Tuple[bool, str]:
         """
-        Erstellt ein ZIP-Archiv aus einem Ordner.
+        Erstellt ein ZIP-Archiv aus einem Ordner. Members werden sortiert geschrieben.
         
         Args:
             source_folder (str): Der Quellordner
-            output_zip (Optional[str]): Der Pfad der ZIP-Datei. 
+            output_zip (Optional[str]): Der Pfad der ZIP-Datei.
                                        Wenn None, wird [source_folder].zip verwendet
+            exclude_git (bool): Wenn True, werden .git-Verzeichnisse übersprungen
+            extra_files (Optional[Dict[str, str]]): Zusätzliche Members (Archivname -> Dateipfad)
+            mtime (Optional[int]): Fester Zeitstempel für ein reproduzierbares Archiv
+                                  (siehe ArchiveManager.source_date_epoch), None = Zeiten der Dateien
         
         Returns:
             Tuple[bool, str]: (Erfolg True/False, Pfad oder Fehlermeldung)
@@ -105,20 +118,19 @@ class FileManager:
             
             self.logger.info(f"Creating ZIP archive: {output_zip}")
             
-            with zipfile.ZipFile(output_zip, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for root, dirs, files in os.walk(source_folder):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        # Relative Pfad für Archive
-                        arcname = os.path.relpath(file_path, source_folder)
-                        zipf.write(file_path, arcname)
+            with archive_open(output_zip, 'wb') as output, zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                # Sortiert: gleiche Reihenfolge unabhängig vom Dateisystem
+                for entry in TreeWalker.for_archive(exclude_git).files(source_folder):
+                    zip_write(zipf, entry.path, entry.relpath, mtime)
+                for arcname, file_path in sorted((extra_files or {}).items()):
+                    zip_write(zipf, file_path, arcname, mtime)
             
             # Dateigrößen ermitteln
             zip_size = os.path.getsize(output_zip)
             msg = f"ZIP archive created: {output_zip} ({zip_size / (1024*1024):.2f} MB)"
             self.logger.success(msg)
             return True, output_zip
-            
+        
         except PermissionError:
             msg = f"Permission denied creating ZIP: {output_zip}"
             self.logger.error(msg)
@@ -181,7 +193,7 @@ class FileManager:
             
             self.logger.debug(f"Config loaded: {config_file}")
             return data
-            
+        
         except json.JSONDecodeError:
             msg = f"Invalid JSON in config file: {config_file}"
             self.logger.warning(msg)
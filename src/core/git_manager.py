@@ -5,12 +5,22 @@ Git-Manager für alle Git-Operationen.
 Verwaltet Git-Befehle und URL-Validierung.
 """
 
+import os
+import re
+import time
+import hashlib
 import subprocess
-from typing import Tuple
-from config import GIT_CLONE_TIMEOUT
+from typing import Callable, Dict, List, Optional, Tuple
+from config import GIT_CLONE_TIMEOUT, MAINTENANCE
 from .logger import Logger
+from .throttle import priority_command, priority_creationflags
+from .throttle_proxy import ThrottlingProxy
+from .job_profiler import JobProfiler, ProfiledPopen
 
 
+# Fortschrittszeilen von Git, z.B. "Receiving objects:  45% (450/1000), 1.20 MiB | 2.00 MiB/s"
+GIT_PROGRESS_PATTERN = re.compile(r'^(?:remote:\s*)?([A-Za-z ]+):\s+(\d+)%(?:.*\|\s*(\S+ \S+/s))?')
+
 class GitManager:
     """
     Manager für Git-Operationen.
@@ -18,18 +28,26 @@ class GitManager:
     Attributes:
         logger (Logger): Logger-Instanz für Logging
         timeout (int): Timeout für Git-Befehle in Sekunden
+        profiler (Optional[JobProfiler]): Erfasst den Ressourcenverbrauch jedes Git-Aufrufs
     """
     
-    def __init__(self, logger: Logger = None, timeout: int = GIT_CLONE_TIMEOUT) -> None:
+    def __init__(
+        self,
+        logger: Logger = None,
+        timeout: int = GIT_CLONE_TIMEOUT,
+        profiler: Optional[JobProfiler] = None
+    ) -> None:
         """
         Initialisiert den GitManager.
         
         Args:
             logger (Logger): Logger-Instanz. Wenn None, wird eine neue erstellt
             timeout (int): Timeout für Git-Befehle. Default aus config.py
+            profiler (Optional[JobProfiler]): Profiler des Jobs oder None
         """
         self.logger = logger or Logger()
         self.timeout = timeout
+        self.profiler = profiler
     
     def is_valid_url(self, url: str) -> bool:
         """
@@ -46,13 +64,7 @@ class GitManager:
             return False
         
         try:
-            result = subprocess.run(
-                ["git", "ls-remote", url],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=True,
-                timeout=self.timeout
-            )
+            self._run_git(["ls-remote", url], timeout=self.timeout)
             self.logger.info(f"URL validation successful: {url}")
             return True
         except subprocess.CalledProcessError as e:
@@ -68,13 +80,21 @@ class GitManager:
             self.logger.error(f"Unexpected error during URL validation: {str(e)}")
             return False
     
-    def clone(self, url: str, target_path: str) -> Tuple[bool, str]:
+    def clone(
+        self,
+        url: str,
+        target_path: str,
+        progress_callback: Optional[Callable[[str, int, str], None]] = None
+    ) -> Tuple[bool, str]:
         """
         Klont ein GitHub-Repository zu einem bestimmten Pfad.
         
         Args:
             url (str): Die GitHub-URL des zu klonenden Repositories
             target_path (str): Der Zielpfad für das Repository
+            progress_callback (Optional[Callable[[str, int, str], None]]):
+                Wird mit (Phase, Prozent, Transferrate) aufgerufen, z.B.
+                ("Receiving objects", 45, "2.00 MiB/s")
         
         Returns:
             Tuple[bool, str]: (Erfolg True/False, Nachricht)
@@ -87,17 +107,19 @@ class GitManager:
         try:
             self.logger.info(f"Starting clone: {url} -> {target_path}")
             
-            subprocess.run(
-                ["git", "clone", url, target_path],
-                check=True,
-                capture_output=True,
-                timeout=None  # Clone kann länger dauern
-            )
+            if progress_callback:
+                self._run_git(
+                    ["clone", "--progress", url, target_path],
+                    timeout=None,  # Clone kann länger dauern
+                    on_output=lambda line: self._parse_progress(line, progress_callback)
+                )
+            else:
+                self._run_git(["clone", url, target_path], timeout=None)  # Clone kann länger dauern
             
             msg = f"Successfully cloned: {url}"
             self.logger.success(msg)
             return True, msg
-            
+        
         except subprocess.CalledProcessError as e:
             error_msg = f"Git clone failed: {str(e.stderr.decode() if e.stderr else e)}"
             self.logger.error(error_msg)
@@ -109,4 +131,605 @@ class GitManager:
         except Exception as e:
             error_msg = f"Unexpected error during clone: {str(e)}"
             self.logger.error(error_msg)
-            return False, error_msg
\ No newline at end of file
+            return False, error_msg
+    
+    def repack(self, repo_path: str) -> Tuple[bool, str]:
+        """
+        Packt alle Objekte eines Repositories in ein einzelnes Pack.
+        Lose Objekte, die danach im Pack liegen, werden entfernt.
+        
+        Args:
+            repo_path (str): Pfad des Arbeitsverzeichnisses
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        try:
+            self._run_git(["repack", "-a", "-d", "-q"], cwd=repo_path)
+            self._run_git(["prune-packed", "-q"], cwd=repo_path)
+            msg = f"Repository repacked: {repo_path}"
+            self.logger.info(msg)
+            return True, msg
+        except subprocess.CalledProcessError as e:
+            error_msg = f"Git repack failed: {self._stderr_text(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+        except FileNotFoundError:
+            error_msg = "Git command not found. Please ensure Git is installed."
+            self.logger.error(error_msg)
+            return False, error_msg
+        except Exception as e:
+            error_msg = f"Unexpected error during repack: {str(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+    
+    def maintain(self, repo_path: str) -> Tuple[bool, str]:
+        """
+        Optimiert ein gespeichertes Repository für spätere Fetches, Logs und Diffs:
+        Refs packen, alle Objekte in ein Pack mit Multi-Pack-Index und Bitmap,
+        Commit-Graph mit Changed-Path-Filtern schreiben, alte unerreichbare Objekte entfernen.
+        
+        Args:
+            repo_path (str): Pfad des Arbeitsverzeichnisses
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        steps = [
+            ["pack-refs", "--all", "--prune"],
+            ["repack", "-a", "-d", "-q", "--write-midx", "--write-bitmap-index"],
+            ["prune-packed", "-q"],
+            ["commit-graph", "write", "--reachable", "--changed-paths", "--no-progress"],
+            ["prune", f"--expire={MAINTENANCE['prune_expire']}"],
+        ]
+        try:
+            for step in steps:
+                self._run_git(step, cwd=repo_path)
+            msg = f"Repository maintained: {repo_path}"
+            self.logger.info(msg)
+            return True, msg
+        except subprocess.CalledProcessError as e:
+            error_msg = f"Git {step[0]} failed: {self._stderr_text(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+        except FileNotFoundError:
+            error_msg = "Git command not found. Please ensure Git is installed."
+            self.logger.error(error_msg)
+            return False, error_msg
+        except Exception as e:
+            error_msg = f"Unexpected error during maintenance: {str(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+    
+    def fsck(self, repo_path: str, full: bool = True) -> Tuple[bool, str]:
+        """
+        Prüft ein gespeichertes Repository mit ``git fsck``: Erreichbarkeit aller
+        Objekte ab Refs, HEAD und Index, bei full zusätzlich Inhalt und Hash jedes
+        Objekts sowie die Prüfsummen der Packs.
+        
+        Args:
+            repo_path (str): Pfad des Arbeitsverzeichnisses
+            full (bool): Alle Objekte lesen; False = nur Erreichbarkeit (--connectivity-only, deutlich schneller)
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht bzw. die ersten gemeldeten Fehler)
+        """
+        args = ["fsck", "--no-progress", "--no-dangling"]
+        if not full:
+            args.append("--connectivity-only")
+        try:
+            self._run_git(args, cwd=repo_path)
+            msg = f"Repository intact: {repo_path}"
+            self.logger.info(msg)
+            return True, msg
+        except subprocess.CalledProcessError as e:
+            # Fehlende Objekte meldet fsck auf stdout, beschädigte auf stderr
+            output = (e.stdout or b"") + (e.stderr or b"")
+            lines = [" ".join(line.split()) for line in output.decode(errors='replace').splitlines() if line.strip()]
+            details = "; ".join(lines[:5]) + (f" (+{len(lines) - 5} more)" if len(lines) > 5 else "")
+            error_msg = f"Git fsck failed for {repo_path}: {details or e}"
+            self.logger.error(error_msg)
+            return False, error_msg
+        except FileNotFoundError:
+            error_msg = "Git command not found. Please ensure Git is installed."
+            self.logger.error(error_msg)
+            return False, error_msg
+        except Exception as e:
+            error_msg = f"Unexpected error during integrity check: {str(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+    
+    def refs_fingerprint(self, repo_path: str) -> Optional[str]:
+        """
+        Prüfsumme über alle Refs und HEAD. Ändert sie sich nicht, sind auch keine
+        neuen erreichbaren Objekte hinzugekommen.
+        
+        Args:
+            repo_path (str): Pfad des Arbeitsverzeichnisses
+        
+        Returns:
+            Optional[str]: Hex-Digest oder None, wenn kein lesbares Repository
+        """
+        try:
+            refs = self._run_git(["for-each-ref", "--format=%(objectname) %(refname)"], cwd=repo_path).stdout
+            head = self._run_git(["rev-parse", "--verify", "-q", "HEAD"], cwd=repo_path).stdout
+        except (subprocess.CalledProcessError, FileNotFoundError, NotADirectoryError):
+            return None
+        return hashlib.blake2b(head + refs, digest_size=16).hexdigest()
+    
+    def create_bundle(self, repo_path: str, bundle_path: str) -> Tuple[bool, str]:
+        """
+        Erstellt ein Git-Bundle mit allen Refs eines Repositories.
+        
+        Args:
+            repo_path (str): Pfad des Arbeitsverzeichnisses
+            bundle_path (str): Pfad der zu erstellenden Bundle-Datei
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Pfad oder Fehlermeldung)
+        """
+        try:
+            self._run_git(["bundle", "create", "-q", os.path.abspath(bundle_path), "--all"], cwd=repo_path)
+            self.logger.info(f"Bundle created: {bundle_path}")
+            return True, bundle_path
+        except subprocess.CalledProcessError as e:
+            error_msg = f"Git bundle failed: {self._stderr_text(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+        except FileNotFoundError:
+            error_msg = "Git command not found. Please ensure Git is installed."
+            self.logger.error(error_msg)
+            return False, error_msg
+        except Exception as e:
+            error_msg = f"Unexpected error during bundle creation: {str(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+    
+    def verify_bundle(self, bundle_path: str) -> Tuple[bool, str]:
+        """
+        Prüft, ob eine Datei ein lesbares Bundle ist (Kopf und Refs).
+        Die Objekte selbst prüft Git beim Klonen bzw. Fetchen.
+        
+        Args:
+            bundle_path (str): Pfad der Bundle-Datei
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        try:
+            # "bundle verify" braucht ein Repository; list-heads liest nur das Bundle
+            self._run_git(["bundle", "list-heads", os.path.abspath(bundle_path)])
+            return True, f"Bundle verified: {bundle_path}"
+        except subprocess.CalledProcessError as e:
+            error_msg = f"Bundle verification failed: {self._stderr_text(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+        except FileNotFoundError:
+            error_msg = "Git command not found. Please ensure Git is installed."
+            self.logger.error(error_msg)
+            return False, error_msg
+    
+    def restore_bundle(self, bundle_path: str, work_dir: str) -> Tuple[bool, str]:
+        """
+        Stellt das .git-Verzeichnis eines Arbeitsverzeichnisses aus einem Bundle
+        wieder her. Die Dateien im Arbeitsverzeichnis bleiben unverändert.
+        
+        Args:
+            bundle_path (str): Pfad der Bundle-Datei
+            work_dir (str): Arbeitsverzeichnis ohne .git
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        temp_dir = os.path.join(work_dir, ".git-restore")
+        try:
+            self._run_git(["clone", "--no-checkout", "-q", os.path.abspath(bundle_path), temp_dir])
+            os.replace(os.path.join(temp_dir, ".git"), os.path.join(work_dir, ".git"))
+            os.rmdir(temp_dir)
+            # Index aus HEAD aufbauen, ohne Dateien zu überschreiben
+            self._run_git(["reset", "-q"], cwd=work_dir)
+            return True, f".git restored in {work_dir}"
+        except subprocess.CalledProcessError as e:
+            error_msg = f"Restoring .git from bundle failed: {self._stderr_text(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+        except (FileNotFoundError, OSError) as e:
+            error_msg = f"Restoring .git from bundle failed: {str(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+    
+    def head_ids(self, repo_path: str) -> Optional[Tuple[str, str]]:
+        """
+        Commit- und Tree-ID von HEAD.
+        
+        Args:
+            repo_path (str): Pfad des Arbeitsverzeichnisses
+        
+        Returns:
+            Optional[Tuple[str, str]]: (Commit-ID, Tree-ID) oder None (kein Repository/leer)
+        """
+        try:
+            output = self._run_git(["rev-parse", "HEAD", "HEAD^{tree}"], cwd=repo_path).stdout.decode().split()
+        except (subprocess.CalledProcessError, FileNotFoundError, NotADirectoryError):
+            return None
+        return (output[0], output[1]) if len(output) == 2 else None
+    
+    def head_commit_time(self, repo_path: str) -> Optional[int]:
+        """
+        Commit-Zeit von HEAD.
+        
+        Args:
+            repo_path (str): Pfad des Arbeitsverzeichnisses
+        
+        Returns:
+            Optional[int]: Unix-Zeit oder None (kein Repository/leer)
+        """
+        try:
+            output = self._run_git(["log", "-1", "--format=%ct", "HEAD"], cwd=repo_path).stdout.decode().strip()
+        except (subprocess.CalledProcessError, FileNotFoundError, NotADirectoryError):
+            return None
+        return int(output) if output.isdigit() else None
+    
+    def diff_trees(
+        self,
+        repo_path: str,
+        old_tree: str,
+        new_tree: str,
+        old_objects: Optional[str] = None
+    ) -> List[Tuple[str, str, str, str]]:
+        """
+        Vergleicht zwei Trees rekursiv, ohne Dateien zu lesen.
+        
+        Args:
+            repo_path (str): Repository mit new_tree
+            old_tree (str): Tree-ID des alten Stands
+            new_tree (str): Tree-ID des neuen Stands
+            old_objects (Optional[str]): objects-Verzeichnis eines anderen Repositories mit old_tree
+                (wird als Alternate eingebunden, nichts wird kopiert)
+        
+        Returns:
+            List[Tuple[str, str, str, str]]: (Status A/D/M/T, alte Blob-ID, neue Blob-ID, Pfad)
+        
+        Raises:
+            subprocess.CalledProcessError: Wenn ein Tree nicht lesbar ist
+        """
+        env = {"GIT_ALTERNATE_OBJECT_DIRECTORIES": old_objects} if old_objects else None
+        output = self._run_git(
+            ["diff-tree", "-r", "-z", "--no-renames", "--raw", old_tree, new_tree],
+            cwd=repo_path,
+            env=env
+        ).stdout
+        
+        # Format: ":<alt-Modus> <neu-Modus> <alt-ID> <neu-ID> <Status>\0<Pfad>\0"
+        fields = output.split(b'\0')
+        changes = []
+        for index in range(0, len(fields) - 1, 2):
+            _, _, old_id, new_id, status = fields[index].decode().split(' ')
+            changes.append((status[0], old_id, new_id, fields[index + 1].decode(errors='replace')))
+        return changes
+    
+    def object_sizes(self, repo_path: str, object_ids: List[str], extra_objects: Optional[str] = None) -> Dict[str, int]:
+        """
+        Größen vieler Objekte mit einem einzigen "git cat-file --batch-check".
+        
+        Args:
+            repo_path (str): Pfad des Repositories
+            object_ids (List[str]): Die Objekt-IDs
+            extra_objects (Optional[str]): Zusätzliches objects-Verzeichnis (Alternate)
+        
+        Returns:
+            Dict[str, int]: Objekt-ID -> Größe in Bytes (fehlende Objekte fehlen)
+        """
+        if not object_ids:
+            return {}
+        env = {"GIT_ALTERNATE_OBJECT_DIRECTORIES": extra_objects} if extra_objects else None
+        output = self._run_git(
+            ["cat-file", "--batch-check=%(objectname) %(objectsize)"],
+            cwd=repo_path,
+            env=env,
+            input="\n".join(object_ids).encode() + b"\n"
+        ).stdout
+        sizes = {}
+        for line in output.decode().splitlines():
+            object_id, _, size = line.partition(' ')
+            if size.isdigit():
+                sizes[object_id] = int(size)
+        return sizes
+    
+    def init_submodules(self, repo_path: str) -> List[Tuple[str, str, str]]:
+        """
+        Registriert die Submodule eines Klons (relative URLs werden aufgelöst).
+        
+        Args:
+            repo_path (str): Pfad des Arbeitsverzeichnisses
+        
+        Returns:
+            List[Tuple[str, str, str]]: (Name, Pfad, URL) pro Submodul, leer ohne .gitmodules
+        
+        Raises:
+            subprocess.CalledProcessError: Wenn "git submodule init" fehlschlägt
+        """
+        if not os.path.isfile(os.path.join(repo_path, '.gitmodules')):
+            return []
+        self._run_git(["submodule", "init", "-q"], cwd=repo_path)
+        urls = self._config_values(repo_path, r'^submodule\..*\.url$')
+        paths = self._config_values(repo_path, r'^submodule\..*\.path$', config_file='.gitmodules')
+        submodules = []
+        for key, url in urls.items():
+            name = key[len("submodule."):-len(".url")]
+            path = paths.get(f"submodule.{name}.path")
+            if path:
+                submodules.append((name, path, url))
+        return submodules
+    
+    def update_submodule(self, repo_path: str, path: str, reference: Optional[str] = None) -> Tuple[bool, str]:
+        """
+        Klont und checkt ein registriertes Submodul aus (nicht rekursiv).
+        
+        Mit reference werden vorhandene Objekte aus einem lokalen Mirror verwendet
+        und anschließend kopiert (--dissociate), das Backup bleibt eigenständig.
+        
+        Args:
+            repo_path (str): Pfad des übergeordneten Arbeitsverzeichnisses
+            path (str): Pfad des Submoduls relativ zu repo_path
+            reference (Optional[str]): Lokaler Mirror mit denselben Objekten
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        args = ["submodule", "update", "-q"]
+        if reference:
+            args += ["--reference", reference, "--dissociate"]
+        try:
+            self._run_git(args + ["--", path], cwd=repo_path)
+            return True, f"Submodule updated: {path}"
+        except subprocess.CalledProcessError as e:
+            error_msg = f"Submodule update failed for {path}: {self._stderr_text(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+        except FileNotFoundError:
+            error_msg = "Git command not found. Please ensure Git is installed."
+            self.logger.error(error_msg)
+            return False, error_msg
+    
+    def update_mirror(self, url: str, mirror_path: str) -> Tuple[bool, str]:
+        """
+        Legt einen Bare-Mirror an oder aktualisiert ihn.
+        
+        Args:
+            url (str): URL des Repositories
+            mirror_path (str): Pfad des Mirrors
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        try:
+            if os.path.isdir(mirror_path):
+                self._run_git(["fetch", "--prune", "-q"], cwd=mirror_path)
+            else:
+                self._run_git(["clone", "--mirror", "-q", url, mirror_path])
+            return True, f"Mirror updated: {mirror_path}"
+        except subprocess.CalledProcessError as e:
+            error_msg = f"Mirror update failed for {url}: {self._stderr_text(e)}"
+            self.logger.warning(error_msg)
+            return False, error_msg
+        except FileNotFoundError:
+            error_msg = "Git command not found. Please ensure Git is installed."
+            self.logger.error(error_msg)
+            return False, error_msg
+    
+    def submodule_paths(self, repo_path: str) -> List[str]:
+        """
+        Pfade aller ausgecheckten Submodule, rekursiv.
+        
+        Args:
+            repo_path (str): Pfad des Arbeitsverzeichnisses
+        
+        Returns:
+            List[str]: Pfade relativ zu repo_path, leer ohne Submodule oder bei Fehlern
+        """
+        if not os.path.isfile(os.path.join(repo_path, '.gitmodules')):
+            return []
+        try:
+            output = self._run_git(["submodule", "status", "--recursive"], cwd=repo_path).stdout
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return []
+        paths = []
+        for line in output.decode(errors='replace').splitlines():
+            # Format: "<Status><SHA> <Pfad> (<Beschreibung>)", Status "-" = nicht initialisiert
+            if line and line[0] != '-':
+                paths.append(line[1:].split(' ', 1)[1].rsplit(' (', 1)[0])
+        return paths
+    
+    def _config_values(self, repo_path: str, pattern: str, config_file: Optional[str] = None) -> Dict[str, str]:
+        """
+        Liest Konfigurationswerte, deren Schlüssel auf pattern passt.
+        
+        Args:
+            repo_path (str): Pfad des Arbeitsverzeichnisses
+            pattern (str): Regulärer Ausdruck für die Schlüssel
+            config_file (Optional[str]): Datei statt der Repository-Konfiguration, z.B. ".gitmodules"
+        
+        Returns:
+            Dict[str, str]: Schlüssel -> Wert (leer, wenn nichts passt)
+        """
+        args = ["config", "-z"] + (["-f", config_file] if config_file else []) + ["--get-regexp", pattern]
+        try:
+            output = self._run_git(args, cwd=repo_path).stdout
+        except subprocess.CalledProcessError:
+            # Exit-Code 1: kein Schlüssel gefunden
+            return {}
+        values = {}
+        for entry in output.decode(errors='replace').split('\0'):
+            if entry:
+                key, _, value = entry.partition('\n')
+                values[key] = value
+        return values
+    
+    def _run_git(
+        self,
+        args: List[str],
+        cwd: Optional[str] = None,
+        timeout: Optional[int] = None,
+        on_output: Optional[Callable[[str], None]] = None,
+        env: Optional[Dict[str, str]] = None,
+        input: Optional[bytes] = None
+    ) -> subprocess.CompletedProcess:
+        """
+        Führt einen Git-Befehl aus und gibt das Ergebnis zurück.
+        
+        Args:
+            args (List[str]): Argumente nach ``git``
+            cwd (Optional[str]): Arbeitsverzeichnis des Befehls
+            timeout (Optional[int]): Timeout in Sekunden, None = unbegrenzt
+            on_output (Optional[Callable[[str], None]]): Erhält jede stderr-Zeile
+                sofort (Fortschritt). stdout wird in diesem Fall verworfen.
+            env (Optional[Dict[str, str]]): Zusätzliche Umgebungsvariablen
+            input (Optional[bytes]): Daten für stdin (nur ohne on_output)
+        
+        Returns:
+            subprocess.CompletedProcess: Ergebnis mit stdout/stderr als Bytes
+        
+        Raises:
+            subprocess.CalledProcessError: Wenn Git mit Fehlercode endet
+            subprocess.TimeoutExpired: Wenn der Timeout überschritten wird
+            FileNotFoundError: Wenn Git nicht installiert ist
+        """
+        command = self._git_command(args)
+        if env:
+            env = dict(os.environ, **env)
+        if on_output is None and self.profiler is None:
+            return subprocess.run(
+                command,
+                cwd=cwd,
+                check=True,
+                capture_output=True,
+                timeout=timeout,
+                env=env,
+                input=input,
+                creationflags=priority_creationflags()
+            )
+        if on_output is None:
+            return self._run_profiled(args, command, cwd, timeout, env, input)
+        
+        started = time.perf_counter()
+        popen = ProfiledPopen if self.profiler else subprocess.Popen
+        process = popen(
+            command,
+            cwd=cwd,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            creationflags=priority_creationflags()
+        )
+        stderr = bytearray()
+        pending = b''
+        # Git trennt Fortschrittszeilen mit \r, daher selbst aufteilen
+        for chunk in iter(lambda: process.stderr.read1(4096), b''):
+            stderr += chunk
+            lines = re.split(rb'[\r\n]', pending + chunk)
+            pending = lines.pop()
+            for line in lines:
+                if line:
+                    on_output(line.decode(errors='replace'))
+        process.stderr.close()
+        returncode = process.wait(timeout=timeout)
+        if self.profiler:
+            self.profiler.record_process(args, process, started)
+        
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, process.args, b'', bytes(stderr))
+        return subprocess.CompletedProcess(process.args, returncode, b'', bytes(stderr))
+    
+    def _run_profiled(
+        self,
+        args: List[str],
+        command: List[str],
+        cwd: Optional[str],
+        timeout: Optional[int],
+        env: Optional[Dict[str, str]],
+        input: Optional[bytes]
+    ) -> subprocess.CompletedProcess:
+        """
+        Wie subprocess.run, erfasst aber den Ressourcenverbrauch für den Profiler.
+        
+        Args:
+            args (List[str]): Argumente nach ``git`` (für den Bericht)
+            command (List[str]): Die vollständige Kommandozeile
+            cwd (Optional[str]): Arbeitsverzeichnis des Befehls
+            timeout (Optional[int]): Timeout in Sekunden, None = unbegrenzt
+            env (Optional[Dict[str, str]]): Vollständige Umgebung oder None
+            input (Optional[bytes]): Daten für stdin
+        
+        Returns:
+            subprocess.CompletedProcess: Ergebnis mit stdout/stderr als Bytes
+        
+        Raises:
+            subprocess.CalledProcessError: Wenn Git mit Fehlercode endet
+            subprocess.TimeoutExpired: Wenn der Timeout überschritten wird
+        """
+        started = time.perf_counter()
+        with ProfiledPopen(
+            command,
+            cwd=cwd,
+            env=env,
+            stdin=subprocess.PIPE if input is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            creationflags=priority_creationflags()
+        ) as process:
+            try:
+                stdout, stderr = process.communicate(input, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                raise
+            finally:
+                self.profiler.record_process(args, process, started)
+        
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, process.args, stdout, stderr)
+        return subprocess.CompletedProcess(process.args, process.returncode, stdout, stderr)
+    
+    def _git_command(self, args: List[str]) -> List[str]:
+        """
+        Baut die Kommandozeile: niedrige Priorität (nice/ionice) und, wenn ein
+        Netzwerk-Limit gesetzt ist, der lokale Drossel-Proxy für HTTPS-Transfers.
+        Ein konfigurierter Proxy wird vom Drossel-Proxy als Upstream genutzt.
+        SSH-Transfers werden nicht gedrosselt.
+        
+        Args:
+            args (List[str]): Argumente nach ``git``
+        
+        Returns:
+            List[str]: Die vollständige Kommandozeile
+        """
+        proxy = ThrottlingProxy.shared(self.logger)
+        options = ["-c", f"http.proxy={proxy.url}"] if proxy else []
+        return priority_command(["git"] + options + args)
+    
+    @staticmethod
+    def _parse_progress(line: str, progress_callback: Callable[[str, int, str], None]) -> None:
+        """
+        Wertet eine Fortschrittszeile von Git aus.
+        
+        Args:
+            line (str): Die stderr-Zeile
+            progress_callback (Callable[[str, int, str], None]): Empfänger für (Phase, Prozent, Rate)
+        """
+        match = GIT_PROGRESS_PATTERN.match(line)
+        if match:
+            progress_callback(match.group(1).strip(), int(match.group(2)), match.group(3) or "")
+    
+    @staticmethod
+    def _stderr_text(error: subprocess.CalledProcessError) -> str:
+        """
+        Gibt die Fehlerausgabe eines Git-Befehls als Text zurück.
+        
+        Args:
+            error (subprocess.CalledProcessError): Die Exception des Befehls
+        
+        Returns:
+            str: stderr als Text oder die Exception selbst
+        """
+        return str(error.stderr.decode(errors='replace').strip() if error.stderr else error)
\ No newline at end of file
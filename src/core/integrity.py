@@ -0,0 +1,241 @@
+# core/integrity.py
+
+"""
+Integritätsprüfung gespeicherter Clones.
+Ein erfolgreicher Clone wird sonst nie wieder gelesen; stille Beschädigungen
+auf dem Backup-Datenträger fielen erst beim Wiederherstellen auf.
+"""
+
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+from config import INTEGRITY
+from .logger import Logger
+from .git_manager import GitManager
+from .file_manager import FileManager
+from .maintenance import MaintenanceManager
+from .throttle import lower_thread_priority
+
+
+class IntegrityChecker:
+    """
+    Führt GitManager.fsck parallel über gespeicherte Clones aus.
+    
+    Zeitpunkt, Dauer und Ergebnis jeder Prüfung stehen pro Backup in
+    INTEGRITY['state_file']. Ein Lauf prüft zuerst nie geprüfte und zuletzt
+    fehlerhafte Backups, dann die am längsten nicht geprüften, und startet nach
+    Ablauf des Zeitbudgets keine weiteren Prüfungen. So wird jede Nacht ein
+    anderer Teil geprüft, und nach einigen Läufen ist jedes Backup einmal dran,
+    ohne dass je alles auf einmal gelesen wird.
+    
+    Attributes:
+        logger (Logger): Logger-Instanz für Logging
+        git_manager (GitManager): Führt git fsck aus
+        file_manager (FileManager): Liest und schreibt die Zustandsdatei
+        workers (int): Parallel geprüfte Repositories
+        state_file (str): Pfad der Zustandsdatei
+        full (bool): Alle Objekte lesen (sonst nur Erreichbarkeit)
+    """
+    
+    # Mehrere Instanzen (z.B. Pipeline-Worker) teilen sich die Zustandsdatei
+    _state_lock = threading.Lock()
+    
+    def __init__(
+        self,
+        logger: Logger = None,
+        workers: int = INTEGRITY['workers'],
+        state_file: str = INTEGRITY['state_file'],
+        full: bool = INTEGRITY['full']
+    ) -> None:
+        """
+        Initialisiert den IntegrityChecker.
+        
+        Args:
+            logger (Logger): Logger-Instanz. Wenn None, wird eine neue erstellt
+            workers (int): Parallel geprüfte Repositories. Default aus config.py
+            state_file (str): Pfad der Zustandsdatei. Default aus config.py
+            full (bool): Inhalt und Hash jedes Objekts prüfen. Default aus config.py
+        """
+        self.logger = logger or Logger()
+        self.git_manager = GitManager(self.logger)
+        self.file_manager = FileManager(self.logger)
+        self.workers = max(1, workers)
+        self.state_file = state_file
+        self.full = full
+    
+    def find_repositories(self, root: str) -> List[str]:
+        """
+        Findet gespeicherte Clones (siehe MaintenanceManager.find_repositories).
+        
+        Args:
+            root (str): Speicherort der Backups oder ein einzelner Backup-Ordner
+        
+        Returns:
+            List[str]: Sortierte Pfade der Arbeitsverzeichnisse
+        """
+        return MaintenanceManager(self.logger).find_repositories(root)
+    
+    @staticmethod
+    def schedule(repositories: List[str], state: Dict[str, Dict]) -> List[str]:
+        """
+        Reihenfolge der Prüfung: nie geprüft, zuletzt fehlerhaft, dann älteste Prüfung zuerst.
+        
+        Args:
+            repositories (List[str]): Arbeitsverzeichnisse
+            state (Dict[str, Dict]): Inhalt der Zustandsdatei
+        
+        Returns:
+            List[str]: Die Repositories in Prüfreihenfolge
+        """
+        def key(repo: str) -> Tuple[int, str, str]:
+            entry = state.get(os.path.abspath(repo))
+            if entry is None:
+                return 0, "", repo
+            return (1 if entry.get("ok") else 0), entry.get("checked", ""), repo
+        
+        return sorted(repositories, key=key)
+    
+    def check(
+        self,
+        repositories: List[str],
+        budget_minutes: float = INTEGRITY['budget_minutes'],
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> Tuple[bool, str]:
+        """
+        Prüft die Repositories in der Reihenfolge von schedule, bis das Zeitbudget aufgebraucht ist.
+        
+        Eine Prüfung startet nur, wenn sie nach der Dauer ihrer letzten Prüfung
+        noch ins Budget passt. Das erste Repository wird immer geprüft, damit auch
+        Backups an die Reihe kommen, deren Prüfung länger als das Budget dauert.
+        
+        Args:
+            repositories (List[str]): Arbeitsverzeichnisse (siehe find_repositories)
+            budget_minutes (float): Zeitbudget des Laufs, 0 = alle prüfen. Default aus config.py
+            progress (Optional[Callable[[int, int], None]]): Wird mit (fertig, gesamt) aufgerufen
+        
+        Returns:
+            Tuple[bool, str]: (False wenn ein Repository beschädigt ist, Nachricht)
+        """
+        if not repositories:
+            return True, "No repositories to check"
+        with self._state_lock:
+            state = self.file_manager.load_config(self.state_file)
+        
+        ordered = self.schedule(repositories, state)
+        deadline = time.monotonic() + budget_minutes * 60 if budget_minutes > 0 else None
+        results: Dict[str, Dict] = {}
+        errors: List[str] = []
+        deferred = done = 0
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="integrity") as executor:
+            futures = {
+                executor.submit(
+                    self._check_one, repo, state.get(os.path.abspath(repo)), None if index == 0 else deadline
+                ): repo
+                for index, repo in enumerate(ordered)
+            }
+            for future in as_completed(futures):
+                success, message, entry = future.result()
+                done += 1
+                if entry is None:
+                    deferred += 1
+                else:
+                    results[os.path.abspath(futures[future])] = entry
+                    if not success:
+                        errors.append(message)
+                if progress:
+                    progress(done, len(ordered))
+        
+        with self._state_lock:
+            # Neu laden, damit parallele Läufe sich nicht überschreiben
+            state = self.file_manager.load_config(self.state_file)
+            if results:
+                state.update(results)
+                self.file_manager.save_config(state, self.state_file)
+        overdue = self._overdue(repositories, state)
+        
+        msg = f"{len(results)} checked, {len(errors)} corrupt, {deferred} deferred"
+        if overdue:
+            msg += f", {overdue} not verified within {INTEGRITY['max_age_days']} days"
+        if errors:
+            msg += ": " + "; ".join(errors)
+            self.logger.error(msg)
+            return False, msg
+        if overdue:
+            self.logger.warning(msg)
+        else:
+            self.logger.success(msg)
+        return True, msg
+    
+    def post_process(self, job) -> Tuple[bool, str]:
+        """
+        Nachbearbeitung für die BackupPipeline: prüft den gerade gesicherten Clone.
+        
+        Args:
+            job (BackupJob): Der fertige Job
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        if not job.target_directory:
+            return True, "No clone to check"
+        return self.check([job.target_directory], budget_minutes=0)
+    
+    def _check_one(self, repo_path: str, previous: Optional[Dict], deadline: Optional[float]) -> Tuple[bool, str, Optional[Dict]]:
+        """
+        Prüft ein Repository und seine Submodule.
+        
+        Args:
+            repo_path (str): Arbeitsverzeichnis
+            previous (Optional[Dict]): Ergebnis der letzten Prüfung oder None
+            deadline (Optional[float]): Ende des Zeitbudgets (time.monotonic) oder None
+        
+        Returns:
+            Tuple[bool, str, Optional[Dict]]: (Erfolg, Nachricht, Ergebnis oder None wenn verschoben)
+        """
+        if deadline is not None:
+            estimate = previous.get("seconds", 0) if previous else 0
+            if time.monotonic() + estimate > deadline:
+                return True, "deferred", None
+        
+        lower_thread_priority()
+        started = time.perf_counter()
+        success, message = True, "intact"
+        repos = [repo_path] + [
+            os.path.join(repo_path, path) for path in self.git_manager.submodule_paths(repo_path)
+        ]
+        for path in repos:
+            success, message = self.git_manager.fsck(path, full=self.full)
+            if not success:
+                break
+        entry = {
+            "checked": datetime.now().isoformat(timespec="seconds"),
+            "ok": success,
+            "full": self.full,
+            "seconds": round(time.perf_counter() - started, 2),
+        }
+        if not success:
+            entry["error"] = message
+        return success, message, entry
+    
+    @staticmethod
+    def _overdue(repositories: List[str], state: Dict[str, Dict]) -> int:
+        """
+        Zählt Repositories ohne erfolgreiche Prüfung innerhalb von INTEGRITY['max_age_days'].
+        
+        Args:
+            repositories (List[str]): Arbeitsverzeichnisse
+            state (Dict[str, Dict]): Inhalt der Zustandsdatei
+        
+        Returns:
+            int: Anzahl überfälliger Repositories
+        """
+        limit = (datetime.now() - timedelta(days=INTEGRITY['max_age_days'])).isoformat(timespec="seconds")
+        overdue = 0
+        for repo in repositories:
+            entry = state.get(os.path.abspath(repo))
+            if entry is None or not entry.get("ok") or entry.get("checked", "") < limit:
+                overdue += 1
+        return overdue
\ No newline at end of file
@@ -0,0 +1,404 @@
+# core/job_history.py
+
+"""
+Laufzeit-Historie der Backups und daraus abgeleitete Restdauer-Schätzungen.
+Jeder erfolgreiche Job speichert Dauer pro Stufe und Größe in einer SQLite-Datenbank;
+vor und während eines Laufs werden daraus Restdauern für Jobs und ganze Batches geschätzt.
+"""
+
+import os
+import sqlite3
+import statistics
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from config import HISTORY
+from .logger import Logger
+from .backup_job import PHASE_PROGRESS
+
+
+# Gemessene Stufen eines BackupJobs (siehe BackupJob.timings)
+STAGES = ("clone", "archive", "replicate")
+
+# Bereich des Gesamtfortschritts (BackupJob.percent) je Stufe
+STAGE_PROGRESS = {
+    "clone": (PHASE_PROGRESS['prepare'], PHASE_PROGRESS['submodules_end']),
+    "archive": (PHASE_PROGRESS['archive'], PHASE_PROGRESS['replicate']),
+    "replicate": (PHASE_PROGRESS['replicate'], PHASE_PROGRESS['done']),
+}
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        url TEXT NOT NULL,
+        finished_at TEXT NOT NULL,
+        clone_seconds REAL NOT NULL,
+        archive_seconds REAL NOT NULL,
+        replicate_seconds REAL NOT NULL,
+        total_seconds REAL NOT NULL,
+        pack_bytes INTEGER NOT NULL,
+        archive_bytes INTEGER NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_runs_url ON runs (url, id);
+"""
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """
+    Formatiert eine Dauer als ``h:mm:ss`` bzw. ``m:ss``.
+    
+    Args:
+        seconds (Optional[float]): Dauer in Sekunden
+    
+    Returns:
+        str: Formatierte Dauer oder leerer String
+    """
+    if seconds is None:
+        return ""
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes}:{secs:02d}"
+
+
+def remaining_seconds(predicted: Optional[float], elapsed: float, percent: float) -> Optional[float]:
+    """
+    Schätzt die Restdauer eines laufenden Jobs.
+    
+    Am Anfang zählt die Vorhersage aus der Historie, mit wachsendem Fortschritt
+    die tatsächlich gemessene Geschwindigkeit. Läuft ein Job langsamer oder
+    schneller als früher, wandert die Schätzung so schrittweise mit.
+    
+    Args:
+        predicted (Optional[float]): Vorhergesagte Gesamtdauer oder None (keine Historie)
+        elapsed (float): Bisherige Laufzeit in Sekunden
+        percent (float): Fortschritt 0-100
+    
+    Returns:
+        Optional[float]: Restdauer in Sekunden oder None wenn nicht schätzbar
+    """
+    linear = elapsed * (100 - percent) / percent if percent > 0 else None
+    if predicted is None:
+        return linear
+    from_history = max(predicted - elapsed, 0.0)
+    if linear is None:
+        return from_history
+    weight = min(percent, 100) / 100
+    return weight * linear + (1 - weight) * from_history
+
+
+def schedule_seconds(durations: List[float], workers: int) -> float:
+    """
+    Dauer, bis alle Aufgaben auf workers Threads erledigt sind (in Reihenfolge verteilt,
+    jede Aufgabe auf den Thread, der zuerst frei wird).
+    
+    Args:
+        durations (List[float]): Restdauer laufender, danach wartender Aufgaben
+        workers (int): Anzahl Threads
+    
+    Returns:
+        float: Geschätzte Gesamtdauer in Sekunden
+    """
+    slots = [0.0] * max(1, workers)
+    for duration in durations:
+        index = slots.index(min(slots))
+        slots[index] += duration
+    return max(slots)
+
+
+class JobHistory:
+    """
+    Speicher für die Laufzeiten vergangener Backups auf Basis von SQLite.
+    
+    Pro Repository bleiben die letzten HISTORY['keep_runs'] Läufe erhalten.
+    Vorhersagen nehmen den Median der letzten HISTORY['sample_runs'] Läufe
+    desselben Repositories; für unbekannte Repositories den Median der
+    letzten HISTORY['global_runs'] Läufe aller Repositories.
+    
+    Attributes:
+        db_file (str): Pfad zur Datenbank
+        logger (Logger): Logger-Instanz für Logging
+    """
+    
+    def __init__(self, db_file: str = HISTORY['file'], logger: Logger = None) -> None:
+        """
+        Initialisiert die JobHistory.
+        
+        Args:
+            db_file (str): Pfad zur Datenbank. Default aus config.py
+            logger (Logger): Logger-Instanz. Wenn None, wird eine neue erstellt
+        """
+        self.db_file = db_file
+        self.logger = logger or Logger()
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._global: Optional[Dict[str, float]] = None
+    
+    def record(self, job) -> None:
+        """
+        Speichert Dauer und Größe eines erfolgreichen Jobs.
+        
+        Args:
+            job (BackupJob): Der fertige Job (mit timings)
+        """
+        if "clone" not in job.timings:
+            return
+        seconds = {stage: job.timings.get(stage, 0.0) for stage in STAGES}
+        row = (
+            job.github_url,
+            datetime.now().isoformat(timespec="seconds"),
+            seconds["clone"],
+            seconds["archive"],
+            seconds["replicate"],
+            sum(seconds.values()),
+            self._pack_size(job.target_directory),
+            self._path_size(job.archive_path),
+        )
+        try:
+            with self._lock:
+                connection = self._connect()
+                with connection:
+                    connection.execute(
+                        "INSERT INTO runs (url, finished_at, clone_seconds, archive_seconds, replicate_seconds, "
+                        "total_seconds, pack_bytes, archive_bytes) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        row
+                    )
+                    connection.execute(
+                        "DELETE FROM runs WHERE url = ? AND id NOT IN "
+                        "(SELECT id FROM runs WHERE url = ? ORDER BY id DESC LIMIT ?)",
+                        (job.github_url, job.github_url, HISTORY['keep_runs'])
+                    )
+                self._global = None
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not record backup history: {str(e)}")
+    
+    def predict(self, job) -> Optional[Dict[str, float]]:
+        """
+        Sagt die Dauer pro Stufe eines Jobs voraus.
+        Stufen, die der Job nicht ausführt (kein Archiv, keine Replikation), zählen mit 0.
+        
+        Args:
+            job (BackupJob): Der geplante Job
+        
+        Returns:
+            Optional[Dict[str, float]]: Sekunden pro Stufe und "total", "known" (Historie des
+                eigenen Repositories) und "pack_bytes" (Median, 0 wenn unbekannt); None ohne jede Historie
+        """
+        try:
+            with self._lock:
+                connection = self._connect()
+                rows = connection.execute(
+                    "SELECT clone_seconds, archive_seconds, replicate_seconds, pack_bytes FROM runs "
+                    "WHERE url = ? ORDER BY id DESC LIMIT ?",
+                    (job.github_url, HISTORY['sample_runs'])
+                ).fetchall()
+                medians = self._medians(rows) if rows else self._global_medians(connection)
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not read backup history: {str(e)}")
+            return None
+        if medians is None:
+            return None
+        
+        prediction = dict(medians)
+        if not job.create_zip:
+            prediction["archive"] = 0.0
+        if not job.replicate_targets and not job.upload:
+            prediction["replicate"] = 0.0
+        prediction["total"] = sum(prediction[stage] for stage in STAGES)
+        prediction["known"] = bool(rows)
+        prediction["pack_bytes"] = statistics.median(row[3] for row in rows) if rows else 0
+        return prediction
+    
+    def close(self) -> None:
+        """Schließt die Datenbank."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+    
+    def _global_medians(self, connection: sqlite3.Connection) -> Optional[Dict[str, float]]:
+        """
+        Mediane über die letzten Läufe aller Repositories (gecacht bis zum nächsten record).
+        
+        Args:
+            connection (sqlite3.Connection): Offene Verbindung
+        
+        Returns:
+            Optional[Dict[str, float]]: Sekunden pro Stufe oder None ohne Historie
+        """
+        if self._global is None:
+            rows = connection.execute(
+                "SELECT clone_seconds, archive_seconds, replicate_seconds FROM runs ORDER BY id DESC LIMIT ?",
+                (HISTORY['global_runs'],)
+            ).fetchall()
+            self._global = self._medians(rows) if rows else {}
+        return self._global or None
+    
+    @staticmethod
+    def _medians(rows: List[tuple]) -> Dict[str, float]:
+        """
+        Median jeder Stufe über mehrere Läufe (robust gegen einzelne Ausreißer).
+        
+        Args:
+            rows (List[tuple]): (clone, archive, replicate) in Sekunden
+        
+        Returns:
+            Dict[str, float]: Sekunden pro Stufe
+        """
+        return {stage: statistics.median(row[index] for row in rows) for index, stage in enumerate(STAGES)}
+    
+    @staticmethod
+    def _pack_size(target_directory: Optional[str]) -> int:
+        """
+        Größe der Pack-Dateien eines Clones.
+        
+        Args:
+            target_directory (Optional[str]): Arbeitsverzeichnis
+        
+        Returns:
+            int: Größe in Bytes, 0 wenn unbekannt
+        """
+        if not target_directory:
+            return 0
+        return JobHistory._path_size(os.path.join(target_directory, '.git', 'objects', 'pack'))
+    
+    @staticmethod
+    def _path_size(path: Optional[str]) -> int:
+        """
+        Größe einer Datei oder der Dateien direkt in einem Ordner (z.B. Volumes).
+        
+        Args:
+            path (Optional[str]): Datei- oder Ordnerpfad
+        
+        Returns:
+            int: Größe in Bytes, 0 wenn nicht vorhanden
+        """
+        if not path:
+            return 0
+        try:
+            if not os.path.isdir(path):
+                return os.path.getsize(path)
+            with os.scandir(path) as entries:
+                return sum(entry.stat().st_size for entry in entries if entry.is_file(follow_symlinks=False))
+        except OSError:
+            return 0
+    
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Öffnet die Datenbank beim ersten Zugriff und legt das Schema an.
+        
+        Returns:
+            sqlite3.Connection: Die offene Verbindung
+        """
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.db_file, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(SCHEMA)
+        return self._connection
+
+
+class BatchEstimator:
+    """
+    Restdauer einer Batch in der gestuften BackupPipeline.
+    
+    Jede Stufe arbeitet ihre noch offenen Jobs mit eigenen Threads ab; die Batch
+    dauert etwa so lange wie die langsamste Stufe plus ein durchschnittlicher Job
+    in den übrigen Stufen (Füllen und Leeren der Pipeline). Vorhersagen werden pro
+    Stufe mit dem Verhältnis von gemessener zu vorhergesagter Dauer der bereits
+    fertigen Jobs korrigiert, sodass die Schätzung der tatsächlichen
+    Geschwindigkeit dieses Laufs folgt (z.B. bei langsamerem Netz).
+    
+    Attributes:
+        history (JobHistory): Quelle der Vorhersagen
+        workers (Dict[str, int]): Threads pro Stufe ("clone", "archive", "replicate")
+        jobs (int): Bekannte Jobs
+        finished (int): Abgeschlossene Jobs
+        unknown (int): Jobs ohne Historie des eigenen Repositories
+    """
+    
+    def __init__(self, history: JobHistory, workers: Dict[str, int]) -> None:
+        """
+        Initialisiert den BatchEstimator.
+        
+        Args:
+            history (JobHistory): Quelle der Vorhersagen
+            workers (Dict[str, int]): Threads pro Stufe
+        """
+        self.history = history
+        self.workers = workers
+        self.jobs = 0
+        self.finished = 0
+        self.unknown = 0
+        self._lock = threading.Lock()
+        self._pending: Dict[int, tuple] = {}
+        self._predicted = {stage: 0.0 for stage in STAGES}
+        self._actual = {stage: 0.0 for stage in STAGES}
+    
+    def add(self, job) -> Optional[Dict[str, float]]:
+        """
+        Nimmt einen Job in die Schätzung auf.
+        
+        Args:
+            job (BackupJob): Der geplante Job
+        
+        Returns:
+            Optional[Dict[str, float]]: Die Vorhersage des Jobs (siehe JobHistory.predict)
+        """
+        prediction = self.history.predict(job)
+        with self._lock:
+            self.jobs += 1
+            if prediction is None or not prediction["known"]:
+                self.unknown += 1
+            if prediction is not None:
+                self._pending[id(job)] = (job, prediction)
+        return prediction
+    
+    def finish(self, job) -> None:
+        """
+        Entfernt einen fertigen Job und übernimmt seine gemessenen Dauern in die Korrektur.
+        
+        Args:
+            job (BackupJob): Der fertige Job
+        """
+        with self._lock:
+            self.finished += 1
+            _, prediction = self._pending.pop(id(job), (None, None))
+            if prediction is None:
+                return
+            for stage in STAGES:
+                if stage in job.timings and prediction[stage] > 0:
+                    self._predicted[stage] += prediction[stage]
+                    self._actual[stage] += job.timings[stage]
+    
+    def remaining(self) -> Optional[float]:
+        """
+        Geschätzte Restdauer der Batch.
+        
+        Returns:
+            Optional[float]: Sekunden oder None ohne jede Historie
+        """
+        with self._lock:
+            if not self._pending:
+                return 0.0 if self.jobs and self.jobs == self.finished else None
+            now = time.monotonic()
+            busy, average = {}, {}
+            for stage in STAGES:
+                factor = self._actual[stage] / self._predicted[stage] if self._predicted[stage] else 1.0
+                durations = []
+                for job, prediction in self._pending.values():
+                    if stage in job.timings:
+                        continue
+                    expected = prediction[stage] * factor
+                    if job.stage == stage:
+                        start, end = STAGE_PROGRESS[stage]
+                        percent = min(max((job.percent - start) * 100 / (end - start), 0.0), 100.0)
+                        expected = remaining_seconds(expected, now - job.stage_started, percent)
+                    durations.append(expected)
+                busy[stage] = schedule_seconds(durations, self.workers.get(stage, 1))
+                average[stage] = sum(durations) / len(durations) if durations else 0.0
+            # Engpass-Stufe plus Füllen/Leeren der Pipeline durch die übrigen Stufen
+            return max(
+                busy[stage] + sum(average[other] for other in STAGES if other != stage)
+                for stage in STAGES
+            )
\ No newline at end of file
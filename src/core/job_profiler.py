@@ -0,0 +1,216 @@
+# core/job_profiler.py
+
+"""
+Optionales Profiling einzelner Backup-Jobs.
+Pro Job entsteht ein Verzeichnis mit CPU-Profilen (cProfile), Speicher-Snapshots
+(tracemalloc) je Stufe und dem Ressourcenverbrauch jedes Git-Aufrufs.
+"""
+
+import os
+import io
+import re
+import sys
+import json
+import time
+import cProfile
+import threading
+import subprocess
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+from config import PROFILING
+from .logger import Logger
+
+
+class ProfiledPopen(subprocess.Popen):
+    """
+    Popen, das den Prozess mit os.wait4 abholt und so dessen Ressourcenverbrauch erhält.
+    Unter Windows (kein wait4) verhält es sich wie subprocess.Popen.
+    
+    Attributes:
+        rusage (Optional[os.struct_rusage]): Verbrauch des beendeten Prozesses und seiner Kinder
+    """
+    
+    rusage = None
+    
+    def _try_wait(self, wait_flags):
+        """Wie subprocess.Popen._try_wait, aber mit os.wait4."""
+        if not hasattr(os, "wait4"):
+            return super()._try_wait(wait_flags)
+        try:
+            pid, status, rusage = os.wait4(self.pid, wait_flags)
+        except ChildProcessError:
+            # Wie subprocess: Prozess wurde bereits anderweitig abgeholt
+            return self.pid, 0
+        if pid:
+            self.rusage = rusage
+        return pid, status
+
+
+class JobProfiler:
+    """
+    Sammelt Profiling-Daten eines Backup-Jobs und schreibt sie in ein eigenes Verzeichnis.
+    
+    Dateien pro Stufe: ``<stufe>.prof`` (cProfile, z.B. für snakeviz oder pstats),
+    ``<stufe>.txt`` (die teuersten Funktionen und Allokationen) und
+    ``<stufe>.tracemalloc`` (Snapshot für tracemalloc.Snapshot.load).
+    ``summary.json`` enthält Dauer und Speicherspitze je Stufe sowie pro Git-Aufruf
+    CPU-Zeit, maximales RSS und Block-I/O.
+    
+    cProfile misst nur den Thread, der die Stufe ausführt; tracemalloc ist prozessweit
+    und wird gestartet, solange mindestens eine Stufe läuft.
+    
+    Attributes:
+        directory (str): Ausgabeverzeichnis dieses Jobs
+        logger (Logger): Logger-Instanz für Logging
+        stages (List[Dict]): Messwerte je Stufe
+        processes (List[Dict]): Messwerte je Git-Aufruf
+    """
+    
+    # tracemalloc ist global: mitzählen, wie viele Stufen es gerade brauchen
+    _tracing_users = 0
+    _tracing_lock = threading.Lock()
+    
+    def __init__(self, name: str, directory: Optional[str] = None, logger: Logger = None) -> None:
+        """
+        Initialisiert den JobProfiler.
+        
+        Args:
+            name (str): Name des Jobs (Teil des Verzeichnisnamens)
+            directory (Optional[str]): Basisverzeichnis. Wenn None, PROFILING['directory']
+            logger (Logger): Logger-Instanz. Wenn None, wird eine neue erstellt
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        self.directory = os.path.join(directory or PROFILING['directory'], f"{name}_{timestamp}")
+        self.logger = logger or Logger()
+        self.stages: List[Dict] = []
+        self.processes: List[Dict] = []
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Profiliert den umschlossenen Block als Stufe ``name``.
+        
+        Args:
+            name (str): Name der Stufe, z.B. "clone"
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        self._start_tracing()
+        tracemalloc.reset_peak()
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Python >= 3.12: nur ein aktiver Profiler zur selben Zeit
+            profile = None
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            if profile:
+                profile.disable()
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            self._stop_tracing()
+            try:
+                self._write_stage(name, profile, snapshot)
+            except OSError as e:
+                self.logger.warning(f"Could not write profile {name}: {str(e)}")
+            with self._lock:
+                self.stages.append({
+                    "stage": name,
+                    "seconds": round(seconds, 3),
+                    "python_peak_bytes": peak,
+                    "cpu_profile": profile is not None,
+                })
+    
+    def record_process(self, args: List[str], process: subprocess.Popen, started: float) -> None:
+        """
+        Speichert den Ressourcenverbrauch eines beendeten Git-Aufrufs.
+        
+        Args:
+            args (List[str]): Argumente nach ``git``
+            process (subprocess.Popen): Der beendete Prozess (ProfiledPopen für rusage)
+            started (float): Startzeitpunkt (time.perf_counter)
+        """
+        entry = {
+            # Zugangsdaten in URLs nicht ins Profil schreiben
+            "command": re.sub(r"://[^/@\s]+@", "://***@", " ".join(args[:2])),
+            "seconds": round(time.perf_counter() - started, 3),
+            "returncode": process.returncode,
+        }
+        rusage = getattr(process, "rusage", None)
+        if rusage is not None:
+            # ru_maxrss: KiB unter Linux, Bytes unter macOS; zählt den Speicher vor dem exec mit
+            # (obere Schranke). I/O in Blöcken zu 512 Bytes
+            rss_unit = 1 if sys.platform == "darwin" else 1024
+            entry.update({
+                "user_cpu_seconds": round(rusage.ru_utime, 3),
+                "system_cpu_seconds": round(rusage.ru_stime, 3),
+                "max_rss_bytes": rusage.ru_maxrss * rss_unit,
+                "read_bytes": rusage.ru_inblock * 512,
+                "write_bytes": rusage.ru_oublock * 512,
+            })
+        with self._lock:
+            self.processes.append(entry)
+    
+    def save(self) -> Optional[str]:
+        """
+        Schreibt summary.json mit allen Stufen und Git-Aufrufen.
+        
+        Returns:
+            Optional[str]: Das Verzeichnis oder None bei Fehlern
+        """
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with self._lock:
+                summary = {"stages": self.stages, "processes": self.processes}
+            with open(os.path.join(self.directory, "summary.json"), 'w', encoding='utf-8') as f:
+                json.dump(summary, f, indent=1)
+            self.logger.info(f"Profile written: {self.directory}")
+            return self.directory
+        except OSError as e:
+            self.logger.warning(f"Could not write profile summary: {str(e)}")
+            return None
+    
+    def _write_stage(self, name: str, profile: Optional[cProfile.Profile], snapshot: tracemalloc.Snapshot) -> None:
+        """
+        Schreibt die Dateien einer Stufe.
+        
+        Args:
+            name (str): Name der Stufe
+            profile (Optional[cProfile.Profile]): CPU-Profil oder None
+            snapshot (tracemalloc.Snapshot): Speicher-Snapshot am Ende der Stufe
+        """
+        import pstats  # Nur mit aktivem Profiling gebraucht, nicht beim Programmstart
+        
+        base = os.path.join(self.directory, name)
+        report = io.StringIO()
+        if profile:
+            profile.dump_stats(f"{base}.prof")
+            pstats.Stats(profile, stream=report).sort_stats("cumulative").print_stats(PROFILING['top_functions'])
+        snapshot.dump(f"{base}.tracemalloc")
+        report.write(f"\nTop {PROFILING['top_functions']} allocations:\n")
+        for statistic in snapshot.statistics("lineno")[:PROFILING['top_functions']]:
+            report.write(f"{statistic}\n")
+        with open(f"{base}.txt", 'w', encoding='utf-8') as f:
+            f.write(report.getvalue())
+    
+    @classmethod
+    def _start_tracing(cls) -> None:
+        """Startet tracemalloc für die erste laufende Stufe."""
+        with cls._tracing_lock:
+            if cls._tracing_users == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start(PROFILING['tracemalloc_frames'])
+            cls._tracing_users += 1
+    
+    @classmethod
+    def _stop_tracing(cls) -> None:
+        """Stoppt tracemalloc, wenn keine Stufe es mehr braucht."""
+        with cls._tracing_lock:
+            cls._tracing_users -= 1
+            if cls._tracing_users == 0:
+                tracemalloc.stop()
\ No newline at end of file
@@ -0,0 +1,296 @@
+# core/job_queue.py
+
+"""
+Job-Warteschlange für Backups auf einem gemeinsamen Thread-Pool.
+Fortschrittsmeldungen werden gesammelt und mit fester Rate an die UI gegeben.
+"""
+
+import time
+import threading
+from typing import Dict, List, Optional
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+from config import JOBS
+from .backup_job import BackupJob
+from .job_history import JobHistory, remaining_seconds, schedule_seconds
+
+
+class JobState:
+    """
+    Zustand eines Jobs, wie ihn die UI anzeigt.
+    
+    Attributes:
+        job_id (int): Fortlaufende ID des Jobs
+        name (str): Anzeigename (Ordnername)
+        url (str): Repository-URL
+        status (str): "queued", "running", "finished" oder "failed"
+        phase (str): Aktuelle Phase
+        percent (float): Fortschritt 0-100
+        rate (str): Transferrate (falls von Git gemeldet)
+        message (str): Ergebnis-Nachricht nach Abschluss
+        started_at (Optional[float]): Startzeit (time.monotonic)
+        finished_at (Optional[float]): Endzeit (time.monotonic)
+        predicted_seconds (Optional[float]): Vorhergesagte Dauer aus der Historie oder None
+    """
+    
+    def __init__(self, job_id: int, name: str, url: str) -> None:
+        """
+        Initialisiert den JobState.
+        
+        Args:
+            job_id (int): Fortlaufende ID des Jobs
+            name (str): Anzeigename
+            url (str): Repository-URL
+        """
+        self.job_id = job_id
+        self.name = name
+        self.url = url
+        self.status = "queued"
+        self.phase = ""
+        self.percent = 0.0
+        self.rate = ""
+        self.message = ""
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.predicted_seconds: Optional[float] = None
+    
+    def eta_seconds(self, factor: float = 1.0) -> Optional[float]:
+        """
+        Schätzt die Restdauer aus Vorhersage und bisherigem Fortschritt (siehe remaining_seconds).
+        Wartende Jobs liefern die vorhergesagte Gesamtdauer.
+        
+        Args:
+            factor (float): Korrektur der Vorhersage (gemessene / vorhergesagte Dauer fertiger Jobs)
+        
+        Returns:
+            Optional[float]: Restdauer in Sekunden oder None wenn nicht schätzbar
+        """
+        predicted = self.predicted_seconds * factor if self.predicted_seconds is not None else None
+        if self.status == "queued":
+            return predicted
+        if self.status != "running" or not self.started_at:
+            return None
+        return remaining_seconds(predicted, time.monotonic() - self.started_at, self.percent)
+
+
+class _BackupRunnable(QRunnable):
+    """QRunnable, das einen BackupJob im Thread-Pool ausführt."""
+    
+    def __init__(self, queue: "JobQueue", job_id: int, job: BackupJob) -> None:
+        """
+        Initialisiert das Runnable.
+        
+        Args:
+            queue (JobQueue): Die besitzende Warteschlange
+            job_id (int): ID des Jobs
+            job (BackupJob): Der auszuführende Job
+        """
+        super().__init__()
+        self.queue = queue
+        self.job_id = job_id
+        self.job = job
+    
+    def run(self) -> None:
+        """Führt den Job aus und meldet Fortschritt und Ergebnis."""
+        self.queue._report(self.job_id, status="running", started_at=time.monotonic())
+        try:
+            success, message = self.job.run(
+                lambda phase, percent, rate: self.queue._report(self.job_id, phase=phase, percent=percent, rate=rate)
+            )
+        except Exception as e:
+            # Ohne Abschlussmeldung bliebe der Job für immer "running"
+            success, message = False, f"Unexpected error: {str(e)}"
+            self.job.logger.error(f"Backup of {self.job.folder_name} failed: {message}")
+        if success:
+            try:
+                self.queue.history.record(self.job)
+            except Exception as e:
+                # Das Backup selbst ist vorhanden, nur die Vorhersage fehlt später
+                self.job.logger.warning(f"Could not record job history for {self.job.folder_name}: {str(e)}")
+        self.queue._report(
+            self.job_id,
+            status="finished" if success else "failed",
+            percent=100.0 if success else None,
+            rate="",
+            message=message,
+            finished_at=time.monotonic()
+        )
+
+
+class JobQueue(QObject):
+    """
+    Führt BackupJobs auf einem gemeinsamen QThreadPool aus.
+    
+    Worker-Threads schreiben Änderungen nur in einen Puffer. Ein Timer im
+    UI-Thread übernimmt den Puffer mit fester Rate und sendet genau ein
+    Signal pro Intervall, egal wie viele Jobs gleichzeitig Fortschritt melden.
+    
+    Vorhersagen kommen aus der JobHistory; das Verhältnis von gemessener zu
+    vorhergesagter Dauer fertiger Jobs korrigiert die Schätzung der übrigen.
+    
+    Signals:
+        jobs_updated: Signal(list) - IDs der seit dem letzten Intervall geänderten Jobs
+        job_finished: Signal(int, bool, str) - (job_id, success, message)
+    """
+    
+    jobs_updated = Signal(list)
+    job_finished = Signal(int, bool, str)
+    
+    def __init__(self, parent=None, max_concurrent: int = JOBS['max_concurrent']) -> None:
+        """
+        Initialisiert die JobQueue.
+        
+        Args:
+            parent: Parent-Objekt
+            max_concurrent (int): Maximale Anzahl gleichzeitiger Jobs. Default aus config.py
+        """
+        super().__init__(parent)
+        self.jobs: Dict[int, JobState] = {}
+        self.backup_jobs: Dict[int, BackupJob] = {}
+        self.order: List[int] = []
+        
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_concurrent)
+        self._runnables: Dict[int, _BackupRunnable] = {}
+        self._next_id = 1
+        self._active = 0
+        
+        self.history = JobHistory()
+        self._predicted_total = 0.0
+        self._actual_total = 0.0
+        
+        # Von Worker-Threads geschriebener Puffer (nur unter Lock)
+        self._lock = threading.Lock()
+        self._pending: Dict[int, Dict] = {}
+        
+        # Läuft nur, solange Jobs aktiv sind
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(int(1000 / JOBS['refresh_hz']))
+        self._flush_timer.timeout.connect(self._flush)
+    
+    def submit(self, job: BackupJob) -> int:
+        """
+        Reiht einen Job ein.
+        
+        Args:
+            job (BackupJob): Der auszuführende Job
+        
+        Returns:
+            int: Die ID des Jobs
+        """
+        job_id = self._next_id
+        self._next_id += 1
+        
+        state = JobState(job_id, job.folder_name, job.github_url)
+        prediction = self.history.predict(job)
+        if prediction is not None:
+            state.predicted_seconds = prediction["total"]
+        self.jobs[job_id] = state
+        self.backup_jobs[job_id] = job
+        self.order.append(job_id)
+        
+        runnable = _BackupRunnable(self, job_id, job)
+        runnable.setAutoDelete(False)
+        self._runnables[job_id] = runnable
+        self._pool.start(runnable)
+        
+        with self._lock:
+            self._pending.setdefault(job_id, {})
+        self._active += 1
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+        return job_id
+    
+    def counts(self) -> Dict[str, int]:
+        """
+        Zählt die Jobs pro Status.
+        
+        Returns:
+            Dict[str, int]: Status -> Anzahl
+        """
+        counts = {"queued": 0, "running": 0, "finished": 0, "failed": 0}
+        for state in self.jobs.values():
+            counts[state.status] += 1
+        return counts
+    
+    def correction_factor(self) -> float:
+        """
+        Verhältnis von gemessener zu vorhergesagter Dauer der bisher fertigen Jobs.
+        
+        Returns:
+            float: Faktor für JobState.eta_seconds, 1.0 solange kein Job mit Vorhersage fertig ist
+        """
+        return self._actual_total / self._predicted_total if self._predicted_total else 1.0
+    
+    def batch_eta(self) -> Optional[float]:
+        """
+        Schätzt, wann alle laufenden und wartenden Jobs fertig sind.
+        
+        Returns:
+            Optional[float]: Restdauer in Sekunden oder None wenn ein Job nicht schätzbar ist
+        """
+        factor = self.correction_factor()
+        running, queued = [], []
+        for job_id in self.order:
+            state = self.jobs[job_id]
+            if state.status in ("running", "queued"):
+                remaining = state.eta_seconds(factor)
+                if remaining is None:
+                    return None
+                (running if state.status == "running" else queued).append(remaining)
+        return schedule_seconds(running + queued, self._pool.maxThreadCount())
+    
+    def wait_for_done(self, timeout_ms: int = -1) -> bool:
+        """
+        Wartet, bis alle Jobs beendet sind, und übernimmt die letzten Änderungen.
+        
+        Args:
+            timeout_ms (int): Timeout in Millisekunden, -1 = unbegrenzt
+        
+        Returns:
+            bool: True wenn alle Jobs beendet sind
+        """
+        done = self._pool.waitForDone(timeout_ms)
+        self._flush()
+        return done
+    
+    def _report(self, job_id: int, **fields) -> None:
+        """
+        Puffert Änderungen eines Jobs (aus beliebigem Thread).
+        Spätere Werte überschreiben frühere innerhalb eines Intervalls.
+        
+        Args:
+            job_id (int): ID des Jobs
+            **fields: Geänderte JobState-Attribute (None = unverändert)
+        """
+        with self._lock:
+            pending = self._pending.setdefault(job_id, {})
+            pending.update({key: value for key, value in fields.items() if value is not None})
+    
+    def _flush(self) -> None:
+        """Übernimmt den Puffer in die JobStates und sendet gebündelte Signale."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        
+        finished = []
+        for job_id, fields in pending.items():
+            state = self.jobs[job_id]
+            for key, value in fields.items():
+                setattr(state, key, value)
+            if fields.get("status") in ("finished", "failed"):
+                finished.append(state)
+                if state.status == "finished" and state.predicted_seconds and state.started_at:
+                    self._predicted_total += state.predicted_seconds
+                    self._actual_total += state.finished_at - state.started_at
+        
+        self.jobs_updated.emit(sorted(pending))
+        for state in finished:
+            self.job_finished.emit(state.job_id, state.status == "finished", state.message)
+            # Job-Objekte nach Abschluss freigeben, nur der JobState bleibt
+            self._runnables.pop(state.job_id, None)
+            self.backup_jobs.pop(state.job_id, None)
+            self._active -= 1
+        
+        if self._active == 0:
+            self._flush_timer.stop()
\ No newline at end of file
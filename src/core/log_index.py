@@ -0,0 +1,215 @@
+# core/log_index.py
+
+"""
+Zeilen-Index für große Log-Dateien.
+Liest die Log-Datei inkrementell über Memory-Mapping ab dem zuletzt
+gelesenen Offset, ohne sie vollständig in den Speicher zu laden.
+"""
+
+import os
+import mmap
+from array import array
+from typing import Optional, Set
+from config import LOG_FILE, LOG_VIEWER
+
+
+class LogIndex:
+    """
+    Index der Zeilenenden einer Log-Datei.
+    
+    Die Datei wird per mmap eingeblendet. Gespeichert wird nur das Ende jeder
+    vollständigen Zeile (8 Bytes pro Zeile), der Text wird erst beim Zugriff
+    auf eine Zeile gelesen und dekodiert.
+    
+    Attributes:
+        log_file (str): Pfad zur Log-Datei
+        batch_bytes (int): Maximale Bytes, die pro update() indiziert werden
+    """
+    
+    def __init__(self, log_file: str = LOG_FILE, batch_bytes: int = LOG_VIEWER['index_batch_bytes']) -> None:
+        """
+        Initialisiert den LogIndex.
+        
+        Args:
+            log_file (str): Pfad zur Log-Datei. Default aus config.py
+            batch_bytes (int): Maximale Bytes pro update(). Default aus config.py
+        """
+        self.log_file = log_file
+        self.batch_bytes = batch_bytes
+        self._line_ends = array('Q')
+        self._indexed_end = 0
+        self._pending = False
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+    
+    def __len__(self) -> int:
+        """Anzahl der vollständig indizierten Zeilen."""
+        return len(self._line_ends)
+    
+    @property
+    def has_pending(self) -> bool:
+        """True, wenn beim letzten update() noch nicht alles indiziert wurde."""
+        return self._pending
+    
+    def check_truncated(self) -> bool:
+        """
+        Prüft, ob die Datei gekürzt oder ersetzt wurde, und setzt den Index zurück.
+        
+        Returns:
+            bool: True wenn der Index zurückgesetzt wurde
+        """
+        size = self._file_size()
+        if size >= self._indexed_end:
+            return False
+        self.close()
+        self._line_ends = array('Q')
+        self._indexed_end = 0
+        self._pending = False
+        return True
+    
+    def update(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Indiziert neu angehängte, vollständige Zeilen ab dem letzten Offset.
+        
+        Args:
+            max_bytes (Optional[int]): Maximale Bytes für diesen Aufruf.
+                                      Wenn None, wird self.batch_bytes verwendet
+        
+        Returns:
+            int: Anzahl neu indizierter Zeilen
+        """
+        size = self._file_size()
+        if size <= self._indexed_end or not self._map(size):
+            self._pending = False
+            return 0
+        
+        max_bytes = max_bytes or self.batch_bytes
+        line_ends = self._line_ends
+        find = self._mmap.find
+        position = self._indexed_end
+        window_end = min(size, position + max_bytes)
+        count_before = len(line_ends)
+        
+        while True:
+            newline = find(b'\n', position, window_end)
+            if newline >= 0:
+                position = newline + 1
+                line_ends.append(position)
+                continue
+            # Zeile länger als das Fenster: Fenster vergrößern statt hängenzubleiben
+            if position == self._indexed_end and window_end < size:
+                window_end = min(size, window_end + max_bytes)
+                continue
+            break
+        
+        self._indexed_end = position
+        self._pending = window_end < size
+        return len(line_ends) - count_before
+    
+    def raw_line(self, line_number: int) -> bytes:
+        """
+        Gibt die Rohbytes einer Zeile ohne Zeilenumbruch zurück.
+        
+        Args:
+            line_number (int): Index der Zeile (0-basiert)
+        
+        Returns:
+            bytes: Inhalt der Zeile
+        """
+        start = self._line_ends[line_number - 1] if line_number > 0 else 0
+        end = self._line_ends[line_number] - 1
+        if self._mmap is None and not self._map(self._file_size()):
+            return b''
+        return self._mmap[start:end].rstrip(b'\r')
+    
+    def line(self, line_number: int) -> str:
+        """
+        Gibt eine Zeile als Text zurück.
+        
+        Args:
+            line_number (int): Index der Zeile (0-basiert)
+        
+        Returns:
+            str: Inhalt der Zeile
+        """
+        return self.raw_line(line_number).decode('utf-8', errors='replace')
+    
+    @staticmethod
+    def parse_level(raw: bytes) -> str:
+        """
+        Liest das Log-Level aus einer Zeile im Format ``[Zeit] [LEVEL] Text``.
+        
+        Args:
+            raw (bytes): Rohbytes der Zeile
+        
+        Returns:
+            str: Das Level oder leerer String bei Folgezeilen ohne Level
+        """
+        start = raw.find(b'] [')
+        if start < 0:
+            return ""
+        end = raw.find(b']', start + 3)
+        return raw[start + 3:end].decode('ascii', errors='replace') if end > 0 else ""
+    
+    def matches(self, line_number: int, levels: Optional[Set[str]] = None, text: Optional[bytes] = None) -> bool:
+        """
+        Prüft, ob eine Zeile zu einem Filter passt.
+        
+        Args:
+            line_number (int): Index der Zeile (0-basiert)
+            levels (Optional[Set[str]]): Erlaubte Levels, None = alle
+            text (Optional[bytes]): Gesuchter Text in Kleinbuchstaben (z.B. Repository), None = alle
+        
+        Returns:
+            bool: True wenn die Zeile passt
+        """
+        raw = self.raw_line(line_number)
+        if levels is not None and self.parse_level(raw) not in levels:
+            return False
+        if text and text not in raw.lower():
+            return False
+        return True
+    
+    def close(self) -> None:
+        """Gibt das Memory-Mapping und die Datei frei (der Index bleibt erhalten)."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def _file_size(self) -> int:
+        """
+        Gibt die aktuelle Größe der Log-Datei zurück.
+        
+        Returns:
+            int: Größe in Bytes, 0 wenn die Datei nicht existiert
+        """
+        try:
+            return os.path.getsize(self.log_file)
+        except OSError:
+            return 0
+    
+    def _map(self, size: int) -> bool:
+        """
+        Blendet die Datei neu ein, wenn sie seit dem letzten Mapping gewachsen ist.
+        
+        Args:
+            size (int): Aktuelle Dateigröße
+        
+        Returns:
+            bool: True wenn ein gültiges Mapping existiert
+        """
+        if self._mmap is not None and len(self._mmap) >= size:
+            return True
+        self.close()
+        if size == 0:
+            return False
+        try:
+            self._file = open(self.log_file, 'rb')
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            return True
+        except (OSError, ValueError):
+            self.close()
+            return False
\ No newline at end of file
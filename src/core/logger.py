@@ -19,15 +19,17 @@ class Logger:
         log_file (str): Pfad zur Log-Datei
     """
     
-    def __init__(self, log_file: str = LOG_FILE) -> None:
+    def __init__(self, log_file: str = LOG_FILE, ensure_exists: bool = True) -> None:
         """
         Initialisiert den Logger.
         
         Args:
             log_file (str): Name oder Pfad der Log-Datei. Default aus config.py
+            ensure_exists (bool): Wenn False, wird die Datei erst beim ersten Eintrag angelegt
         """
         self.log_file = log_file
-        self._ensure_log_file_exists()
+        if ensure_exists:
+            self._ensure_log_file_exists()
     
     def _ensure_log_file_exists(self) -> None:
         """Stellt sicher, dass die Log-Datei existiert."""
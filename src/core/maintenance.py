@@ -0,0 +1,216 @@
+# core/maintenance.py
+
+"""
+Wartung gespeicherter Clones.
+Frische Clones haben weder Commit-Graph noch Bitmap; die Wartung holt das nach,
+damit spätere Fetches, Logs, Diffs und Vergleiche schneller und kleiner werden.
+"""
+
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from config import MAINTENANCE
+from .logger import Logger
+from .git_manager import GitManager
+from .file_manager import FileManager
+from .disk_space import format_size
+from .throttle import lower_thread_priority
+
+
+class MaintenanceManager:
+    """
+    Führt GitManager.maintain parallel über gespeicherte Clones aus.
+    
+    Pro Repository wird eine Prüfsumme über Refs und HEAD in MAINTENANCE['state_file']
+    gespeichert. Repositories, deren Refs sich seit der letzten Wartung nicht
+    geändert haben, werden übersprungen. Worker-Threads und Git-Prozesse laufen
+    mit niedriger Priorität (siehe THROTTLE['low_priority']).
+    
+    Attributes:
+        logger (Logger): Logger-Instanz für Logging
+        git_manager (GitManager): Führt die Git-Befehle aus
+        file_manager (FileManager): Liest und schreibt die Zustandsdatei
+        workers (int): Parallel gewartete Repositories
+        state_file (str): Pfad der Zustandsdatei
+    """
+    
+    # Mehrere Instanzen (z.B. Pipeline-Worker) teilen sich die Zustandsdatei
+    _state_lock = threading.Lock()
+    
+    def __init__(
+        self,
+        logger: Logger = None,
+        workers: int = MAINTENANCE['workers'],
+        state_file: str = MAINTENANCE['state_file']
+    ) -> None:
+        """
+        Initialisiert den MaintenanceManager.
+        
+        Args:
+            logger (Logger): Logger-Instanz. Wenn None, wird eine neue erstellt
+            workers (int): Parallel gewartete Repositories. Default aus config.py
+            state_file (str): Pfad der Zustandsdatei. Default aus config.py
+        """
+        self.logger = logger or Logger()
+        self.git_manager = GitManager(self.logger)
+        self.file_manager = FileManager(self.logger)
+        self.workers = max(1, workers)
+        self.state_file = state_file
+    
+    def find_repositories(self, root: str) -> List[str]:
+        """
+        Findet gespeicherte Clones: root selbst oder dessen direkte Unterordner mit .git-Verzeichnis.
+        
+        Args:
+            root (str): Speicherort der Backups oder ein einzelner Backup-Ordner
+        
+        Returns:
+            List[str]: Sortierte Pfade der Arbeitsverzeichnisse
+        """
+        if os.path.isdir(os.path.join(root, '.git')):
+            return [root]
+        try:
+            with os.scandir(root) as entries:
+                return sorted(
+                    entry.path for entry in entries
+                    if entry.is_dir() and os.path.isdir(os.path.join(entry.path, '.git'))
+                )
+        except OSError as e:
+            self.logger.warning(f"Cannot scan {root}: {str(e)}")
+            return []
+    
+    def maintain(
+        self,
+        repositories: List[str],
+        force: bool = False,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> Tuple[bool, str]:
+        """
+        Wartet alle Repositories, deren Refs sich seit der letzten Wartung geändert haben.
+        
+        Args:
+            repositories (List[str]): Arbeitsverzeichnisse (siehe find_repositories)
+            force (bool): Auch unveränderte Repositories warten
+            progress (Optional[Callable[[int, int], None]]): Wird mit (fertig, gesamt) aufgerufen
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        if not repositories:
+            return True, "No repositories to maintain"
+        with self._state_lock:
+            state = self.file_manager.load_config(self.state_file)
+        
+        results: Dict[str, Dict] = {}
+        errors: List[str] = []
+        skipped = done = 0
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="maintenance") as executor:
+            futures = {
+                executor.submit(self._maintain_one, repo, None if force else state.get(os.path.abspath(repo))): repo
+                for repo in repositories
+            }
+            for future in as_completed(futures):
+                success, message, entry = future.result()
+                done += 1
+                if not success:
+                    errors.append(message)
+                elif entry is None:
+                    skipped += 1
+                else:
+                    results[os.path.abspath(futures[future])] = entry
+                if progress:
+                    progress(done, len(repositories))
+        
+        if results:
+            with self._state_lock:
+                # Neu laden, damit parallele Läufe sich nicht überschreiben
+                state = self.file_manager.load_config(self.state_file)
+                state.update(results)
+                self.file_manager.save_config(state, self.state_file)
+        
+        saved = sum(entry["bytes_before"] - entry["bytes_after"] for entry in results.values())
+        msg = (
+            f"{len(results)} maintained, {skipped} unchanged, {len(errors)} failed "
+            f"({format_size(max(saved, 0))} saved)"
+        )
+        if errors:
+            msg += ": " + "; ".join(errors)
+            self.logger.error(msg)
+            return False, msg
+        self.logger.success(msg)
+        return True, msg
+    
+    def post_process(self, job) -> Tuple[bool, str]:
+        """
+        Nachbearbeitung für die BackupPipeline: wartet den gerade gesicherten Clone.
+        
+        Args:
+            job (BackupJob): Der fertige Job
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        if not job.target_directory:
+            return True, "No clone to maintain"
+        return self.maintain([job.target_directory])
+    
+    def _maintain_one(self, repo_path: str, previous: Optional[Dict]) -> Tuple[bool, str, Optional[Dict]]:
+        """
+        Wartet ein Repository und seine Submodule.
+        
+        Args:
+            repo_path (str): Arbeitsverzeichnis
+            previous (Optional[Dict]): Zustand der letzten Wartung oder None (erzwingen)
+        
+        Returns:
+            Tuple[bool, str, Optional[Dict]]: (Erfolg, Nachricht, neuer Zustand oder None wenn übersprungen)
+        """
+        lower_thread_priority()
+        fingerprint = self.git_manager.refs_fingerprint(repo_path)
+        if fingerprint is None:
+            return False, f"Not a readable repository: {repo_path}", None
+        if previous and previous.get("fingerprint") == fingerprint:
+            return True, "unchanged", None
+        
+        started = time.perf_counter()
+        bytes_before = self._objects_size(repo_path)
+        repos = [repo_path] + [
+            os.path.join(repo_path, path) for path in self.git_manager.submodule_paths(repo_path)
+        ]
+        for path in repos:
+            success, message = self.git_manager.maintain(path)
+            if not success:
+                return False, message, None
+        entry = {
+            "fingerprint": fingerprint,
+            "maintained": datetime.now().isoformat(timespec="seconds"),
+            "seconds": round(time.perf_counter() - started, 2),
+            "bytes_before": bytes_before,
+            "bytes_after": self._objects_size(repo_path),
+        }
+        return True, "maintained", entry
+    
+    @staticmethod
+    def _objects_size(repo_path: str) -> int:
+        """
+        Größe aller Objekt-Verzeichnisse unter .git (inklusive .git/modules).
+        
+        Args:
+            repo_path (str): Arbeitsverzeichnis
+        
+        Returns:
+            int: Größe in Bytes
+        """
+        total = 0
+        for root, _, files in os.walk(os.path.join(repo_path, '.git')):
+            if f"{os.sep}objects" not in root:
+                continue
+            for name in files:
+                try:
+                    total += os.lstat(os.path.join(root, name)).st_size
+                except OSError:
+                    pass
+        return total
\ No newline at end of file
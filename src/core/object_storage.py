@@ -0,0 +1,890 @@
+# core/object_storage.py
+
+"""
+Upload von Backups in S3-kompatiblen Object Storage (AWS S3, MinIO, Ceph, ...).
+Große Dateien werden als Multipart-Upload mit parallelen Teilen hochgeladen;
+TAR-Archive schon, während sie noch geschrieben werden. Ohne zusätzliche
+Pakete: Signature V4 und HTTP kommen aus der Standardbibliothek.
+"""
+
+import os
+import hmac
+import json
+import time
+import base64
+import hashlib
+import threading
+import http.client
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote, urlsplit
+from xml.etree import ElementTree
+from config import OBJECT_STORAGE
+from .logger import Logger
+from .disk_space import format_size
+
+
+# Grenzen von S3: Mindestgröße eines Teils (außer dem letzten) und maximale Anzahl Teile
+MIN_PART_SIZE = 5 * 1024 * 1024
+MAX_PARTS = 10000
+
+
+class StorageError(Exception):
+    """Fehlgeschlagene S3-Anfrage oder Prüfsumme, die nicht zum Upload passt."""
+    
+    def __init__(self, status: int, code: str, message: str) -> None:
+        """
+        Initialisiert den StorageError.
+        
+        Args:
+            status (int): HTTP-Status (0 = keine Antwort)
+            code (str): S3-Fehlercode, z.B. "NoSuchUpload"
+            message (str): Beschreibung
+        """
+        super().__init__(f"{code} ({status}): {message}" if status else f"{code}: {message}")
+        self.status = status
+        self.code = code
+
+
+def _xml_find(data: bytes, tag: str) -> List[ElementTree.Element]:
+    """
+    Alle Elemente eines Tags in einer S3-Antwort, unabhängig vom XML-Namespace.
+    
+    Args:
+        data (bytes): XML-Antwort
+        tag (str): Tag ohne Namespace
+    
+    Returns:
+        List[ElementTree.Element]: Gefundene Elemente
+    """
+    if not data.strip():
+        return []
+    return [element for element in ElementTree.fromstring(data).iter() if element.tag.rsplit("}", 1)[-1] == tag]
+
+
+def _xml_text(element: ElementTree.Element, tag: str) -> str:
+    """
+    Text eines direkten Kind-Elements, unabhängig vom XML-Namespace.
+    
+    Args:
+        element (ElementTree.Element): Eltern-Element
+        tag (str): Tag ohne Namespace
+    
+    Returns:
+        str: Text oder "" wenn nicht vorhanden
+    """
+    for child in element:
+        if child.tag.rsplit("}", 1)[-1] == tag:
+            return child.text or ""
+    return ""
+
+
+class S3Client:
+    """
+    Minimaler S3-Client: Signature V4, Path-Style-Adressen, ein Keep-Alive pro Thread.
+    Verbindungsfehler und 5xx-Antworten werden mit Backoff wiederholt.
+    
+    Attributes:
+        endpoint (str): Basis-URL, z.B. "https://s3.eu-central-1.amazonaws.com" oder "http://localhost:9000"
+        bucket (str): Name des Buckets
+        region (str): Region für die Signatur
+        timeout (float): Timeout pro Anfrage in Sekunden
+        retries (int): Wiederholungen nach Verbindungsfehlern und 5xx
+    """
+    
+    def __init__(
+        self,
+        endpoint: str = None,
+        bucket: str = None,
+        region: str = None,
+        access_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        timeout: float = OBJECT_STORAGE['timeout'],
+        retries: int = OBJECT_STORAGE['retries']
+    ) -> None:
+        """
+        Initialisiert den S3Client.
+        
+        Args:
+            endpoint (str): Basis-URL. Wenn None, aus config.py
+            bucket (str): Bucket. Wenn None, aus config.py
+            region (str): Region. Wenn None, aus config.py
+            access_key (Optional[str]): Zugriffsschlüssel. Wenn None, aus config.py oder AWS_ACCESS_KEY_ID
+            secret_key (Optional[str]): Geheimer Schlüssel. Wenn None, aus config.py oder AWS_SECRET_ACCESS_KEY
+            timeout (float): Timeout pro Anfrage in Sekunden. Default aus config.py
+            retries (int): Wiederholungen. Default aus config.py
+        
+        Raises:
+            ValueError: Wenn Endpoint oder Bucket fehlen bzw. ungültig sind
+        """
+        self.endpoint = endpoint or OBJECT_STORAGE['endpoint']
+        self.bucket = bucket or OBJECT_STORAGE['bucket']
+        self.region = region or OBJECT_STORAGE['region']
+        self.timeout = timeout
+        self.retries = max(0, retries)
+        self._access_key = access_key or OBJECT_STORAGE['access_key'] or os.environ.get("AWS_ACCESS_KEY_ID", "")
+        self._secret_key = secret_key or OBJECT_STORAGE['secret_key'] or os.environ.get("AWS_SECRET_ACCESS_KEY", "")
+        
+        parts = urlsplit(self.endpoint)
+        if parts.scheme not in ("http", "https") or not parts.netloc:
+            raise ValueError(f"Invalid S3 endpoint: {self.endpoint!r}")
+        if not self.bucket:
+            raise ValueError("No S3 bucket configured")
+        self._secure = parts.scheme == "https"
+        self._host = parts.netloc
+        self._base_path = parts.path.rstrip("/")
+        self._local = threading.local()
+    
+    def url(self, key: str) -> str:
+        """
+        Anzeige-Adresse eines Objekts.
+        
+        Args:
+            key (str): Objekt-Schlüssel
+        
+        Returns:
+            str: "s3://bucket/key"
+        """
+        return f"s3://{self.bucket}/{key}"
+    
+    def request(
+        self,
+        method: str,
+        key: str,
+        query: Optional[Dict[str, str]] = None,
+        body: bytes = b"",
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Sendet eine signierte Anfrage an ein Objekt des Buckets.
+        
+        Args:
+            method (str): HTTP-Methode
+            key (str): Objekt-Schlüssel
+            query (Optional[Dict[str, str]]): Query-Parameter
+            body (bytes): Inhalt (wird für die Signatur gehasht, der Server prüft den Hash)
+            headers (Optional[Dict[str, str]]): Zusätzliche Header
+        
+        Returns:
+            Tuple[int, Dict[str, str], bytes]: (Status, Header in Kleinbuchstaben, Antwort)
+        
+        Raises:
+            StorageError: Bei Fehlerstatus oder nach erfolglosen Wiederholungen
+        """
+        path = f"{self._base_path}/{quote(self.bucket, safe='')}/{quote(key, safe='/-_.~')}"
+        canonical_query = "&".join(
+            f"{quote(name, safe='-_.~')}={quote(value, safe='-_.~')}" for name, value in sorted((query or {}).items())
+        )
+        target = f"{path}?{canonical_query}" if canonical_query else path
+        payload_hash = hashlib.sha256(body).hexdigest()
+        
+        for attempt in range(self.retries + 1):
+            signed = self._sign(method, path, canonical_query, dict(headers or {}), payload_hash)
+            try:
+                connection = self._connection()
+                connection.request(method, target, body=body, headers=signed)
+                response = connection.getresponse()
+                data = response.read()
+            except (OSError, http.client.HTTPException) as e:
+                self._close_connection()
+                if attempt == self.retries:
+                    raise StorageError(0, "ConnectionError", str(e))
+                time.sleep(0.5 * 2 ** attempt)
+                continue
+            if response.status >= 500 and attempt < self.retries:
+                time.sleep(0.5 * 2 ** attempt)
+                continue
+            if response.status >= 300:
+                raise self._error(response.status, data)
+            return response.status, {name.lower(): value for name, value in response.getheaders()}, data
+        raise StorageError(0, "ConnectionError", "no response")
+    
+    def put_object(self, key: str, data: bytes) -> str:
+        """
+        Lädt ein kleines Objekt in einer Anfrage hoch (mit Content-MD5).
+        
+        Args:
+            key (str): Objekt-Schlüssel
+            data (bytes): Inhalt
+        
+        Returns:
+            str: ETag (MD5 als Hex)
+        """
+        digest = hashlib.md5(data).digest()
+        _, headers, _ = self.request("PUT", key, body=data, headers={"Content-MD5": base64.b64encode(digest).decode()})
+        return self._check_etag(headers.get("etag", ""), digest.hex(), key)
+    
+    def head_object(self, key: str) -> Optional[Dict[str, str]]:
+        """
+        Metadaten eines Objekts.
+        
+        Args:
+            key (str): Objekt-Schlüssel
+        
+        Returns:
+            Optional[Dict[str, str]]: Header (u.a. "content-length", "etag") oder None wenn nicht vorhanden
+        """
+        try:
+            return self.request("HEAD", key)[1]
+        except StorageError as e:
+            if e.status == 404:
+                return None
+            raise
+    
+    def create_multipart_upload(self, key: str) -> str:
+        """
+        Startet einen Multipart-Upload.
+        
+        Args:
+            key (str): Objekt-Schlüssel
+        
+        Returns:
+            str: Upload-ID
+        """
+        _, _, data = self.request("POST", key, query={"uploads": ""})
+        elements = _xml_find(data, "UploadId")
+        if not elements or not elements[0].text:
+            raise StorageError(0, "InvalidResponse", "CreateMultipartUpload returned no UploadId")
+        return elements[0].text
+    
+    def upload_part(self, key: str, upload_id: str, number: int, data: bytes, digest: bytes) -> str:
+        """
+        Lädt einen Teil hoch; der Server prüft Content-MD5 und den signierten SHA-256.
+        
+        Args:
+            key (str): Objekt-Schlüssel
+            upload_id (str): Upload-ID
+            number (int): Teilnummer ab 1
+            data (bytes): Inhalt des Teils
+            digest (bytes): MD5 des Inhalts
+        
+        Returns:
+            str: ETag des Teils (MD5 als Hex)
+        """
+        _, headers, _ = self.request(
+            "PUT",
+            key,
+            query={"partNumber": str(number), "uploadId": upload_id},
+            body=data,
+            headers={"Content-MD5": base64.b64encode(digest).decode()}
+        )
+        return self._check_etag(headers.get("etag", ""), digest.hex(), f"{key} part {number}")
+    
+    def list_parts(self, key: str, upload_id: str) -> Optional[Dict[int, str]]:
+        """
+        Bereits hochgeladene Teile eines Multipart-Uploads (für die Fortsetzung).
+        
+        Args:
+            key (str): Objekt-Schlüssel
+            upload_id (str): Upload-ID
+        
+        Returns:
+            Optional[Dict[int, str]]: Teilnummer -> ETag (ohne Anführungszeichen) oder None wenn der Upload nicht mehr existiert
+        """
+        parts: Dict[int, str] = {}
+        marker = "0"
+        while True:
+            try:
+                _, _, data = self.request("GET", key, query={"uploadId": upload_id, "part-number-marker": marker})
+            except StorageError as e:
+                if e.status == 404:
+                    return None
+                raise
+            for part in _xml_find(data, "Part"):
+                parts[int(_xml_text(part, "PartNumber"))] = _xml_text(part, "ETag").strip('"')
+            truncated = _xml_find(data, "IsTruncated")
+            next_marker = _xml_find(data, "NextPartNumberMarker")
+            if not truncated or truncated[0].text != "true" or not next_marker:
+                return parts
+            marker = next_marker[0].text
+    
+    def complete_multipart_upload(self, key: str, upload_id: str, parts: List[Tuple[int, str]]) -> str:
+        """
+        Setzt die Teile zum Objekt zusammen.
+        
+        Args:
+            key (str): Objekt-Schlüssel
+            upload_id (str): Upload-ID
+            parts (List[Tuple[int, str]]): (Teilnummer, ETag), aufsteigend
+        
+        Returns:
+            str: ETag des Objekts (ohne Anführungszeichen)
+        """
+        body = "<CompleteMultipartUpload>" + "".join(
+            f"<Part><PartNumber>{number}</PartNumber><ETag>\"{etag}\"</ETag></Part>" for number, etag in parts
+        ) + "</CompleteMultipartUpload>"
+        _, _, data = self.request("POST", key, query={"uploadId": upload_id}, body=body.encode())
+        # S3 kann trotz Status 200 einen Fehler im Inhalt melden
+        errors = _xml_find(data, "Error")
+        if errors:
+            raise StorageError(200, _xml_text(errors[0], "Code"), _xml_text(errors[0], "Message"))
+        etags = _xml_find(data, "ETag")
+        return (etags[0].text or "").strip('"') if etags else ""
+    
+    def abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        """
+        Bricht einen Multipart-Upload ab und gibt die hochgeladenen Teile frei.
+        
+        Args:
+            key (str): Objekt-Schlüssel
+            upload_id (str): Upload-ID
+        """
+        try:
+            self.request("DELETE", key, query={"uploadId": upload_id})
+        except StorageError as e:
+            if e.status != 404:
+                raise
+    
+    def _sign(self, method: str, path: str, canonical_query: str, headers: Dict[str, str], payload_hash: str) -> Dict[str, str]:
+        """
+        Ergänzt Host, Datum, Payload-Hash und die Signature-V4-Authorization.
+        
+        Args:
+            method (str): HTTP-Methode
+            path (str): URI-kodierter Pfad
+            canonical_query (str): Sortierte, kodierte Query
+            headers (Dict[str, str]): Header der Anfrage (werden ergänzt)
+            payload_hash (str): SHA-256 des Inhalts als Hex
+        
+        Returns:
+            Dict[str, str]: Die signierten Header
+        """
+        amz_date = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        headers.update({"Host": self._host, "x-amz-date": amz_date, "x-amz-content-sha256": payload_hash})
+        names = sorted(headers, key=str.lower)
+        canonical_headers = "".join(f"{name.lower()}:{str(headers[name]).strip()}\n" for name in names)
+        signed_headers = ";".join(name.lower() for name in names)
+        canonical_request = "\n".join([method, path, canonical_query, canonical_headers, signed_headers, payload_hash])
+        
+        scope = f"{amz_date[:8]}/{self.region}/s3/aws4_request"
+        string_to_sign = "\n".join([
+            "AWS4-HMAC-SHA256", amz_date, scope, hashlib.sha256(canonical_request.encode()).hexdigest()
+        ])
+        key = f"AWS4{self._secret_key}".encode()
+        for part in (amz_date[:8], self.region, "s3", "aws4_request"):
+            key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+        signature = hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+        headers["Authorization"] = (
+            f"AWS4-HMAC-SHA256 Credential={self._access_key}/{scope}, "
+            f"SignedHeaders={signed_headers}, Signature={signature}"
+        )
+        return headers
+    
+    def _connection(self) -> http.client.HTTPConnection:
+        """Keep-Alive-Verbindung des aktuellen Threads (http.client ist nicht threadsicher)."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            factory = http.client.HTTPSConnection if self._secure else http.client.HTTPConnection
+            connection = factory(self._host, timeout=self.timeout)
+            self._local.connection = connection
+        return connection
+    
+    def _close_connection(self) -> None:
+        """Schließt die Verbindung des aktuellen Threads nach einem Fehler."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+    
+    @staticmethod
+    def _error(status: int, data: bytes) -> StorageError:
+        """
+        Baut einen StorageError aus einer Fehlerantwort.
+        
+        Args:
+            status (int): HTTP-Status
+            data (bytes): Antwort (XML mit Code und Message, bei HEAD leer)
+        
+        Returns:
+            StorageError: Der Fehler
+        """
+        try:
+            errors = _xml_find(data, "Error")
+        except ElementTree.ParseError:
+            errors = []
+        if errors:
+            return StorageError(status, _xml_text(errors[0], "Code"), _xml_text(errors[0], "Message"))
+        return StorageError(status, http.client.responses.get(status, "Error"), data[:200].decode(errors="replace"))
+    
+    @staticmethod
+    def _check_etag(etag: str, expected: str, what: str) -> str:
+        """
+        Vergleicht den ETag eines Uploads mit dem lokal berechneten MD5.
+        
+        Args:
+            etag (str): ETag-Header der Antwort
+            expected (str): MD5 als Hex
+            what (str): Beschreibung für die Fehlermeldung
+        
+        Returns:
+            str: Der ETag ohne Anführungszeichen
+        
+        Raises:
+            StorageError: Wenn der ETag nicht passt
+        """
+        etag = etag.strip('"')
+        if etag and etag != expected:
+            raise StorageError(0, "BadDigest", f"{what}: server ETag {etag} does not match MD5 {expected}")
+        return etag or expected
+
+
+class S3Uploader:
+    """
+    Lädt Archive als parallele Multipart-Uploads hoch.
+    
+    Höchstens ``workers`` Teile sind gleichzeitig unterwegs, der Speicherbedarf
+    bleibt damit bei etwa (workers + 1) x part_size. Jeder Teil wird per
+    Content-MD5 und signiertem SHA-256 vom Server geprüft, das fertige Objekt
+    über den zusammengesetzten ETag und die Größe.
+    
+    Der Stand eines Multipart-Uploads steht in ``<archiv>.upload.json``. Ein
+    abgebrochener Upload wird fortgesetzt: Teile, deren MD5 auf dem Server schon
+    passt, werden nicht erneut gesendet.
+    
+    Attributes:
+        client (S3Client): Der S3-Client
+        prefix (str): Vorangestellter Schlüssel-Präfix, z.B. "backups/"
+        part_size (int): Bytes pro Teil
+        workers (int): Gleichzeitig hochgeladene Teile
+        logger (Logger): Logger-Instanz für Logging
+        stats (Dict[str, int]): Dateien, Bytes, gesendete und übernommene Teile des letzten Uploads
+    """
+    
+    def __init__(
+        self,
+        client: Optional[S3Client] = None,
+        prefix: str = None,
+        part_size: int = OBJECT_STORAGE['part_size'],
+        workers: int = OBJECT_STORAGE['workers'],
+        logger: Logger = None
+    ) -> None:
+        """
+        Initialisiert den S3Uploader.
+        
+        Args:
+            client (Optional[S3Client]): S3-Client. Wenn None, aus config.py
+            prefix (str): Schlüssel-Präfix. Wenn None, aus config.py
+            part_size (int): Bytes pro Teil (mindestens 5 MiB). Default aus config.py
+            workers (int): Gleichzeitige Teile. Default aus config.py
+            logger (Logger): Logger-Instanz. Wenn None, wird eine neue erstellt
+        """
+        self.client = client or S3Client()
+        self.prefix = OBJECT_STORAGE['prefix'] if prefix is None else prefix
+        self.part_size = max(MIN_PART_SIZE, part_size)
+        self.workers = max(1, workers)
+        self.logger = logger or Logger()
+        self.stats: Dict[str, int] = {}
+        self._lock = threading.Lock()
+    
+    def object_key(self, path: str) -> str:
+        """
+        Schlüssel einer Datei oder eines Ordners: Präfix + Name.
+        
+        Args:
+            path (str): Lokaler Pfad
+        
+        Returns:
+            str: Objekt-Schlüssel
+        """
+        return f"{self.prefix}{os.path.basename(os.path.normpath(path))}"
+    
+    def upload(self, paths: List[str]) -> Tuple[bool, str]:
+        """
+        Lädt Dateien und Ordner (z.B. Volumes, eine Ebene) hoch. Fehlende Pfade werden übersprungen.
+        
+        Args:
+            paths (List[str]): Archive, Manifeste, Volume-Ordner
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        tasks = []
+        for path in paths:
+            if os.path.isdir(path):
+                tasks += [
+                    (os.path.join(path, name), f"{self.object_key(path)}/{name}")
+                    for name in sorted(os.listdir(path))
+                    if os.path.isfile(os.path.join(path, name)) and not name.endswith(OBJECT_STORAGE['state_suffix'])
+                ]
+            elif os.path.isfile(path):
+                tasks.append((path, self.object_key(path)))
+        
+        self.stats = {"files": 0, "bytes": 0, "parts": 0, "resumed_parts": 0}
+        started = time.perf_counter()
+        errors = []
+        for path, key in tasks:
+            try:
+                with open(path, 'rb') as source:
+                    self._upload_source(source, key, f"{path}{OBJECT_STORAGE['state_suffix']}", size=os.fstat(source.fileno()).st_size)
+            except (OSError, StorageError) as e:
+                errors.append(f"{os.path.basename(path)}: {str(e)}")
+        
+        if errors:
+            msg = f"Upload failed: {'; '.join(errors)}"
+            self.logger.error(msg)
+            return False, msg
+        return True, self._summary(started)
+    
+    def stream(self, partial_path: str, final_path: str) -> "StreamingUpload":
+        """
+        Startet den Upload eines Archivs, das gerade geschrieben wird (siehe StreamingUpload).
+        
+        Args:
+            partial_path (str): Temporäre Datei, in die das Archiv geschrieben wird
+            final_path (str): Endgültiger Pfad nach dem Umbenennen
+        
+        Returns:
+            StreamingUpload: Der laufende Upload
+        """
+        self.stats = {"files": 0, "bytes": 0, "parts": 0, "resumed_parts": 0}
+        return StreamingUpload(self, partial_path, final_path)
+    
+    def _summary(self, started: float) -> str:
+        """
+        Erfolgsmeldung mit Größe und Rate des letzten Uploads.
+        
+        Args:
+            started (float): Startzeit (time.perf_counter)
+        
+        Returns:
+            str: Die (auch geloggte) Nachricht
+        """
+        seconds = max(time.perf_counter() - started, 1e-6)
+        msg = (
+            f"Uploaded {self.stats['files']} file(s) ({format_size(self.stats['bytes'])}) to "
+            f"{self.client.url(self.prefix)} in {seconds:.1f}s ({format_size(self.stats['bytes'] / seconds)}/s"
+        )
+        if self.stats['resumed_parts']:
+            msg += f", {self.stats['resumed_parts']} part(s) resumed"
+        msg += ")"
+        self.logger.success(msg)
+        return msg
+    
+    def _upload_source(
+        self,
+        source: BinaryIO,
+        key: str,
+        state_path: str,
+        size: Optional[int] = None,
+        growing: Optional[Callable[[], bool]] = None,
+        cancelled: Optional[Callable[[], bool]] = None
+    ) -> None:
+        """
+        Lädt einen Datenstrom hoch: kleine Dateien in einer Anfrage, sonst als Multipart-Upload.
+        
+        Args:
+            source (BinaryIO): Geöffnete Quelle
+            key (str): Objekt-Schlüssel
+            state_path (str): Zustandsdatei für die Fortsetzung
+            size (Optional[int]): Gesamtgröße, wenn bekannt (bestimmt die Teilgröße)
+            growing (Optional[Callable[[], bool]]): Liefert True, solange die Quelle noch wächst
+            cancelled (Optional[Callable[[], bool]]): Liefert True, wenn der Upload verworfen werden soll
+        
+        Raises:
+            StorageError: Bei Fehlern des Servers oder abweichenden Prüfsummen
+        """
+        part_size = self.part_size
+        if size is not None:
+            # Höchstens MAX_PARTS Teile: bei sehr großen Dateien größere Teile (auf MiB aufgerundet)
+            needed = -(-size // MAX_PARTS)
+            part_size = max(part_size, -(-needed // (1024 * 1024)) * 1024 * 1024)
+        upload_id, server_parts = self._resume(key, state_path, part_size)
+        
+        data = self._read_part(source, part_size, growing)
+        if len(data) < part_size and upload_id is None:
+            if cancelled and cancelled():
+                raise StorageError(0, "Cancelled", "source was discarded")
+            self.client.put_object(key, data)
+            self._count(len(data), 0, 0, files=1)
+            self._remove_state(state_path)
+            return
+        
+        if upload_id is None:
+            upload_id = self.client.create_multipart_upload(key)
+            self._save_state(state_path, {"key": key, "upload_id": upload_id, "part_size": part_size})
+        
+        digests: List[bytes] = []
+        etags: Dict[int, str] = {}
+        futures: List[Future] = []
+        slots = threading.BoundedSemaphore(self.workers)
+        total = 0
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="s3-part") as executor:
+                while True:
+                    number = len(digests) + 1
+                    if number > MAX_PARTS:
+                        raise StorageError(0, "TooManyParts", f"more than {MAX_PARTS} parts of {format_size(part_size)}")
+                    digest = hashlib.md5(data).digest()
+                    digests.append(digest)
+                    total += len(data)
+                    if server_parts.get(number) == digest.hex():
+                        etags[number] = digest.hex()
+                        self._count(0, 0, 1)
+                    else:
+                        # Begrenzt die Teile im Speicher: erst lesen, wenn ein Platz frei ist
+                        slots.acquire()
+                        for future in [future for future in futures if future.done()]:
+                            future.result()
+                            futures.remove(future)
+                        futures.append(executor.submit(self._send_part, key, upload_id, number, data, digest, etags, slots))
+                    if len(data) < part_size:
+                        break
+                    data = self._read_part(source, part_size, growing)
+                    if not data:
+                        break
+                for future in futures:
+                    future.result()
+            
+            if cancelled and cancelled():
+                raise StorageError(0, "Cancelled", "source was discarded")
+            etag = self.client.complete_multipart_upload(key, upload_id, sorted(etags.items()))
+        except StorageError as e:
+            if e.code == "Cancelled":
+                self.client.abort_multipart_upload(key, upload_id)
+                self._remove_state(state_path)
+            raise
+        
+        # Zusammengesetzter ETag: MD5 über die MD5s der Teile, "-" Anzahl Teile
+        expected = f"{hashlib.md5(b''.join(digests)).hexdigest()}-{len(digests)}"
+        if etag and etag != expected:
+            raise StorageError(0, "BadDigest", f"{key}: object ETag {etag} does not match {expected}")
+        head = self.client.head_object(key)
+        if head is None or int(head.get("content-length", -1)) != total:
+            raise StorageError(0, "BadDigest", f"{key}: stored size does not match {total} bytes")
+        self._count(0, 0, 0, files=1)
+        self._remove_state(state_path)
+    
+    def _send_part(
+        self,
+        key: str,
+        upload_id: str,
+        number: int,
+        data: bytes,
+        digest: bytes,
+        etags: Dict[int, str],
+        slots: threading.BoundedSemaphore
+    ) -> None:
+        """
+        Lädt einen Teil hoch (läuft im Thread-Pool) und gibt seinen Speicherplatz frei.
+        
+        Args:
+            key (str): Objekt-Schlüssel
+            upload_id (str): Upload-ID
+            number (int): Teilnummer
+            data (bytes): Inhalt
+            digest (bytes): MD5 des Inhalts
+            etags (Dict[int, str]): Ergebnis: Teilnummer -> ETag
+            slots (threading.BoundedSemaphore): Freie Plätze für Teile im Speicher
+        """
+        try:
+            etag = self.client.upload_part(key, upload_id, number, data, digest)
+            with self._lock:
+                etags[number] = etag
+            self._count(len(data), 1, 0)
+        finally:
+            slots.release()
+    
+    def _resume(self, key: str, state_path: str, part_size: int) -> Tuple[Optional[str], Dict[int, str]]:
+        """
+        Prüft, ob ein abgebrochener Multipart-Upload fortgesetzt werden kann.
+        Nicht passende Uploads werden abgebrochen, damit keine Teile liegen bleiben.
+        
+        Args:
+            key (str): Objekt-Schlüssel
+            state_path (str): Zustandsdatei
+            part_size (int): Geplante Teilgröße
+        
+        Returns:
+            Tuple[Optional[str], Dict[int, str]]: (Upload-ID oder None, Teilnummer -> ETag auf dem Server)
+        """
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None, {}
+        
+        upload_id = state.get("upload_id")
+        if not upload_id:
+            return None, {}
+        if state.get("key") == key and state.get("part_size") == part_size:
+            parts = self.client.list_parts(key, upload_id)
+            if parts is not None:
+                self.logger.info(f"Resuming upload of {self.client.url(key)} ({len(parts)} parts on the server)")
+                return upload_id, parts
+        else:
+            try:
+                self.client.abort_multipart_upload(state.get("key", key), upload_id)
+            except StorageError as e:
+                self.logger.warning(f"Could not abort stale upload {upload_id}: {str(e)}")
+        self._remove_state(state_path)
+        return None, {}
+    
+    @staticmethod
+    def _read_part(source: BinaryIO, size: int, growing: Optional[Callable[[], bool]]) -> bytes:
+        """
+        Liest einen Teil; bei einer wachsenden Quelle wird auf weitere Daten gewartet.
+        
+        Args:
+            source (BinaryIO): Die Quelle
+            size (int): Gewünschte Bytes
+            growing (Optional[Callable[[], bool]]): Liefert True, solange noch geschrieben wird
+        
+        Returns:
+            bytes: Bis zu size Bytes (weniger nur am Ende der Quelle)
+        """
+        chunks = []
+        remaining = size
+        while remaining:
+            # Erst den Zustand, dann lesen: nach dem Ende des Schreibens fehlt so kein Rest
+            done = growing is None or not growing()
+            data = source.read(remaining)
+            if data:
+                chunks.append(data)
+                remaining -= len(data)
+            elif done:
+                break
+            else:
+                time.sleep(OBJECT_STORAGE['poll_seconds'])
+        return b"".join(chunks)
+    
+    def _count(self, size: int, parts: int, resumed: int, files: int = 0) -> None:
+        """
+        Zählt hochgeladene Bytes, Teile und Dateien (threadsicher).
+        
+        Args:
+            size (int): Gesendete Bytes
+            parts (int): Gesendete Teile
+            resumed (int): Übernommene Teile
+            files (int): Fertige Dateien
+        """
+        with self._lock:
+            self.stats["bytes"] += size
+            self.stats["parts"] += parts
+            self.stats["resumed_parts"] += resumed
+            self.stats["files"] += files
+    
+    @staticmethod
+    def _save_state(state_path: str, state: Dict) -> None:
+        """
+        Speichert den Stand eines Multipart-Uploads atomar.
+        
+        Args:
+            state_path (str): Zustandsdatei
+            state (Dict): {"key", "upload_id", "part_size"}
+        """
+        temp_path = f"{state_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(temp_path, state_path)
+    
+    @staticmethod
+    def _remove_state(state_path: str) -> None:
+        """
+        Entfernt die Zustandsdatei nach Abschluss oder Abbruch.
+        
+        Args:
+            state_path (str): Zustandsdatei
+        """
+        try:
+            os.remove(state_path)
+        except FileNotFoundError:
+            pass
+
+
+class StreamingUpload:
+    """
+    Lädt ein Archiv hoch, während es geschrieben wird.
+    
+    Nur für Formate, die ihre Ausgabe ausschließlich anhängen (TAR-Ströme:
+    tar.zst, tar.enc). Ein Thread liest die temporäre Datei des Archivs und lädt
+    jeden vollen Teil sofort hoch; nach dem Schreiben fehlt nur noch der Rest.
+    Wird das Archiv verworfen, wird auch der Upload abgebrochen.
+    
+    Attributes:
+        uploader (S3Uploader): Der ausführende Uploader
+        partial_path (str): Temporäre Datei des Archivs
+        final_path (str): Pfad des fertigen Archivs
+        key (str): Objekt-Schlüssel
+    """
+    
+    def __init__(self, uploader: S3Uploader, partial_path: str, final_path: str) -> None:
+        """
+        Initialisiert den StreamingUpload und startet den Upload-Thread.
+        
+        Args:
+            uploader (S3Uploader): Der ausführende Uploader
+            partial_path (str): Temporäre Datei des Archivs (darf noch nicht existieren)
+            final_path (str): Pfad des fertigen Archivs
+        """
+        self.uploader = uploader
+        self.partial_path = partial_path
+        self.final_path = final_path
+        self.key = uploader.object_key(final_path)
+        self._written = threading.Event()
+        self._discarded = False
+        self._error: Optional[str] = None
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="s3-stream", daemon=True)
+        self._thread.start()
+    
+    def finish(self, success: bool) -> Tuple[bool, str]:
+        """
+        Meldet das Ende des Schreibens und wartet auf den Rest des Uploads.
+        
+        Args:
+            success (bool): Ob das Archiv erfolgreich geschrieben wurde (sonst Abbruch)
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        self._discarded = not success
+        self._written.set()
+        self._thread.join()
+        if not success:
+            return False, "Archive failed, upload aborted"
+        if self._error:
+            msg = f"Upload of {self.uploader.client.url(self.key)} failed: {self._error}"
+            self.uploader.logger.error(msg)
+            return False, msg
+        return True, self.uploader._summary(self._started)
+    
+    def _run(self) -> None:
+        """Öffnet das Archiv, sobald es existiert, und lädt es hoch (Upload-Thread)."""
+        try:
+            source = self._open()
+            if source is None:
+                if not self._discarded:
+                    self._error = f"archive not found: {self.final_path}"
+                return
+            with source:
+                self.uploader._upload_source(
+                    source,
+                    self.key,
+                    f"{self.final_path}{OBJECT_STORAGE['state_suffix']}",
+                    growing=lambda: not self._written.is_set(),
+                    cancelled=lambda: self._discarded
+                )
+        except (OSError, StorageError) as e:
+            self._error = str(e)
+    
+    def _open(self) -> Optional[BinaryIO]:
+        """
+        Wartet auf die temporäre Datei. Ist sie schon umbenannt, wird nach dem Ende
+        des Schreibens das fertige Archiv geöffnet (nie vorher: dort kann noch ein
+        älteres Archiv liegen).
+        
+        Returns:
+            Optional[BinaryIO]: Die geöffnete Datei oder None (Archiv verworfen)
+        """
+        while True:
+            written = self._written.is_set()
+            try:
+                return open(self.partial_path, 'rb')
+            except FileNotFoundError:
+                pass
+            if written:
+                if self._discarded or not os.path.isfile(self.final_path):
+                    return None
+                return open(self.final_path, 'rb')
+            time.sleep(OBJECT_STORAGE['poll_seconds'])
\ No newline at end of file
@@ -0,0 +1,243 @@
+# core/pipeline.py
+
+"""
+Gestufte Backup-Pipeline für Batch-Läufe ohne Qt.
+Clone-, Archiv- und Nachbearbeitungs-Stufe laufen in eigenen Thread-Pools,
+verbunden durch begrenzte Warteschlangen: Repository N wird komprimiert,
+während Repository N+1 herunterlädt.
+"""
+
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from config import PIPELINE
+from .logger import Logger
+from .backup_job import BackupJob
+
+
+# Ende-Markierung in den Warteschlangen
+_DONE = object()
+
+# Nachbearbeitung: erhält den Job nach Clone und Archiv, liefert (Erfolg, Nachricht)
+PostProcessor = Callable[[BackupJob], Tuple[bool, str]]
+
+ResultCallback = Callable[[BackupJob, bool, str], None]
+
+
+class BackupPipeline:
+    """
+    Führt viele BackupJobs in drei überlappenden Stufen aus.
+    
+    Die Warteschlangen zwischen den Stufen sind begrenzt (PIPELINE['queue_size']).
+    Ist eine Stufe langsamer, blockieren die vorherigen, statt unbegrenzt
+    fertige Clones auf der Platte anzuhäufen. Die Gesamtdauer nähert sich
+    damit der Dauer der langsamsten Stufe statt der Summe aller Stufen.
+    
+    Attributes:
+        logger (Logger): Logger-Instanz für Logging
+        workers (Dict[str, int]): Threads pro Stufe ("clone", "archive", "post")
+        post_processors (List[PostProcessor]): Schritte der Nachbearbeitungs-Stufe
+        busy_seconds (Dict[str, float]): Summierte Arbeitszeit pro Stufe (nach run())
+    """
+    
+    def __init__(
+        self,
+        clone_workers: int = PIPELINE['clone_workers'],
+        archive_workers: int = PIPELINE['archive_workers'],
+        post_workers: int = PIPELINE['post_workers'],
+        queue_size: int = PIPELINE['queue_size'],
+        post_processors: Optional[List[PostProcessor]] = None,
+        logger: Logger = None
+    ) -> None:
+        """
+        Initialisiert die BackupPipeline.
+        
+        Args:
+            clone_workers (int): Parallele Clones. Default aus config.py
+            archive_workers (int): Parallele Archivierungen. Default aus config.py
+            post_workers (int): Parallele Nachbearbeitungen. Default aus config.py
+            queue_size (int): Kapazität der Warteschlangen zwischen den Stufen
+            post_processors (Optional[List[PostProcessor]]): Schritte nach dem Archivieren
+            logger (Logger): Logger-Instanz. Wenn None, wird eine neue erstellt
+        """
+        self.logger = logger or Logger()
+        self.workers = {"clone": clone_workers, "archive": archive_workers, "post": post_workers}
+        self.queue_size = queue_size
+        self.post_processors = post_processors or []
+        self.busy_seconds: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def run(
+        self,
+        jobs: Iterable[BackupJob],
+        on_result: Optional[ResultCallback] = None,
+        progress: Optional[Callable[[BackupJob, str, float, str], None]] = None
+    ) -> Dict[str, int]:
+        """
+        Führt alle Jobs aus (blockierend). jobs wird erst bei Bedarf gelesen,
+        daher kann auch ein Generator über sehr viele Profile übergeben werden.
+        
+        Args:
+            jobs (Iterable[BackupJob]): Die Jobs
+            on_result (Optional[ResultCallback]): Wird pro Job mit (Job, Erfolg, Nachricht) aufgerufen
+            progress (Optional[Callable]): Wird mit (Job, Phase, Prozent, Rate) aufgerufen
+        
+        Returns:
+            Dict[str, int]: {"finished": Anzahl, "failed": Anzahl}
+        """
+        counts = {"finished": 0, "failed": 0}
+        self.busy_seconds = {stage: 0.0 for stage in self.workers}
+        queues = {stage: queue.Queue(maxsize=self.queue_size) for stage in self.workers}
+        remaining = dict(self.workers)
+        
+        def finish_worker(stage: str, next_stage: Optional[str]) -> None:
+            # Der letzte Worker einer Stufe beendet die nächste Stufe
+            with self._lock:
+                remaining[stage] -= 1
+                last = remaining[stage] == 0
+            if last and next_stage:
+                for _ in range(self.workers[next_stage]):
+                    queues[next_stage].put(_DONE)
+        
+        def clone_worker() -> None:
+            try:
+                while True:
+                    job = queues["clone"].get()
+                    if job is _DONE:
+                        break
+                    started = time.monotonic()
+                    try:
+                        if progress:
+                            job.set_progress(lambda phase, percent, rate, job=job: progress(job, phase, percent, rate))
+                        success, message = job.clone_stage()
+                    except Exception as e:
+                        success, message = False, self._unexpected("clone", job, e)
+                    self._add_busy("clone", started)
+                    queues["archive"].put((job, success, message))
+            finally:
+                finish_worker("clone", "archive")
+        
+        def archive_worker() -> None:
+            try:
+                while True:
+                    item = queues["archive"].get()
+                    if item is _DONE:
+                        break
+                    job, success, message = item
+                    if success:
+                        started = time.monotonic()
+                        try:
+                            job.archive_stage()
+                        except Exception as e:
+                            # Wie in archive_stage: das Backup selbst ist vorhanden
+                            self._unexpected("archive", job, e)
+                        self._add_busy("archive", started)
+                    queues["post"].put(item)
+            finally:
+                finish_worker("archive", "post")
+        
+        def post_worker() -> None:
+            try:
+                while True:
+                    item = queues["post"].get()
+                    if item is _DONE:
+                        break
+                    job, success, message = item
+                    started = time.monotonic()
+                    try:
+                        success, message = self._post_process(job, success, message)
+                    except Exception as e:
+                        success, message = False, self._unexpected("post", job, e)
+                    self._add_busy("post", started)
+                    job.set_progress(None)
+                    with self._lock:
+                        counts["finished" if success else "failed"] += 1
+                    if on_result:
+                        try:
+                            on_result(job, success, message)
+                        except Exception as e:
+                            self.logger.error(f"Result callback failed for {job.folder_name}: {str(e)}")
+            finally:
+                finish_worker("post", None)
+        
+        targets = {"clone": clone_worker, "archive": archive_worker, "post": post_worker}
+        threads = [
+            threading.Thread(target=targets[stage], name=f"pipeline-{stage}-{index}", daemon=True)
+            for stage, count in self.workers.items()
+            for index in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        
+        started = time.monotonic()
+        try:
+            # Blockiert, sobald die Clone-Warteschlange voll ist
+            for job in jobs:
+                queues["clone"].put(job)
+        finally:
+            for _ in range(self.workers["clone"]):
+                queues["clone"].put(_DONE)
+            for thread in threads:
+                thread.join()
+        
+        stages = ", ".join(f"{stage} {seconds:.1f}s" for stage, seconds in self.busy_seconds.items())
+        self.logger.info(
+            f"Pipeline finished in {time.monotonic() - started:.1f}s: "
+            f"{counts['finished']} finished, {counts['failed']} failed (busy: {stages})"
+        )
+        return counts
+    
+    def _post_process(self, job: BackupJob, success: bool, message: str) -> Tuple[bool, str]:
+        """
+        Repliziert das Backup, führt die Nachbearbeitung aus und schließt den Job ab.
+        
+        Args:
+            job (BackupJob): Der Job
+            success (bool): Ergebnis der Clone-Stufe
+            message (str): Nachricht der Clone-Stufe
+        
+        Returns:
+            Tuple[bool, str]: Endergebnis des Jobs
+        """
+        if success:
+            try:
+                job.replicate_stage()
+                for post_processor in self.post_processors:
+                    try:
+                        ok, post_message = post_processor(job)
+                    except Exception as e:
+                        ok, post_message = False, f"Unexpected error: {str(e)}"
+                    if not ok:
+                        self.logger.warning(f"Post-processing failed for {job.folder_name}: {post_message}")
+            except Exception as e:
+                # finish() muss trotzdem laufen, sonst bleibt die Speicherplatz-Reservierung bestehen
+                success, message = False, self._unexpected("post", job, e)
+        return job.finish(success, message)
+    
+    def _unexpected(self, stage: str, job: BackupJob, error: Exception) -> str:
+        """
+        Loggt eine unerwartete Exception einer Stufe; der Worker läuft mit dem nächsten Job weiter.
+        
+        Args:
+            stage (str): Name der Stufe
+            job (BackupJob): Der betroffene Job
+            error (Exception): Die Exception
+        
+        Returns:
+            str: Die Fehlermeldung für das Ergebnis des Jobs
+        """
+        msg = f"Unexpected error in {stage} stage for {job.folder_name}: {str(error)}"
+        self.logger.error(msg)
+        return msg
+    
+    def _add_busy(self, stage: str, started: float) -> None:
+        """
+        Addiert die Arbeitszeit einer Stufe.
+        
+        Args:
+            stage (str): Name der Stufe
+            started (float): Startzeit (time.monotonic)
+        """
+        with self._lock:
+            self.busy_seconds[stage] += time.monotonic() - started
\ No newline at end of file
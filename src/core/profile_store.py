@@ -0,0 +1,324 @@
+# core/profile_store.py
+
+"""
+Profil-Speicher für verwaltete Repositories.
+Speichert tausende Repository-Profile in einer SQLite-Datenbank mit Index,
+cached geladene Profile im Speicher und schreibt nur geänderte Einträge.
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from config import PROFILE_STORE_FILE, PROFILE_STORE
+from .logger import Logger
+from .backup_job import BackupJob
+
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS profiles (
+        url TEXT PRIMARY KEY,
+        folder_name TEXT NOT NULL,
+        target_path TEXT NOT NULL,
+        strategy TEXT NOT NULL,
+        options TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_profiles_folder ON profiles (folder_name);
+    CREATE INDEX IF NOT EXISTS idx_profiles_target ON profiles (target_path);
+"""
+
+
+class RepositoryProfile:
+    """
+    Einstellungen für das Backup eines einzelnen Repositories.
+    
+    Attributes:
+        github_url (str): Die Repository-URL (Schlüssel des Profils)
+        folder_name (str): Name des lokalen Ordners
+        target_path (str): Speicherort der Backups
+        strategy (str): "timestamped" (neuer Ordner pro Lauf) oder "overwrite"
+        options (Dict): Archiv-Optionen (create_zip, archive_format, incremental_zip, git_mode)
+    """
+    
+    def __init__(
+        self,
+        github_url: str,
+        folder_name: str,
+        target_path: str,
+        strategy: str = PROFILE_STORE['default_strategy'],
+        options: Optional[Dict] = None
+    ) -> None:
+        """
+        Initialisiert das RepositoryProfile.
+        
+        Args:
+            github_url (str): Die Repository-URL
+            folder_name (str): Name des lokalen Ordners
+            target_path (str): Speicherort der Backups
+            strategy (str): "timestamped" oder "overwrite"
+            options (Optional[Dict]): Archiv-Optionen. Fehlende Werte aus config.py
+        """
+        self.github_url = github_url
+        self.folder_name = folder_name
+        self.target_path = target_path
+        self.strategy = strategy
+        self.options = dict(PROFILE_STORE['default_options'])
+        self.options.update(options or {})
+    
+    def to_job(self, logger: Optional[Logger] = None) -> BackupJob:
+        """
+        Erstellt einen BackupJob mit den Einstellungen dieses Profils.
+        
+        Args:
+            logger (Optional[Logger]): Logger-Instanz für den Job
+        
+        Returns:
+            BackupJob: Der ausführbare Job
+        """
+        return BackupJob(
+            self.github_url,
+            self.folder_name,
+            self.target_path,
+            add_backup=self.strategy == "timestamped",
+            logger=logger,
+            **self.options
+        )
+    
+    def _to_row(self, updated_at: Optional[str] = None, options_json: Optional[str] = None) -> Tuple:
+        """
+        Datenbank-Zeile des Profils.
+        
+        Args:
+            updated_at (Optional[str]): Zeitstempel, None = jetzt
+            options_json (Optional[str]): Bereits serialisierte Optionen (Bulk-Import)
+        """
+        return (
+            self.github_url,
+            self.folder_name,
+            self.target_path,
+            self.strategy,
+            options_json or json.dumps(self.options, sort_keys=True),
+            updated_at or datetime.now().isoformat(),
+        )
+    
+    @classmethod
+    def _from_row(cls, row: Tuple) -> "RepositoryProfile":
+        """Erstellt ein Profil aus einer Datenbank-Zeile."""
+        url, folder_name, target_path, strategy, options, _ = row
+        return cls(url, folder_name, target_path, strategy, json.loads(options))
+
+
+class ProfileStore:
+    """
+    Speicher für Repository-Profile auf Basis von SQLite.
+    
+    Lookups laufen über den Primärschlüssel (URL) bzw. Indizes und laden nur
+    das angefragte Profil. Änderungen werden im Speicher gesammelt und von
+    save() in einer einzigen Transaktion geschrieben, d.h. der Aufwand hängt
+    nur von der Anzahl geänderter Profile ab, nicht von der Gesamtzahl.
+    
+    Attributes:
+        db_file (str): Pfad zur Datenbank
+        logger (Logger): Logger-Instanz für Logging
+    """
+    
+    def __init__(self, db_file: str = PROFILE_STORE_FILE, logger: Logger = None) -> None:
+        """
+        Initialisiert den ProfileStore.
+        
+        Args:
+            db_file (str): Pfad zur Datenbank. Default aus config.py
+            logger (Logger): Logger-Instanz. Wenn None, wird eine neue erstellt
+        """
+        self.db_file = db_file
+        self.logger = logger or Logger()
+        self._cache: Dict[str, RepositoryProfile] = {}
+        self._dirty: Set[str] = set()
+        self._deleted: Set[str] = set()
+        self._lock = threading.RLock()
+        self._connection: Optional[sqlite3.Connection] = None
+    
+    def get(self, url: str) -> Optional[RepositoryProfile]:
+        """
+        Gibt das Profil zu einer URL zurück (aus dem Cache oder per Index).
+        
+        Args:
+            url (str): Die Repository-URL
+        
+        Returns:
+            Optional[RepositoryProfile]: Das Profil oder None
+        """
+        with self._lock:
+            if url in self._deleted:
+                return None
+            if url not in self._cache:
+                row = self._connect().execute(
+                    "SELECT * FROM profiles WHERE url = ?", (url,)
+                ).fetchone()
+                if row is None:
+                    return None
+                self._cache[url] = RepositoryProfile._from_row(row)
+            return self._cache[url]
+    
+    def find_by_folder(self, folder_name: str) -> List[RepositoryProfile]:
+        """
+        Sucht Profile über den Ordnernamen (indiziert).
+        
+        Args:
+            folder_name (str): Der Ordnername
+        
+        Returns:
+            List[RepositoryProfile]: Passende Profile
+        """
+        self.save()
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT url FROM profiles WHERE folder_name = ?", (folder_name,)
+            ).fetchall()
+        return [profile for profile in (self.get(url) for (url,) in rows) if profile]
+    
+    def put(self, profile: RepositoryProfile) -> None:
+        """
+        Legt ein Profil an oder ersetzt es und markiert es als geändert.
+        Geänderte Profile aus get() müssen ebenfalls mit put() gemeldet werden.
+        
+        Args:
+            profile (RepositoryProfile): Das Profil
+        """
+        with self._lock:
+            self._cache[profile.github_url] = profile
+            self._dirty.add(profile.github_url)
+            self._deleted.discard(profile.github_url)
+    
+    def add_many(self, profiles: List[RepositoryProfile]) -> int:
+        """
+        Fügt neue Profile direkt in einer Transaktion ein (für Bulk-Imports).
+        Vorhandene Profile bleiben unverändert, neue werden nicht gecacht.
+        
+        Args:
+            profiles (List[RepositoryProfile]): Die Profile
+        
+        Returns:
+            int: Anzahl tatsächlich neu eingefügter Profile
+        """
+        self.save()
+        # Zeitstempel und identische Optionen nur einmal pro Block serialisieren
+        updated_at = datetime.now().isoformat()
+        options_cache: Dict[Tuple, str] = {}
+        rows = []
+        for profile in profiles:
+            key = tuple(sorted(profile.options.items()))
+            if key not in options_cache:
+                options_cache[key] = json.dumps(profile.options, sort_keys=True)
+            rows.append(profile._to_row(updated_at, options_cache[key]))
+        
+        with self._lock:
+            connection = self._connect()
+            before = connection.total_changes
+            with connection:
+                connection.executemany("INSERT OR IGNORE INTO profiles VALUES (?, ?, ?, ?, ?, ?)", rows)
+            return connection.total_changes - before
+    
+    def delete(self, url: str) -> None:
+        """
+        Entfernt ein Profil (wirksam nach save()).
+        
+        Args:
+            url (str): Die Repository-URL
+        """
+        with self._lock:
+            self._cache.pop(url, None)
+            self._dirty.discard(url)
+            self._deleted.add(url)
+    
+    def count(self) -> int:
+        """
+        Anzahl der gespeicherten Profile inklusive ungespeicherter Änderungen.
+        
+        Returns:
+            int: Anzahl der Profile
+        """
+        self.save()
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+    
+    def iter_profiles(self, batch_size: int = PROFILE_STORE['batch_size']) -> Iterator[RepositoryProfile]:
+        """
+        Liefert alle Profile seitenweise, ohne alle gleichzeitig zu laden.
+        
+        Args:
+            batch_size (int): Profile pro Datenbankabfrage
+        
+        Yields:
+            RepositoryProfile: Die Profile, sortiert nach URL
+        """
+        self.save()
+        last_url = ""
+        while True:
+            with self._lock:
+                rows = self._connect().execute(
+                    "SELECT * FROM profiles WHERE url > ? ORDER BY url LIMIT ?",
+                    (last_url, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield self._cache.get(row[0]) or RepositoryProfile._from_row(row)
+            last_url = rows[-1][0]
+    
+    def save(self) -> Tuple[bool, str]:
+        """
+        Schreibt alle geänderten und gelöschten Profile in einer Transaktion.
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        with self._lock:
+            if not self._dirty and not self._deleted:
+                return True, "No changes"
+            try:
+                connection = self._connect()
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO profiles VALUES (?, ?, ?, ?, ?, ?)",
+                        [self._cache[url]._to_row() for url in self._dirty]
+                    )
+                    connection.executemany(
+                        "DELETE FROM profiles WHERE url = ?",
+                        [(url,) for url in self._deleted]
+                    )
+                msg = f"Profiles saved: {len(self._dirty)} updated, {len(self._deleted)} deleted"
+                self._dirty.clear()
+                self._deleted.clear()
+                self.logger.debug(msg)
+                return True, msg
+            except sqlite3.Error as e:
+                msg = f"Error saving profiles: {str(e)}"
+                self.logger.error(msg)
+                return False, msg
+    
+    def close(self) -> None:
+        """Speichert offene Änderungen und schließt die Datenbank."""
+        self.save()
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+    
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Öffnet die Datenbank beim ersten Zugriff und legt das Schema an.
+        
+        Returns:
+            sqlite3.Connection: Die offene Verbindung
+        """
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.db_file, check_same_thread=False)
+            # WAL: Schreiben blockiert Leser nicht, Commits sind atomar
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(SCHEMA)
+            self.logger.debug(f"Profile store opened: {self.db_file}")
+        return self._connection
\ No newline at end of file
@@ -0,0 +1,293 @@
+# core/replication.py
+
+"""
+Replikation fertiger Backups auf weitere Laufwerke.
+Kopiert wird ohne Umweg über Python-Puffer, wo das Dateisystem es erlaubt:
+Reflink (Copy-on-Write), danach copy_file_range bzw. sendfile im Kernel.
+"""
+
+import os
+import sys
+import shutil
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+from config import REPLICATION, ARCHIVE
+from .logger import Logger
+from .disk_space import format_size
+
+try:
+    import fcntl
+except ImportError:  # Windows: kein ioctl, Reflinks werden übersprungen
+    fcntl = None
+
+
+# ioctl FICLONE (Linux): Ziel teilt sich die Blöcke der Quelle (Btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+
+def fast_copy(source: str, target: str) -> str:
+    """
+    Kopiert eine Datei mit dem schnellsten verfügbaren Verfahren.
+    
+    Args:
+        source (str): Quelldatei
+        target (str): Zieldatei (wird überschrieben)
+    
+    Returns:
+        str: Verwendetes Verfahren ("reflink", "copy_file_range", "sendfile" oder "copy")
+    """
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        method = _kernel_copy(src.fileno(), dst.fileno(), os.fstat(src.fileno()).st_size)
+        if method is None:
+            shutil.copyfileobj(src, dst, ARCHIVE['chunk_size'])
+            method = "copy"
+    shutil.copystat(source, target)
+    return method
+
+
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> Optional[str]:
+    """
+    Versucht Reflink, copy_file_range und sendfile nacheinander.
+    
+    Args:
+        src_fd (int): Dateideskriptor der Quelle
+        dst_fd (int): Dateideskriptor des (leeren) Ziels
+        size (int): Größe der Quelle
+    
+    Returns:
+        Optional[str]: Verfahren oder None, wenn nur die normale Kopie bleibt
+    """
+    if fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            fcntl.ioctl(dst_fd, FICLONE, src_fd)
+            return "reflink"
+        except OSError:
+            pass
+    
+    for name in ("copy_file_range", "sendfile"):
+        function = getattr(os, name, None)
+        if function is None or (name == "sendfile" and not sys.platform.startswith("linux")):
+            continue
+        copied = 0
+        try:
+            while copied < size:
+                if name == "copy_file_range":
+                    sent = function(src_fd, dst_fd, size - copied, copied, copied)
+                else:
+                    sent = function(dst_fd, src_fd, copied, size - copied)
+                if sent == 0:
+                    break
+                copied += sent
+            if copied == size:
+                return name
+        except OSError:
+            pass
+        # Teilweise kopierte Daten verwerfen und das nächste Verfahren versuchen
+        os.ftruncate(dst_fd, 0)
+        os.lseek(dst_fd, 0, os.SEEK_SET)
+    return None
+
+
+class Replicator:
+    """
+    Kopiert Backup-Ordner und Archive parallel auf mehrere Ziele.
+    
+    Jede Datei wird in alle Ziele gleichzeitig kopiert. Der Hash der Quelle
+    wird pro Datei nur einmal berechnet; jede Kopie wird danach vom Ziel
+    gelesen und verglichen (unter Linux nach dem Verwerfen des Page-Caches,
+    damit wirklich die Platte gelesen wird). Ordner werden unter einem
+    temporären Namen aufgebaut und erst nach erfolgreicher Prüfung umbenannt.
+    
+    Attributes:
+        targets (List[str]): Zielverzeichnisse
+        logger (Logger): Logger-Instanz für Logging
+        workers (int): Parallele Kopier-Threads
+        verify (bool): Ob Prüfsummen am Ziel verglichen werden
+        stats (Dict[str, int]): Dateien pro Verfahren und Bytes der letzten Replikation
+    """
+    
+    def __init__(
+        self,
+        targets: List[str],
+        logger: Logger = None,
+        workers: int = REPLICATION['workers'],
+        verify: bool = REPLICATION['verify']
+    ) -> None:
+        """
+        Initialisiert den Replicator.
+        
+        Args:
+            targets (List[str]): Zielverzeichnisse
+            logger (Logger): Logger-Instanz. Wenn None, wird eine neue erstellt
+            workers (int): Parallele Kopier-Threads. Default aus config.py
+            verify (bool): Prüfsummen am Ziel vergleichen. Default aus config.py
+        """
+        self.targets = list(targets)
+        self.logger = logger or Logger()
+        self.workers = max(1, workers)
+        self.verify = verify
+        self.stats: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._source_hashes: Dict[str, str] = {}
+        self._hash_locks: Dict[str, threading.Lock] = {}
+    
+    def replicate(self, paths: List[str]) -> Tuple[bool, str]:
+        """
+        Kopiert Ordner und Dateien in alle Ziele.
+        
+        Args:
+            paths (List[str]): Backup-Ordner, Archive und Manifeste
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        paths = [path for path in paths if path and os.path.exists(path)]
+        if not self.targets or not paths:
+            return True, "Nothing to replicate"
+        
+        self.stats = {"bytes": 0}
+        self._source_hashes = {}
+        self._hash_locks = {}
+        tasks, renames = [], []
+        try:
+            for target in self.targets:
+                os.makedirs(target, exist_ok=True)
+                for path in paths:
+                    destination = os.path.join(target, os.path.basename(path.rstrip(os.sep)))
+                    staging = f"{destination}.replicating"
+                    if os.path.isdir(path):
+                        tasks += self._plan_folder(path, staging)
+                    else:
+                        tasks.append((path, staging))
+                    renames.append((staging, destination))
+        except OSError as e:
+            msg = f"Replication failed: {str(e)}"
+            self.logger.error(msg)
+            return False, msg
+        
+        errors = []
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="replicate") as executor:
+            futures = {executor.submit(self._copy_file, source, target): target for source, target in tasks}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    errors.append(f"{futures[future]}: {str(e)}")
+        
+        if errors:
+            for staging, _ in renames:
+                self._remove(staging)
+            msg = f"Replication failed ({len(errors)} files): {errors[0]}"
+            self.logger.error(msg)
+            return False, msg
+        
+        for staging, destination in renames:
+            # Vorherige Replik (gleicher Name, z.B. ohne Zeitstempel) ersetzen
+            self._remove(destination)
+            os.replace(staging, destination)
+        
+        methods = ", ".join(f"{count} {name}" for name, count in sorted(self.stats.items()) if name != "bytes")
+        msg = (
+            f"Replicated {len(paths)} items to {len(self.targets)} targets "
+            f"({format_size(self.stats['bytes'])}, {methods})"
+        )
+        self.logger.success(msg)
+        return True, msg
+    
+    def _plan_folder(self, source: str, staging: str) -> List[Tuple[str, str]]:
+        """
+        Legt die Ordnerstruktur am Ziel an und liefert die zu kopierenden Dateien.
+        
+        Args:
+            source (str): Backup-Ordner
+            staging (str): Temporärer Zielordner
+        
+        Returns:
+            List[Tuple[str, str]]: (Quelldatei, Zieldatei)
+        """
+        self._remove(staging)
+        tasks = []
+        for root, dirs, files in os.walk(source):
+            target_root = os.path.join(staging, os.path.relpath(root, source))
+            os.makedirs(target_root, exist_ok=True)
+            for name in dirs + files:
+                path = os.path.join(root, name)
+                if os.path.islink(path):
+                    os.symlink(os.readlink(path), os.path.join(target_root, name))
+                elif name in files:
+                    tasks.append((path, os.path.join(target_root, name)))
+        return tasks
+    
+    def _copy_file(self, source: str, target: str) -> None:
+        """
+        Kopiert eine Datei und prüft die Kopie.
+        
+        Args:
+            source (str): Quelldatei
+            target (str): Zieldatei
+        
+        Raises:
+            IOError: Wenn die Prüfsumme am Ziel abweicht
+        """
+        method = fast_copy(source, target)
+        size = os.path.getsize(target)
+        if self.verify and self._hash(target, drop_cache=True) != self._source_hash(source):
+            raise IOError("checksum mismatch after copy")
+        with self._lock:
+            self.stats[method] = self.stats.get(method, 0) + 1
+            self.stats["bytes"] += size
+    
+    def _source_hash(self, source: str) -> str:
+        """
+        Hash einer Quelldatei, einmal pro Replikation berechnet.
+        
+        Args:
+            source (str): Quelldatei
+        
+        Returns:
+            str: Hex-Digest
+        """
+        with self._lock:
+            lock = self._hash_locks.setdefault(source, threading.Lock())
+        with lock:
+            if source not in self._source_hashes:
+                self._source_hashes[source] = self._hash(source)
+            return self._source_hashes[source]
+    
+    @staticmethod
+    def _hash(path: str, drop_cache: bool = False) -> str:
+        """
+        Hash einer Datei.
+        
+        Args:
+            path (str): Pfad der Datei
+            drop_cache (bool): Page-Cache vorher verwerfen (nur Linux), damit vom Datenträger gelesen wird
+        
+        Returns:
+            str: Hex-Digest
+        """
+        digest = hashlib.new(ARCHIVE['hash_algorithm'])
+        with open(path, 'rb') as f:
+            if drop_cache and REPLICATION['drop_cache'] and hasattr(os, "posix_fadvise"):
+                os.fsync(f.fileno())
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            for block in iter(lambda: f.read(ARCHIVE['chunk_size']), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def _remove(self, path: str) -> None:
+        """
+        Entfernt eine Datei oder einen Ordner, falls vorhanden.
+        
+        Args:
+            path (str): Der Pfad
+        """
+        try:
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path)
+            elif os.path.lexists(path):
+                os.remove(path)
+        except OSError as e:
+            self.logger.warning(f"Could not remove {path}: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,99 @@
+# core/reproducible.py
+
+"""
+Reproduzierbare Archive: gleicher Inhalt ergibt byte-identische Archive.
+Zeitstempel werden auf einen festen Zeitpunkt (Commit-Zeit von HEAD) und
+Rechte auf 644/755 normalisiert, Besitzer entfallen.
+"""
+
+import os
+import stat
+import time
+import tarfile
+import zipfile
+from typing import Optional
+
+
+# Frühester im ZIP-Format darstellbarer Zeitpunkt (1980-01-01 00:00:00 UTC)
+ZIP_EPOCH = 315532800
+
+# ZipInfo.create_system für Unix: Rechte stehen in den oberen 16 Bit von external_attr
+ZIP_UNIX_SYSTEM = 3
+
+
+def normalized_mode(mode: int) -> int:
+    """
+    Normalisiert Rechte: 755 für Verzeichnisse und ausführbare Dateien, sonst 644.
+    
+    Args:
+        mode (int): st_mode der Quelle
+    
+    Returns:
+        int: Die normalisierten Rechte (ohne Dateityp)
+    """
+    if stat.S_ISDIR(mode) or mode & 0o111:
+        return 0o755
+    return 0o644
+
+
+def zip_info(file_path: str, arcname: str, mtime: int, compress_type: int) -> zipfile.ZipInfo:
+    """
+    ZipInfo einer Datei mit festem Zeitstempel und normalisierten Rechten.
+    
+    Args:
+        file_path (str): Quelldatei
+        arcname (str): Name im Archiv
+        mtime (int): Zeitstempel (Unix-Zeit, UTC)
+        compress_type (int): Kompressionsverfahren, z.B. zipfile.ZIP_DEFLATED
+    
+    Returns:
+        zipfile.ZipInfo: Der Header (file_size gesetzt, damit ZIP64 richtig gewählt wird)
+    """
+    st = os.stat(file_path)
+    info = zipfile.ZipInfo(arcname, time.gmtime(max(mtime, ZIP_EPOCH))[:6])
+    info.compress_type = compress_type
+    info.create_system = ZIP_UNIX_SYSTEM
+    info.external_attr = (stat.S_IFREG | normalized_mode(st.st_mode)) << 16
+    info.file_size = st.st_size
+    return info
+
+
+def tar_info(tar: tarfile.TarFile, path: str, arcname: str, mtime: int) -> tarfile.TarInfo:
+    """
+    TarInfo eines Pfads mit festem Zeitstempel, normalisierten Rechten und ohne Besitzer.
+    
+    Args:
+        tar (tarfile.TarFile): Das Archiv im Schreibmodus
+        path (str): Quellpfad
+        arcname (str): Name im Archiv
+        mtime (int): Zeitstempel (Unix-Zeit)
+    
+    Returns:
+        tarfile.TarInfo: Der Header
+    """
+    info = tar.gettarinfo(path, arcname)
+    info.mtime = mtime
+    info.uid = info.gid = 0
+    info.uname = info.gname = ""
+    if not info.issym():
+        info.mode = normalized_mode(os.lstat(path).st_mode)
+    return info
+
+
+def source_date_epoch(commit_time: Optional[int]) -> int:
+    """
+    Zeitstempel für alle Members eines reproduzierbaren Archivs.
+    
+    Reihenfolge: Umgebungsvariable SOURCE_DATE_EPOCH, Commit-Zeit von HEAD,
+    sonst ZIP_EPOCH.
+    
+    Args:
+        commit_time (Optional[int]): Commit-Zeit von HEAD oder None
+    
+    Returns:
+        int: Unix-Zeit
+    """
+    value = os.environ.get("SOURCE_DATE_EPOCH", "")
+    if value.isdigit():
+        return int(value)
+    return commit_time if commit_time is not None else ZIP_EPOCH
\ No newline at end of file
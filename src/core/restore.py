@@ -0,0 +1,701 @@
+# core/restore.py
+
+"""
+Wiederherstellung von Backups (Ordner, ZIP, TAR, Git-Bundle).
+Dateien werden parallel extrahiert und schon beim Schreiben gegen CRC,
+Größe und - falls vorhanden - den Hash aus dem Manifest geprüft.
+"""
+
+import os
+import time
+import shutil
+import hashlib
+import tarfile
+import zipfile
+import threading
+import subprocess
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+from config import RESTORE, ARCHIVE
+from .logger import Logger
+from .git_manager import GitManager
+from .archive_manager import ArchiveManager, VOLUME_SUFFIX
+from .reproducible import ZIP_UNIX_SYSTEM
+from .encryption import DecryptingReader, EncryptionError, load_key
+from .disk_space import format_size
+
+try:
+    import zstandard
+except ImportError:  # Optional: Fallback auf das zstd-Kommandozeilentool
+    zstandard = None
+
+
+# Endungen wiederherstellbarer Backups (Ordner haben keine Endung)
+RESTORE_SUFFIXES = (".zip", ".tar.zst", ".tar.gz", ".tgz", ".tar", ".tar.enc", ".bundle", VOLUME_SUFFIX)
+
+
+class IntegrityError(Exception):
+    """Eine wiederhergestellte Datei stimmt nicht mit dem Backup überein."""
+
+
+class RestoreManager:
+    """
+    Stellt Backups parallel und geprüft wieder her.
+    
+    ZIP-Members und Ordner werden auf RESTORE['workers'] Threads verteilt.
+    TAR-Archive sind ein Datenstrom und werden sequenziell gelesen; das
+    Schreiben und Prüfen der Dateien läuft trotzdem parallel. Bundles werden
+    geprüft und geklont. Archive im Git-Modus
+    ``bundle`` erhalten ihr .git-Verzeichnis aus dem enthaltenen Bundle zurück.
+    
+    Attributes:
+        logger (Logger): Logger-Instanz für Logging
+        git_manager (GitManager): Für Bundles
+        archive_manager (ArchiveManager): Für Manifeste
+        workers (int): Parallele Extraktions-Threads
+        stats (Dict): Dateien, Bytes und Sekunden der letzten Wiederherstellung
+    """
+    
+    def __init__(self, logger: Logger = None, workers: int = RESTORE['workers']) -> None:
+        """
+        Initialisiert den RestoreManager.
+        
+        Args:
+            logger (Logger): Logger-Instanz. Wenn None, wird eine neue erstellt
+            workers (int): Parallele Extraktions-Threads. Default aus config.py
+        """
+        self.logger = logger or Logger()
+        self.git_manager = GitManager(self.logger)
+        self.archive_manager = ArchiveManager(self.logger)
+        self.workers = max(1, workers)
+        self.stats: Dict = {}
+        self._lock = threading.Lock()
+    
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+    
+    def list_snapshots(self, directory: str, folder_name: str) -> List[str]:
+        """
+        Alle Backups eines Repositories in einem Speicherort, älteste zuerst.
+        
+        Args:
+            directory (str): Speicherort der Backups
+            folder_name (str): Basis-Ordnername des Repositories
+        
+        Returns:
+            List[str]: Pfade der Backup-Ordner und -Archive
+        """
+        snapshots = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    suffix = next((suffix for suffix in RESTORE_SUFFIXES if entry.name.endswith(suffix)), "")
+                    stem = entry.name[:len(entry.name) - len(suffix)]
+                    if stem != folder_name and not stem.startswith(f"{folder_name}_backup_"):
+                        continue
+                    if suffix or entry.is_dir():
+                        snapshots.append((entry.stat().st_mtime, entry.path))
+        except OSError as e:
+            self.logger.error(f"Cannot list backups in {directory}: {str(e)}")
+        return [path for _, path in sorted(snapshots)]
+    
+    def find_snapshot(self, directory: str, folder_name: str, snapshot: Optional[str] = None) -> Optional[str]:
+        """
+        Wählt ein Backup aus: das neueste oder das, dessen Name snapshot enthält.
+        
+        Args:
+            directory (str): Speicherort der Backups
+            folder_name (str): Basis-Ordnername des Repositories
+            snapshot (Optional[str]): Teil des Namens, z.B. "20260325_143022". None/"latest" = neuestes
+        
+        Returns:
+            Optional[str]: Pfad des Backups oder None
+        """
+        snapshots = self.list_snapshots(directory, folder_name)
+        if snapshot and snapshot != "latest":
+            snapshots = [path for path in snapshots if snapshot in os.path.basename(path)]
+        return snapshots[-1] if snapshots else None
+    
+    # ------------------------------------------------------------------
+    # Wiederherstellung
+    # ------------------------------------------------------------------
+    
+    def restore(
+        self,
+        source: str,
+        destination: str,
+        path: Optional[str] = None,
+        verify: bool = RESTORE['verify'],
+        progress: Optional[Callable[[int], None]] = None
+    ) -> Tuple[bool, str]:
+        """
+        Stellt ein Backup (oder einen Pfad daraus) in einem Ordner wieder her.
+        
+        Args:
+            source (str): Backup-Ordner, ZIP, TAR(.zst/.gz), Bundle oder Volume-Ordner
+            destination (str): Zielordner (darf nicht existieren oder muss leer sein)
+            path (Optional[str]): Nur diese Datei bzw. diesen Ordner wiederherstellen
+            verify (bool): Hashes aus dem Manifest prüfen (CRC und Größe werden immer geprüft)
+            progress (Optional[Callable[[int], None]]): Wird mit dem Fortschritt in Prozent aufgerufen
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        path = path.replace(os.sep, '/').strip('/') if path else None
+        if not os.path.exists(source):
+            msg = f"Backup not found: {source}"
+            self.logger.error(msg)
+            return False, msg
+        if os.path.isdir(destination) and os.listdir(destination):
+            msg = f"Destination is not empty: {destination}"
+            self.logger.error(msg)
+            return False, msg
+        
+        self.logger.info(f"Restoring {source} -> {destination}" + (f" (path: {path})" if path else ""))
+        self.stats = {"files": 0, "bytes": 0, "seconds": 0.0}
+        started = time.monotonic()
+        try:
+            os.makedirs(destination, exist_ok=True)
+            if self.archive_manager.is_volume_archive(source):
+                self._restore_volumes(source, destination, path, verify, progress)
+            elif os.path.isdir(source):
+                self._restore_folder(source, destination, path, progress)
+            elif source.endswith(".zip"):
+                self._restore_zip(source, destination, path, verify, progress)
+            elif source.endswith(".bundle"):
+                self._restore_bundle(source, destination, path)
+            elif source.endswith((".tar.zst", ".tar.gz", ".tgz", ".tar", ".tar.enc")):
+                self._restore_tar(source, destination, path, verify, progress)
+            else:
+                raise ValueError(f"Unknown backup format: {source}")
+            if not source.endswith(".bundle"):
+                self._rehydrate_bundles(destination)
+        except IntegrityError as e:
+            msg = f"Integrity check failed: {str(e)}"
+            self.logger.error(msg)
+            return False, msg
+        except (zipfile.BadZipFile, tarfile.TarError, EncryptionError) as e:
+            msg = f"Corrupt backup {source}: {str(e)}"
+            self.logger.error(msg)
+            return False, msg
+        except Exception as e:
+            msg = f"Restore failed: {str(e)}"
+            self.logger.error(msg)
+            return False, msg
+        
+        seconds = time.monotonic() - started
+        self.stats["seconds"] = seconds
+        if path and not self.stats["files"]:
+            msg = f"Path not found in backup: {path}"
+            self.logger.error(msg)
+            return False, msg
+        rate = self.stats["bytes"] / seconds if seconds > 0 else 0
+        msg = (
+            f"Restored {self.stats['files']} files ({format_size(self.stats['bytes'])}) "
+            f"to {destination} in {seconds:.1f}s ({format_size(rate)}/s)"
+        )
+        self.logger.success(msg)
+        if progress:
+            progress(100)
+        return True, msg
+    
+    def _restore_folder(
+        self,
+        source: str,
+        destination: str,
+        path: Optional[str],
+        progress: Optional[Callable[[int], None]]
+    ) -> None:
+        """
+        Kopiert einen Backup-Ordner parallel.
+        
+        Args:
+            source (str): Backup-Ordner
+            destination (str): Zielordner
+            path (Optional[str]): Nur dieser Pfad
+            progress (Optional[Callable[[int], None]]): Fortschritt in Prozent
+        """
+        files = []
+        for root, dirs, filenames in os.walk(source):
+            for name in dirs + filenames:
+                file_path = os.path.join(root, name)
+                arcname = os.path.relpath(file_path, source).replace(os.sep, '/')
+                if not self._selected(arcname, path):
+                    continue
+                target = self._target_path(destination, arcname)
+                if os.path.islink(file_path):
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    os.symlink(os.readlink(file_path), target)
+                elif name in dirs:
+                    os.makedirs(target, exist_ok=True)
+                else:
+                    files.append((file_path, target))
+        
+        def copy(file_path: str, target: str) -> int:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copyfile(file_path, target)
+            shutil.copystat(file_path, target)
+            size = os.path.getsize(file_path)
+            if os.path.getsize(target) != size:
+                raise IntegrityError(f"{target}: size mismatch")
+            return size
+        
+        self._run_parallel([(copy, task) for task in files], progress)
+    
+    def _restore_zip(
+        self,
+        archive: str,
+        destination: str,
+        path: Optional[str],
+        verify: bool,
+        progress: Optional[Callable[[int], None]]
+    ) -> None:
+        """
+        Extrahiert ein ZIP parallel. Jeder Thread öffnet das Archiv selbst;
+        Members eines Delta-Archivs werden aus dem Archiv gelesen, das sie enthält.
+        
+        Args:
+            archive (str): Pfad des ZIP
+            destination (str): Zielordner
+            path (Optional[str]): Nur dieser Pfad
+            verify (bool): Hashes aus dem Manifest prüfen
+            progress (Optional[Callable[[int], None]]): Fortschritt in Prozent
+        """
+        manifest_files = self.archive_manager.load_manifest(archive).get("files", {})
+        archive_dir = os.path.dirname(os.path.abspath(archive))
+        
+        # Member -> (Archiv, Manifest-Eintrag); ohne Manifest nur das Archiv selbst
+        members: Dict[str, Tuple[str, Dict]] = {}
+        with zipfile.ZipFile(archive) as zipf:
+            for info in zipf.infolist():
+                if self._selected(info.filename.rstrip('/'), path):
+                    entry = manifest_files.get(info.filename, {})
+                    members[info.filename] = (archive, dict(entry, size=info.file_size))
+        for arcname, entry in manifest_files.items():
+            # Delta-Archive: fehlende Members liegen im Archiv, auf das das Manifest verweist
+            if arcname not in members and self._selected(arcname, path):
+                members[arcname] = (os.path.join(archive_dir, entry.get("archive") or ""), entry)
+        self._extract_zip_members(members, destination, verify, progress)
+    
+    def _restore_volumes(
+        self,
+        volume_dir: str,
+        destination: str,
+        path: Optional[str],
+        verify: bool,
+        progress: Optional[Callable[[int], None]]
+    ) -> None:
+        """
+        Extrahiert ein mehrteiliges Archiv; alle Volumes werden gleichzeitig gelesen.
+        
+        Args:
+            volume_dir (str): Ordner mit den Volumes und index.json
+            destination (str): Zielordner
+            path (Optional[str]): Nur dieser Pfad
+            verify (bool): Hashes aus dem Index prüfen
+            progress (Optional[Callable[[int], None]]): Fortschritt in Prozent
+        """
+        files = self.archive_manager.load_manifest(volume_dir).get("files", {})
+        members = {
+            arcname: (os.path.join(volume_dir, entry["archive"]), entry)
+            for arcname, entry in files.items() if self._selected(arcname, path)
+        }
+        self._extract_zip_members(members, destination, verify, progress)
+    
+    def _extract_zip_members(
+        self,
+        members: Dict[str, Tuple[str, Dict]],
+        destination: str,
+        verify: bool,
+        progress: Optional[Callable[[int], None]]
+    ) -> None:
+        """
+        Extrahiert Members aus einem oder mehreren ZIPs parallel. Jeder Thread öffnet die Archive selbst.
+        
+        Args:
+            members (Dict[str, Tuple[str, Dict]]): Member -> (Archiv, Manifest-Eintrag)
+            destination (str): Zielordner
+            verify (bool): Hashes aus dem Manifest prüfen
+            progress (Optional[Callable[[int], None]]): Fortschritt in Prozent
+        """
+        local = threading.local()
+        opened: List[zipfile.ZipFile] = []
+        
+        def extract(arcname: str, origin: str, entry: Dict) -> int:
+            # ZipFile-Objekte sind nicht thread-sicher: eines pro Thread und Archiv
+            archives = getattr(local, "archives", None)
+            if archives is None:
+                archives = local.archives = {}
+            zipf = archives.get(origin)
+            if zipf is None:
+                zipf = archives[origin] = zipfile.ZipFile(origin)
+                with self._lock:
+                    opened.append(zipf)
+            target = self._target_path(destination, arcname)
+            if arcname.endswith('/'):
+                os.makedirs(target, exist_ok=True)
+                return 0
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            info = zipf.getinfo(arcname)
+            # Rechte stehen nur in ZIPs von Unix-Systemen in den oberen 16 Bit
+            mode = (info.external_attr >> 16) & 0o7777 if info.create_system == ZIP_UNIX_SYSTEM else None
+            # Beim Lesen bis zum Ende prüft zipfile die CRC (BadZipFile bei Abweichung)
+            with zipf.open(info) as source:
+                return self._write_checked(source, target, entry if verify else {"size": entry.get("size")}, mode)
+        
+        tasks = sorted(members.items(), key=lambda item: item[1][1].get("size", 0), reverse=True)
+        try:
+            self._run_parallel([(extract, (arcname, origin, entry)) for arcname, (origin, entry) in tasks], progress)
+        finally:
+            for zipf in opened:
+                zipf.close()
+    
+    def _restore_tar(
+        self,
+        archive: str,
+        destination: str,
+        path: Optional[str],
+        verify: bool,
+        progress: Optional[Callable[[int], None]]
+    ) -> None:
+        """
+        Liest ein TAR sequenziell und schreibt/prüft die Dateien parallel.
+        Die Menge gelesener, noch nicht geschriebener Daten ist durch
+        RESTORE['max_inflight_bytes'] begrenzt; größere Dateien werden direkt geschrieben.
+        
+        Args:
+            archive (str): Pfad des TAR (.tar, .tar.gz/.tgz, .tar.zst, .tar.enc)
+            destination (str): Zielordner
+            path (Optional[str]): Nur dieser Pfad
+            verify (bool): Hashes aus dem Manifest prüfen
+            progress (Optional[Callable[[int], None]]): Fortschritt in Prozent (nach gelesenen Bytes)
+        """
+        manifest_files = self.archive_manager.load_manifest(archive).get("files", {}) if verify else {}
+        total_size = os.path.getsize(archive) or 1
+        inflight = threading.BoundedSemaphore(RESTORE['max_inflight_bytes'] // ARCHIVE['chunk_size'])
+        
+        def write(data: bytes, target: str, entry: Dict, mode: int, slots: int) -> int:
+            try:
+                with open(target, 'wb') as f:
+                    f.write(data)
+                self._apply_mode(target, mode)
+                return self._check_entry(target, len(data), hashlib.new(ARCHIVE['hash_algorithm'], data), entry)
+            finally:
+                for _ in range(slots):
+                    inflight.release()
+        
+        # Geschriebene Dateien (Member -> Future oder None) als Ziele für Hardlinks
+        written: Dict[str, Optional[Future]] = {}
+        # Hardlinks auf nicht wiederhergestellte Dateien: Member -> (Ziel-Member, Zielpfad)
+        unresolved: Dict[str, Tuple[str, str]] = {}
+        futures = []
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="restore") as executor, \
+                self._open_tar(archive) as (tar, raw):
+            for member in tar:
+                if not self._selected(member.name, path):
+                    continue
+                target = self._target_path(destination, member.name)
+                if member.isdir():
+                    os.makedirs(target, exist_ok=True)
+                    continue
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                if member.issym():
+                    os.symlink(member.linkname, target)
+                    continue
+                if member.islnk():
+                    if member.linkname in written:
+                        # Das Ziel muss fertig geschrieben sein, bevor es verlinkt wird
+                        if written[member.linkname] is not None:
+                            written[member.linkname].result()
+                        self._link_restored(self._target_path(destination, member.linkname), target)
+                    else:
+                        unresolved[member.name] = (member.linkname, target)
+                    continue
+                if not member.isreg():
+                    raise IntegrityError(f"{member.name}: unsupported TAR member type {member.type!r}")
+                entry = manifest_files.get(member.name, {})
+                entry = dict(entry, size=member.size)
+                source = tar.extractfile(member)
+                slots = max(1, -(-member.size // ARCHIVE['chunk_size']))
+                if slots * ARCHIVE['chunk_size'] > RESTORE['max_inflight_bytes'] // 4:
+                    # Große Datei: direkt aus dem Strom schreiben
+                    self._add_stats(self._write_checked(source, target, entry, member.mode))
+                    written[member.name] = None
+                else:
+                    for _ in range(slots):
+                        inflight.acquire()
+                    future = executor.submit(write, source.read(), target, entry, member.mode, slots)
+                    futures.append(future)
+                    written[member.name] = future
+                if progress:
+                    progress(min(99, int(raw.tell() * 100 / total_size)))
+            for future in as_completed(futures):
+                self._add_stats(future.result())
+        if unresolved:
+            self._restore_tar_links(archive, unresolved, manifest_files)
+    
+    def _restore_tar_links(self, archive: str, links: Dict[str, Tuple[str, str]], manifest_files: Dict) -> None:
+        """
+        Stellt Hardlinks wieder her, deren Ziel nicht mit wiederhergestellt wurde
+        (z.B. außerhalb des gewählten Pfads): ein zweiter Durchlauf liest die Ziele
+        aus dem Archiv.
+        
+        Args:
+            archive (str): Pfad des TAR
+            links (Dict[str, Tuple[str, str]]): Member -> (Ziel-Member, Zielpfad)
+            manifest_files (Dict): Manifest-Einträge für die Prüfung
+        
+        Raises:
+            IntegrityError: Wenn ein Ziel nicht im Archiv steht
+        """
+        targets: Dict[str, List[str]] = {}
+        for name, (linkname, target) in links.items():
+            targets.setdefault(linkname, []).append(target)
+        with self._open_tar(archive) as (tar, _):
+            for member in tar:
+                if not targets:
+                    break
+                if member.name not in targets or not member.isreg():
+                    continue
+                first, *others = targets.pop(member.name)
+                entry = dict(manifest_files.get(member.name, {}), size=member.size)
+                self._add_stats(self._write_checked(tar.extractfile(member), first, entry, member.mode))
+                for target in others:
+                    self._link_restored(first, target)
+        if targets:
+            raise IntegrityError(f"Hard link target missing in backup: {', '.join(sorted(targets))}")
+    
+    @contextmanager
+    def _open_tar(self, archive: str) -> Iterator[Tuple[tarfile.TarFile, BinaryIO]]:
+        """
+        Öffnet ein TAR als Strom, je nach Endung entschlüsselt und dekomprimiert.
+        
+        Args:
+            archive (str): Pfad des TAR (.tar, .tar.gz/.tgz, .tar.zst, .tar.enc)
+        
+        Yields:
+            Tuple[tarfile.TarFile, BinaryIO]: (Archiv im Stream-Modus, Rohdatei für den Fortschritt)
+        """
+        process = None
+        raw = open(archive, 'rb')
+        stream = raw
+        try:
+            if archive.endswith(".enc"):
+                stream = DecryptingReader(raw, load_key())
+            elif archive.endswith(".zst"):
+                if zstandard is not None:
+                    stream = zstandard.ZstdDecompressor().stream_reader(raw)
+                elif shutil.which("zstd"):
+                    process = subprocess.Popen(["zstd", "-dc", "-q"], stdin=raw, stdout=subprocess.PIPE)
+                    stream = process.stdout
+                else:
+                    raise RuntimeError("Zstandard not available. Install the 'zstandard' package or the zstd tool.")
+            mode = "r|gz" if archive.endswith((".gz", ".tgz")) else "r|"
+            with tarfile.open(fileobj=stream, mode=mode) as tar:
+                yield tar, raw
+        finally:
+            raw.close()
+            if isinstance(stream, DecryptingReader):
+                stream.close()
+            if process is not None:
+                process.kill()
+                process.wait()
+    
+    def _link_restored(self, source: str, target: str) -> None:
+        """
+        Legt eine wiederhergestellte Datei per Hardlink ein zweites Mal an
+        (Kopie, wenn das Dateisystem keine Hardlinks kann).
+        
+        Args:
+            source (str): Bereits wiederhergestellte Datei
+            target (str): Zielpfad des Hardlinks
+        """
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+        self._add_stats(os.path.getsize(target))
+    
+    def _restore_bundle(self, bundle: str, destination: str, path: Optional[str]) -> None:
+        """
+        Prüft den Kopf eines Bundles und klont es; beim Klonen prüft Git die
+        Prüfsummen aller Objekte. Mit path wird nur dieser Pfad übernommen.
+        
+        Args:
+            bundle (str): Pfad des Bundles
+            destination (str): Zielordner
+            path (Optional[str]): Nur dieser Pfad
+        """
+        success, msg = self.git_manager.verify_bundle(bundle)
+        if not success:
+            raise IntegrityError(msg)
+        clone_path = f"{destination.rstrip(os.sep)}.restore" if path else destination
+        try:
+            success, msg = self.git_manager.clone(os.path.abspath(bundle), clone_path)
+            if not success:
+                raise RuntimeError(msg)
+            if path:
+                self._restore_folder(clone_path, destination, path, None)
+                return
+            for root, dirs, files in os.walk(destination):
+                dirs[:] = [d for d in dirs if d != '.git']
+                self._add_stats(sum(os.path.getsize(os.path.join(root, f)) for f in files), len(files))
+        finally:
+            if path and os.path.isdir(clone_path):
+                shutil.rmtree(clone_path, ignore_errors=True)
+    
+    def _rehydrate_bundles(self, destination: str) -> None:
+        """
+        Ersetzt die Bundles aus dem Git-Modus ``bundle`` wieder durch .git-Verzeichnisse.
+        
+        Args:
+            destination (str): Wiederhergestellter Ordner
+        """
+        for root, dirs, files in os.walk(destination):
+            if ARCHIVE['bundle_member'] in files and '.git' not in dirs and '.git' not in files:
+                bundle = os.path.join(root, ARCHIVE['bundle_member'])
+                success, msg = self.git_manager.restore_bundle(bundle, root)
+                if success:
+                    os.remove(bundle)
+                else:
+                    self.logger.warning(f"Could not restore .git from {bundle}: {msg}")
+    
+    # ------------------------------------------------------------------
+    # Hilfsfunktionen
+    # ------------------------------------------------------------------
+    
+    def _run_parallel(self, tasks: List[Tuple[Callable[..., int], Tuple]], progress: Optional[Callable[[int], None]]) -> None:
+        """
+        Führt Extraktions-Aufgaben parallel aus und zählt Dateien und Bytes.
+        Der erste Fehler bricht die Wiederherstellung ab.
+        
+        Args:
+            tasks (List[Tuple[Callable[..., int], Tuple]]): (Funktion, Argumente); Funktion liefert Bytes
+            progress (Optional[Callable[[int], None]]): Fortschritt in Prozent
+        """
+        if not tasks:
+            return
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="restore") as executor:
+            futures = [executor.submit(function, *args) for function, args in tasks]
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    self._add_stats(future.result())
+                    if progress:
+                        progress(min(99, done * 100 // len(futures)))
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+    
+    def _write_checked(self, source, target: str, entry: Dict, mode: Optional[int] = None) -> int:
+        """
+        Schreibt einen Datenstrom in eine Datei und prüft ihn dabei.
+        
+        Args:
+            source: Lesbares Datei-Objekt
+            target (str): Zieldatei
+            entry (Dict): Erwartete Werte {"size", "hash"} (fehlende werden nicht geprüft)
+            mode (Optional[int]): Rechte aus dem Archiv oder None
+        
+        Returns:
+            int: Geschriebene Bytes
+        """
+        digest = hashlib.new(ARCHIVE['hash_algorithm'])
+        size = 0
+        with open(target, 'wb') as f:
+            for block in iter(lambda: source.read(ARCHIVE['chunk_size']), b''):
+                digest.update(block)
+                f.write(block)
+                size += len(block)
+        self._apply_mode(target, mode)
+        return self._check_entry(target, size, digest, entry)
+    
+    @staticmethod
+    def _apply_mode(target: str, mode: Optional[int]) -> None:
+        """
+        Übernimmt die archivierten Rechte (z.B. das Ausführungs-Bit von Skripten).
+        Ohne Rechte im Archiv bleibt die Voreinstellung (umask) stehen.
+        
+        Args:
+            target (str): Die geschriebene Datei
+            mode (Optional[int]): Rechte aus dem Archiv oder None
+        """
+        if mode:
+            os.chmod(target, mode & 0o7777)
+    
+    @staticmethod
+    def _check_entry(target: str, size: int, digest, entry: Dict) -> int:
+        """
+        Vergleicht Größe und Hash einer geschriebenen Datei mit dem Manifest.
+        
+        Args:
+            target (str): Die geschriebene Datei (für Fehlermeldungen)
+            size (int): Geschriebene Bytes
+            digest: Hash-Objekt über die geschriebenen Daten
+            entry (Dict): Erwartete Werte {"size", "hash"}
+        
+        Returns:
+            int: Die Größe
+        
+        Raises:
+            IntegrityError: Bei Abweichung
+        """
+        if entry.get("size") is not None and entry["size"] != size:
+            raise IntegrityError(f"{target}: expected {entry['size']} bytes, got {size}")
+        if entry.get("hash") and entry["hash"] != digest.hexdigest():
+            raise IntegrityError(f"{target}: hash mismatch")
+        return size
+    
+    def _add_stats(self, size: int, files: int = 1) -> None:
+        """
+        Zählt wiederhergestellte Dateien und Bytes.
+        
+        Args:
+            size (int): Bytes
+            files (int): Anzahl Dateien
+        """
+        with self._lock:
+            self.stats["files"] += files
+            self.stats["bytes"] += size
+    
+    @staticmethod
+    def _selected(arcname: str, path: Optional[str]) -> bool:
+        """
+        Ob ein Member zum gewünschten Pfad gehört.
+        
+        Args:
+            arcname (str): Name im Backup (mit ``/``)
+            path (Optional[str]): Gewünschter Pfad oder None für alles
+        
+        Returns:
+            bool: True wenn wiederhergestellt werden soll
+        """
+        return not path or arcname == path or arcname.startswith(f"{path}/")
+    
+    @staticmethod
+    def _target_path(destination: str, arcname: str) -> str:
+        """
+        Zielpfad eines Members; Pfade außerhalb des Zielordners werden abgelehnt.
+        
+        Args:
+            destination (str): Zielordner
+            arcname (str): Name im Backup
+        
+        Returns:
+            str: Absoluter Zielpfad
+        
+        Raises:
+            IntegrityError: Bei absoluten Pfaden, ".." oder Symlinks, die aus dem Zielordner führen
+        """
+        parts = arcname.replace('\\', '/').split('/')
+        if arcname.startswith('/') or '..' in parts:
+            raise IntegrityError(f"Unsafe path in backup: {arcname}")
+        target = os.path.join(os.path.abspath(destination), *[part for part in parts if part])
+        # Ein zuvor wiederhergestellter Symlink (z.B. "link -> /tmp") darf nicht nach außen schreiben lassen
+        root = os.path.realpath(destination)
+        resolved = os.path.realpath(target)
+        if resolved != root and not resolved.startswith(root.rstrip(os.sep) + os.sep):
+            raise IntegrityError(f"Unsafe path in backup (leaves destination via symlink): {arcname}")
+        return target
\ No newline at end of file
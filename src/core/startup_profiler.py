@@ -0,0 +1,69 @@
+# core/startup_profiler.py
+
+"""
+Zeitmessung des Programmstarts.
+Misst die Dauer einzelner Startphasen bis zum ersten gezeichneten Frame.
+"""
+
+import time
+from typing import List, Optional, Tuple
+
+
+class StartupProfiler:
+    """
+    Sammelt die Dauer benannter Startphasen.
+    
+    Jede Marke misst die Zeit seit der vorherigen Marke. Ist der Profiler
+    deaktiviert, sind alle Aufrufe wirkungslos.
+    
+    Attributes:
+        enabled (bool): Ob gemessen wird
+        phases (List[Tuple[str, float]]): (Phase, Dauer in Sekunden)
+    """
+    
+    def __init__(self, enabled: bool = False, start_time: Optional[float] = None) -> None:
+        """
+        Initialisiert den StartupProfiler.
+        
+        Args:
+            enabled (bool): Ob gemessen wird
+            start_time (Optional[float]): Startzeitpunkt (time.perf_counter), z.B. vor den Imports
+        """
+        self.enabled = enabled
+        self.phases: List[Tuple[str, float]] = []
+        self._start = start_time if start_time is not None else time.perf_counter()
+        self._last = self._start
+    
+    def mark(self, phase: str) -> None:
+        """
+        Beendet eine Phase und speichert ihre Dauer.
+        
+        Args:
+            phase (str): Name der gerade beendeten Phase
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+    
+    def total(self) -> float:
+        """
+        Gibt die Zeit seit dem Start zurück.
+        
+        Returns:
+            float: Sekunden seit dem Startzeitpunkt
+        """
+        return self._last - self._start
+    
+    def report(self) -> str:
+        """
+        Erstellt einen lesbaren Bericht aller Phasen.
+        
+        Returns:
+            str: Ein Bericht mit einer Zeile pro Phase
+        """
+        width = max((len(phase) for phase, _ in self.phases), default=0)
+        lines = [f"{phase:<{width}}  {duration * 1000:8.1f} ms" for phase, duration in self.phases]
+        lines.append(f"{'total':<{width}}  {self.total() * 1000:8.1f} ms")
+        return "\n".join(lines)
\ No newline at end of file
@@ -0,0 +1,170 @@
+# core/submodules.py
+
+"""
+Rekursives, paralleles Klonen von Submodulen.
+Jedes Submodul wird als eigener Auftrag in einem Thread-Pool geklont; verschachtelte
+Submodule werden eingeplant, sobald ihr übergeordnetes Submodul ausgecheckt ist.
+Die Dauer nähert sich so der längsten Kette statt der Summe aller Submodule.
+"""
+
+import os
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, List, Optional, Tuple
+from config import SUBMODULES
+from .logger import Logger
+from .git_manager import GitManager
+from .job_profiler import JobProfiler
+
+
+class SubmoduleManager:
+    """
+    Klont alle Submodule eines Klons parallel und rekursiv.
+    
+    Ist SUBMODULES['cache_dir'] gesetzt, wird pro Submodul-URL ein Bare-Mirror
+    gepflegt. Submodule, die mehrere Superprojekte teilen, werden dann nur
+    einmal vollständig übertragen; jeder weitere Klon holt nur neue Objekte.
+    
+    Attributes:
+        logger (Logger): Logger-Instanz für Logging
+        git_manager (GitManager): Führt die Git-Befehle aus
+        jobs (int): Parallele Submodul-Klone
+        cache_dir (str): Verzeichnis der Mirrors, leer = kein Cache
+    """
+    
+    # Ein Lock pro Mirror, damit parallele Jobs denselben Mirror nicht gleichzeitig aktualisieren
+    _mirror_locks: Dict[str, threading.Lock] = {}
+    _locks_guard = threading.Lock()
+    
+    def __init__(
+        self,
+        logger: Logger = None,
+        jobs: int = SUBMODULES['jobs'],
+        cache_dir: str = SUBMODULES['cache_dir'],
+        profiler: Optional[JobProfiler] = None
+    ) -> None:
+        """
+        Initialisiert den SubmoduleManager.
+        
+        Args:
+            logger (Logger): Logger-Instanz. Wenn None, wird eine neue erstellt
+            jobs (int): Parallele Submodul-Klone. Default aus config.py
+            cache_dir (str): Verzeichnis der Mirrors, leer = kein Cache. Default aus config.py
+            profiler (Optional[JobProfiler]): Erfasst die Git-Aufrufe für das Job-Profil
+        """
+        self.logger = logger or Logger()
+        self.git_manager = GitManager(self.logger, profiler=profiler)
+        self.jobs = max(1, jobs)
+        self.cache_dir = cache_dir
+    
+    def clone_submodules(
+        self,
+        repo_path: str,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> Tuple[bool, str]:
+        """
+        Klont alle Submodule von repo_path, inklusive verschachtelter Submodule.
+        
+        Args:
+            repo_path (str): Der geklonte Ordner des Superprojekts
+            progress (Optional[Callable[[int, int], None]]): Wird mit (fertig, bekannt) aufgerufen
+        
+        Returns:
+            Tuple[bool, str]: (Erfolg True/False, Nachricht)
+        """
+        try:
+            pending_tasks = self._discover(repo_path)
+        except Exception as e:
+            error_msg = f"Submodule initialization failed: {str(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+        if not pending_tasks:
+            return True, "No submodules"
+        
+        total, done = len(pending_tasks), 0
+        errors: List[str] = []
+        with ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix="submodule") as executor:
+            futures = {executor.submit(self._clone_one, *task) for task in pending_tasks}
+            while futures:
+                finished, futures = wait(futures, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    success, message, children = future.result()
+                    done += 1
+                    if not success:
+                        errors.append(message)
+                    # Verschachtelte Submodule sofort einplanen
+                    total += len(children)
+                    futures |= {executor.submit(self._clone_one, *task) for task in children}
+                if progress:
+                    progress(done, total)
+        
+        if errors:
+            return False, f"{len(errors)} of {total} submodules failed: " + "; ".join(errors)
+        msg = f"{total} submodules cloned"
+        self.logger.info(f"{msg} in {repo_path}")
+        return True, msg
+    
+    def _discover(self, repo_path: str) -> List[Tuple[str, str, str, str]]:
+        """
+        Registriert die Submodule eines (Sub-)Projekts.
+        
+        Args:
+            repo_path (str): Arbeitsverzeichnis des Projekts
+        
+        Returns:
+            List[Tuple[str, str, str, str]]: (Projektpfad, Name, Pfad, URL) pro Submodul
+        """
+        return [(repo_path, name, path, url) for name, path, url in self.git_manager.init_submodules(repo_path)]
+    
+    def _clone_one(self, repo_path: str, name: str, path: str, url: str) -> Tuple[bool, str, List]:
+        """
+        Klont ein Submodul und ermittelt seine eigenen Submodule.
+        
+        Args:
+            repo_path (str): Arbeitsverzeichnis des übergeordneten Projekts
+            name (str): Name des Submoduls
+            path (str): Pfad relativ zu repo_path
+            url (str): Aufgelöste URL
+        
+        Returns:
+            Tuple[bool, str, List]: (Erfolg, Nachricht, verschachtelte Aufträge)
+        """
+        try:
+            reference = self._mirror(url)
+            success, message = self.git_manager.update_submodule(repo_path, path, reference)
+            if not success and reference:
+                # Ein veralteter Mirror darf das Backup nicht verhindern
+                success, message = self.git_manager.update_submodule(repo_path, path)
+            if not success:
+                return False, message, []
+            return True, message, self._discover(os.path.join(repo_path, path))
+        except Exception as e:
+            error_msg = f"Submodule {name} failed: {str(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg, []
+    
+    def _mirror(self, url: str) -> Optional[str]:
+        """
+        Aktualisiert den Mirror einer Submodul-URL.
+        
+        Args:
+            url (str): URL des Submoduls
+        
+        Returns:
+            Optional[str]: Pfad des Mirrors oder None (kein Cache oder Fehler)
+        """
+        if not self.cache_dir:
+            return None
+        key = url.rstrip("/")
+        key = key[:-4] if key.endswith(".git") else key
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+        name = os.path.basename(key.replace(":", "/")) or "submodule"
+        mirror_path = os.path.abspath(os.path.join(self.cache_dir, f"{name}_{digest}.git"))
+        
+        with self._locks_guard:
+            lock = self._mirror_locks.setdefault(mirror_path, threading.Lock())
+        with lock:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            success, _ = self.git_manager.update_mirror(url, mirror_path)
+        return mirror_path if success else None
\ No newline at end of file
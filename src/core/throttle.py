@@ -0,0 +1,244 @@
+# core/throttle.py
+
+"""
+Drosselung von Archiv-I/O und Prioritäten von Backup-Arbeit.
+Token-Buckets begrenzen den Durchsatz, Git-Prozesse und Worker-Threads
+laufen mit niedriger CPU- und I/O-Priorität.
+"""
+
+import os
+import sys
+import time
+import shutil
+import tarfile
+import threading
+import zipfile
+from typing import List, Optional
+from config import THROTTLE
+from .reproducible import zip_info, tar_info
+
+
+class TokenBucket:
+    """
+    Thread-sicherer Token-Bucket für Bytes pro Sekunde.
+    
+    Ein Aufrufer darf den Bucket überziehen und schläft dann die Schuld ab.
+    So werden auch Blöcke größer als der Burst ohne Aufteilen gedrosselt,
+    und parallele Aufrufer teilen sich die Rate.
+    
+    Attributes:
+        rate (float): Bytes pro Sekunde, 0 = unbegrenzt
+        burst (float): Maximale Anzahl angesparter Bytes
+    """
+    
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        """
+        Initialisiert den TokenBucket.
+        
+        Args:
+            rate (float): Bytes pro Sekunde, 0 = unbegrenzt
+            burst (Optional[float]): Angesparte Bytes. Default: rate * THROTTLE['burst_seconds']
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else rate * THROTTLE['burst_seconds']
+        self._tokens = self.burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def consume(self, amount: int) -> None:
+        """
+        Verbraucht amount Bytes und blockiert, bis sie gedeckt sind.
+        
+        Args:
+            amount (int): Anzahl Bytes
+        """
+        if self.rate <= 0 or amount <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= amount
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+
+class ThrottledFile:
+    """
+    Datei-Wrapper, der read() und write() über einen TokenBucket drosselt.
+    Alle anderen Attribute (seek, tell, flush, ...) werden durchgereicht,
+    daher kann er direkt an ZipFile, tarfile oder Kompressoren gegeben werden.
+    """
+    
+    def __init__(self, file, bucket: TokenBucket) -> None:
+        """
+        Initialisiert den ThrottledFile.
+        
+        Args:
+            file: Das geöffnete Datei-Objekt
+            bucket (TokenBucket): Der zu belastende Bucket
+        """
+        self._file = file
+        self._bucket = bucket
+    
+    def read(self, size: int = -1) -> bytes:
+        """Liest und belastet den Bucket mit der gelesenen Menge."""
+        data = self._file.read(size)
+        self._bucket.consume(len(data))
+        return data
+    
+    def write(self, data) -> int:
+        """Belastet den Bucket und schreibt."""
+        self._bucket.consume(len(data))
+        return self._file.write(data)
+    
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+    
+    def __enter__(self) -> "ThrottledFile":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self._file.close()
+
+
+# Gemeinsamer Bucket für Lesen und Schreiben aller Archiv-Operationen
+_archive_bucket = TokenBucket(THROTTLE['archive_bytes_per_s'])
+
+
+def archive_open(path: str, mode: str = "rb"):
+    """
+    Öffnet eine Datei für Archiv-I/O, gedrosselt wenn ein Limit gesetzt ist.
+    
+    Args:
+        path (str): Pfad der Datei
+        mode (str): Binärer Dateimodus
+    
+    Returns:
+        Datei-Objekt oder ThrottledFile
+    """
+    file = open(path, mode)
+    if _archive_bucket.rate > 0:
+        return ThrottledFile(file, _archive_bucket)
+    return file
+
+
+def zip_write(zipf: zipfile.ZipFile, file_path: str, arcname: str, mtime: Optional[int] = None) -> None:
+    """
+    Fügt eine Datei einem ZIP hinzu; das Lesen der Quelle wird gedrosselt.
+    Ohne Limit und mtime entspricht es zipf.write(file_path, arcname).
+    
+    Args:
+        zipf (zipfile.ZipFile): Das Archiv im Schreibmodus
+        file_path (str): Quelldatei
+        arcname (str): Name im Archiv
+        mtime (Optional[int]): Fester Zeitstempel mit normalisierten Rechten (reproduzierbare Archive)
+    """
+    if mtime is not None and os.path.isfile(file_path):
+        info = zip_info(file_path, arcname, mtime, zipf.compression)
+    elif _archive_bucket.rate <= 0 or not os.path.isfile(file_path):
+        zipf.write(file_path, arcname)
+        return
+    else:
+        info = zipfile.ZipInfo.from_file(file_path, arcname)
+        info.compress_type = zipf.compression
+    with archive_open(file_path) as source, zipf.open(info, 'w') as target:
+        shutil.copyfileobj(source, target, THROTTLE['chunk_size'])
+
+
+def tar_add(tar: tarfile.TarFile, path: str, arcname: str, mtime: Optional[int] = None) -> None:
+    """
+    Fügt einen Pfad (nicht rekursiv) einem TAR hinzu; reguläre Dateien
+    werden gedrosselt gelesen. Ohne Limit und mtime entspricht es tar.add().
+    
+    Args:
+        tar (tarfile.TarFile): Das Archiv im Schreibmodus
+        path (str): Quellpfad
+        arcname (str): Name im Archiv
+        mtime (Optional[int]): Fester Zeitstempel, normalisierte Rechte, ohne Besitzer (reproduzierbare Archive)
+    """
+    if mtime is not None:
+        info = tar_info(tar, path, arcname, mtime)
+    elif _archive_bucket.rate <= 0:
+        tar.add(path, arcname=arcname, recursive=False)
+        return
+    else:
+        info = tar.gettarinfo(path, arcname)
+    if info.isreg():
+        with archive_open(path) as source:
+            tar.addfile(info, source)
+    else:
+        tar.addfile(info)
+
+
+def priority_command(command: List[str]) -> List[str]:
+    """
+    Stellt einem Befehl nice/ionice voran, wenn THROTTLE['low_priority'] aktiv ist
+    (nur POSIX; unter Windows siehe priority_creationflags()).
+    
+    Args:
+        command (List[str]): Der Befehl, z.B. ["git", "clone", ...]
+    
+    Returns:
+        List[str]: Der ggf. erweiterte Befehl
+    """
+    if not THROTTLE['low_priority'] or os.name != "posix":
+        return command
+    prefix = []
+    if _which("nice"):
+        prefix += ["nice", "-n", str(THROTTLE['nice'])]
+    if _which("ionice"):
+        prefix += ["ionice", "-c", str(THROTTLE['ionice_class']), "-n", str(THROTTLE['ionice_level'])]
+    return prefix + command
+
+
+def priority_creationflags() -> int:
+    """
+    Prozess-Flags für niedrige Priorität unter Windows.
+    
+    Returns:
+        int: BELOW_NORMAL_PRIORITY_CLASS oder 0
+    """
+    if THROTTLE['low_priority'] and sys.platform == "win32":
+        return 0x00004000  # BELOW_NORMAL_PRIORITY_CLASS
+    return 0
+
+
+def lower_thread_priority() -> None:
+    """
+    Senkt die CPU-Priorität des aufrufenden Threads (Linux: nice pro Thread,
+    Windows: THREAD_PRIORITY_BELOW_NORMAL). Auf anderen Systemen ohne Wirkung,
+    da dort nur der ganze Prozess (inklusive UI) betroffen wäre.
+    """
+    if not THROTTLE['low_priority']:
+        return
+    try:
+        if sys.platform.startswith("linux"):
+            thread_id = threading.get_native_id()
+            current = os.getpriority(os.PRIO_PROCESS, thread_id)
+            os.setpriority(os.PRIO_PROCESS, thread_id, max(current, THROTTLE['nice']))
+        elif sys.platform == "win32":
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), -1)  # THREAD_PRIORITY_BELOW_NORMAL
+    except OSError:
+        pass
+
+
+_which_cache = {}
+
+
+def _which(program: str) -> Optional[str]:
+    """
+    shutil.which mit Cache (wird für jeden Git-Aufruf benötigt).
+    
+    Args:
+        program (str): Name des Programms
+    
+    Returns:
+        Optional[str]: Pfad oder None
+    """
+    if program not in _which_cache:
+        _which_cache[program] = shutil.which(program)
+    return _which_cache[program]
\ No newline at end of file
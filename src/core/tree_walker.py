@@ -0,0 +1,229 @@
+# core/tree_walker.py
+
+"""
+Schneller Verzeichnis-Durchlauf für große Arbeitsverzeichnisse.
+Unterverzeichnisse werden vorausschauend parallel mit os.scandir gelesen,
+die Einträge aber in fester, sortierter Reihenfolge als Stream geliefert.
+"""
+
+import os
+import fnmatch
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple, Union
+from config import ARCHIVE, WALKER
+from .logger import Logger
+
+
+class WalkEntry:
+    """
+    Ein Eintrag aus TreeWalker.walk.
+    
+    Attributes:
+        path (str): Vollständiger Pfad
+        relpath (str): Pfad relativ zur Wurzel, immer mit "/" getrennt
+        is_dir (bool): Verzeichnis (auch Symlink auf ein Verzeichnis, wie bei os.walk)
+        is_symlink (bool): Symbolischer Link
+        stat (Optional[os.stat_result]): Stat der Datei (Symlinks aufgelöst), None bei
+                                         Verzeichnissen und defekten Links
+    """
+    
+    __slots__ = ("path", "relpath", "is_dir", "is_symlink", "stat")
+    
+    def __init__(self, path: str, relpath: str, is_dir: bool, is_symlink: bool, stat: Optional[os.stat_result]) -> None:
+        """
+        Initialisiert den WalkEntry.
+        
+        Args:
+            path (str): Vollständiger Pfad
+            relpath (str): Relativer Pfad mit "/"
+            is_dir (bool): Verzeichnis
+            is_symlink (bool): Symbolischer Link
+            stat (Optional[os.stat_result]): Stat der Datei oder None
+        """
+        self.path = path
+        self.relpath = relpath
+        self.is_dir = is_dir
+        self.is_symlink = is_symlink
+        self.stat = stat
+    
+    @property
+    def size(self) -> int:
+        """Dateigröße in Bytes (0 ohne Stat)."""
+        return self.stat.st_size if self.stat is not None else 0
+
+
+# Ergebnis eines Verzeichnis-Scans: (Unterverzeichnisse, Dateien), beide sortiert
+_Listing = Tuple[List[WalkEntry], List[WalkEntry]]
+
+
+class TreeWalker:
+    """
+    Durchläuft einen Verzeichnisbaum in derselben Reihenfolge wie ein sortiertes os.walk.
+    
+    Pro Verzeichnis kommen zuerst die Unterverzeichnisse, dann die Dateien (jeweils
+    nach Namen sortiert), danach rekursiv die Unterverzeichnisse. Ihre Inhalte werden
+    schon gelesen, während der Aufrufer noch die vorherigen Einträge verarbeitet.
+    Die Dateigröße kommt aus dem Stat des Scans, Aufrufer müssen nicht erneut stat() aufrufen.
+    
+    Muster (fnmatch) ohne "/" gelten für den Namen in jeder Tiefe, Muster mit "/"
+    für den relativen Pfad. Ausgeschlossene Verzeichnisse werden nicht betreten;
+    Include-Muster gelten nur für Dateien.
+    
+    Attributes:
+        workers (int): Threads, die Verzeichnisse lesen
+        lookahead (int): Maximal vorausgelesene, noch nicht gelieferte Verzeichnisse
+        include (List[str]): Nur passende Dateien liefern (leer = alle)
+        exclude (List[str]): Passende Dateien und Verzeichnisse überspringen
+        logger (Optional[Logger]): Meldet unlesbare Verzeichnisse, wenn gesetzt
+    """
+    
+    def __init__(
+        self,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        workers: int = WALKER['workers'],
+        lookahead: int = WALKER['lookahead'],
+        logger: Optional[Logger] = None
+    ) -> None:
+        """
+        Initialisiert den TreeWalker.
+        
+        Args:
+            include (Optional[Iterable[str]]): Include-Muster für Dateien
+            exclude (Optional[Iterable[str]]): Exclude-Muster für Dateien und Verzeichnisse
+            workers (int): Threads für os.scandir. Default aus config.py
+            lookahead (int): Vorausgelesene Verzeichnisse. Default aus config.py
+            logger (Optional[Logger]): Logger für unlesbare Verzeichnisse
+        """
+        self.include = list(include or [])
+        self.exclude = list(exclude or [])
+        self.workers = max(1, workers)
+        self.lookahead = max(1, lookahead)
+        self.logger = logger
+    
+    @classmethod
+    def for_archive(cls, exclude_git: bool = False) -> "TreeWalker":
+        """
+        TreeWalker mit den Ausschlüssen für Archive (ARCHIVE['exclude']).
+        
+        Args:
+            exclude_git (bool): .git-Verzeichnisse und -Dateien (Verweise von Submodulen) überspringen
+        
+        Returns:
+            TreeWalker: Der konfigurierte Walker
+        """
+        return cls(exclude=([".git"] if exclude_git else []) + ARCHIVE['exclude'])
+    
+    def walk(self, root: str) -> Iterator[WalkEntry]:
+        """
+        Liefert alle Einträge unterhalb von root (ohne root selbst) als Stream.
+        Symlinks auf Verzeichnisse werden geliefert, aber nicht betreten.
+        
+        Args:
+            root (str): Wurzelverzeichnis
+        
+        Yields:
+            WalkEntry: Verzeichnisse und Dateien in sortierter Tiefensuche
+        """
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="walk")
+        outstanding = [0]
+        
+        def prefetch(path: str, prefix: str) -> Union[Future, Tuple[str, str]]:
+            # Über dem Limit erst beim Betreten lesen, damit der Speicher begrenzt bleibt
+            if outstanding[0] >= self.lookahead:
+                return (path, prefix)
+            outstanding[0] += 1
+            return executor.submit(self._scan, path, prefix)
+        
+        def result(item: Union[Future, Tuple[str, str]]) -> _Listing:
+            if isinstance(item, Future):
+                outstanding[0] -= 1
+                return item.result()
+            return self._scan(*item)
+        
+        try:
+            stack: List[Deque] = [deque([prefetch(root, "")])]
+            while stack:
+                pending = stack[-1]
+                if not pending:
+                    stack.pop()
+                    continue
+                dirs, files = result(pending.popleft())
+                yield from dirs
+                yield from files
+                stack.append(deque(
+                    prefetch(entry.path, f"{entry.relpath}/") for entry in dirs if not entry.is_symlink
+                ))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def files(self, root: str) -> Iterator[WalkEntry]:
+        """
+        Liefert nur die Dateien unterhalb von root (wie die Dateilisten eines sortierten os.walk).
+        
+        Args:
+            root (str): Wurzelverzeichnis
+        
+        Yields:
+            WalkEntry: Dateien und Symlinks auf Dateien
+        """
+        return (entry for entry in self.walk(root) if not entry.is_dir)
+    
+    def _scan(self, path: str, prefix: str) -> _Listing:
+        """
+        Liest ein Verzeichnis und filtert die Einträge (läuft im Thread-Pool).
+        
+        Args:
+            path (str): Das Verzeichnis
+            prefix (str): Relativer Pfad des Verzeichnisses mit abschließendem "/" (Wurzel: "")
+        
+        Returns:
+            _Listing: (Unterverzeichnisse, Dateien), nach Namen sortiert
+        """
+        dirs: List[WalkEntry] = []
+        files: List[WalkEntry] = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    relpath = f"{prefix}{entry.name}"
+                    if self._matches(self.exclude, entry.name, relpath):
+                        continue
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        dirs.append(WalkEntry(entry.path, relpath, True, entry.is_symlink(), None))
+                    elif not self.include or self._matches(self.include, entry.name, relpath):
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            stat = None
+                        files.append(WalkEntry(entry.path, relpath, False, entry.is_symlink(), stat))
+        except OSError as e:
+            # Wie os.walk: unlesbare Verzeichnisse überspringen
+            if self.logger:
+                self.logger.warning(f"Cannot scan {path}: {str(e)}")
+        dirs.sort(key=lambda entry: entry.relpath)
+        files.sort(key=lambda entry: entry.relpath)
+        return dirs, files
+    
+    @staticmethod
+    def _matches(patterns: List[str], name: str, relpath: str) -> bool:
+        """
+        Ob ein Eintrag auf eines der Muster passt.
+        
+        Args:
+            patterns (List[str]): fnmatch-Muster
+            name (str): Name des Eintrags
+            relpath (str): Relativer Pfad des Eintrags
+        
+        Returns:
+            bool: True bei einem Treffer
+        """
+        for pattern in patterns:
+            pattern = pattern.strip("/")
+            if fnmatch.fnmatchcase(relpath if "/" in pattern else name, pattern):
+                return True
+        return False
\ No newline at end of file
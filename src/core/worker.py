@@ -1,103 +1,79 @@
 # core/worker.py
 
 """
-Worker-Thread für die Clone-Operation ohne UI-Blockierung.
+Worker-Threads für Import- und Restore-Operationen ohne UI-Blockierung.
+Backups laufen über die JobQueue (siehe job_queue.py).
 """
 
-import os
-from typing import Callable
+from typing import Callable, Optional, Tuple
 from PySide6.QtCore import QThread, Signal
-from .logger import Logger
-from .git_manager import GitManager
-from .file_manager import FileManager
+from .restore import RestoreManager
 
 
-class CloneWorker(QThread):
+class ImportWorker(QThread):
     """
-    Worker-Thread für Repository-Clone-Operationen.
-    Verhindert, dass die UI blockiert wird während Git klont.
+    Worker-Thread für den Bulk-Import von Repository-Listen.
     
     Signals:
-        finished: Signal(bool, str) - Emittiert wenn Clone fertig ist
-        progress: Signal(str) - Emittiert Fortschritts-Nachrichten
+        finished: Signal(bool, str) - Emittiert wenn der Import fertig ist
+        progress: Signal(int) - Anzahl bisher gelesener Einträge
     """
     
-    # Signals definieren
     finished = Signal(bool, str)  # (success, message)
-    progress = Signal(str)
+    progress = Signal(int)
     
-    def __init__(
-        self,
-        github_url: str,
-        folder_name: str,
-        target_path: str,
-        add_backup: bool = False,
-        create_zip: bool = False
-    ) -> None:
+    def __init__(self, import_function: Callable[..., Tuple[bool, str]], *args) -> None:
         """
-        Initialisiert den CloneWorker.
+        Initialisiert den ImportWorker.
         
         Args:
-            github_url (str): Die GitHub-URL des zu klonenden Repositories
-            folder_name (str): Der Name des lokalen Ordners
-            target_path (str): Der Pfad wo das Repository gespeichert wird
-            add_backup (bool): Ob ein Zeitstempel-Backup erstellt wird
-            create_zip (bool): Ob nach dem Clone ein ZIP erstellt wird
+            import_function (Callable): RepositoryImporter.import_file oder import_directory
+            *args: Argumente für import_function (Quelle, Zielpfad)
         """
         super().__init__()
-        self.github_url = github_url
-        self.folder_name = folder_name
-        self.target_path = target_path
-        self.add_backup = add_backup
-        self.create_zip = create_zip
-        
-        # Manager-Instanzen
-        self.logger = Logger()
-        self.git_manager = GitManager(self.logger)
-        self.file_manager = FileManager(self.logger)
+        self.import_function = import_function
+        self.args = args
     
     def run(self) -> None:
+        """Führt den Import im Worker-Thread aus."""
+        success, message = self.import_function(*self.args, progress=self.progress.emit)
+        self.finished.emit(success, message)
+
+
+class RestoreWorker(QThread):
+    """
+    Worker-Thread für die Wiederherstellung eines Backups.
+    
+    Signals:
+        finished: Signal(bool, str) - Emittiert wenn die Wiederherstellung fertig ist
+        progress: Signal(int) - Fortschritt in Prozent
+    """
+    
+    finished = Signal(bool, str)  # (success, message)
+    progress = Signal(int)
+    
+    def __init__(self, restore_manager: RestoreManager, source: str, destination: str, path: Optional[str] = None) -> None:
         """
-        Führt die Clone-Operation aus.
-        Diese Methode wird in einem separaten Thread ausgeführt.
+        Initialisiert den RestoreWorker.
+        
+        Args:
+            restore_manager (RestoreManager): Führt die Wiederherstellung aus
+            source (str): Backup-Ordner, Archiv oder Bundle
+            destination (str): Leerer Zielordner
+            path (Optional[str]): Nur dieser Pfad aus dem Backup
         """
-        try:
-            # Schritt 1: Backup-Ordnernamen generieren
-            self.progress.emit("Preparing backup folder...")
-            backup_folder_name = self.file_manager.create_backup_folder_name(
-                self.folder_name,
-                add_timestamp=self.add_backup
-            )
-            target_directory = os.path.join(self.target_path, backup_folder_name)
-            
-            # Schritt 2: Verzeichnis erstellen
-            self.progress.emit("Creating directory...")
-            success, msg = self.file_manager.ensure_directory_exists(target_directory)
-            if not success:
-                self.finished.emit(False, msg)
-                return
-            
-            # Schritt 3: Repository klonen
-            self.progress.emit("Cloning repository...")
-            success, clone_msg = self.git_manager.clone(self.github_url, target_directory)
-            if not success:
-                self.finished.emit(False, clone_msg)
-                return
-            
-            # Schritt 4: ZIP-Archiv erstellen wenn gewünscht
-            if self.create_zip:
-                self.progress.emit("Creating ZIP archive...")
-                success, zip_msg = self.file_manager.create_zip_archive(target_directory)
-                if not success:
-                    self.logger.warning(f"ZIP creation failed: {zip_msg}")
-                    # Aber nicht abbrechen, Clone war erfolgreich
-            
-            # Erfolg
-            success_msg = f"Repository successfully cloned to {target_directory}"
-            self.logger.success(success_msg)
-            self.finished.emit(True, success_msg)
-            
-        except Exception as e:
-            error_msg = f"Unexpected error: {str(e)}"
-            self.logger.error(error_msg)
-            self.finished.emit(False, error_msg)
\ No newline at end of file
+        super().__init__()
+        self.restore_manager = restore_manager
+        self.source = source
+        self.destination = destination
+        self.path = path
+    
+    def run(self) -> None:
+        """Führt die Wiederherstellung im Worker-Thread aus."""
+        success, message = self.restore_manager.restore(
+            self.source,
+            self.destination,
+            path=self.path,
+            progress=self.progress.emit
+        )
+        self.finished.emit(success, message)
\ No newline at end of file
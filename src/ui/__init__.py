@@ -3,20 +3,50 @@
 """
 UI-Modul für GitBackupTool Pro.
 Enthält alle Benutzeroberflächen-Komponenten.
+
+Wie in src.core werden die Klassen erst beim ersten Zugriff geladen; Log-Viewer
+und Job-Übersicht kommen so erst, wenn sie geöffnet werden.
 """
 
-from .widgets import (
-    ModernLineEdit,
-    ModernButton,
-    ModernCheckBox,
-    StatusLabel
-)
-from .main_window import GitBackupToolPro
-
-__all__ = [
-    'ModernLineEdit',
-    'ModernButton',
-    'ModernCheckBox',
-    'StatusLabel',
-    'GitBackupToolPro'
-]
+import importlib
+
+# Exportierter Name -> Modul
+_EXPORTS = {
+    'ModernLineEdit': 'widgets',
+    'ModernButton': 'widgets',
+    'ModernCheckBox': 'widgets',
+    'ModernComboBox': 'widgets',
+    'StatusLabel': 'widgets',
+    'LogListModel': 'log_viewer',
+    'LogViewerDialog': 'log_viewer',
+    'JobsTableModel': 'jobs_view',
+    'JobsDialog': 'jobs_view',
+    'GitBackupToolPro': 'main_window',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """
+    Lädt eine exportierte Klasse beim ersten Zugriff (PEP 562).
+    
+    Args:
+        name (str): Name der Klasse
+    
+    Returns:
+        Die Klasse aus ihrem Modul
+    
+    Raises:
+        AttributeError: Wenn der Name nicht exportiert wird
+    """
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Exportierte Namen für dir() und Autovervollständigung."""
+    return sorted(list(globals()) + __all__)
\ No newline at end of file
@@ -0,0 +1,150 @@
+# ui/jobs_view.py
+
+"""
+Job-Übersicht: Tabelle aller eingereihten, laufenden und beendeten Backups.
+"""
+
+from typing import List
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QTableView, QHeaderView
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor
+
+from config import COLORS, JOB_COLUMNS, JOBS, LABELS
+from styles import STYLESHEET_MAIN_WINDOW, STYLESHEET_JOB_TABLE
+from src.core.job_queue import JobQueue, JobState
+from src.core.job_history import format_duration
+
+
+# Farbe pro Job-Status
+STATUS_COLORS = {
+    "queued": COLORS['text_secondary'],
+    "running": COLORS['text'],
+    "finished": COLORS['success'],
+    "failed": COLORS['error'],
+}
+
+
+class JobsTableModel(QAbstractTableModel):
+    """
+    Table-Model über den JobStates einer JobQueue.
+    Reagiert nur auf die gebündelten Signale der Queue.
+    """
+    
+    def __init__(self, job_queue: JobQueue, parent=None):
+        """
+        Initialisiert das JobsTableModel.
+        
+        Args:
+            job_queue (JobQueue): Die anzuzeigende Warteschlange
+            parent: Parent-Objekt
+        """
+        super().__init__(parent)
+        self.job_queue = job_queue
+        self._row_count = len(job_queue.order)
+        self._rows = {job_id: row for row, job_id in enumerate(job_queue.order)}
+        job_queue.jobs_updated.connect(self._on_jobs_updated)
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Anzahl der Jobs."""
+        return 0 if parent.isValid() else self._row_count
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """Anzahl der Spalten."""
+        return 0 if parent.isValid() else len(JOB_COLUMNS)
+    
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        """Spaltenüberschriften."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return JOB_COLUMNS[section]
+        return None
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Liefert die Zellwerte eines Jobs."""
+        if not index.isValid():
+            return None
+        state = self.job_queue.jobs[self.job_queue.order[index.row()]]
+        
+        if role == Qt.DisplayRole:
+            return self._cell_text(state, index.column())
+        if role == Qt.ToolTipRole:
+            return state.message or state.url
+        if role == Qt.ForegroundRole:
+            return QColor(STATUS_COLORS.get(state.status, COLORS['text']))
+        return None
+    
+    def _cell_text(self, state: JobState, column: int) -> str:
+        """
+        Text einer Zelle.
+        
+        Args:
+            state (JobState): Der Job
+            column (int): Spaltenindex (siehe JOB_COLUMNS)
+        
+        Returns:
+            str: Der anzuzeigende Text
+        """
+        values = [
+            state.name,
+            state.status,
+            state.phase,
+            f"{state.percent:.0f}%",
+            state.rate,
+            format_duration(state.eta_seconds(self.job_queue.correction_factor())),
+        ]
+        return values[column]
+    
+    def _on_jobs_updated(self, job_ids: List[int]) -> None:
+        """
+        Übernimmt neue Jobs als Zeilen und meldet Änderungen als einen Bereich.
+        
+        Args:
+            job_ids (List[int]): Geänderte Job-IDs
+        """
+        total = len(self.job_queue.order)
+        if total > self._row_count:
+            self.beginInsertRows(QModelIndex(), self._row_count, total - 1)
+            for row in range(self._row_count, total):
+                self._rows[self.job_queue.order[row]] = row
+            self._row_count = total
+            self.endInsertRows()
+        
+        rows = [self._rows[job_id] for job_id in job_ids if job_id in self._rows]
+        if rows:
+            self.dataChanged.emit(
+                self.index(min(rows), 0),
+                self.index(max(rows), len(JOB_COLUMNS) - 1)
+            )
+
+
+class JobsDialog(QDialog):
+    """
+    Nicht-modales Fenster mit der Job-Tabelle.
+    """
+    
+    def __init__(self, job_queue: JobQueue, parent=None):
+        """
+        Initialisiert den JobsDialog.
+        
+        Args:
+            job_queue (JobQueue): Die anzuzeigende Warteschlange
+            parent: Parent-Widget
+        """
+        super().__init__(parent)
+        self.setWindowTitle(LABELS['jobs_title'])
+        self.resize(JOBS['width'], JOBS['height'])
+        self.setStyleSheet(STYLESHEET_MAIN_WINDOW)
+        
+        self.model = JobsTableModel(job_queue, self)
+        
+        layout = QVBoxLayout(self)
+        self.table_view = QTableView()
+        self.table_view.setStyleSheet(STYLESHEET_JOB_TABLE)
+        self.table_view.setModel(self.model)
+        self.table_view.setSelectionBehavior(QTableView.SelectRows)
+        self.table_view.verticalHeader().setVisible(False)
+        self.table_view.verticalHeader().setDefaultSectionSize(28)
+        self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.table_view.horizontalHeader().setStretchLastSection(True)
+        self.table_view.setColumnWidth(0, 200)
+        self.table_view.setColumnWidth(2, 260)
+        layout.addWidget(self.table_view)
\ No newline at end of file
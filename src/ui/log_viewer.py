@@ -0,0 +1,221 @@
+# ui/log_viewer.py
+
+"""
+In-App Log-Viewer mit Model/View und inkrementellem Tail.
+"""
+
+from array import array
+from typing import Optional, Set
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QListView
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QTimer
+from PySide6.QtGui import QColor
+
+from config import COLORS, LABELS, LAYOUTS, LOG_LEVELS, LOG_VIEWER, MESSAGES, PLACEHOLDERS
+from styles import STYLESHEET_MAIN_WINDOW, STYLESHEET_LOG_VIEW
+from src.core.log_index import LogIndex
+from .widgets import ModernLineEdit, ModernCheckBox, ModernComboBox, DescriptionLabel
+
+
+# Farbe pro Log-Level
+LEVEL_COLORS = {
+    "SUCCESS": COLORS['success'],
+    "WARNING": COLORS['warning'],
+    "ERROR": COLORS['error'],
+    "DEBUG": COLORS['text_secondary'],
+}
+
+
+class LogListModel(QAbstractListModel):
+    """
+    List-Model über einem LogIndex.
+    
+    Ohne Filter entspricht jede Zeile des Models einer Zeile der Log-Datei.
+    Mit Filter werden die passenden Zeilennummern schrittweise in poll()
+    gesammelt, damit auch sehr große Logs die UI nicht blockieren.
+    """
+    
+    def __init__(self, log_index: LogIndex, parent=None):
+        """
+        Initialisiert das LogListModel.
+        
+        Args:
+            log_index (LogIndex): Der Zeilen-Index der Log-Datei
+            parent: Parent-Objekt
+        """
+        super().__init__(parent)
+        self.log_index = log_index
+        self._levels: Optional[Set[str]] = None
+        self._text: Optional[bytes] = None
+        self._visible: Optional[array] = None
+        self._scan_position = 0
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Anzahl der sichtbaren Zeilen."""
+        if parent.isValid():
+            return 0
+        return len(self._visible) if self._visible is not None else len(self.log_index)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Liefert Text und Farbe einer Zeile erst beim Zugriff."""
+        if not index.isValid():
+            return None
+        line_number = self._visible[index.row()] if self._visible is not None else index.row()
+        
+        if role == Qt.DisplayRole:
+            return self.log_index.line(line_number)
+        if role == Qt.ForegroundRole:
+            level = LogIndex.parse_level(self.log_index.raw_line(line_number))
+            return QColor(LEVEL_COLORS.get(level, COLORS['text']))
+        return None
+    
+    def set_filter(self, levels: Optional[Set[str]] = None, text: str = "") -> None:
+        """
+        Setzt den Filter und startet den Durchlauf von vorne.
+        
+        Args:
+            levels (Optional[Set[str]]): Erlaubte Levels, None = alle
+            text (str): Gesuchter Text (z.B. Repository-URL), leer = alle
+        """
+        self.beginResetModel()
+        self._levels = levels
+        self._text = text.lower().encode('utf-8') if text else None
+        self._visible = array('Q') if levels is not None or self._text else None
+        self._scan_position = 0
+        self.endResetModel()
+    
+    def poll(self) -> bool:
+        """
+        Liest neue Zeilen ein und filtert einen Block.
+        
+        Returns:
+            bool: True wenn noch Arbeit aussteht (nächster Aufruf sofort sinnvoll)
+        """
+        if self.log_index.check_truncated():
+            self.set_filter(self._levels, self._text.decode('utf-8') if self._text else "")
+        
+        count_before = len(self.log_index)
+        added = self.log_index.update()
+        if added and self._visible is None:
+            self.beginInsertRows(QModelIndex(), count_before, count_before + added - 1)
+            self.endInsertRows()
+        
+        if self._visible is not None:
+            self._scan_batch(LOG_VIEWER['filter_batch_lines'])
+            return self.log_index.has_pending or self._scan_position < len(self.log_index)
+        return self.log_index.has_pending
+    
+    def _scan_batch(self, max_lines: int) -> None:
+        """
+        Prüft den nächsten Block von Zeilen gegen den Filter.
+        
+        Args:
+            max_lines (int): Maximale Anzahl zu prüfender Zeilen
+        """
+        end = min(len(self.log_index), self._scan_position + max_lines)
+        matches = array('Q')
+        for line_number in range(self._scan_position, end):
+            if self.log_index.matches(line_number, self._levels, self._text):
+                matches.append(line_number)
+        self._scan_position = end
+        
+        if matches:
+            first = len(self._visible)
+            self.beginInsertRows(QModelIndex(), first, first + len(matches) - 1)
+            self._visible.extend(matches)
+            self.endInsertRows()
+
+
+class LogViewerDialog(QDialog):
+    """
+    Nicht-modales Fenster mit der Log-Ansicht.
+    Folgt der Log-Datei, solange das Fenster sichtbar ist.
+    """
+    
+    def __init__(self, log_file: str, parent=None):
+        """
+        Initialisiert den LogViewerDialog.
+        
+        Args:
+            log_file (str): Pfad zur Log-Datei
+            parent: Parent-Widget
+        """
+        super().__init__(parent)
+        self.setWindowTitle(LABELS['log_viewer_title'])
+        self.resize(LOG_VIEWER['width'], LOG_VIEWER['height'])
+        self.setStyleSheet(STYLESHEET_MAIN_WINDOW)
+        
+        self.log_index = LogIndex(log_file)
+        self.model = LogListModel(self.log_index, self)
+        
+        self._poll_timer = QTimer(self)
+        self._poll_timer.timeout.connect(self._poll)
+        
+        self._setup_ui()
+    
+    def _setup_ui(self) -> None:
+        """Initialisiert Filter-Leiste und Listenansicht."""
+        layout = QVBoxLayout(self)
+        layout.setSpacing(LAYOUTS['input_spacing'])
+        
+        # Filter-Leiste
+        filter_layout = QHBoxLayout()
+        filter_layout.setSpacing(LAYOUTS['input_spacing'])
+        
+        levels = {"": MESSAGES['log_all_levels']}
+        levels.update({level: level for level in LOG_LEVELS})
+        self.level_combo = ModernComboBox(levels)
+        self.level_combo.currentIndexChanged.connect(self._apply_filter)
+        
+        self.repo_filter_entry = ModernLineEdit(PLACEHOLDERS['log_repo_filter'])
+        self.repo_filter_entry.editingFinished.connect(self._apply_filter)
+        
+        self.follow_checkbox = ModernCheckBox(LABELS['log_follow'])
+        self.follow_checkbox.setChecked(True)
+        
+        filter_layout.addWidget(DescriptionLabel(LABELS['log_level_filter']))
+        filter_layout.addWidget(self.level_combo)
+        filter_layout.addWidget(DescriptionLabel(LABELS['log_repo_filter']))
+        filter_layout.addWidget(self.repo_filter_entry, stretch=1)
+        filter_layout.addWidget(self.follow_checkbox)
+        
+        # Listenansicht: einheitliche Zeilenhöhe, damit Qt nur sichtbare Zeilen abfragt
+        self.list_view = QListView()
+        self.list_view.setStyleSheet(STYLESHEET_LOG_VIEW)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setLayoutMode(QListView.Batched)
+        self.list_view.setModel(self.model)
+        self.model.rowsInserted.connect(self._on_rows_inserted)
+        
+        layout.addLayout(filter_layout)
+        layout.addWidget(self.list_view)
+    
+    def _apply_filter(self) -> None:
+        """Überträgt die Filter-Eingaben auf das Model."""
+        level = self.level_combo.current_key()
+        self.model.set_filter(
+            levels={level} if level else None,
+            text=self.repo_filter_entry.text().strip()
+        )
+        self._poll()
+    
+    def _poll(self) -> None:
+        """Liest neue Zeilen und plant den nächsten Durchlauf."""
+        busy = self.model.poll()
+        # Solange noch indiziert/gefiltert wird, sofort weitermachen
+        self._poll_timer.start(0 if busy else LOG_VIEWER['poll_interval_ms'])
+    
+    def _on_rows_inserted(self) -> None:
+        """Scrollt ans Ende, wenn 'Follow' aktiv ist."""
+        if self.follow_checkbox.isChecked():
+            self.list_view.scrollToBottom()
+    
+    def showEvent(self, event) -> None:
+        """Startet das Tailing beim Anzeigen."""
+        super().showEvent(event)
+        self._poll()
+    
+    def hideEvent(self, event) -> None:
+        """Stoppt das Tailing und gibt das Memory-Mapping frei."""
+        super().hideEvent(event)
+        self._poll_timer.stop()
+        self.log_index.close()
\ No newline at end of file
@@ -5,23 +5,30 @@ Hauptfenster und Benutzeroberfläche für GitBackupTool Pro.
 """
 
 import os
-import platform
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QFileDialog, QFrame
+    QFileDialog, QFrame, QMenu, QInputDialog
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QPalette, QColor
 
 from config import (
     WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE, WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT,
-    COLORS, MESSAGES, PLACEHOLDERS, LABELS, LAYOUTS, STATUS_LABEL
+    COLORS, MESSAGES, PLACEHOLDERS, LABELS, LAYOUTS, STATUS_LABEL, ARCHIVE_FORMATS,
+    GIT_ARCHIVE_MODES
 )
 from styles import STYLESHEET_MAIN_WINDOW, STYLESHEET_FRAME_OPTIONS
-from src.core import GitManager, FileManager, CloneWorker, Logger
+# Backup, Import und Restore werden erst beim ersten Gebrauch importiert (schnellerer erster Frame)
+from src.core import GitManager, FileManager, Logger, StartupProfiler
+
+if TYPE_CHECKING:
+    from src.core.backup_job import BackupJob
+    from src.core.job_queue import JobQueue
+    from src.core.profile_store import ProfileStore
+    from src.core.worker import ImportWorker, RestoreWorker
 from .widgets import (
-    ModernLineEdit, ModernButton, ModernCheckBox,
+    ModernLineEdit, ModernButton, ModernCheckBox, ModernComboBox,
     StatusLabel, DescriptionLabel, TitleLabel
 )
 
@@ -32,35 +39,75 @@ class GitBackupToolPro(QMainWindow):
     
     Verwaltet die Benutzeroberfläche und koordiniert die Interaktionen
     zwischen UI und der Backend-Logik.
+    
+    Vor dem ersten Frame werden nur die Eingabefelder und Buttons gebaut.
+    Options-Bereich, Stylesheet, Konfiguration und Log-Datei folgen in
+    _finish_startup(), nachdem das Fenster angezeigt wurde.
+    
+    Signals:
+        startup_finished: Signal() - Emittiert nach dem verzögerten Aufbau
     """
     
-    def __init__(self):
-        """Initialisiert das Hauptfenster."""
+    startup_finished = Signal()
+    
+    def __init__(self, profiler: Optional[StartupProfiler] = None):
+        """
+        Initialisiert das Hauptfenster.
+        
+        Args:
+            profiler (Optional[StartupProfiler]): Misst die Startphasen, wenn aktiviert
+        """
         super().__init__()
+        self.profiler = profiler or StartupProfiler()
         self.setWindowTitle(WINDOW_TITLE)
         self.setMinimumSize(WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT)
         self.resize(WINDOW_WIDTH, WINDOW_HEIGHT)
         
-        # Manager-Instanzen
-        self.logger = Logger()
+        # Manager-Instanzen (Log-Datei wird erst beim ersten Eintrag angelegt)
+        self.logger = Logger(ensure_exists=False)
         self.git_manager = GitManager(self.logger)
         self.file_manager = FileManager(self.logger)
         
-        # Worker-Thread (wird später initialisiert)
-        self.worker: Optional[CloneWorker] = None
+        # Job-Warteschlange und Dialoge (werden bei Bedarf erstellt)
+        self.job_queue: Optional["JobQueue"] = None
+        self.profile_store: Optional["ProfileStore"] = None
+        self.import_worker: Optional["ImportWorker"] = None
+        self.restore_worker: Optional["RestoreWorker"] = None
+        self.log_viewer = None
+        self.jobs_dialog = None
+        self._startup_done = False
         
-        # UI aufbauen
+        # UI aufbauen (nur was für den ersten Frame nötig ist)
         self._setup_ui()
-        self._load_last_used_repo()
         self._center_window()
+        self.profiler.mark("widget construction")
+    
+    def showEvent(self, event) -> None:
+        """Plant den verzögerten Aufbau nach dem ersten Anzeigen."""
+        super().showEvent(event)
+        if not self._startup_done:
+            self._startup_done = True
+            QTimer.singleShot(0, self._finish_startup)
+    
+    def _finish_startup(self) -> None:
+        """Baut nicht-essenzielle Bereiche auf und lädt die Konfiguration."""
+        self.profiler.mark("first frame")
+        
+        # Main Stylesheet (die Dark-Palette deckt den ersten Frame ab)
+        self.setStyleSheet(STYLESHEET_MAIN_WINDOW)
+        self.centralWidget().layout().insertWidget(self._options_index, self._create_options_frame())
+        self.github_url_entry.editingFinished.connect(self._load_profile)
+        self.profiler.mark("deferred sections")
+        
+        self._load_last_used_repo()
+        self.profiler.mark("config load")
         
         self.logger.info("Application started")
+        self.profiler.mark("log file")
+        self.startup_finished.emit()
     
     def _setup_ui(self) -> None:
-        """Initialisiert die komplette Benutzeroberfläche."""
-        # Main Stylesheet
-        self.setStyleSheet(STYLESHEET_MAIN_WINDOW)
-        
+        """Initialisiert die Benutzeroberfläche für den ersten Frame."""
         # Central Widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -92,8 +139,8 @@ class GitBackupToolPro(QMainWindow):
         # Save Path Input
         main_layout.addLayout(self._create_save_path_section())
         
-        # Options Frame
-        main_layout.addWidget(self._create_options_frame())
+        # Options Frame (wird in _finish_startup eingefügt)
+        self._options_index = main_layout.count()
         
         # Spacer
         main_layout.addStretch()
@@ -181,15 +228,50 @@ class GitBackupToolPro(QMainWindow):
         
         self.backup_checkbox = ModernCheckBox(LABELS['backup_option'])
         self.zip_checkbox = ModernCheckBox(LABELS['zip_option'])
+        self.incremental_checkbox = ModernCheckBox(LABELS['incremental_option'])
+        self.incremental_checkbox.setEnabled(False)
+        self.reproducible_checkbox = ModernCheckBox(LABELS['reproducible_option'])
+        self.reproducible_checkbox.setEnabled(False)
+        
+        # Archiv-Format Auswahl
+        format_layout = QHBoxLayout()
+        format_layout.setSpacing(LAYOUTS['input_spacing'])
+        self.archive_format_combo = ModernComboBox(ARCHIVE_FORMATS)
+        self.archive_format_combo.setEnabled(False)
+        format_layout.addWidget(DescriptionLabel(LABELS['archive_format']))
+        format_layout.addWidget(self.archive_format_combo, stretch=1)
+        
+        # Behandlung des .git-Verzeichnisses
+        self.git_mode_combo = ModernComboBox(GIT_ARCHIVE_MODES)
+        self.git_mode_combo.setEnabled(False)
+        format_layout.addWidget(DescriptionLabel(LABELS['git_mode']))
+        format_layout.addWidget(self.git_mode_combo, stretch=1)
+        
+        self.zip_checkbox.toggled.connect(self._update_archive_options)
+        self.archive_format_combo.currentIndexChanged.connect(self._update_archive_options)
         
         layout.addWidget(self.backup_checkbox)
         layout.addWidget(self.zip_checkbox)
+        layout.addLayout(format_layout)
+        layout.addWidget(self.incremental_checkbox)
+        layout.addWidget(self.reproducible_checkbox)
         
         return frame
     
+    def _update_archive_options(self) -> None:
+        """Aktiviert die Archiv-Optionen passend zur Auswahl."""
+        archive_enabled = self.zip_checkbox.isChecked()
+        self.archive_format_combo.setEnabled(archive_enabled)
+        self.git_mode_combo.setEnabled(archive_enabled)
+        self.reproducible_checkbox.setEnabled(archive_enabled)
+        # Inkrementelle Archive gibt es nur für ZIP
+        self.incremental_checkbox.setEnabled(
+            archive_enabled and self.archive_format_combo.current_key() == "zip"
+        )
+    
     def _create_button_section(self) -> QHBoxLayout:
         """
-        Erstellt die Button-Sektion mit Clone, Clear und Log Buttons.
+        Erstellt die Button-Sektion mit Clone, Clear, Import, Jobs und Log Buttons.
         
         Returns:
             QHBoxLayout: Das Layout mit allen Action-Buttons
@@ -205,12 +287,33 @@ class GitBackupToolPro(QMainWindow):
         clear_button = ModernButton(LABELS['clear_button'])
         clear_button.clicked.connect(self._clear_entries)
         
+        # Import Button mit Auswahl der Quelle
+        import_button = ModernButton(LABELS['import_button'])
+        import_menu = QMenu(import_button)
+        import_menu.addAction(LABELS['import_file'], lambda: self._import_repositories(from_directory=False))
+        import_menu.addAction(LABELS['import_directory'], lambda: self._import_repositories(from_directory=True))
+        import_button.setMenu(import_menu)
+        
+        # Restore Button mit Auswahl der Quelle
+        restore_button = ModernButton(LABELS['restore_button'])
+        restore_menu = QMenu(restore_button)
+        restore_menu.addAction(LABELS['restore_archive'], lambda: self._restore_backup(from_folder=False))
+        restore_menu.addAction(LABELS['restore_folder'], lambda: self._restore_backup(from_folder=True))
+        restore_button.setMenu(restore_menu)
+        
+        # Jobs Button
+        jobs_button = ModernButton(LABELS['jobs_button'])
+        jobs_button.clicked.connect(self._open_jobs)
+        
         # Log Button
         log_button = ModernButton(LABELS['log_button'])
         log_button.clicked.connect(self._open_log)
         
         layout.addWidget(self.clone_button, stretch=2)
         layout.addWidget(clear_button, stretch=1)
+        layout.addWidget(import_button, stretch=1)
+        layout.addWidget(restore_button, stretch=1)
+        layout.addWidget(jobs_button, stretch=1)
         layout.addWidget(log_button, stretch=1)
         
         return layout
@@ -258,45 +361,71 @@ class GitBackupToolPro(QMainWindow):
             )
             return
         
-        # UI für Clone-Operation deaktivieren
-        self.clone_button.setEnabled(False)
-        self.clone_button.setText(MESSAGES['clone_in_progress'])
-        
-        # Worker Thread erstellen und starten
-        self.worker = CloneWorker(
+        # Job erstellen und in die Warteschlange stellen
+        from src.core.backup_job import BackupJob
+        job = BackupJob(
             github_url,
             folder_name,
             target_path,
             add_backup=self.backup_checkbox.isChecked(),
-            create_zip=self.zip_checkbox.isChecked()
+            create_zip=self.zip_checkbox.isChecked(),
+            incremental_zip=self.incremental_checkbox.isEnabled() and self.incremental_checkbox.isChecked(),
+            archive_format=self.archive_format_combo.current_key(),
+            git_mode=self.git_mode_combo.current_key(),
+            reproducible=self.reproducible_checkbox.isEnabled() and self.reproducible_checkbox.isChecked(),
+            logger=self.logger
+        )
+        self._get_job_queue().submit(job)
+        
+        self.status_label.show_message(
+            MESSAGES['job_queued'] + folder_name,
+            success=True,
+            auto_hide_ms=STATUS_LABEL['auto_hide_ms']
         )
-        self.worker.finished.connect(self._on_clone_finished)
-        self.worker.progress.connect(self._on_clone_progress)
-        self.worker.start()
+        self.logger.info(f"Clone queued: {github_url}")
+    
+    def _get_job_queue(self) -> "JobQueue":
+        """
+        Gibt die Job-Warteschlange zurück und erstellt sie beim ersten Zugriff.
         
-        self.logger.info(f"Clone started: {github_url}")
+        Returns:
+            JobQueue: Die gemeinsame Warteschlange
+        """
+        if self.job_queue is None:
+            from src.core.job_queue import JobQueue
+            self.job_queue = JobQueue(self)
+            self.job_queue.jobs_updated.connect(self._on_jobs_updated)
+            self.job_queue.job_finished.connect(self._on_job_finished)
+        return self.job_queue
     
-    def _on_clone_progress(self, message: str) -> None:
+    def _on_jobs_updated(self, job_ids: list) -> None:
         """
-        Callback für Fortschritts-Updates während des Clone.
+        Callback für gebündelte Job-Updates (höchstens JOBS['refresh_hz'] pro Sekunde).
         
         Args:
-            message (str): Die Fortschritts-Nachricht
+            job_ids (list): IDs der geänderten Jobs
         """
-        self.status_label.show_message(message, success=True)
+        from src.core.job_history import format_duration
+        counts = self.job_queue.counts()
+        if counts['running'] or counts['queued']:
+            self.clone_button.setText(f"{LABELS['clone_button']} ({counts['running'] + counts['queued']})")
+            eta = self.job_queue.batch_eta()
+            self.status_label.set_progress(
+                MESSAGES['jobs_eta'].format(eta=format_duration(eta), **counts) if eta is not None else ""
+            )
+        else:
+            self.clone_button.setText(LABELS['clone_button'])
+            self.status_label.set_progress("")
     
-    def _on_clone_finished(self, success: bool, message: str) -> None:
+    def _on_job_finished(self, job_id: int, success: bool, message: str) -> None:
         """
-        Callback wenn Clone-Operation fertig ist.
+        Callback wenn ein Backup-Job fertig ist.
         
         Args:
+            job_id (int): ID des Jobs
             success (bool): True wenn erfolgreich, False bei Fehler
             message (str): Status-Nachricht
         """
-        # UI reaktivieren
-        self.clone_button.setEnabled(True)
-        self.clone_button.setText(LABELS['clone_button'])
-        
         # Status anzeigen
         self.status_label.show_message(
             message,
@@ -305,8 +434,19 @@ class GitBackupToolPro(QMainWindow):
         )
         
         # Wenn erfolgreich, Konfiguration speichern
-        if success:
-            self._save_last_used_repo(github_url=self.github_url_entry.text(), path=self.path_entry.text())
+        job = self.job_queue.backup_jobs.get(job_id)
+        if success and job:
+            self._save_last_used_repo(github_url=job.github_url, path=job.target_path)
+            self._save_profile(job)
+    
+    def _open_jobs(self) -> None:
+        """Öffnet die Job-Übersicht."""
+        if self.jobs_dialog is None:
+            from .jobs_view import JobsDialog
+            self.jobs_dialog = JobsDialog(self._get_job_queue(), self)
+        self.jobs_dialog.show()
+        self.jobs_dialog.raise_()
+        self.jobs_dialog.activateWindow()
     
     def _clear_entries(self) -> None:
         """Löscht alle Input-Felder und versteckt Status-Label."""
@@ -315,6 +455,10 @@ class GitBackupToolPro(QMainWindow):
         self.path_entry.clear()
         self.backup_checkbox.setChecked(False)
         self.zip_checkbox.setChecked(False)
+        self.incremental_checkbox.setChecked(False)
+        self.reproducible_checkbox.setChecked(False)
+        self.archive_format_combo.setCurrentIndex(0)
+        self.git_mode_combo.setCurrentIndex(0)
         self.status_label.hide_message()
         self.logger.debug("All entries cleared")
     
@@ -334,6 +478,172 @@ class GitBackupToolPro(QMainWindow):
         if success:
             self.logger.debug("Last used repo saved")
     
+    def _get_profile_store(self) -> "ProfileStore":
+        """
+        Gibt den Profil-Speicher zurück und öffnet ihn beim ersten Zugriff.
+        
+        Returns:
+            ProfileStore: Der Profil-Speicher
+        """
+        if self.profile_store is None:
+            from src.core.profile_store import ProfileStore
+            self.profile_store = ProfileStore(logger=self.logger)
+        return self.profile_store
+    
+    def _save_profile(self, job: "BackupJob") -> None:
+        """
+        Speichert die Einstellungen eines erfolgreichen Jobs als Profil.
+        Geschrieben wird nur dieses eine Profil.
+        
+        Args:
+            job (BackupJob): Der abgeschlossene Job
+        """
+        from src.core.profile_store import RepositoryProfile
+        store = self._get_profile_store()
+        store.put(RepositoryProfile(
+            job.github_url,
+            job.folder_name,
+            job.target_path,
+            strategy="timestamped" if job.add_backup else "overwrite",
+            options={
+                "create_zip": job.create_zip,
+                "incremental_zip": job.incremental_zip,
+                "archive_format": job.archive_format,
+                "git_mode": job.git_mode,
+                "reproducible": job.reproducible,
+                "submodules": job.submodules,
+            }
+        ))
+        store.save()
+    
+    def _import_repositories(self, from_directory: bool) -> None:
+        """
+        Importiert eine Repository-Liste oder einen Ordner mit Bare-Repositories
+        als Profile. Neue Profile übernehmen Speicherort und Optionen aus dem Fenster.
+        
+        Args:
+            from_directory (bool): True = Ordner durchsuchen, False = Listen-Datei lesen
+        """
+        target_path = self.path_entry.text().strip()
+        if not target_path:
+            self.status_label.show_message(
+                MESSAGES['select_location_first'],
+                success=False,
+                auto_hide_ms=STATUS_LABEL['auto_hide_ms']
+            )
+            return
+        if self.import_worker is not None and self.import_worker.isRunning():
+            self.status_label.show_message(
+                MESSAGES['import_running'],
+                success=False,
+                auto_hide_ms=STATUS_LABEL['auto_hide_ms']
+            )
+            return
+        
+        if from_directory:
+            source = QFileDialog.getExistingDirectory(self, LABELS['import_directory'])
+        else:
+            source, _ = QFileDialog.getOpenFileName(self, LABELS['import_file'], "", LABELS['import_file_filter'])
+        if not source:
+            return
+        
+        from src.core.repo_importer import RepositoryImporter
+        from src.core.worker import ImportWorker
+        importer = RepositoryImporter(
+            self._get_profile_store(),
+            self.logger,
+            strategy="timestamped" if self.backup_checkbox.isChecked() else "overwrite",
+            options={
+                "create_zip": self.zip_checkbox.isChecked(),
+                "incremental_zip": self.incremental_checkbox.isEnabled() and self.incremental_checkbox.isChecked(),
+                "archive_format": self.archive_format_combo.current_key(),
+                "git_mode": self.git_mode_combo.current_key(),
+                "reproducible": self.reproducible_checkbox.isEnabled() and self.reproducible_checkbox.isChecked(),
+            }
+        )
+        self.import_worker = ImportWorker(
+            importer.import_directory if from_directory else importer.import_file,
+            source,
+            target_path
+        )
+        self.import_worker.progress.connect(
+            lambda count: self.status_label.show_message(MESSAGES['import_progress'].format(count=count), success=True)
+        )
+        self.import_worker.finished.connect(self._on_import_finished)
+        self.import_worker.start()
+        self.logger.info(f"Import started: {source}")
+    
+    def _on_import_finished(self, success: bool, message: str) -> None:
+        """
+        Callback wenn ein Import oder eine Wiederherstellung fertig ist.
+        
+        Args:
+            success (bool): True wenn erfolgreich, False bei Fehler
+            message (str): Zusammenfassung der Operation
+        """
+        self.status_label.show_message(
+            message,
+            success=success,
+            auto_hide_ms=STATUS_LABEL['auto_hide_ms']
+        )
+    
+    def _restore_backup(self, from_folder: bool) -> None:
+        """
+        Stellt ein Backup (optional nur einen Pfad daraus) in einem leeren Ordner wieder her.
+        
+        Args:
+            from_folder (bool): True = Backup-Ordner, False = Archiv oder Bundle
+        """
+        if self.restore_worker is not None and self.restore_worker.isRunning():
+            self.status_label.show_message(
+                MESSAGES['restore_running'],
+                success=False,
+                auto_hide_ms=STATUS_LABEL['auto_hide_ms']
+            )
+            return
+        
+        start_dir = self.path_entry.text().strip()
+        if from_folder:
+            source = QFileDialog.getExistingDirectory(self, LABELS['restore_folder'], start_dir)
+        else:
+            source, _ = QFileDialog.getOpenFileName(self, LABELS['restore_archive'], start_dir, LABELS['restore_file_filter'])
+        if not source:
+            return
+        destination = QFileDialog.getExistingDirectory(self, LABELS['restore_destination'])
+        if not destination:
+            return
+        path, accepted = QInputDialog.getText(self, LABELS['restore_button'], LABELS['restore_path'])
+        if not accepted:
+            return
+        
+        from src.core.restore import RestoreManager
+        from src.core.worker import RestoreWorker
+        self.restore_worker = RestoreWorker(RestoreManager(self.logger), source, destination, path.strip() or None)
+        self.restore_worker.progress.connect(
+            lambda percent: self.status_label.show_message(MESSAGES['restore_progress'].format(percent=percent), success=True)
+        )
+        self.restore_worker.finished.connect(self._on_import_finished)
+        self.restore_worker.start()
+    
+    def _load_profile(self) -> None:
+        """Übernimmt das gespeicherte Profil zur eingegebenen URL in die Eingabefelder."""
+        github_url = self.github_url_entry.text().strip()
+        if not github_url:
+            return
+        profile = self._get_profile_store().get(github_url)
+        if profile is None:
+            return
+        
+        self.folder_name_entry.setText(profile.folder_name)
+        self.path_entry.setText(profile.target_path)
+        self.backup_checkbox.setChecked(profile.strategy == "timestamped")
+        self.zip_checkbox.setChecked(profile.options['create_zip'])
+        self.archive_format_combo.set_current_key(profile.options['archive_format'])
+        self.git_mode_combo.set_current_key(profile.options['git_mode'])
+        self.incremental_checkbox.setChecked(profile.options['incremental_zip'])
+        self.reproducible_checkbox.setChecked(profile.options['reproducible'])
+        self.logger.debug(f"Profile loaded: {github_url}")
+    
     def _load_last_used_repo(self) -> None:
         """Lädt die zuletzt verwendete Repository-Info."""
         data = self.file_manager.load_config()
@@ -343,7 +653,7 @@ class GitBackupToolPro(QMainWindow):
             self.logger.debug("Last used repo loaded")
     
     def _open_log(self) -> None:
-        """Öffnet die Log-Datei im Standard-Editor des Betriebssystems."""
+        """Öffnet die Log-Datei im In-App Log-Viewer."""
         log_file = self.logger.get_log_file_path()
         
         if not os.path.exists(log_file):
@@ -355,13 +665,13 @@ class GitBackupToolPro(QMainWindow):
             return
         
         try:
-            if platform.system() == "Windows":
-                os.system(f"notepad {log_file}")
-            elif platform.system() == "Darwin":  # macOS
-                os.system(f"open {log_file}")
-            else:  # Linux
-                os.system(f"xdg-open {log_file}")
-            self.logger.info("Log file opened")
+            if self.log_viewer is None:
+                from .log_viewer import LogViewerDialog
+                self.log_viewer = LogViewerDialog(log_file, self)
+            self.log_viewer.show()
+            self.log_viewer.raise_()
+            self.log_viewer.activateWindow()
+            self.logger.info("Log viewer opened")
         except Exception as e:
             self.logger.error(f"Error opening log file: {str(e)}")
             self.status_label.show_message(
@@ -5,7 +5,7 @@ Custom UI-Widgets mit moderner Gestaltung.
 """
 
 from typing import Optional
-from PySide6.QtWidgets import QLineEdit, QPushButton, QCheckBox, QLabel
+from PySide6.QtWidgets import QLineEdit, QPushButton, QCheckBox, QComboBox, QLabel
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QPainter, QColor, QPen
 from styles import (
@@ -13,6 +13,7 @@ from styles import (
     STYLESHEET_BUTTON_PRIMARY,
     STYLESHEET_BUTTON_SECONDARY,
     STYLESHEET_CHECKBOX,
+    STYLESHEET_COMBOBOX,
     STYLESHEET_LABEL_DESCRIPTION,
     STYLESHEET_LABEL_TITLE,
     STYLESHEET_STATUS_LABEL,
@@ -146,6 +147,46 @@ class ModernCheckBox(QCheckBox):
             painter.end()
 
 
+class ModernComboBox(QComboBox):
+    """
+    Custom ComboBox mit modernem Styling.
+    Speichert zu jedem Eintrag einen internen Schlüssel als Item-Data.
+    """
+    
+    def __init__(self, items: Optional[dict] = None, parent=None):
+        """
+        Initialisiert die ModernComboBox.
+        
+        Args:
+            items (Optional[dict]): Schlüssel -> Anzeigename der Einträge
+            parent: Parent-Widget
+        """
+        super().__init__(parent)
+        self.setStyleSheet(STYLESHEET_COMBOBOX)
+        for key, text in (items or {}).items():
+            self.addItem(text, key)
+    
+    def current_key(self) -> str:
+        """
+        Gibt den Schlüssel des ausgewählten Eintrags zurück.
+        
+        Returns:
+            str: Der Schlüssel des Eintrags
+        """
+        return self.currentData()
+    
+    def set_current_key(self, key: str) -> None:
+        """
+        Wählt den Eintrag mit dem angegebenen Schlüssel aus (falls vorhanden).
+        
+        Args:
+            key (str): Der Schlüssel des Eintrags
+        """
+        index = self.findData(key)
+        if index >= 0:
+            self.setCurrentIndex(index)
+
+
 class DescriptionLabel(QLabel):
     """
     Label für Beschreibungs- und Untertitel-Text.
@@ -187,6 +228,7 @@ class StatusLabel(QLabel):
     """
     Animiertes Status-Label für Benutzer-Feedback.
     Zeigt Erfolgs- oder Fehler-Meldungen mit farblicher Codierung.
+    Ein dauerhafter Fortschrittstext (set_progress) erscheint, sobald keine Meldung angezeigt wird.
     """
     
     def __init__(self, parent=None):
@@ -201,7 +243,8 @@ class StatusLabel(QLabel):
         self.setStyleSheet(STYLESHEET_STATUS_LABEL)
         self.hide()
         self._auto_hide_timer = QTimer()
-        self._auto_hide_timer.timeout.connect(self.hide)
+        self._auto_hide_timer.timeout.connect(self._on_auto_hide)
+        self._progress_text = ""
     
     def show_message(self, message: str, success: bool = True, auto_hide_ms: int = 3000) -> None:
         """
@@ -221,6 +264,27 @@ class StatusLabel(QLabel):
         self._auto_hide_timer.stop()
         self._auto_hide_timer.start(auto_hide_ms)
     
+    def set_progress(self, text: str) -> None:
+        """
+        Setzt den dauerhaften Fortschrittstext, z.B. die Restdauer laufender Jobs.
+        
+        Args:
+            text (str): Der Text, leer = keinen Fortschritt anzeigen
+        """
+        self._progress_text = text
+        if not self._auto_hide_timer.isActive():
+            self._on_auto_hide()
+    
+    def _on_auto_hide(self) -> None:
+        """Beendet eine Meldung und zeigt den Fortschrittstext, falls vorhanden."""
+        self._auto_hide_timer.stop()
+        if not self._progress_text:
+            self.hide()
+            return
+        self.setStyleSheet(get_status_label_style(True))
+        self.setText(self._progress_text)
+        self.show()
+    
     def hide_message(self) -> None:
         """Versteckt die Nachricht sofort und stoppt den Timer."""
         self._auto_hide_timer.stop()
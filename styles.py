@@ -4,7 +4,7 @@
 Zentrale Stylesheet-Definitionen für alle UI-Komponenten.
 """
 
-from config import COLORS, BUTTONS, INPUTS, CHECKBOX, STATUS_LABEL
+from config import COLORS, BUTTONS, INPUTS, CHECKBOX, COMBOBOX, STATUS_LABEL
 
 # Haupt-Stylesheet
 STYLESHEET_MAIN_WINDOW = f"""
@@ -111,6 +111,66 @@ STYLESHEET_CHECKBOX = f"""
     }}
 """
 
+# ComboBox (Auswahlliste)
+STYLESHEET_COMBOBOX = f"""
+    QComboBox {{
+        background-color: {COLORS['dark_secondary']};
+        border: 2px solid {COLORS['border']};
+        border-radius: {COMBOBOX['border_radius']};
+        padding: {COMBOBOX['padding']};
+        color: {COLORS['text']};
+        font-size: {COMBOBOX['font_size']};
+    }}
+    QComboBox:hover, QComboBox:focus {{
+        border: 2px solid {COLORS['primary']};
+    }}
+    QComboBox:disabled {{
+        color: {COLORS['text_disabled']};
+        border: 2px solid {COLORS['text_disabled']};
+    }}
+    QComboBox QAbstractItemView {{
+        background-color: {COLORS['dark_secondary']};
+        color: {COLORS['text']};
+        selection-background-color: {COLORS['primary']};
+    }}
+"""
+
+# Log-Ansicht
+STYLESHEET_LOG_VIEW = f"""
+    QListView {{
+        background-color: {COLORS['dark_secondary']};
+        border: 2px solid {COLORS['border']};
+        border-radius: {INPUTS['border_radius']};
+        color: {COLORS['text']};
+        font-family: monospace;
+        font-size: 12px;
+    }}
+    QListView::item:selected {{
+        background-color: {COLORS['primary']}40;
+    }}
+"""
+
+# Job-Tabelle
+STYLESHEET_JOB_TABLE = f"""
+    QTableView {{
+        background-color: {COLORS['dark_secondary']};
+        border: 2px solid {COLORS['border']};
+        border-radius: {INPUTS['border_radius']};
+        color: {COLORS['text']};
+        gridline-color: {COLORS['border']};
+        font-size: 13px;
+    }}
+    QTableView::item:selected {{
+        background-color: {COLORS['primary']}40;
+    }}
+    QHeaderView::section {{
+        background-color: {COLORS['dark']};
+        color: {COLORS['text_secondary']};
+        border: none;
+        padding: 6px;
+    }}
+"""
+
 # Label (Standard)
 STYLESHEET_LABEL = f"""
     QLabel {{
@@ -0,0 +1,19 @@
+# tests/conftest.py
+
+"""
+Gemeinsame Fixtures: Projektverzeichnis im Importpfad, jeder Test läuft in
+einem eigenen Arbeitsverzeichnis (log.txt und Zustandsdateien landen dort).
+"""
+
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(autouse=True)
+def work_dir(tmp_path, monkeypatch):
+    """Wechselt für jeden Test in ein leeres temporäres Verzeichnis."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
\ No newline at end of file
@@ -0,0 +1,240 @@
+# tests/test_archive_manager.py
+
+"""
+Tests für ArchiveManager: inkrementelle ZIP-Archive (merged und delta) mit Manifest
+und gestreamte TAR+Zstandard-Archive.
+"""
+
+import io
+import os
+import shutil
+import tarfile
+import zipfile
+import pytest
+import zstandard
+from src.core import archive_manager
+from src.core.archive_manager import ArchiveManager
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def make_tree(root):
+    write(os.path.join(root, "keep.txt"), "unchanged " * 100)
+    write(os.path.join(root, "edit.txt"), "before")
+    write(os.path.join(root, "drop.txt"), "deleted later")
+    write(os.path.join(root, "sub", "deep.txt"), "nested")
+    return root
+
+
+def change_tree(root):
+    write(os.path.join(root, "edit.txt"), "after")
+    write(os.path.join(root, "new.txt"), "added")
+    os.remove(os.path.join(root, "drop.txt"))
+
+
+def tar_contents(archive):
+    with open(archive, "rb") as f:
+        data = zstandard.ZstdDecompressor().stream_reader(f).read()
+    with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+        return {member.name: tar.extractfile(member).read().decode() for member in tar if member.isfile()}
+
+
+def contents(archive):
+    with zipfile.ZipFile(archive) as zipf:
+        return {name: zipf.read(name).decode() for name in zipf.namelist()}
+
+
+@pytest.fixture
+def compressed(monkeypatch):
+    """Zeichnet auf, welche Members neu komprimiert (nicht übernommen) werden."""
+    names = []
+    original = archive_manager.zip_write
+    
+    def spy(zipf, file_path, arcname, mtime=None):
+        names.append(arcname)
+        original(zipf, file_path, arcname, mtime)
+    
+    monkeypatch.setattr(archive_manager, "zip_write", spy)
+    return names
+
+
+def test_first_archive_is_full(work_dir):
+    source = make_tree(str(work_dir / "repo"))
+    manager = ArchiveManager()
+    
+    success, archive = manager.create_incremental_zip_archive(source, str(work_dir / "repo_1.zip"))
+    
+    assert success, archive
+    manifest = manager.load_manifest(archive)
+    assert manifest["mode"] == "full"
+    assert manifest["base_archive"] is None
+    assert sorted(manifest["files"]) == ["drop.txt", "edit.txt", "keep.txt", "sub/deep.txt"]
+    assert manifest["files"]["edit.txt"]["size"] == len("before")
+    assert contents(archive)["sub/deep.txt"] == "nested"
+
+
+def test_merged_archive_reuses_unchanged_members(work_dir, compressed):
+    source = make_tree(str(work_dir / "repo"))
+    manager = ArchiveManager()
+    success, first = manager.create_incremental_zip_archive(source, str(work_dir / "repo_1.zip"))
+    assert success
+    change_tree(source)
+    compressed.clear()
+    
+    success, second = manager.create_incremental_zip_archive(source, str(work_dir / "repo_2.zip"), first, mode="merged")
+    
+    assert success, second
+    assert sorted(compressed) == ["edit.txt", "new.txt"]
+    assert contents(second) == {
+        "keep.txt": "unchanged " * 100,
+        "edit.txt": "after",
+        "new.txt": "added",
+        "sub/deep.txt": "nested",
+    }
+    with zipfile.ZipFile(second) as zipf:
+        assert zipf.testzip() is None
+    manifest = manager.load_manifest(second)
+    assert manifest["mode"] == "merged"
+    assert manifest["base_archive"] == "repo_1.zip"
+    assert manifest["deleted"] == ["drop.txt"]
+    assert {entry["archive"] for entry in manifest["files"].values()} == {"repo_2.zip"}
+
+
+def test_delta_archive_refers_to_its_bases(work_dir, compressed):
+    source = make_tree(str(work_dir / "repo"))
+    manager = ArchiveManager()
+    success, first = manager.create_incremental_zip_archive(source, str(work_dir / "repo_1.zip"))
+    assert success
+    change_tree(source)
+    
+    success, second = manager.create_incremental_zip_archive(source, str(work_dir / "repo_2.zip"), first, mode="delta")
+    
+    assert success, second
+    assert contents(second) == {"edit.txt": "after", "new.txt": "added"}
+    manifest = manager.load_manifest(second)
+    assert manifest["mode"] == "delta"
+    assert manifest["files"]["keep.txt"]["archive"] == "repo_1.zip"
+    assert manifest["files"]["edit.txt"]["archive"] == "repo_2.zip"
+    
+    # Ein weiteres Delta verweist weiter auf das Archiv, das die Datei tatsächlich enthält
+    write(os.path.join(source, "new.txt"), "changed again")
+    compressed.clear()
+    success, third = manager.create_incremental_zip_archive(source, str(work_dir / "repo_3.zip"), second, mode="delta")
+    
+    assert success, third
+    assert compressed == ["new.txt"]
+    files = manager.load_manifest(third)["files"]
+    assert files["keep.txt"]["archive"] == "repo_1.zip"
+    assert files["edit.txt"]["archive"] == "repo_2.zip"
+    assert files["new.txt"]["archive"] == "repo_3.zip"
+
+
+def test_delta_onto_its_own_base_is_merged(work_dir):
+    source = make_tree(str(work_dir / "repo"))
+    manager = ArchiveManager()
+    success, archive = manager.create_incremental_zip_archive(source)
+    assert success
+    change_tree(source)
+    
+    success, archive = manager.create_incremental_zip_archive(source, previous_zip=archive, mode="delta")
+    
+    assert success, archive
+    assert manager.load_manifest(archive)["mode"] == "merged"
+    assert contents(archive)["keep.txt"] == "unchanged " * 100
+
+
+def test_unknown_mode_is_rejected(work_dir):
+    source = make_tree(str(work_dir / "repo"))
+    
+    success, msg = ArchiveManager().create_incremental_zip_archive(source, mode="sparse")
+    
+    assert not success
+    assert "sparse" in msg
+
+
+def test_previous_archive_is_the_newest_with_manifest(work_dir):
+    source = make_tree(str(work_dir / "repo"))
+    manager = ArchiveManager()
+    older = str(work_dir / "repo_backup_20240101_000000.zip")
+    newer = str(work_dir / "repo_backup_20240102_000000.zip")
+    assert manager.create_incremental_zip_archive(source, older)[0]
+    assert manager.create_incremental_zip_archive(source, newer, older)[0]
+    write(str(work_dir / "repo_backup_20240103_000000.zip"), "no manifest")
+    
+    assert manager.find_previous_archive(str(work_dir), "repo") == newer
+    assert manager.find_previous_archive(str(work_dir), "repo", exclude=newer) == older
+    assert manager.find_previous_archive(str(work_dir), "other") is None
+
+
+def test_tar_zstd_streams_the_whole_tree(work_dir):
+    source = make_tree(str(work_dir / "repo"))
+    write(os.path.join(source, ".git", "HEAD"), "ref: refs/heads/main")
+    
+    success, archive = ArchiveManager().create_tar_zstd_archive(source, level=3)
+    
+    assert success, archive
+    assert archive == f"{source}.tar.zst"
+    files = tar_contents(archive)
+    assert files == {
+        ".git/HEAD": "ref: refs/heads/main",
+        "drop.txt": "deleted later",
+        "edit.txt": "before",
+        "keep.txt": "unchanged " * 100,
+        "sub/deep.txt": "nested",
+    }
+    assert not os.path.exists(ArchiveManager.partial_path(archive))
+
+
+def test_tar_zstd_can_skip_git_and_add_extra_files(work_dir):
+    source = make_tree(str(work_dir / "repo"))
+    write(os.path.join(source, ".git", "HEAD"), "ref: refs/heads/main")
+    write(str(work_dir / "repo.bundle"), "bundle")
+    
+    success, archive = ArchiveManager().create_tar_zstd_archive(
+        source, exclude_git=True, extra_files={"repo.bundle": str(work_dir / "repo.bundle")}
+    )
+    
+    assert success, archive
+    files = tar_contents(archive)
+    assert not any(name.startswith(".git") for name in files)
+    assert files["repo.bundle"] == "bundle"
+
+
+@pytest.mark.skipif(shutil.which("zstd") is None, reason="zstd tool not installed")
+def test_tar_zstd_falls_back_to_the_zstd_tool(work_dir, monkeypatch):
+    source = make_tree(str(work_dir / "repo"))
+    monkeypatch.setattr(archive_manager, "zstandard", None)
+    
+    success, archive = ArchiveManager().create_tar_zstd_archive(source, threads=1)
+    
+    assert success, archive
+    assert tar_contents(archive)["edit.txt"] == "before"
+
+
+def test_tar_zstd_rejects_invalid_level(work_dir):
+    source = make_tree(str(work_dir / "repo"))
+    
+    success, msg = ArchiveManager().create_tar_zstd_archive(source, level=23)
+    
+    assert not success
+    assert "level" in msg
+    assert not os.path.exists(f"{source}.tar.zst")
+
+
+def test_failed_tar_zstd_leaves_no_partial_archive(work_dir, monkeypatch):
+    source = make_tree(str(work_dir / "repo"))
+    
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+    
+    monkeypatch.setattr(ArchiveManager, "_write_tar_stream", fail)
+    success, msg = ArchiveManager().create_tar_zstd_archive(source)
+    
+    assert not success
+    assert "disk full" in msg
+    assert not os.path.exists(f"{source}.tar.zst")
+    assert not os.path.exists(ArchiveManager.partial_path(f"{source}.tar.zst"))
\ No newline at end of file
@@ -0,0 +1,128 @@
+# tests/test_backup_diff.py
+
+"""
+Tests für BackupComparer: Vergleich über Git-Trees, Manifeste und Dateilisten.
+"""
+
+import os
+import subprocess
+import zipfile
+import pytest
+from src.core.archive_manager import ArchiveManager
+from src.core.backup_diff import BackupComparer
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def git(cwd, *args):
+    subprocess.run(
+        ["git", "-C", str(cwd), "-c", "user.name=Test", "-c", "user.email=test@example.com"] + list(args),
+        check=True, capture_output=True
+    )
+
+
+def snapshot(root):
+    """Erster Stand: a.txt, same.txt, gone.txt."""
+    write(os.path.join(root, "a.txt"), "aaaa")
+    write(os.path.join(root, "same.txt"), "unchanged")
+    write(os.path.join(root, "gone.txt"), "removed later")
+    return root
+
+
+def change(root):
+    """Zweiter Stand: a.txt gleich groß geändert, new.txt neu, gone.txt gelöscht."""
+    write(os.path.join(root, "a.txt"), "bbbb")
+    write(os.path.join(root, "new.txt"), "added!")
+    os.remove(os.path.join(root, "gone.txt"))
+
+
+def assert_expected(diff):
+    assert diff.added == {"new.txt": 6}
+    assert diff.removed == {"gone.txt": 13}
+    assert diff.modified == {"a.txt": (4, 4)}
+    assert diff.byte_delta == 6 - 13
+    assert diff.changed_bytes == 6 + 4
+
+
+def test_git_backups_are_compared_by_tree(work_dir):
+    origin = snapshot(str(work_dir / "origin"))
+    git(origin, "init", "-q")
+    git(origin, "add", ".")
+    git(origin, "commit", "-q", "-m", "first")
+    git(work_dir, "clone", "-q", origin, str(work_dir / "old"))
+    change(origin)
+    git(origin, "add", "-A")
+    git(origin, "commit", "-q", "-m", "second")
+    git(work_dir, "clone", "-q", origin, str(work_dir / "new"))
+    
+    diff, msg = BackupComparer().compare(str(work_dir / "old"), str(work_dir / "new"))
+    
+    assert diff.method == "git"
+    assert diff.old_commit != diff.new_commit
+    assert_expected(diff)
+    assert msg == diff.summary()
+    
+    same, _ = BackupComparer().compare(str(work_dir / "new"), str(work_dir / "new"))
+    assert same.method == "git"
+    assert not same.added and not same.removed and not same.modified
+
+
+def test_folders_without_git_are_compared_by_stat_and_hash(work_dir):
+    old = snapshot(str(work_dir / "old"))
+    new = snapshot(str(work_dir / "new"))
+    change(new)
+    # Gleich große Dateien mit abweichender Änderungszeit werden gehasht
+    os.utime(os.path.join(new, "a.txt"), ns=(1, 1))
+    os.utime(os.path.join(new, "same.txt"), ns=(1, 1))
+    
+    diff, _ = BackupComparer().compare(old, new)
+    
+    assert diff.method == "stat"
+    assert_expected(diff)
+
+
+def test_archives_with_manifest_are_compared_by_manifest(work_dir):
+    source = snapshot(str(work_dir / "repo"))
+    manager = ArchiveManager()
+    assert manager.create_incremental_zip_archive(source, str(work_dir / "old.zip"))[0]
+    change(source)
+    assert manager.create_incremental_zip_archive(source, str(work_dir / "new.zip"))[0]
+    
+    diff, _ = BackupComparer().compare(str(work_dir / "old.zip"), str(work_dir / "new.zip"))
+    
+    assert diff.method == "manifest"
+    assert_expected(diff)
+
+
+@pytest.mark.parametrize("new_format", ["zip", "tar.zst"])
+def test_archive_without_manifest_against_folder(work_dir, new_format):
+    old = snapshot(str(work_dir / "old"))
+    source = snapshot(str(work_dir / "repo"))
+    change(source)
+    write(os.path.join(source, ".git", "HEAD"), "ignored")
+    if new_format == "zip":
+        archive = str(work_dir / "new.zip")
+        with zipfile.ZipFile(archive, "w") as zipf:
+            for name in ("a.txt", "same.txt", "new.txt", ".git/HEAD"):
+                zipf.write(os.path.join(source, name), name)
+    else:
+        success, archive = ArchiveManager().create_tar_zstd_archive(source)
+        assert success
+    
+    diff, _ = BackupComparer().compare(old, archive)
+    
+    assert diff.method == "stat"
+    assert_expected(diff)
+
+
+def test_missing_backup_is_reported(work_dir):
+    snapshot(str(work_dir / "old"))
+    
+    diff, msg = BackupComparer().compare(str(work_dir / "old"), str(work_dir / "missing"))
+    
+    assert diff is None
+    assert msg.startswith("Backup not found")
\ No newline at end of file
@@ -0,0 +1,96 @@
+# tests/test_backup_job.py
+
+"""
+Tests für BackupJob: Schlüssel für die Wiederverwendung unveränderter Archive
+und Übernahme per Hardlink, solange sich der Stand nicht ändert.
+"""
+
+import os
+import subprocess
+import pytest
+from config import ARCHIVE
+from src.core.backup_job import BackupJob
+
+
+@pytest.fixture
+def repo(tmp_path):
+    path = tmp_path / "repo"
+    path.mkdir()
+    (path / "file.txt").write_text("content")
+    git = ["git", "-C", str(path), "-c", "user.name=Test", "-c", "user.email=test@example.com"]
+    subprocess.run(git + ["init", "-q"], check=True)
+    subprocess.run(git + ["add", "."], check=True)
+    subprocess.run(git + ["commit", "-q", "-m", "init"], check=True)
+    return str(path)
+
+
+def source(repo, **kwargs):
+    job = BackupJob("https://example.com/repo.git", "repo", repo, create_zip=True, **kwargs)
+    return job._archive_source(repo)
+
+
+@pytest.mark.parametrize("setting, value", [("zstd_level", 19), ("zstd_threads", 1)])
+def test_zstd_settings_change_source(repo, monkeypatch, setting, value):
+    before = source(repo, archive_format="tar.zst")
+    monkeypatch.setitem(ARCHIVE, setting, value if ARCHIVE[setting] != value else value + 1)
+    assert source(repo, archive_format="tar.zst") != before
+
+
+def test_incremental_zip_changes_source(repo):
+    assert source(repo, archive_format="zip", incremental_zip=True) != source(repo, archive_format="zip")
+
+
+def test_unchanged_settings_keep_source(repo):
+    assert source(repo, archive_format="tar.zst") == source(repo, archive_format="tar.zst")
+
+
+def clone(repo, target):
+    subprocess.run(["git", "clone", "-q", repo, target], check=True)
+    return target
+
+
+def create_archive(clone_dir, git_mode="exclude"):
+    job = BackupJob(
+        "https://example.com/repo.git", "repo", os.path.dirname(clone_dir),
+        create_zip=True, archive_format="tar.zst", git_mode=git_mode
+    )
+    job._create_archive(clone_dir)
+    return job.archive_path
+
+
+def test_unchanged_clone_reuses_the_archive(repo, tmp_path):
+    first = create_archive(clone(repo, str(tmp_path / "backups" / "repo_1")))
+    second = create_archive(clone(repo, str(tmp_path / "backups" / "repo_2")))
+    
+    assert second == str(tmp_path / "backups" / "repo_2.tar.zst")
+    assert os.path.samefile(first, second)
+    assert os.path.isfile(tmp_path / "backups" / "archives.json")
+
+
+def test_changed_clone_gets_a_new_archive(repo, tmp_path):
+    first = create_archive(clone(repo, str(tmp_path / "backups" / "repo_1")))
+    with open(first, "rb") as f:
+        original = f.read()
+    second_dir = clone(repo, str(tmp_path / "backups" / "repo_2"))
+    second = create_archive(second_dir)
+    git = ["git", "-C", second_dir, "-c", "user.name=Test", "-c", "user.email=test@example.com"]
+    with open(os.path.join(second_dir, "file.txt"), "w") as f:
+        f.write("changed")
+    subprocess.run(git + ["commit", "-q", "-a", "-m", "next"], check=True)
+    
+    # Der Hardlink wird vor dem Neuschreiben gelöst, das erste Archiv bleibt unverändert
+    assert create_archive(second_dir) == second
+    assert not os.path.samefile(first, second)
+    with open(first, "rb") as f:
+        assert f.read() == original
+
+
+def test_new_refs_count_when_git_is_archived(repo, tmp_path):
+    first_dir = clone(repo, str(tmp_path / "backups" / "repo_1"))
+    first = create_archive(first_dir, git_mode="include")
+    second_dir = clone(repo, str(tmp_path / "backups" / "repo_2"))
+    subprocess.run(["git", "-C", second_dir, "tag", "v1"], check=True)
+    
+    assert not os.path.samefile(first, create_archive(second_dir, git_mode="include"))
+    # Ohne .git im Archiv zählt nur der Tree
+    assert os.path.samefile(create_archive(first_dir), create_archive(second_dir))
\ No newline at end of file
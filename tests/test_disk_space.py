@@ -0,0 +1,124 @@
+# tests/test_disk_space.py
+
+"""
+Tests für DiskSpaceChecker: Schätzung aus dem letzten Backup, Reservierungen und Batch-Prüfung.
+"""
+
+import os
+import time
+import threading
+from types import SimpleNamespace
+import pytest
+from config import DISK_SPACE
+from src.core import disk_space
+from src.core.disk_space import DiskSpaceChecker, format_size
+
+
+def write(path, size):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"x" * size)
+
+
+@pytest.fixture
+def free_space(monkeypatch):
+    """Dateisystem mit einstellbarem freien Platz und leeren Reservierungen."""
+    disk = SimpleNamespace(free=1000)
+    monkeypatch.setattr(disk_space.shutil, "disk_usage", lambda path: disk)
+    monkeypatch.setattr(DiskSpaceChecker, "_reserved", {})
+    monkeypatch.setitem(DISK_SPACE, "min_free_bytes", 100)
+    return disk
+
+
+def test_volume_archive_is_not_taken_as_clone(tmp_path):
+    write(str(tmp_path / "repo_backup_20240101_000000" / "file.bin"), 5000)
+    time.sleep(0.01)
+    volumes = tmp_path / "repo_backup_20240101_000000.volumes"
+    write(str(volumes / "part0001.zip"), 300)
+    write(str(volumes / "part0002.zip"), 200)
+    
+    clone_bytes, archive_bytes = DiskSpaceChecker()._estimate_from_previous("repo", str(tmp_path))
+    assert clone_bytes == 5000
+    assert archive_bytes == 500
+
+
+def test_estimate_from_previous_backup_and_archive(tmp_path, monkeypatch):
+    monkeypatch.setitem(DISK_SPACE, "margin_ratio", 0.1)
+    monkeypatch.setitem(DISK_SPACE, "archive_ratio", 1.0)
+    write(str(tmp_path / "repo" / "file.bin"), 1000)
+    write(str(tmp_path / "repo.zip"), 400)
+    write(str(tmp_path / "other" / "file.bin"), 9999)
+    checker = DiskSpaceChecker()
+    
+    assert checker.estimate("https://github.com/o/repo.git", "repo", str(tmp_path)) == 1100
+    assert checker.estimate("https://github.com/o/repo.git", "repo", str(tmp_path), create_archive=True) == 1540
+    # Repack/Bundle kopieren die Objekte vor dem Archivieren
+    assert checker.estimate(
+        "https://github.com/o/repo.git", "repo", str(tmp_path), create_archive=True, git_mode="bundle"
+    ) == 2640
+
+
+def test_estimate_from_local_mirror_pack_size(tmp_path, monkeypatch):
+    monkeypatch.setitem(DISK_SPACE, "margin_ratio", 0.0)
+    monkeypatch.setitem(DISK_SPACE, "pack_factor", 2.5)
+    write(str(tmp_path / "mirror.git" / "objects" / "pack" / "p.pack"), 400)
+    
+    needed = DiskSpaceChecker().estimate(f"file://{tmp_path / 'mirror.git'}", "repo", str(tmp_path / "backups"))
+    
+    assert needed == 1000
+
+
+def test_reservations_share_the_free_space(tmp_path, free_space):
+    checker = DiskSpaceChecker()
+    target = str(tmp_path / "not" / "yet" / "created")
+    
+    assert checker.reserve(target, 600)[0]
+    assert checker.available(target) == 300
+    success, msg = checker.reserve(target, 400, wait=False)
+    assert not success
+    assert "Not enough disk space" in msg
+    
+    checker.release(target, 600)
+    assert checker.available(target) == 900
+
+
+def test_reserve_waits_for_other_jobs(tmp_path, free_space, monkeypatch):
+    monkeypatch.setitem(DISK_SPACE, "defer_poll_interval", 5)
+    checker = DiskSpaceChecker()
+    target = str(tmp_path)
+    checker.reserve(target, 600)
+    result = {}
+    waiting = threading.Thread(target=lambda: result.update(ok=checker.reserve(target, 400)))
+    waiting.start()
+    time.sleep(0.1)
+    assert waiting.is_alive()
+    
+    checker.release(target, 600)
+    waiting.join(timeout=2)
+    
+    assert result["ok"][0]
+    assert DiskSpaceChecker._reserved == {os.stat(target).st_dev: 400}
+
+
+def test_reserve_without_other_jobs_fails_immediately(tmp_path, free_space):
+    started = time.monotonic()
+    
+    success, _ = DiskSpaceChecker().reserve(str(tmp_path), 5000)
+    
+    assert not success
+    assert time.monotonic() - started < 1
+
+
+def test_batch_is_checked_per_filesystem(tmp_path, free_space):
+    checker = DiskSpaceChecker()
+    
+    assert checker.check_batch([(str(tmp_path / "a"), 400), (str(tmp_path / "b"), 400)])[0]
+    success, msg = checker.check_batch([(str(tmp_path / "a"), 500), (str(tmp_path / "b"), 500)])
+    assert not success
+    assert "Batch does not fit" in msg
+
+
+def test_format_size():
+    assert format_size(512) == "512.0 B"
+    assert format_size(1536) == "1.5 KiB"
+    assert format_size(3 * 1024 ** 4) == "3.0 TiB"
\ No newline at end of file
@@ -0,0 +1,106 @@
+# tests/test_encryption.py
+
+"""
+Tests für verschlüsselte Archive: Round-Trip über mehrere Blöcke, falscher Schlüssel, Manipulation.
+"""
+
+import io
+import os
+import tarfile
+import pytest
+from src.core.archive_manager import ArchiveManager
+from src.core.encryption import (
+    DecryptingReader, EncryptingWriter, EncryptionError, HEADER, RECORD, generate_key, load_key
+)
+
+
+def write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def encrypt(data, key, chunk_size=1024):
+    output = io.BytesIO()
+    with EncryptingWriter(output, key, chunk_size=chunk_size, workers=2) as writer:
+        writer.write(data)
+    return output.getvalue()
+
+
+def decrypt(blob, key):
+    reader = DecryptingReader(io.BytesIO(blob), key, workers=2)
+    try:
+        return reader.read()
+    finally:
+        reader.close()
+
+
+def test_encrypted_archive_round_trip(work_dir):
+    source = str(work_dir / "repo")
+    payload = os.urandom(3 * 1024 * 1024)
+    write(os.path.join(source, "big.bin"), payload)
+    write(os.path.join(source, "sub", "note.txt"), b"secret note")
+    assert generate_key("backup.key")[0]
+    
+    extra = {"extra.txt": os.path.join(source, "sub", "note.txt")}
+    success, archive = ArchiveManager().create_encrypted_archive(source, extra_files=extra)
+    
+    assert success, archive
+    assert archive == source + ".tar.enc"
+    # Kein Manifest im Klartext neben dem Archiv
+    assert not [name for name in os.listdir(work_dir) if name.startswith("repo.") and name != "repo.tar.enc"]
+    with open(archive, "rb") as f:
+        raw = f.read()
+    assert b"secret note" not in raw
+    reader = DecryptingReader(io.BytesIO(raw), load_key())
+    with tarfile.open(fileobj=reader, mode="r|") as tar:
+        contents = {member.name: tar.extractfile(member).read() for member in tar if member.isfile()}
+    reader.close()
+    assert contents == {"big.bin": payload, "sub/note.txt": b"secret note", "extra.txt": b"secret note"}
+
+
+def test_chunks_round_trip_and_salt_differs():
+    key = os.urandom(32)
+    data = os.urandom(10 * 1024 + 17)
+    
+    first, second = encrypt(data, key), encrypt(data, key)
+    
+    assert first != second
+    assert decrypt(first, key) == decrypt(second, key) == data
+    assert decrypt(encrypt(b"", key), key) == b""
+
+
+def test_wrong_key_is_rejected():
+    blob = encrypt(b"payload" * 1000, os.urandom(32))
+    
+    with pytest.raises(EncryptionError, match="wrong key or damaged archive"):
+        decrypt(blob, os.urandom(32))
+
+
+def test_tampered_and_truncated_archives_are_rejected():
+    key = os.urandom(32)
+    blob = encrypt(os.urandom(4096), key)
+    tampered = bytearray(blob)
+    tampered[HEADER.size + RECORD.size + 5] ^= 0x01
+    
+    with pytest.raises(EncryptionError, match="cannot be decrypted"):
+        decrypt(bytes(tampered), key)
+    with pytest.raises(EncryptionError, match="truncated"):
+        decrypt(blob[:len(blob) // 2], key)
+    with pytest.raises(EncryptionError, match="Not an encrypted archive"):
+        decrypt(b"PK\x03\x04" + blob[4:], key)
+
+
+def test_key_files(work_dir):
+    assert generate_key("backup.key")[0]
+    assert generate_key("backup.key") == (False, "Key file already exists: backup.key")
+    assert os.stat("backup.key").st_mode & 0o077 == 0
+    key = load_key("backup.key")
+    
+    write(str(work_dir / "raw.key"), key)
+    assert load_key(str(work_dir / "raw.key")) == key
+    write(str(work_dir / "short.key"), b"abcd")
+    with pytest.raises(EncryptionError, match="Invalid key file"):
+        load_key(str(work_dir / "short.key"))
+    with pytest.raises(EncryptionError, match="Cannot read key file"):
+        load_key(str(work_dir / "missing.key"))
\ No newline at end of file
@@ -0,0 +1,113 @@
+# tests/test_git_modes.py
+
+"""
+Tests für ArchiveManager.prepare_git_directory: .git einschließen, weglassen, umpacken oder als Bundle ablegen.
+"""
+
+import os
+import glob
+import zipfile
+import subprocess
+import pytest
+from src.core.archive_manager import ArchiveManager
+
+
+@pytest.fixture(autouse=True)
+def git_env(monkeypatch):
+    """Lokale Submodul-URLs erlauben und Commits ohne globale Git-Konfiguration."""
+    monkeypatch.setenv("GIT_CONFIG_COUNT", "1")
+    monkeypatch.setenv("GIT_CONFIG_KEY_0", "protocol.file.allow")
+    monkeypatch.setenv("GIT_CONFIG_VALUE_0", "always")
+    for role in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{role}_NAME", "Test")
+        monkeypatch.setenv(f"GIT_{role}_EMAIL", "test@example.com")
+
+
+def git(cwd, *args):
+    subprocess.run(["git", "-C", str(cwd)] + list(args), check=True, capture_output=True)
+
+
+def make_repo(path, files, submodules=()):
+    os.makedirs(path)
+    git(path, "init", "-q")
+    for name, text in files.items():
+        with open(os.path.join(path, name), "w") as f:
+            f.write(text)
+        git(path, "add", name)
+        git(path, "commit", "-q", "-m", name)
+    for url, sub_path in submodules:
+        git(path, "submodule", "add", "-q", str(url), sub_path)
+        git(path, "commit", "-q", "-m", sub_path)
+    return path
+
+
+@pytest.fixture
+def clone(work_dir):
+    """Klon mit mehreren losen Objekten und einem ausgecheckten Submodul."""
+    lib = make_repo(str(work_dir / "lib"), {"lib.txt": "lib"})
+    origin = make_repo(str(work_dir / "origin"), {"a.txt": "a", "b.txt": "b"}, [(lib, "vendor/lib")])
+    target = str(work_dir / "clone")
+    git(work_dir, "clone", "-q", "--recurse-submodules", origin, target)
+    return target
+
+
+def test_include_and_exclude(clone, work_dir):
+    manager = ArchiveManager()
+    
+    assert manager.prepare_git_directory(clone, "include") == (False, {})
+    assert manager.prepare_git_directory(clone, "exclude") == (True, {})
+    assert manager.prepare_git_directory(clone, "unknown") == (False, {})
+    os.makedirs(work_dir / "plain")
+    assert manager.prepare_git_directory(str(work_dir / "plain"), "bundle") == (False, {})
+
+
+def test_repack_leaves_one_pack(clone):
+    git(clone, "commit", "-q", "--allow-empty", "-m", "loose")
+    
+    assert ArchiveManager().prepare_git_directory(clone, "repack") == (False, {})
+    
+    for git_dir in (os.path.join(clone, ".git"), os.path.join(clone, ".git", "modules", "vendor", "lib")):
+        objects = os.path.join(git_dir, "objects")
+        assert len(glob.glob(os.path.join(objects, "pack", "*.pack"))) == 1
+        assert not glob.glob(os.path.join(objects, "[0-9a-f][0-9a-f]", "*"))
+
+
+def test_bundles_replace_git_in_the_archive(clone, work_dir):
+    manager = ArchiveManager()
+    
+    exclude_git, extra_files = manager.prepare_git_directory(clone, "bundle")
+    
+    assert exclude_git
+    assert sorted(extra_files) == ["repository.bundle", "vendor/lib/repository.bundle"]
+    success, archive = manager.create_incremental_zip_archive(
+        clone, str(work_dir / "clone.zip"), exclude_git=exclude_git, extra_files=extra_files
+    )
+    manager.cleanup_git_directory(extra_files)
+    
+    assert success, archive
+    assert not any(os.path.exists(path) for path in extra_files.values())
+    with zipfile.ZipFile(archive) as zipf:
+        names = zipf.namelist()
+        assert not [name for name in names if ".git" in name.split("/")]
+        assert {"a.txt", ".gitmodules", "vendor/lib/lib.txt", "repository.bundle", "vendor/lib/repository.bundle"} <= set(names)
+        zipf.extract("repository.bundle", work_dir / "extracted")
+    # Das Bundle enthält die vollständige Historie
+    git(work_dir, "clone", "-q", str(work_dir / "extracted" / "repository.bundle"), str(work_dir / "restored"))
+    log = subprocess.run(["git", "-C", str(work_dir / "restored"), "log", "--format=%s"], capture_output=True, text=True)
+    assert log.stdout.split() == ["vendor/lib", "b.txt", "a.txt"]
+
+
+def test_failed_bundle_falls_back_to_git_as_is(clone, work_dir, monkeypatch):
+    manager = ArchiveManager()
+    calls = []
+    original = manager.git_manager.create_bundle
+    
+    def failing_second(repo_path, bundle_path):
+        calls.append(repo_path)
+        return original(repo_path, bundle_path) if len(calls) == 1 else (False, "bundle failed")
+    
+    monkeypatch.setattr(manager.git_manager, "create_bundle", failing_second)
+    
+    assert manager.prepare_git_directory(clone, "bundle") == (False, {})
+    assert len(calls) == 2
+    assert not glob.glob(str(work_dir / "clone.*.bundle"))
\ No newline at end of file
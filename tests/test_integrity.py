@@ -0,0 +1,136 @@
+# tests/test_integrity.py
+
+"""
+Tests für IntegrityChecker: beschädigte Clones erkennen, Reihenfolge und Zeitbudget der Prüfungen.
+"""
+
+import os
+import json
+import subprocess
+from types import SimpleNamespace
+import pytest
+from src.core.integrity import IntegrityChecker
+
+
+def git(cwd, *args):
+    result = subprocess.run(
+        ["git", "-C", str(cwd), "-c", "user.name=Test", "-c", "user.email=test@example.com"] + list(args),
+        check=True, capture_output=True
+    )
+    return result.stdout.decode().strip()
+
+
+@pytest.fixture
+def backups(work_dir):
+    """Speicherort mit drei Clones (nur lose Objekte)."""
+    root = work_dir / "backups"
+    for name in ("alpha", "beta", "gamma"):
+        repo = str(root / name)
+        git(work_dir, "init", "-q", repo)
+        with open(os.path.join(repo, "a.txt"), "w") as f:
+            f.write(f"content of {name}")
+        git(repo, "add", "a.txt")
+        git(repo, "commit", "-q", "-m", "init")
+    return str(root)
+
+
+def blob_path(repo):
+    object_id = git(repo, "rev-parse", "HEAD:a.txt")
+    return os.path.join(repo, ".git", "objects", object_id[:2], object_id[2:])
+
+
+def checker(work_dir, **kwargs):
+    return IntegrityChecker(workers=2, state_file=str(work_dir / "integrity.json"), **kwargs)
+
+
+def load_state(work_dir):
+    with open(work_dir / "integrity.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_intact_repositories_are_recorded(backups, work_dir):
+    integrity = checker(work_dir)
+    repos = integrity.find_repositories(backups)
+    calls = []
+    
+    success, msg = integrity.check(repos, budget_minutes=0, progress=lambda done, total: calls.append((done, total)))
+    
+    assert success, msg
+    assert msg == "3 checked, 0 corrupt, 0 deferred"
+    assert calls[-1] == (3, 3)
+    state = load_state(work_dir)
+    assert sorted(state) == [os.path.abspath(repo) for repo in repos]
+    assert all(entry["ok"] and entry["full"] for entry in state.values())
+
+
+def test_corrupted_object_is_detected(backups, work_dir):
+    integrity = checker(work_dir)
+    repos = integrity.find_repositories(backups)
+    path = blob_path(repos[1])
+    os.chmod(path, 0o644)
+    with open(path, "r+b") as f:
+        f.seek(4)
+        f.write(b"\x00garbage\x00")
+    
+    success, msg = integrity.check(repos, budget_minutes=0)
+    
+    assert not success
+    assert msg.startswith("3 checked, 1 corrupt, 0 deferred")
+    assert f"Git fsck failed for {repos[1]}" in msg
+    state = load_state(work_dir)
+    assert not state[os.path.abspath(repos[1])]["ok"]
+    assert "error" in state[os.path.abspath(repos[1])]
+    assert state[os.path.abspath(repos[0])]["ok"]
+    # Beschädigte Backups kommen beim nächsten Lauf zuerst an die Reihe
+    assert IntegrityChecker.schedule(repos, state)[0] == repos[1]
+
+
+def test_missing_object_is_detected_without_full_check(backups, work_dir):
+    repos = checker(work_dir).find_repositories(backups)
+    os.remove(blob_path(repos[0]))
+    
+    success, msg = checker(work_dir, full=False).check(repos[:1], budget_minutes=0)
+    
+    assert not success
+    assert "1 corrupt" in msg
+    assert not load_state(work_dir)[os.path.abspath(repos[0])]["full"]
+
+
+def test_schedule_order():
+    state = {
+        os.path.abspath("old"): {"ok": True, "checked": "2026-01-01T00:00:00"},
+        os.path.abspath("recent"): {"ok": True, "checked": "2026-06-01T00:00:00"},
+        os.path.abspath("broken"): {"ok": False, "checked": "2026-09-01T00:00:00"},
+    }
+    
+    assert IntegrityChecker.schedule(["recent", "old", "broken", "new"], state) == ["new", "broken", "old", "recent"]
+
+
+def test_budget_defers_slow_checks(backups, work_dir):
+    integrity = checker(work_dir)
+    repos = integrity.find_repositories(backups)
+    # Letzte Prüfungen dauerten länger als das Budget; gamma ist am längsten nicht geprüft
+    with open(work_dir / "integrity.json", "w", encoding="utf-8") as f:
+        json.dump({
+            os.path.abspath(repo): {"ok": True, "checked": checked, "seconds": 600}
+            for repo, checked in zip(repos, ["2026-02-01T00:00:00", "2026-03-01T00:00:00", "2026-01-01T00:00:00"])
+        }, f)
+    
+    success, msg = integrity.check(repos, budget_minutes=1)
+    
+    assert success, msg
+    assert msg.startswith("1 checked, 0 corrupt, 2 deferred")
+    # Die übrigen Backups wurden zu lange nicht geprüft
+    assert msg.endswith("2 not verified within 7 days")
+    state = load_state(work_dir)
+    assert state[os.path.abspath(repos[2])]["checked"] > "2026-01-01T00:00:00"
+    assert state[os.path.abspath(repos[0])]["checked"] == "2026-02-01T00:00:00"
+
+
+def test_post_process_checks_the_new_clone(backups, work_dir):
+    integrity = checker(work_dir)
+    repo = integrity.find_repositories(backups)[0]
+    
+    assert integrity.post_process(SimpleNamespace(target_directory=repo)) == (True, "1 checked, 0 corrupt, 0 deferred")
+    assert integrity.post_process(SimpleNamespace(target_directory=None)) == (True, "No clone to check")
+    assert integrity.check([]) == (True, "No repositories to check")
\ No newline at end of file
@@ -0,0 +1,101 @@
+# tests/test_job_history.py
+
+"""
+Tests für JobHistory und BatchEstimator: Vorhersagen aus vergangenen Läufen und Restdauer einer Batch.
+"""
+
+from types import SimpleNamespace
+import pytest
+from config import HISTORY
+from src.core.job_history import BatchEstimator, JobHistory, format_duration, remaining_seconds, schedule_seconds
+
+
+def job(url="https://github.com/o/a.git", timings=None, create_zip=True, replicate_targets=()):
+    return SimpleNamespace(
+        github_url=url, timings=timings or {}, target_directory=None, archive_path=None,
+        create_zip=create_zip, replicate_targets=list(replicate_targets), upload=None,
+        stage="queued", percent=0.0, stage_started=0.0
+    )
+
+
+@pytest.fixture
+def history(work_dir):
+    history = JobHistory(str(work_dir / "history.db"))
+    yield history
+    history.close()
+
+
+def test_prediction_is_the_median_of_previous_runs(history):
+    assert history.predict(job()) is None
+    
+    for clone, archive in ((10, 4), (12, 5), (300, 6)):
+        history.record(job(timings={"clone": clone, "archive": archive, "replicate": 1}))
+    history.record(job(timings={}))  # Ohne Clone-Zeit nicht gespeichert
+    
+    prediction = history.predict(job(replicate_targets=["/mnt/disk"]))
+    assert prediction["clone"] == 12
+    assert prediction["archive"] == 5
+    assert prediction["replicate"] == 1
+    assert prediction["total"] == 18
+    assert prediction["known"]
+    # Stufen, die der Job nicht ausführt, zählen nicht
+    assert history.predict(job(create_zip=False))["total"] == 12
+
+
+def test_unknown_repository_uses_all_repositories(history):
+    history.record(job("https://github.com/o/a.git", {"clone": 10, "archive": 2}))
+    history.record(job("https://github.com/o/b.git", {"clone": 30, "archive": 4}))
+    
+    prediction = history.predict(job("https://github.com/o/new.git"))
+    
+    assert prediction["clone"] == 20
+    assert prediction["archive"] == 3
+    assert not prediction["known"]
+    assert prediction["pack_bytes"] == 0
+
+
+def test_only_the_last_runs_are_kept(history, monkeypatch):
+    monkeypatch.setitem(HISTORY, "keep_runs", 3)
+    
+    for seconds in (1000, 1000, 1, 2, 3):
+        history.record(job(timings={"clone": seconds}))
+    
+    assert history.predict(job())["clone"] == 2
+    count = history._connect().execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+    assert count == 3
+
+
+def test_remaining_time_helpers():
+    # Ohne Fortschritt zählt nur die Vorhersage, bei 50 % je zur Hälfte
+    assert remaining_seconds(100, 20, 0) == 80
+    assert remaining_seconds(100, 40, 50) == 0.5 * 40 + 0.5 * 60
+    assert remaining_seconds(None, 30, 25) == 90
+    assert remaining_seconds(None, 30, 0) is None
+    assert schedule_seconds([10, 10, 10], 2) == 20
+    assert schedule_seconds([], 4) == 0
+    assert format_duration(3725) == "1:02:05"
+    assert format_duration(65) == "1:05"
+    assert format_duration(None) == ""
+
+
+def test_batch_estimate_follows_measured_speed(history):
+    for _ in range(3):
+        history.record(job(timings={"clone": 10, "archive": 4}))
+    estimator = BatchEstimator(history, {"clone": 1, "archive": 1, "replicate": 1})
+    first, second = job(), job()
+    assert estimator.remaining() is None
+    estimator.add(first)
+    estimator.add(second)
+    
+    # Engpass Clone (2 x 10 s) plus ein Archiv (4 s)
+    assert estimator.remaining() == 24
+    
+    first.timings = {"clone": 20, "archive": 8}
+    estimator.finish(first)
+    # Der fertige Job war doppelt so langsam wie vorhergesagt
+    assert estimator.remaining() == 28
+    
+    second.timings = {"clone": 20, "archive": 8}
+    estimator.finish(second)
+    assert estimator.remaining() == 0.0
+    assert (estimator.jobs, estimator.finished, estimator.unknown) == (2, 2, 0)
\ No newline at end of file
@@ -0,0 +1,76 @@
+# tests/test_job_queue.py
+
+"""
+Tests für JobQueue: jeder Job muss einen Endzustand erreichen, Fortschritt wird gebündelt gemeldet.
+"""
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+from src.core.backup_job import BackupJob
+from src.core.job_queue import JobQueue, JobState
+from src.ui.jobs_view import JobsTableModel
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+class RaisingJob(BackupJob):
+    def run(self, progress=None):
+        raise RuntimeError("boom")
+
+
+class ProgressJob(BackupJob):
+    def run(self, progress=None):
+        for step in range(500):
+            progress(f"step {step}", step / 5, "1 MiB/s")
+        return True, "done"
+
+
+def test_raising_job_is_reported_failed(app, tmp_path):
+    queue = JobQueue()
+    job_id = queue.submit(RaisingJob("https://example.com/a.git", "a", str(tmp_path)))
+    assert queue.wait_for_done(10000)
+    state = queue.jobs[job_id]
+    assert state.status == "failed"
+    assert "boom" in state.message
+    assert state.finished_at is not None
+    assert queue._active == 0
+    assert not queue._flush_timer.isActive()
+
+
+def test_progress_of_many_jobs_is_coalesced(app, tmp_path):
+    queue = JobQueue(max_concurrent=4)
+    model = JobsTableModel(queue)
+    batches, changed, inserted = [], [], []
+    queue.jobs_updated.connect(batches.append)
+    model.dataChanged.connect(lambda first, last: changed.append((first.row(), last.row())))
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    
+    ids = [queue.submit(ProgressJob("https://example.com/r.git", f"r{i}", str(tmp_path))) for i in range(20)]
+    assert queue.wait_for_done(10000)
+    
+    # Ohne Event-Loop lief kein Timer: 20 x 500 Meldungen ergeben genau ein Signal
+    assert batches == [ids]
+    assert inserted == [(0, 19)]
+    assert changed == [(0, 19)]
+    assert model.rowCount() == 20
+    for job_id in ids:
+        state = queue.jobs[job_id]
+        assert (state.status, state.phase, state.percent, state.message) == ("finished", "step 499", 100.0, "done")
+    assert queue.counts() == {"queued": 0, "running": 0, "finished": 20, "failed": 0}
+    assert not queue.backup_jobs
+
+
+def test_job_eta_uses_queue_correction(app):
+    queue = JobQueue()
+    state = JobState(1, "a", "https://example.com/a.git")
+    state.predicted_seconds = 100.0
+    queue.jobs[1] = state
+    queue.order.append(1)
+    queue._predicted_total, queue._actual_total = 50.0, 100.0
+    
+    assert queue.correction_factor() == 2.0
+    assert JobsTableModel(queue)._cell_text(state, 5) == "3:20"
+    assert queue.batch_eta() == 200.0
\ No newline at end of file
@@ -0,0 +1,91 @@
+# tests/test_log_index.py
+
+"""
+Tests für LogIndex: inkrementelles Indizieren angehängter Zeilen und Filter.
+"""
+
+from src.core.log_index import LogIndex
+
+
+def append(path, text):
+    with open(path, "ab") as f:
+        f.write(text.encode())
+
+
+def test_only_complete_appended_lines_are_indexed(work_dir):
+    log = str(work_dir / "log.txt")
+    append(log, "[10:00] [INFO] first\n[10:01] [ERROR] sec")
+    index = LogIndex(log)
+    
+    assert index.update() == 1
+    assert index.line(0) == "[10:00] [INFO] first"
+    
+    append(log, "ond\r\n[10:02] [SUCCESS] third\n")
+    assert index.update() == 2
+    assert len(index) == 3
+    assert index.line(1) == "[10:01] [ERROR] second"
+    assert index.line(2) == "[10:02] [SUCCESS] third"
+    assert index.update() == 0
+    index.close()
+
+
+def test_update_is_limited_to_a_batch(work_dir):
+    log = str(work_dir / "log.txt")
+    append(log, "".join(f"line {i:04d}\n" for i in range(100)))
+    index = LogIndex(log, batch_bytes=100)
+    
+    assert index.update() == 10
+    assert index.has_pending
+    while index.has_pending:
+        index.update()
+    assert len(index) == 100
+    assert index.line(99) == "line 0099"
+    index.close()
+
+
+def test_line_longer_than_the_batch_is_indexed(work_dir):
+    log = str(work_dir / "log.txt")
+    append(log, "x" * 1000 + "\nshort\n")
+    index = LogIndex(log, batch_bytes=64)
+    
+    assert index.update() >= 1
+    assert index.line(0) == "x" * 1000
+    index.close()
+
+
+def test_truncated_file_resets_the_index(work_dir):
+    log = str(work_dir / "log.txt")
+    append(log, "old one\nold two\n")
+    index = LogIndex(log)
+    index.update()
+    
+    with open(log, "wb") as f:
+        f.write(b"new\n")
+    
+    assert index.check_truncated()
+    assert len(index) == 0
+    assert index.update() == 1
+    assert index.line(0) == "new"
+    assert not index.check_truncated()
+    index.close()
+
+
+def test_missing_file_has_no_lines(work_dir):
+    index = LogIndex(str(work_dir / "missing.txt"))
+    
+    assert index.update() == 0
+    assert len(index) == 0
+
+
+def test_filter_by_level_and_text(work_dir):
+    log = str(work_dir / "log.txt")
+    append(log, "[10:00] [INFO] Cloning repo-a\n[10:01] [ERROR] Clone failed: Repo-B\n  traceback line\n")
+    index = LogIndex(log)
+    index.update()
+    
+    assert LogIndex.parse_level(index.raw_line(1)) == "ERROR"
+    assert LogIndex.parse_level(index.raw_line(2)) == ""
+    assert [n for n in range(3) if index.matches(n, levels={"ERROR"})] == [1]
+    assert [n for n in range(3) if index.matches(n, text=b"repo-b")] == [1]
+    assert [n for n in range(3) if index.matches(n, levels={"INFO", "ERROR"}, text=b"repo")] == [0, 1]
+    index.close()
\ No newline at end of file
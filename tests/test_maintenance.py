@@ -0,0 +1,89 @@
+# tests/test_maintenance.py
+
+"""
+Tests für MaintenanceManager: Commit-Graph und Bitmap schreiben, unveränderte Clones überspringen.
+"""
+
+import os
+import glob
+import json
+import subprocess
+import pytest
+from src.core.maintenance import MaintenanceManager
+
+
+def git(cwd, *args):
+    subprocess.run(
+        ["git", "-C", str(cwd), "-c", "user.name=Test", "-c", "user.email=test@example.com"] + list(args),
+        check=True, capture_output=True
+    )
+
+
+def commit(repo, name):
+    with open(os.path.join(repo, name), "w") as f:
+        f.write(name)
+    git(repo, "add", name)
+    git(repo, "commit", "-q", "-m", name)
+
+
+@pytest.fixture
+def backups(work_dir):
+    """Speicherort mit zwei Clones und einem Ordner ohne .git."""
+    root = work_dir / "backups"
+    for name in ("alpha", "beta"):
+        repo = str(root / name)
+        git(work_dir, "init", "-q", repo)
+        commit(repo, "a.txt")
+        commit(repo, "b.txt")
+    os.makedirs(root / "not-a-repo")
+    return str(root)
+
+
+def manager(work_dir):
+    return MaintenanceManager(workers=2, state_file=str(work_dir / "maintenance.json"))
+
+
+def test_find_repositories(backups, work_dir):
+    found = manager(work_dir).find_repositories(backups)
+    
+    assert [os.path.basename(path) for path in found] == ["alpha", "beta"]
+    assert manager(work_dir).find_repositories(found[0]) == [found[0]]
+
+
+def test_maintenance_writes_commit_graph_and_bitmap(backups, work_dir):
+    maintenance = manager(work_dir)
+    repos = maintenance.find_repositories(backups)
+    calls = []
+    
+    success, msg = maintenance.maintain(repos, progress=lambda done, total: calls.append((done, total)))
+    
+    assert success, msg
+    assert msg.startswith("2 maintained, 0 unchanged, 0 failed")
+    assert calls[-1] == (2, 2)
+    objects = os.path.join(repos[0], ".git", "objects")
+    assert glob.glob(os.path.join(objects, "info", "commit-graph*"))
+    assert glob.glob(os.path.join(objects, "pack", "*.bitmap"))
+    assert not glob.glob(os.path.join(objects, "[0-9a-f][0-9a-f]", "*"))
+    with open(work_dir / "maintenance.json", encoding="utf-8") as f:
+        state = json.load(f)
+    assert sorted(state) == [os.path.abspath(repo) for repo in repos]
+    assert state[os.path.abspath(repos[0])]["bytes_after"] > 0
+
+
+def test_unchanged_repositories_are_skipped(backups, work_dir):
+    repos = manager(work_dir).find_repositories(backups)
+    assert manager(work_dir).maintain(repos)[0]
+    
+    assert manager(work_dir).maintain(repos)[1].startswith("0 maintained, 2 unchanged")
+    
+    commit(repos[1], "c.txt")
+    assert manager(work_dir).maintain(repos)[1].startswith("1 maintained, 1 unchanged")
+    assert manager(work_dir).maintain(repos, force=True)[1].startswith("2 maintained, 0 unchanged")
+
+
+def test_unreadable_repository_fails(backups, work_dir):
+    success, msg = manager(work_dir).maintain([os.path.join(backups, "not-a-repo")])
+    
+    assert not success
+    assert "1 failed" in msg
+    assert "Not a readable repository" in msg
\ No newline at end of file
@@ -0,0 +1,378 @@
+# tests/test_object_storage.py
+
+"""
+Tests für S3Client und S3Uploader gegen einen S3-kompatiblen Ersatzserver im
+selben Prozess: Multipart-Upload, Fortsetzung nach einem Abbruch und Ablehnung
+bei abweichendem ETag oder Prüfsumme.
+"""
+
+import os
+import re
+import hmac
+import json
+import base64
+import hashlib
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, quote, unquote
+from xml.etree import ElementTree
+from config import OBJECT_STORAGE
+from src.core import object_storage
+from src.core.logger import Logger
+from src.core.object_storage import S3Client, S3Uploader, StorageError
+
+
+ACCESS_KEY = "test-access"
+SECRET_KEY = "test-secret"
+REGION = "us-east-1"
+BUCKET = "backups"
+PART = 1024 * 1024
+
+
+class S3StandIn(ThreadingHTTPServer):
+    """
+    Minimaler S3-Server: prüft Signature V4, Content-MD5 und x-amz-content-sha256
+    und speichert Objekte und Multipart-Uploads im Speicher.
+    
+    Fehler zum Testen: ``fail_parts`` (Teilnummern, die einmal mit 500 scheitern),
+    ``bad_etag`` (falscher ETag in der Antwort), ``corrupt`` (Inhalt kommt verändert an).
+    """
+    
+    daemon_threads = True
+    
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), S3Handler)
+        self.lock = threading.Lock()
+        self.objects = {}
+        self.uploads = {}
+        self.aborted = []
+        self.requests = []
+        self.fail_parts = set()
+        self.bad_etag = False
+        self.corrupt = False
+        self.list_page = 2
+    
+    @property
+    def endpoint(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class S3Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def do_PUT(self):
+        self.handle_request("PUT")
+    
+    def do_POST(self):
+        self.handle_request("POST")
+    
+    def do_GET(self):
+        self.handle_request("GET")
+    
+    def do_DELETE(self):
+        self.handle_request("DELETE")
+    
+    def do_HEAD(self):
+        self.handle_request("HEAD")
+    
+    def handle_request(self, method):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        path, _, query_string = self.path.partition("?")
+        query = dict(parse_qsl(query_string, keep_blank_values=True))
+        server = self.server
+        with server.lock:
+            server.requests.append((method, query))
+        
+        if server.corrupt and body:
+            body = bytes([body[0] ^ 0xFF]) + body[1:]
+        md5 = self.headers.get("Content-MD5")
+        if md5 and base64.b64decode(md5) != hashlib.md5(body).digest():
+            return self.error(400, "BadDigest", "The Content-MD5 you specified did not match what we received.")
+        if self.headers.get("x-amz-content-sha256") != hashlib.sha256(body).hexdigest():
+            return self.error(400, "XAmzContentSHA256Mismatch", "The provided x-amz-content-sha256 header does not match.")
+        if not self.signature_valid(method, path, query):
+            return self.error(403, "SignatureDoesNotMatch", "The request signature we calculated does not match.")
+        
+        bucket, _, key = unquote(path).lstrip("/").partition("/")
+        if bucket != BUCKET:
+            return self.error(404, "NoSuchBucket", bucket)
+        with server.lock:
+            if method == "PUT" and "partNumber" in query:
+                return self.upload_part(key, query, body)
+            if method == "PUT":
+                server.objects[key] = body
+                return self.reply(200, etag=self.etag(hashlib.md5(body).hexdigest()))
+            if method == "POST" and "uploads" in query:
+                upload_id = f"upload-{len(server.uploads) + len(server.aborted) + 1}"
+                server.uploads[upload_id] = {"key": key, "parts": {}}
+                return self.reply(200, f"<InitiateMultipartUploadResult><UploadId>{upload_id}</UploadId></InitiateMultipartUploadResult>")
+            if method == "POST":
+                return self.complete(key, query, body)
+            if method == "GET" and "uploadId" in query:
+                return self.list_parts(key, query)
+            if method == "DELETE":
+                if server.uploads.pop(query.get("uploadId"), None) is None:
+                    return self.error(404, "NoSuchUpload", "no such upload")
+                server.aborted.append(query["uploadId"])
+                return self.reply(204)
+            if method == "HEAD":
+                if key not in server.objects:
+                    return self.reply(404)
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(server.objects[key])))
+                self.end_headers()
+                return
+        return self.error(400, "InvalidRequest", f"{method} {self.path}")
+    
+    def upload_part(self, key, query, body):
+        upload = self.server.uploads.get(query.get("uploadId"))
+        if upload is None or upload["key"] != key:
+            return self.error(404, "NoSuchUpload", "no such upload")
+        number = int(query["partNumber"])
+        if number in self.server.fail_parts:
+            self.server.fail_parts.discard(number)
+            return self.error(500, "InternalError", "part lost")
+        upload["parts"][number] = body
+        return self.reply(200, etag=self.etag(hashlib.md5(body).hexdigest()))
+    
+    def list_parts(self, key, query):
+        upload = self.server.uploads.get(query["uploadId"])
+        if upload is None or upload["key"] != key:
+            return self.error(404, "NoSuchUpload", "no such upload")
+        numbers = [n for n in sorted(upload["parts"]) if n > int(query.get("part-number-marker", 0))]
+        page, rest = numbers[:self.server.list_page], numbers[self.server.list_page:]
+        parts = "".join(
+            f"<Part><PartNumber>{n}</PartNumber><ETag>\"{hashlib.md5(upload['parts'][n]).hexdigest()}\"</ETag></Part>"
+            for n in page
+        )
+        more = f"<IsTruncated>true</IsTruncated><NextPartNumberMarker>{page[-1]}</NextPartNumberMarker>" if rest else "<IsTruncated>false</IsTruncated>"
+        return self.reply(200, f"<ListPartsResult xmlns=\"http://s3.amazonaws.com/doc/2006-03-01/\">{parts}{more}</ListPartsResult>")
+    
+    def complete(self, key, query, body):
+        upload = self.server.uploads.get(query.get("uploadId"))
+        if upload is None or upload["key"] != key:
+            return self.error(404, "NoSuchUpload", "no such upload")
+        requested = [
+            (int(part.findtext("PartNumber")), part.findtext("ETag").strip('"'))
+            for part in ElementTree.fromstring(body).iter("Part")
+        ]
+        digests = []
+        for number, etag in requested:
+            data = upload["parts"].get(number)
+            if data is None or hashlib.md5(data).hexdigest() != etag:
+                return self.error(400, "InvalidPart", f"part {number}")
+            digests.append(hashlib.md5(data).digest())
+        self.server.objects[key] = b"".join(upload["parts"][number] for number, _ in requested)
+        del self.server.uploads[query["uploadId"]]
+        etag = f"{hashlib.md5(b''.join(digests)).hexdigest()}-{len(digests)}"
+        return self.reply(200, f"<CompleteMultipartUploadResult><ETag>{self.etag(etag)}</ETag></CompleteMultipartUploadResult>")
+    
+    def signature_valid(self, method, path, query):
+        match = re.fullmatch(
+            r"AWS4-HMAC-SHA256 Credential=([^/]+)/(\d{8})/([^/]+)/s3/aws4_request, SignedHeaders=([^,]+), Signature=([0-9a-f]{64})",
+            self.headers.get("Authorization", "")
+        )
+        if not match or match.group(1) != ACCESS_KEY or match.group(3) != REGION:
+            return False
+        date, signed_headers = match.group(2), match.group(4)
+        amz_date = self.headers.get("x-amz-date", "")
+        canonical_query = "&".join(
+            f"{quote(name, safe='-_.~')}={quote(value, safe='-_.~')}" for name, value in sorted(query.items())
+        )
+        canonical_headers = "".join(f"{name}:{self.headers.get(name, '').strip()}\n" for name in signed_headers.split(";"))
+        canonical_request = "\n".join([
+            method, path, canonical_query, canonical_headers, signed_headers, self.headers["x-amz-content-sha256"]
+        ])
+        string_to_sign = "\n".join([
+            "AWS4-HMAC-SHA256", amz_date, f"{date}/{REGION}/s3/aws4_request",
+            hashlib.sha256(canonical_request.encode()).hexdigest()
+        ])
+        key = f"AWS4{SECRET_KEY}".encode()
+        for part in (date, REGION, "s3", "aws4_request"):
+            key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+        expected = hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+        return "host" in signed_headers.split(";") and hmac.compare_digest(expected, match.group(5))
+    
+    def etag(self, value):
+        return "0" * 32 if self.server.bad_etag else value
+    
+    def error(self, status, code, message):
+        self.reply(status, f"<Error><Code>{code}</Code><Message>{message}</Message></Error>")
+    
+    def reply(self, status, text="", etag=None):
+        data = text.encode()
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", f"\"{etag}\"")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    """Ersatzserver; Teile ab 1 MiB, damit die Testdateien klein bleiben."""
+    monkeypatch.setattr(object_storage, "MIN_PART_SIZE", PART)
+    server = S3StandIn()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_uploader(server, workers=4):
+    client = S3Client(
+        endpoint=server.endpoint, bucket=BUCKET, region=REGION,
+        access_key=ACCESS_KEY, secret_key=SECRET_KEY, timeout=5, retries=0
+    )
+    return S3Uploader(client, prefix="repos/", part_size=PART, workers=workers, logger=Logger())
+
+
+def write_archive(name, size):
+    data = os.urandom(size)
+    with open(name, "wb") as f:
+        f.write(data)
+    return data
+
+
+def test_small_file_is_uploaded_in_one_request(s3):
+    data = write_archive("repo.manifest.json", 1000)
+    
+    success, message = make_uploader(s3).upload(["repo.manifest.json"])
+    
+    assert success, message
+    assert s3.objects["repos/repo.manifest.json"] == data
+    assert [method for method, _ in s3.requests] == ["PUT"]
+
+
+def test_multipart_upload(s3):
+    data = write_archive("repo.tar.zst", 3 * PART + 12345)
+    uploader = make_uploader(s3)
+    
+    success, message = uploader.upload(["repo.tar.zst"])
+    
+    assert success, message
+    assert s3.objects["repos/repo.tar.zst"] == data
+    assert uploader.stats == {"files": 1, "bytes": len(data), "parts": 4, "resumed_parts": 0}
+    assert not s3.uploads
+    assert not os.path.exists(f"repo.tar.zst{OBJECT_STORAGE['state_suffix']}")
+
+
+def test_volume_folder_is_uploaded_file_by_file(s3):
+    os.mkdir("repo.volumes")
+    first = write_archive(os.path.join("repo.volumes", "part-0001"), PART + 1)
+    second = write_archive(os.path.join("repo.volumes", "part-0002"), 10)
+    
+    success, message = make_uploader(s3).upload(["repo.volumes", "missing.zip"])
+    
+    assert success, message
+    assert s3.objects["repos/repo.volumes/part-0001"] == first
+    assert s3.objects["repos/repo.volumes/part-0002"] == second
+
+
+def test_interrupted_upload_is_resumed(s3):
+    data = write_archive("repo.tar.zst", 4 * PART + 100)
+    state_path = f"repo.tar.zst{OBJECT_STORAGE['state_suffix']}"
+    s3.fail_parts = {3}
+    
+    success, message = make_uploader(s3, workers=1).upload(["repo.tar.zst"])
+    
+    assert not success
+    assert "InternalError" in message
+    with open(state_path, encoding="utf-8") as f:
+        state = json.load(f)
+    assert state["key"] == "repos/repo.tar.zst"
+    assert sorted(s3.uploads[state["upload_id"]]["parts"]) == [1, 2]
+    
+    s3.requests.clear()
+    uploader = make_uploader(s3, workers=1)
+    success, message = uploader.upload(["repo.tar.zst"])
+    
+    assert success, message
+    assert "2 part(s) resumed" in message
+    assert s3.objects["repos/repo.tar.zst"] == data
+    assert uploader.stats["parts"] == 3
+    assert uploader.stats["resumed_parts"] == 2
+    sent = sorted(int(query["partNumber"]) for method, query in s3.requests if "partNumber" in query)
+    assert sent == [3, 4, 5]
+    assert not any("uploads" in query for _, query in s3.requests)
+    assert not os.path.exists(state_path)
+
+
+def test_stale_upload_with_other_part_size_is_aborted(s3):
+    data = write_archive("repo.tar.zst", 2 * PART + 1)
+    client = make_uploader(s3).client
+    stale_id = client.create_multipart_upload("repos/repo.tar.zst")
+    with open(f"repo.tar.zst{OBJECT_STORAGE['state_suffix']}", "w", encoding="utf-8") as f:
+        json.dump({"key": "repos/repo.tar.zst", "upload_id": stale_id, "part_size": 2 * PART}, f)
+    
+    success, message = make_uploader(s3).upload(["repo.tar.zst"])
+    
+    assert success, message
+    assert s3.aborted == [stale_id]
+    assert s3.objects["repos/repo.tar.zst"] == data
+
+
+def test_wrong_part_etag_is_rejected(s3):
+    write_archive("repo.tar.zst", 2 * PART + 1)
+    s3.bad_etag = True
+    
+    success, message = make_uploader(s3).upload(["repo.tar.zst"])
+    
+    assert not success
+    assert "BadDigest" in message
+    assert "repos/repo.tar.zst" not in s3.objects
+
+
+def test_wrong_object_etag_is_rejected(s3):
+    s3.bad_etag = True
+    
+    with pytest.raises(StorageError) as error:
+        make_uploader(s3).client.put_object("repos/repo.manifest.json", b"x" * 100)
+    
+    assert error.value.code == "BadDigest"
+
+
+def test_corrupted_part_is_rejected_by_checksum(s3):
+    write_archive("repo.tar.zst", 2 * PART + 1)
+    s3.corrupt = True
+    
+    success, message = make_uploader(s3).upload(["repo.tar.zst"])
+    
+    assert not success
+    assert "BadDigest (400)" in message
+    assert "repos/repo.tar.zst" not in s3.objects
+
+
+def test_wrong_secret_is_rejected(s3):
+    client = S3Client(
+        endpoint=s3.endpoint, bucket=BUCKET, region=REGION,
+        access_key=ACCESS_KEY, secret_key="wrong", timeout=5, retries=0
+    )
+    
+    with pytest.raises(StorageError) as error:
+        client.put_object("repos/x", b"data")
+    
+    assert error.value.code == "SignatureDoesNotMatch"
+
+
+def test_streaming_upload_of_growing_archive(s3, monkeypatch):
+    monkeypatch.setitem(OBJECT_STORAGE, "poll_seconds", 0.01)
+    uploader = make_uploader(s3)
+    upload = uploader.stream("repo.tar.zst.partial", "repo.tar.zst")
+    data = os.urandom(2 * PART + 500)
+    with open("repo.tar.zst.partial", "wb") as f:
+        for start in range(0, len(data), 256 * 1024):
+            f.write(data[start:start + 256 * 1024])
+            f.flush()
+    os.replace("repo.tar.zst.partial", "repo.tar.zst")
+    
+    success, message = upload.finish(True)
+    
+    assert success, message
+    assert s3.objects["repos/repo.tar.zst"] == data
+    assert uploader.stats["parts"] == 3
\ No newline at end of file
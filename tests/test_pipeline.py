@@ -0,0 +1,74 @@
+# tests/test_pipeline.py
+
+"""
+Tests für BackupPipeline: Fehler einzelner Jobs dürfen den Lauf nicht blockieren.
+"""
+
+import threading
+from src.core.pipeline import BackupPipeline
+
+
+class FakeJob:
+    """Minimaler Ersatz für BackupJob mit wählbaren Fehlern pro Stufe."""
+    
+    def __init__(self, name, fail_stage=None):
+        self.folder_name = name
+        self.fail_stage = fail_stage
+    
+    def set_progress(self, progress):
+        pass
+    
+    def _maybe_fail(self, stage):
+        if self.fail_stage == stage:
+            raise RuntimeError(f"{stage} exploded")
+    
+    def clone_stage(self):
+        self._maybe_fail("clone")
+        return True, "cloned"
+    
+    def archive_stage(self):
+        self._maybe_fail("archive")
+    
+    def replicate_stage(self):
+        self._maybe_fail("replicate")
+    
+    def finish(self, success, message):
+        self._maybe_fail("finish")
+        return success, message
+
+
+def run_pipeline(jobs, on_result=None):
+    pipeline = BackupPipeline(clone_workers=2, archive_workers=1, post_workers=1, queue_size=1)
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(pipeline.run(jobs, on_result=on_result)), daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+    assert not thread.is_alive(), "pipeline hung"
+    return result
+
+
+def test_raising_result_callback_does_not_hang():
+    calls = []
+    
+    def on_result(job, success, message):
+        calls.append(job.folder_name)
+        if len(calls) == 1:
+            raise RuntimeError("callback exploded")
+    
+    counts = run_pipeline([FakeJob(f"repo{i}") for i in range(10)], on_result)
+    assert counts == {"finished": 10, "failed": 0}
+    assert len(calls) == 10
+
+
+def test_stage_exceptions_count_as_failed():
+    jobs = [FakeJob("ok1"), FakeJob("clone", "clone"), FakeJob("replicate", "replicate"),
+            FakeJob("finish", "finish"), FakeJob("ok2")]
+    results = {}
+    counts = run_pipeline(jobs, lambda job, success, message: results.__setitem__(job.folder_name, success))
+    assert counts == {"finished": 2, "failed": 3}
+    assert results == {"ok1": True, "clone": False, "replicate": False, "finish": False, "ok2": True}
+
+
+def test_archive_exception_keeps_backup():
+    counts = run_pipeline([FakeJob("archive", "archive")])
+    assert counts == {"finished": 1, "failed": 0}
\ No newline at end of file
@@ -0,0 +1,92 @@
+# tests/test_profile_store.py
+
+"""
+Tests für ProfileStore: nur geänderte Profile werden geschrieben, Lookups und Paging.
+"""
+
+import sqlite3
+from src.core.profile_store import ProfileStore, RepositoryProfile
+
+
+def profile(n, **kwargs):
+    return RepositoryProfile(f"https://example.com/repo{n:03d}.git", f"repo{n:03d}", "/backups", **kwargs)
+
+
+def updated_at(db_file):
+    with sqlite3.connect(db_file) as connection:
+        return dict(connection.execute("SELECT url, updated_at FROM profiles"))
+
+
+def test_save_writes_only_changed_profiles(work_dir):
+    db_file = str(work_dir / "profiles.db")
+    store = ProfileStore(db_file)
+    for n in range(5):
+        store.put(profile(n))
+    assert store.save() == (True, "Profiles saved: 5 updated, 0 deleted")
+    before = updated_at(db_file)
+    
+    changed = store.get("https://example.com/repo002.git")
+    changed.strategy = "overwrite"
+    store.put(changed)
+    store.delete("https://example.com/repo004.git")
+    
+    assert store.save() == (True, "Profiles saved: 1 updated, 1 deleted")
+    assert store.save() == (True, "No changes")
+    after = updated_at(db_file)
+    assert "https://example.com/repo004.git" not in after
+    assert after["https://example.com/repo002.git"] != before["https://example.com/repo002.git"]
+    assert all(after[url] == before[url] for url in after if not url.endswith("repo002.git"))
+    store.close()
+
+
+def test_profiles_persist_across_instances(work_dir):
+    db_file = str(work_dir / "profiles.db")
+    store = ProfileStore(db_file)
+    store.put(profile(1, strategy="overwrite", options={"create_zip": True, "archive_format": "tar.zst"}))
+    store.close()
+    
+    loaded = ProfileStore(db_file).get("https://example.com/repo001.git")
+    
+    assert loaded.folder_name == "repo001"
+    assert loaded.strategy == "overwrite"
+    assert loaded.options["archive_format"] == "tar.zst"
+    assert loaded.options["create_zip"] is True
+    job = loaded.to_job()
+    assert not job.add_backup
+    assert job.archive_format == "tar.zst"
+
+
+def test_deleted_profile_is_hidden_before_save(work_dir):
+    store = ProfileStore(str(work_dir / "profiles.db"))
+    store.put(profile(1))
+    store.save()
+    
+    store.delete("https://example.com/repo001.git")
+    
+    assert store.get("https://example.com/repo001.git") is None
+    assert store.count() == 0
+    store.close()
+
+
+def test_add_many_keeps_existing_profiles(work_dir):
+    store = ProfileStore(str(work_dir / "profiles.db"))
+    store.put(profile(1, strategy="overwrite"))
+    
+    added = store.add_many([profile(n) for n in range(3)])
+    
+    assert added == 2
+    assert store.count() == 3
+    assert store.get("https://example.com/repo001.git").strategy == "overwrite"
+    store.close()
+
+
+def test_lookup_by_folder_and_paging(work_dir):
+    store = ProfileStore(str(work_dir / "profiles.db"))
+    store.add_many([profile(n) for n in range(25)])
+    store.put(RepositoryProfile("https://mirror.example.com/repo007.git", "repo007", "/mirror"))
+    
+    assert sorted(p.target_path for p in store.find_by_folder("repo007")) == ["/backups", "/mirror"]
+    urls = [p.github_url for p in store.iter_profiles(batch_size=4)]
+    assert len(urls) == 26
+    assert urls == sorted(urls)
+    store.close()
\ No newline at end of file
@@ -0,0 +1,104 @@
+# tests/test_replication.py
+
+"""
+Tests für Replicator und fast_copy: Kopien in mehrere Ziele, Prüfung am Ziel, atomares Ersetzen.
+"""
+
+import os
+import sys
+import pytest
+from src.core import replication
+from src.core.replication import Replicator, fast_copy
+
+
+def write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@pytest.fixture
+def backup(work_dir):
+    """Backup-Ordner mit Unterordner und Symlink sowie ein Archiv."""
+    folder = str(work_dir / "src" / "repo")
+    write(os.path.join(folder, "a.bin"), os.urandom(300 * 1024))
+    write(os.path.join(folder, "sub", "b.txt"), b"nested")
+    os.symlink("a.bin", os.path.join(folder, "alias"))
+    os.utime(os.path.join(folder, "sub", "b.txt"), (1_000_000, 1_000_000))
+    archive = str(work_dir / "src" / "repo.zip")
+    write(archive, b"archive")
+    return folder, archive
+
+
+def test_backup_is_replicated_to_every_target(work_dir, backup):
+    folder, archive = backup
+    targets = [str(work_dir / "disk1"), str(work_dir / "disk2")]
+    replicator = Replicator(targets, workers=3)
+    
+    success, msg = replicator.replicate([folder, archive, str(work_dir / "missing.json")])
+    
+    assert success, msg
+    for target in targets:
+        assert sorted(os.listdir(target)) == ["repo", "repo.zip"]
+        assert read(os.path.join(target, "repo", "a.bin")) == read(os.path.join(folder, "a.bin"))
+        assert read(os.path.join(target, "repo", "sub", "b.txt")) == b"nested"
+        assert os.readlink(os.path.join(target, "repo", "alias")) == "a.bin"
+        assert os.path.getmtime(os.path.join(target, "repo", "sub", "b.txt")) == 1_000_000
+        assert read(os.path.join(target, "repo.zip")) == b"archive"
+    assert replicator.stats["bytes"] == 2 * (300 * 1024 + len(b"nested") + len(b"archive"))
+    assert sum(count for name, count in replicator.stats.items() if name != "bytes") == 6
+
+
+def test_previous_replica_is_replaced(work_dir, backup):
+    folder, _ = backup
+    write(str(work_dir / "disk" / "repo" / "stale.txt"), b"old")
+    
+    success, msg = Replicator([str(work_dir / "disk")]).replicate([folder])
+    
+    assert success, msg
+    assert not os.path.exists(work_dir / "disk" / "repo" / "stale.txt")
+    assert read(str(work_dir / "disk" / "repo" / "sub" / "b.txt")) == b"nested"
+
+
+def test_corrupted_copy_fails_and_keeps_previous_replica(work_dir, backup, monkeypatch):
+    folder, archive = backup
+    write(str(work_dir / "disk" / "repo.zip"), b"previous")
+    original = replication.fast_copy
+    
+    def corrupting_copy(source, target):
+        method = original(source, target)
+        if source.endswith("b.txt"):
+            write(target, b"NESTED")
+        return method
+    
+    monkeypatch.setattr(replication, "fast_copy", corrupting_copy)
+    success, msg = Replicator([str(work_dir / "disk")]).replicate([folder, archive])
+    
+    assert not success
+    assert "checksum mismatch" in msg
+    assert os.listdir(work_dir / "disk") == ["repo.zip"]
+    assert read(str(work_dir / "disk" / "repo.zip")) == b"previous"
+
+
+def test_nothing_to_replicate(work_dir):
+    assert Replicator([]).replicate([str(work_dir)]) == (True, "Nothing to replicate")
+    assert Replicator([str(work_dir / "disk")]).replicate([str(work_dir / "missing")]) == (True, "Nothing to replicate")
+
+
+def test_fast_copy_uses_the_kernel_and_falls_back(work_dir, monkeypatch):
+    data = os.urandom(1024 * 1024 + 7)
+    write(str(work_dir / "source.bin"), data)
+    
+    method = fast_copy(str(work_dir / "source.bin"), str(work_dir / "kernel.bin"))
+    assert read(str(work_dir / "kernel.bin")) == data
+    if sys.platform.startswith("linux"):
+        assert method in ("reflink", "copy_file_range", "sendfile")
+    
+    monkeypatch.setattr(replication, "_kernel_copy", lambda src_fd, dst_fd, size: None)
+    assert fast_copy(str(work_dir / "source.bin"), str(work_dir / "plain.bin")) == "copy"
+    assert read(str(work_dir / "plain.bin")) == data
\ No newline at end of file
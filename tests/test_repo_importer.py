@@ -0,0 +1,107 @@
+# tests/test_repo_importer.py
+
+"""
+Tests für RepositoryImporter: Deduplizierung nach normalisierter URL,
+blockweises Lesen von Text, CSV, JSON und Bare-Repositories.
+"""
+
+import os
+import json
+import subprocess
+import pytest
+from config import IMPORT
+from src.core.profile_store import ProfileStore
+from src.core.repo_importer import RepositoryImporter
+
+
+def import_urls(tmp_path, urls):
+    importer = RepositoryImporter(ProfileStore(str(tmp_path / "profiles.db")))
+    success, message = importer.import_entries(((url, None, None) for url in urls), str(tmp_path), validate=False)
+    assert success, message
+    return importer.stats
+
+
+def test_case_sensitive_paths_are_distinct(tmp_path):
+    stats = import_urls(tmp_path, [
+        "https://git.example.com/Team/Repo",
+        "https://git.example.com/team/repo",
+        "/srv/git/Repo",
+        "/srv/git/repo",
+    ])
+    expected_duplicates = 1 if os.path.normcase("A") == "a" else 0
+    assert stats["duplicate"] == expected_duplicates
+
+
+def test_case_insensitive_hosts_and_ssh_are_merged(tmp_path):
+    stats = import_urls(tmp_path, [
+        "https://github.com/Owner/Repo.git",
+        "https://GitHub.com/owner/repo/",
+        "git@github.com:owner/repo.git",
+    ])
+    assert stats["duplicate"] == 2
+
+
+def write(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def entries(tmp_path, name, text):
+    write(str(tmp_path / name), text)
+    return list(RepositoryImporter(None).iter_file(str(tmp_path / name)))
+
+
+def test_all_file_formats_yield_the_same_entries(tmp_path, monkeypatch):
+    # Kleine Blöcke: JSON-Elemente werden über Blockgrenzen hinweg zusammengesetzt
+    monkeypatch.setitem(IMPORT, "json_chunk_size", 16)
+    expected = [
+        ("https://github.com/o/a.git", None, None),
+        ("https://github.com/o/b.git", "bee", "/backups/b"),
+    ]
+    
+    text = "# Kommentar\n\nhttps://github.com/o/a.git\nhttps://github.com/o/b.git extra\n"
+    assert entries(tmp_path, "list.txt", text) == [expected[0], ("https://github.com/o/b.git", None, None)]
+    csv_text = "folder_name,url,target_path\n,https://github.com/o/a.git,\nbee,https://github.com/o/b.git,/backups/b\n"
+    assert entries(tmp_path, "list.csv", csv_text) == expected
+    assert entries(tmp_path, "list.json", json.dumps([
+        "https://github.com/o/a.git",
+        {"github_url": "https://github.com/o/b.git", "folder_name": "bee", "target_path": "/backups/b"},
+    ], indent=2)) == expected
+    assert entries(tmp_path, "list.jsonl", "\n".join(json.dumps(value) for value in [
+        {"url": "https://github.com/o/a.git"},
+        {"url": "https://github.com/o/b.git", "folder_name": "bee", "target_path": "/backups/b"},
+    ])) == expected
+    with pytest.raises(ValueError):
+        entries(tmp_path, "object.json", '{"url": "https://github.com/o/a.git"}')
+
+
+def test_entries_are_stored_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setitem(IMPORT, "batch_size", 2)
+    store = ProfileStore(str(tmp_path / "profiles.db"))
+    write(str(tmp_path / "list.txt"), "\n".join(f"https://github.com/o/r{i}.git" for i in range(5)) + "\n")
+    calls = []
+    importer = RepositoryImporter(store)
+    
+    success, msg = importer.import_file(str(tmp_path / "list.txt"), "/backups", validate=False, progress=calls.append)
+    
+    assert success, msg
+    assert msg == "Imported 5 repositories (0 existing, 0 duplicates, 0 invalid)"
+    assert calls == [2, 4, 5]
+    assert store.count() == 5
+    assert store.get("https://github.com/o/r3").folder_name == "o_r3"
+    
+    assert importer.import_file(str(tmp_path / "list.txt"), "/backups", validate=False)[0]
+    assert (importer.stats["imported"], importer.stats["existing"]) == (0, 5)
+
+
+def test_bare_repositories_are_found(tmp_path):
+    for path in ("mirrors/team/app.git", "mirrors/lib.git"):
+        subprocess.run(["git", "init", "-q", "--bare", str(tmp_path / path)], check=True)
+    os.makedirs(tmp_path / "mirrors" / "empty")
+    
+    found = list(RepositoryImporter(None).iter_bare_repositories(str(tmp_path / "mirrors")))
+    
+    assert found == [
+        (str(tmp_path / "mirrors" / "lib.git"), "mirrors_lib", None),
+        (str(tmp_path / "mirrors" / "team" / "app.git"), "team_app", None),
+    ]
\ No newline at end of file
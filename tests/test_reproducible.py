@@ -0,0 +1,97 @@
+# tests/test_reproducible.py
+
+"""
+Tests für reproduzierbare Archive: zwei Läufe über denselben Stand ergeben byte-identische Dateien.
+"""
+
+import os
+import time
+import subprocess
+import zipfile
+import pytest
+from src.core.archive_manager import ArchiveManager
+from src.core.reproducible import ZIP_EPOCH
+
+MTIME = 1_700_000_000
+
+
+def write(path, text, mode=0o644):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+    os.chmod(path, mode)
+
+
+def make_tree(root, reverse=False):
+    """Gleicher Inhalt; Reihenfolge, Rechte und Zeitstempel hängen vom Lauf ab."""
+    files = [("a.txt", "alpha"), ("sub/b.txt", "beta"), ("sub/deep/c.txt", "gamma"), ("z.sh", "#!/bin/sh\n")]
+    for name, text in reversed(files) if reverse else files:
+        path = os.path.join(root, name)
+        executable = name.endswith(".sh")
+        write(path, text, (0o700 if reverse else 0o755) if executable else (0o600 if reverse else 0o664))
+        os.utime(path, (1000 if reverse else 2000,) * 2)
+    return root
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def build(manager, archive_format, source, output):
+    if archive_format == "zip":
+        return manager.create_incremental_zip_archive(source, output, mtime=MTIME)
+    if archive_format == "tar.zst":
+        return manager.create_tar_zstd_archive(source, output, mtime=MTIME)
+    return manager.create_volume_archive(source, output, volume_size=64, workers=2, mtime=MTIME)
+
+
+def archive_bytes(path):
+    if os.path.isdir(path):
+        return {name: read(os.path.join(path, name)) for name in sorted(os.listdir(path))}
+    return read(path)
+
+
+@pytest.mark.parametrize("archive_format", ["zip", "tar.zst", "volumes"])
+def test_two_runs_are_byte_identical(work_dir, archive_format):
+    first = make_tree(str(work_dir / "one" / "repo"))
+    second = make_tree(str(work_dir / "two" / "repo"), reverse=True)
+    manager = ArchiveManager()
+    
+    assert build(manager, archive_format, first, str(work_dir / "first"))[0]
+    assert build(manager, archive_format, second, str(work_dir / "second"))[0]
+    
+    assert archive_bytes(str(work_dir / "first")) == archive_bytes(str(work_dir / "second"))
+    
+    assert build(manager, archive_format, first, str(work_dir / "plain"))[0]
+    os.utime(os.path.join(first, "a.txt"), (5000, 5000))
+    assert build(manager, archive_format, first, str(work_dir / "again"))[0]
+    assert archive_bytes(str(work_dir / "plain")) == archive_bytes(str(work_dir / "again"))
+
+
+def test_zip_members_are_normalized(work_dir):
+    source = make_tree(str(work_dir / "repo"), reverse=True)
+    
+    assert ArchiveManager().create_incremental_zip_archive(source, str(work_dir / "out.zip"), mtime=0)[0]
+    
+    with zipfile.ZipFile(work_dir / "out.zip") as zipf:
+        infos = {info.filename: info for info in zipf.infolist() if not info.filename.startswith(".")}
+    assert infos["z.sh"].external_attr >> 16 & 0o777 == 0o755
+    assert infos["a.txt"].external_attr >> 16 & 0o777 == 0o644
+    # Vor 1980 kann ZIP nicht darstellen: ZIP_EPOCH
+    assert infos["a.txt"].date_time == time.gmtime(ZIP_EPOCH)[:6]
+
+
+def test_source_date_epoch(work_dir, monkeypatch):
+    manager = ArchiveManager()
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    repo = str(work_dir / "repo")
+    env = dict(os.environ, GIT_AUTHOR_DATE="@1600000000 +0000", GIT_COMMITTER_DATE="@1600000000 +0000")
+    git = ["git", "-C", repo, "-c", "user.name=Test", "-c", "user.email=test@example.com"]
+    subprocess.run(["git", "init", "-q", repo], check=True)
+    
+    assert manager.source_date_epoch(repo) == ZIP_EPOCH
+    subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", "init"], check=True, env=env)
+    assert manager.source_date_epoch(repo) == 1_600_000_000
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1234567890")
+    assert manager.source_date_epoch(repo) == 1_234_567_890
\ No newline at end of file
@@ -0,0 +1,181 @@
+# tests/test_restore.py
+
+"""
+Round-Trip-Tests für RestoreManager: Archiv erstellen, wiederherstellen, vergleichen.
+"""
+
+import io
+import os
+import tarfile
+import stat
+import pytest
+from src.core.archive_manager import ArchiveManager
+from src.core.encryption import generate_key
+from src.core.file_manager import FileManager
+from src.core.restore import IntegrityError, RestoreManager
+
+
+def make_tree(root):
+    """Ordner mit a.txt, c.txt und dem Hardlink sub/b.txt -> a.txt."""
+    os.makedirs(os.path.join(root, "sub"))
+    with open(os.path.join(root, "a.txt"), "w") as f:
+        f.write("shared content")
+    with open(os.path.join(root, "c.txt"), "w") as f:
+        f.write("other")
+    os.link(os.path.join(root, "a.txt"), os.path.join(root, "sub", "b.txt"))
+    return root
+
+
+def read(path):
+    with open(path) as f:
+        return f.read()
+
+
+def add_file(tar, name, data):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    tar.addfile(info, io.BytesIO(data))
+
+
+def test_tar_zst_restores_hard_links(work_dir):
+    source = make_tree(str(work_dir / "src"))
+    success, archive = ArchiveManager().create_tar_zstd_archive(source)
+    assert success
+    with RestoreManager()._open_tar(archive) as (tar, _):
+        assert any(member.islnk() for member in tar)
+    
+    manager = RestoreManager()
+    success, msg = manager.restore(archive, str(work_dir / "out"))
+    assert success, msg
+    assert manager.stats["files"] == 3
+    assert read(work_dir / "out" / "a.txt") == "shared content"
+    assert read(work_dir / "out" / "sub" / "b.txt") == "shared content"
+    assert read(work_dir / "out" / "c.txt") == "other"
+
+
+def test_tar_restores_hard_link_outside_selected_path(work_dir):
+    source = make_tree(str(work_dir / "src"))
+    success, archive = ArchiveManager().create_tar_zstd_archive(source)
+    assert success
+    
+    manager = RestoreManager()
+    success, msg = manager.restore(archive, str(work_dir / "out"), path="sub")
+    assert success, msg
+    assert manager.stats["files"] == 1
+    assert read(work_dir / "out" / "sub" / "b.txt") == "shared content"
+    assert not os.path.exists(work_dir / "out" / "a.txt")
+
+
+def test_tar_symlink_cannot_redirect_writes_outside(work_dir):
+    outside = work_dir / "outside"
+    outside.mkdir()
+    archive = str(work_dir / "evil.tar")
+    with tarfile.open(archive, "w") as tar:
+        link = tarfile.TarInfo("link")
+        link.type = tarfile.SYMTYPE
+        link.linkname = str(outside)
+        tar.addfile(link)
+        add_file(tar, "link/evil.txt", b"escaped")
+    
+    success, msg = RestoreManager().restore(archive, str(work_dir / "out"))
+    assert not success
+    assert "Unsafe path" in msg
+    assert not os.path.exists(outside / "evil.txt")
+
+
+def test_tar_symlink_cannot_be_overwritten_through(work_dir):
+    outside = work_dir / "outside.txt"
+    outside.write_text("keep")
+    archive = str(work_dir / "evil.tar")
+    with tarfile.open(archive, "w") as tar:
+        link = tarfile.TarInfo("file")
+        link.type = tarfile.SYMTYPE
+        link.linkname = str(outside)
+        tar.addfile(link)
+        add_file(tar, "file", b"overwritten")
+    
+    success, _ = RestoreManager().restore(archive, str(work_dir / "out"))
+    assert not success
+    assert outside.read_text() == "keep"
+
+
+def test_tar_unsupported_member_fails_restore(work_dir):
+    archive = str(work_dir / "fifo.tar")
+    with tarfile.open(archive, "w") as tar:
+        add_file(tar, "a.txt", b"a")
+        fifo = tarfile.TarInfo("pipe")
+        fifo.type = tarfile.FIFOTYPE
+        tar.addfile(fifo)
+    
+    success, msg = RestoreManager().restore(archive, str(work_dir / "out"))
+    assert not success
+    assert "pipe" in msg
+
+
+def test_tar_relative_symlink_inside_destination_is_kept(work_dir):
+    archive = str(work_dir / "ok.tar")
+    with tarfile.open(archive, "w") as tar:
+        add_file(tar, "docs/readme.txt", b"hello")
+        link = tarfile.TarInfo("latest")
+        link.type = tarfile.SYMTYPE
+        link.linkname = "docs"
+        tar.addfile(link)
+    
+    success, msg = RestoreManager().restore(archive, str(work_dir / "out"))
+    assert success, msg
+    assert os.readlink(work_dir / "out" / "latest") == "docs"
+    assert read(work_dir / "out" / "latest" / "readme.txt") == "hello"
+
+
+def test_folder_round_trip_keeps_symlinks(work_dir):
+    source = make_tree(str(work_dir / "src"))
+    os.symlink("a.txt", os.path.join(source, "alias"))
+    
+    success, msg = RestoreManager().restore(source, str(work_dir / "out"))
+    assert success, msg
+    assert os.readlink(work_dir / "out" / "alias") == "a.txt"
+    assert read(work_dir / "out" / "sub" / "b.txt") == "shared content"
+
+
+def test_target_path_rejects_symlinked_parent(work_dir):
+    destination = work_dir / "out"
+    destination.mkdir()
+    (work_dir / "outside").mkdir()
+    os.symlink(str(work_dir / "outside"), str(destination / "link"))
+    
+    with pytest.raises(IntegrityError):
+        RestoreManager._target_path(str(destination), "link/evil.txt")
+    with pytest.raises(IntegrityError):
+        RestoreManager._target_path(str(destination), "../evil.txt")
+    assert RestoreManager._target_path(str(destination), "sub/ok.txt") == str(destination / "sub" / "ok.txt")
+
+
+def create_archive(archive_format, source):
+    manager = ArchiveManager()
+    if archive_format == "zip":
+        return FileManager().create_zip_archive(source)
+    if archive_format == "zip-incremental":
+        return manager.create_incremental_zip_archive(source)
+    if archive_format == "tar.zst":
+        return manager.create_tar_zstd_archive(source)
+    if archive_format == "tar.enc":
+        generate_key("backup.key")
+        return manager.create_encrypted_archive(source)
+    return manager.create_volume_archive(source, volume_size=1)
+
+
+@pytest.mark.parametrize("archive_format", ["zip", "zip-incremental", "tar.zst", "tar.enc", "volumes"])
+def test_restore_keeps_executable_bit(work_dir, archive_format):
+    source = make_tree(str(work_dir / "src"))
+    script = os.path.join(source, "run.sh")
+    with open(script, "w") as f:
+        f.write("#!/bin/sh\n")
+    os.chmod(script, 0o755)
+    os.chmod(os.path.join(source, "c.txt"), 0o640)
+    success, archive = create_archive(archive_format, source)
+    assert success, archive
+    
+    success, msg = RestoreManager().restore(archive, str(work_dir / "out"))
+    assert success, msg
+    assert stat.S_IMODE(os.stat(work_dir / "out" / "run.sh").st_mode) == 0o755
+    assert stat.S_IMODE(os.stat(work_dir / "out" / "c.txt").st_mode) == 0o640
\ No newline at end of file
@@ -0,0 +1,50 @@
+# tests/test_startup.py
+
+"""
+Tests für den Programmstart: keine Funktions-Module vor der Argument-Auswertung, StartupProfiler.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from src.core.startup_profiler import StartupProfiler
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_after(code):
+    """Module, die nach code in einem frischen Interpreter geladen sind."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys; {code}; print('\\n'.join(sys.modules))"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+def test_importing_main_loads_no_qt_or_feature_modules():
+    modules = loaded_after("import main")
+    for name in ("PySide6", "src.ui", "src.core.object_storage", "src.core.restore", "src.core.pipeline", "urllib.request"):
+        assert name not in modules
+
+
+def test_core_package_loads_classes_on_first_access():
+    modules = loaded_after("import src.core; src.core.RestoreManager")
+    assert "src.core.restore" in modules
+    assert "src.core.object_storage" not in modules
+    assert "PySide6" not in modules
+
+
+def test_startup_profiler_reports_phases():
+    profiler = StartupProfiler(enabled=True, start_time=time.perf_counter())
+    time.sleep(0.01)
+    profiler.mark("imports")
+    profiler.mark("show")
+    
+    assert [phase for phase, _ in profiler.phases] == ["imports", "show"]
+    assert profiler.phases[0][1] >= 0.01
+    assert profiler.report().splitlines()[-1].startswith("total")
+    
+    disabled = StartupProfiler()
+    disabled.mark("imports")
+    assert disabled.phases == []
\ No newline at end of file
@@ -0,0 +1,95 @@
+# tests/test_submodules.py
+
+"""
+Tests für SubmoduleManager: verschachtelte Submodule parallel klonen, mit Mirror-Cache.
+"""
+
+import os
+import subprocess
+import pytest
+from src.core.submodules import SubmoduleManager
+
+
+@pytest.fixture(autouse=True)
+def git_env(monkeypatch):
+    """Lokale Submodul-URLs erlauben und Commits ohne globale Git-Konfiguration."""
+    monkeypatch.setenv("GIT_CONFIG_COUNT", "1")
+    monkeypatch.setenv("GIT_CONFIG_KEY_0", "protocol.file.allow")
+    monkeypatch.setenv("GIT_CONFIG_VALUE_0", "always")
+    for role in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{role}_NAME", "Test")
+        monkeypatch.setenv(f"GIT_{role}_EMAIL", "test@example.com")
+
+
+def git(cwd, *args):
+    subprocess.run(["git", "-C", str(cwd)] + list(args), check=True, capture_output=True)
+
+
+def make_repo(path, files, submodules=()):
+    os.makedirs(path)
+    git(path, "init", "-q")
+    for name, text in files.items():
+        with open(os.path.join(path, name), "w") as f:
+            f.write(text)
+    git(path, "add", ".")
+    for url, sub_path in submodules:
+        git(path, "submodule", "add", "-q", str(url), sub_path)
+    git(path, "commit", "-q", "-m", "init")
+    return path
+
+
+@pytest.fixture
+def superproject(work_dir):
+    """top -> mid -> libs/leaf und top -> leaf (leaf wird von zwei Projekten geteilt)."""
+    leaf = make_repo(str(work_dir / "leaf"), {"leaf.txt": "leaf"})
+    mid = make_repo(str(work_dir / "mid"), {"mid.txt": "mid"}, [(leaf, "libs/leaf")])
+    top = make_repo(str(work_dir / "top"), {"top.txt": "top"}, [(mid, "mid"), (leaf, "leaf")])
+    clone = str(work_dir / "clone")
+    git(work_dir, "clone", "-q", top, clone)
+    return clone
+
+
+def read(path):
+    with open(path) as f:
+        return f.read()
+
+
+def test_nested_submodules_are_cloned(superproject, work_dir):
+    calls = []
+    manager = SubmoduleManager(jobs=4, cache_dir=str(work_dir / "cache"))
+    
+    success, msg = manager.clone_submodules(superproject, progress=lambda done, total: calls.append((done, total)))
+    
+    assert success, msg
+    assert msg == "3 submodules cloned"
+    assert read(os.path.join(superproject, "mid", "mid.txt")) == "mid"
+    assert read(os.path.join(superproject, "mid", "libs", "leaf", "leaf.txt")) == "leaf"
+    assert read(os.path.join(superproject, "leaf", "leaf.txt")) == "leaf"
+    assert calls[-1] == (3, 3)
+    # Das geteilte Submodul hat nur einen Mirror; die Klone hängen nicht vom Cache ab
+    assert len(os.listdir(work_dir / "cache")) == 2
+    modules = os.path.join(superproject, ".git", "modules", "leaf")
+    assert not os.path.exists(os.path.join(modules, "objects", "info", "alternates"))
+
+
+def test_submodules_without_cache(superproject):
+    success, msg = SubmoduleManager(jobs=1, cache_dir="").clone_submodules(superproject)
+    
+    assert success, msg
+    assert read(os.path.join(superproject, "mid", "libs", "leaf", "leaf.txt")) == "leaf"
+
+
+def test_failed_submodule_is_reported(superproject, work_dir):
+    git(superproject, "config", "-f", ".gitmodules", "submodule.leaf.url", str(work_dir / "missing"))
+    
+    success, msg = SubmoduleManager(jobs=2, cache_dir=str(work_dir / "cache")).clone_submodules(superproject)
+    
+    assert not success
+    assert msg.startswith("1 of 3 submodules failed")
+    assert read(os.path.join(superproject, "mid", "libs", "leaf", "leaf.txt")) == "leaf"
+
+
+def test_repository_without_submodules(work_dir):
+    repo = make_repo(str(work_dir / "plain"), {"a.txt": "a"})
+    
+    assert SubmoduleManager().clone_submodules(repo) == (True, "No submodules")
\ No newline at end of file
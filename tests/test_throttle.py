@@ -0,0 +1,103 @@
+# tests/test_throttle.py
+
+"""
+Tests für die Drosselung von Archiv-I/O und die Priorität von Git-Prozessen und Worker-Threads.
+"""
+
+import io
+import os
+import sys
+import time
+import tarfile
+import threading
+import zipfile
+import pytest
+from config import THROTTLE
+from src.core import throttle
+from src.core.throttle import ThrottledFile, TokenBucket, archive_open, lower_thread_priority, priority_command, tar_add, zip_write
+
+
+@pytest.fixture
+def archive_limit(monkeypatch):
+    """Archiv-I/O mit 1 MiB/s ohne Burst."""
+    monkeypatch.setattr(throttle, "_archive_bucket", TokenBucket(1024 * 1024, burst=0))
+
+
+def write(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def test_archive_io_is_unthrottled_without_limit(work_dir):
+    write("data.bin", b"x" * 10)
+    
+    with archive_open("data.bin") as f:
+        assert not isinstance(f, ThrottledFile)
+        assert f.read() == b"x" * 10
+
+
+def test_archive_reads_and_writes_are_throttled(work_dir, archive_limit):
+    write("data.bin", b"x" * 256 * 1024)
+    started = time.monotonic()
+    
+    with archive_open("data.bin") as source, archive_open("copy.bin", "wb") as target:
+        assert isinstance(source, ThrottledFile)
+        target.write(source.read())
+    
+    # 256 KiB gelesen + 256 KiB geschrieben bei 1 MiB/s
+    assert time.monotonic() - started >= 0.45
+    with open("copy.bin", "rb") as f:
+        assert len(f.read()) == 256 * 1024
+
+
+def test_throttled_zip_and_tar_members_match_unthrottled(work_dir, archive_limit):
+    write("data.bin", os.urandom(64 * 1024))
+    with open("data.bin", "rb") as f:
+        data = f.read()
+    
+    with zipfile.ZipFile("out.zip", "w", zipfile.ZIP_DEFLATED) as zipf:
+        zip_write(zipf, "data.bin", "dir/data.bin")
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        tar_add(tar, "data.bin", "dir/data.bin")
+    
+    with zipfile.ZipFile("out.zip") as zipf:
+        assert zipf.read("dir/data.bin") == data
+    buffer.seek(0)
+    with tarfile.open(fileobj=buffer) as tar:
+        member = tar.getmember("dir/data.bin")
+        assert tar.extractfile(member).read() == data
+        assert member.mode == os.stat("data.bin").st_mode & 0o7777
+
+
+@pytest.mark.skipif(os.name != "posix", reason="nice/ionice only on POSIX")
+def test_priority_command_prefixes_nice_and_ionice(monkeypatch):
+    monkeypatch.setattr(throttle, "_which_cache", {"nice": "/usr/bin/nice", "ionice": "/usr/bin/ionice"})
+    monkeypatch.setitem(THROTTLE, "low_priority", True)
+    
+    assert priority_command(["git", "fetch"]) == [
+        "nice", "-n", str(THROTTLE['nice']),
+        "ionice", "-c", str(THROTTLE['ionice_class']), "-n", str(THROTTLE['ionice_level']),
+        "git", "fetch",
+    ]
+    
+    monkeypatch.setitem(THROTTLE, "low_priority", False)
+    assert priority_command(["git", "fetch"]) == ["git", "fetch"]
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="per-thread nice only on Linux")
+def test_worker_thread_priority_is_lowered_without_touching_the_caller(monkeypatch):
+    monkeypatch.setitem(THROTTLE, "low_priority", True)
+    own = os.getpriority(os.PRIO_PROCESS, threading.get_native_id())
+    result = {}
+    
+    def worker():
+        lower_thread_priority()
+        result["nice"] = os.getpriority(os.PRIO_PROCESS, threading.get_native_id())
+    
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    
+    assert result["nice"] == max(own, THROTTLE['nice'])
+    assert os.getpriority(os.PRIO_PROCESS, threading.get_native_id()) == own
\ No newline at end of file
@@ -0,0 +1,98 @@
+# tests/test_tree_walker.py
+
+"""
+Tests für TreeWalker: Reihenfolge wie ein sortiertes os.walk, Include- und Exclude-Muster.
+"""
+
+import os
+import pytest
+import config
+from src.core.tree_walker import TreeWalker
+
+
+def write(path, text=""):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+@pytest.fixture
+def tree(work_dir):
+    """Baum mit mehreren Ebenen, .git, Build-Ordner, Logdateien und Symlinks."""
+    root = str(work_dir / "tree")
+    for index in range(12):
+        write(os.path.join(root, f"dir{index:02d}", "sub", f"file{index}.txt"), "x" * index)
+        write(os.path.join(root, f"dir{index:02d}", "debug.log"), "log")
+    write(os.path.join(root, ".git", "HEAD"), "ref")
+    write(os.path.join(root, "build", "out.o"), "obj")
+    write(os.path.join(root, "src", "build", "keep.c"), "code")
+    write(os.path.join(root, "README.md"), "readme")
+    os.symlink("dir00", os.path.join(root, "link"))
+    os.symlink("README.md", os.path.join(root, "readme-link"))
+    return root
+
+
+def os_walk(root):
+    """Referenz: sortiertes os.walk mit denselben relativen Pfaden."""
+    result = []
+    for current, dirs, files in os.walk(root):
+        dirs.sort()
+        prefix = os.path.relpath(current, root).replace(os.sep, "/")
+        prefix = "" if prefix == "." else f"{prefix}/"
+        result += [prefix + name for name in dirs] + [prefix + name for name in sorted(files)]
+    return result
+
+
+@pytest.mark.parametrize("workers, lookahead", [(1, 1), (4, 2), (8, 1024)])
+def test_order_matches_sorted_os_walk(tree, workers, lookahead):
+    walker = TreeWalker(workers=workers, lookahead=lookahead)
+    
+    entries = list(walker.walk(tree))
+    
+    assert [entry.relpath for entry in entries] == os_walk(tree)
+    by_path = {entry.relpath: entry for entry in entries}
+    assert by_path["dir05/sub/file5.txt"].size == 5
+    assert by_path["dir05"].is_dir and by_path["dir05"].stat is None
+    # Symlink auf ein Verzeichnis: geliefert, aber nicht betreten
+    assert by_path["link"].is_dir and by_path["link"].is_symlink
+    assert not any(path.startswith("link/") for path in by_path)
+    assert by_path["readme-link"].is_symlink and by_path["readme-link"].size == len("readme")
+
+
+def test_exclude_patterns(tree):
+    walker = TreeWalker(exclude=[".git", "*.log", "src/build", "link"])
+    
+    paths = [entry.relpath for entry in walker.files(tree)]
+    
+    assert not any(path.startswith(".git") or path.endswith(".log") for path in paths)
+    # Muster mit "/" gilt nur für den relativen Pfad: build/ auf oberster Ebene bleibt
+    assert "build/out.o" in paths and "src/build/keep.c" not in paths
+    assert "link" not in paths
+    
+    # Muster ohne "/" gilt für den Namen in jeder Tiefe
+    assert not [entry for entry in TreeWalker(exclude=["build"]).walk(tree) if "build" in entry.relpath]
+    assert "build/out.o" not in [entry.relpath for entry in TreeWalker(exclude=["/build/out.o"]).files(tree)]
+
+
+def test_include_patterns_apply_to_files_only(tree):
+    walker = TreeWalker(include=["*.txt", "src/*/*.c"])
+    
+    paths = [entry.relpath for entry in walker.files(tree)]
+    
+    assert paths == [f"dir{index:02d}/sub/file{index}.txt" for index in range(12)] + ["src/build/keep.c"]
+    assert all(not entry.is_dir or entry.stat is None for entry in walker.walk(tree))
+
+
+def test_for_archive_skips_git(tree, monkeypatch):
+    monkeypatch.setitem(config.ARCHIVE, "exclude", ["*.log"])
+    
+    with_git = {entry.relpath for entry in TreeWalker.for_archive().files(tree)}
+    without_git = {entry.relpath for entry in TreeWalker.for_archive(exclude_git=True).files(tree)}
+    
+    assert ".git/HEAD" in with_git
+    assert with_git - without_git == {".git/HEAD"}
+    assert not any(path.endswith(".log") for path in with_git)
+
+
+def test_missing_root_yields_nothing(work_dir):
+    assert list(TreeWalker().walk(str(work_dir / "missing"))) == []
\ No newline at end of file
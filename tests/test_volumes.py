@@ -0,0 +1,95 @@
+# tests/test_volumes.py
+
+"""
+Tests für Volume-Archive: Aufteilung nach Größe, eigenständige Volumes, Index und Prüfung.
+"""
+
+import os
+import json
+import hashlib
+import zipfile
+import pytest
+from src.core.archive_manager import ArchiveManager
+
+
+def write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+@pytest.fixture
+def source(work_dir):
+    """Drei kleine Dateien, eine Datei größer als ein Volume, danach noch eine kleine."""
+    root = str(work_dir / "repo")
+    for name, size in (("a.txt", 40), ("b.txt", 40), ("c.txt", 40), ("d.bin", 200), ("e.txt", 10)):
+        write(os.path.join(root, name), os.urandom(size))
+    write(str(work_dir / "extra.bundle"), b"bundle")
+    return root
+
+
+def load_index(volume_dir):
+    with open(os.path.join(volume_dir, "index.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_files_are_split_into_standalone_volumes(source, work_dir):
+    manager = ArchiveManager()
+    
+    success, volume_dir = manager.create_volume_archive(
+        source, volume_size=100, workers=3, extra_files={"repository.bundle": str(work_dir / "extra.bundle")}
+    )
+    
+    assert success, volume_dir
+    assert volume_dir == source + ".volumes"
+    assert manager.is_volume_archive(volume_dir)
+    members = {}
+    for name in sorted(os.listdir(volume_dir)):
+        if name.endswith(".zip"):
+            with zipfile.ZipFile(os.path.join(volume_dir, name)) as zipf:
+                assert zipf.testzip() is None
+                members[name] = zipf.namelist()
+    # Größere Dateien bekommen ein eigenes Volume, Members werden nie geteilt
+    assert members == {
+        "part0001.zip": ["a.txt", "b.txt"],
+        "part0002.zip": ["c.txt"],
+        "part0003.zip": ["d.bin"],
+        "part0004.zip": ["e.txt", "repository.bundle"],
+    }
+    index = load_index(volume_dir)
+    assert index["volume_size"] == 100
+    assert [volume["files"] for volume in index["volumes"]] == [2, 1, 1, 2]
+    with open(os.path.join(source, "d.bin"), "rb") as f:
+        data = f.read()
+    assert index["files"]["d.bin"]["archive"] == "part0003.zip"
+    assert index["files"]["d.bin"]["size"] == 200
+    assert index["files"]["d.bin"]["hash"] == hashlib.sha256(data).hexdigest()
+    assert not os.path.exists(volume_dir + ".tmp")
+
+
+def test_damaged_volume_is_detected(source):
+    manager = ArchiveManager()
+    success, volume_dir = manager.create_volume_archive(source, volume_size=100)
+    assert success, volume_dir
+    assert manager.verify_volumes(volume_dir) == (True, f"All 4 volumes verified: {volume_dir}")
+    
+    with open(os.path.join(volume_dir, "part0002.zip"), "r+b") as f:
+        f.seek(10)
+        f.write(b"\xff")
+    os.remove(os.path.join(volume_dir, "part0004.zip"))
+    
+    success, msg = manager.verify_volumes(volume_dir)
+    assert not success
+    assert msg == "2 of 4 volumes damaged: part0002.zip: hash mismatch; part0004.zip: missing or wrong size"
+
+
+def test_new_volumes_replace_the_old_ones(source):
+    manager = ArchiveManager()
+    assert manager.create_volume_archive(source, volume_size=100)[0]
+    
+    success, volume_dir = manager.create_volume_archive(source, volume_size=1000)
+    
+    assert success, volume_dir
+    assert sorted(os.listdir(volume_dir)) == ["index.json", "part0001.zip"]
+    
+    assert manager.create_volume_archive(source + "-missing")[0] is False
\ No newline at end of file